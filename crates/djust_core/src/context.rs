@@ -4,7 +4,7 @@ use crate::Value;
 use ahash::{AHashMap, AHashSet};
 use pyo3::prelude::*;
 use std::collections::{HashMap, HashSet};
-use std::sync::{Mutex, OnceLock};
+use std::sync::{Arc, Mutex, OnceLock};
 
 /// A context for template rendering, similar to Django's Context
 ///
@@ -15,6 +15,12 @@ use std::sync::{Mutex, OnceLock};
 #[derive(Debug)]
 pub struct Context {
     stack: Vec<AHashMap<String, Value>>,
+    /// Read-only bottom layer shared with the owner of the state (a
+    /// `RustLiveView`'s state map), looked up after every stack frame.
+    /// Sharing it instead of copying it into the first frame keeps
+    /// building a render context O(1) in the size of the state; writes
+    /// (`set`, `update`) land in the stack and shadow it.
+    shared: Option<Arc<HashMap<String, Value>>>,
     /// Keys marked as safe (skip auto-escaping), like Django's SafeData
     safe_keys: AHashSet<String>,
     /// Track loop variable mappings: loop_var -> (iterable_name, index)
@@ -49,6 +55,7 @@ impl Clone for Context {
     fn clone(&self) -> Self {
         Self {
             stack: self.stack.clone(),
+            shared: self.shared.clone(),
             safe_keys: self.safe_keys.clone(),
             loop_mappings: self.loop_mappings.clone(),
             // Arc::clone is cheap and does not require the GIL —
@@ -76,6 +83,7 @@ impl Context {
     pub fn new() -> Self {
         Self {
             stack: vec![AHashMap::new()],
+            shared: None,
             safe_keys: AHashSet::new(),
             loop_mappings: AHashMap::new(),
             raw_py_objects: None,
@@ -90,6 +98,7 @@ impl Context {
         }
         Self {
             stack: vec![map],
+            shared: None,
             safe_keys: AHashSet::new(),
             loop_mappings: AHashMap::new(),
             raw_py_objects: None,
@@ -97,6 +106,17 @@ impl Context {
         }
     }
 
+    /// Build a context over a shared state map without copying it.
+    ///
+    /// Equivalent to `from_dict((*state).clone())` for every lookup; the
+    /// map is only borrowed (one `Arc` refcount) for the context's life.
+    pub fn from_shared(state: Arc<HashMap<String, Value>>) -> Self {
+        Self {
+            shared: Some(state),
+            ..Self::new()
+        }
+    }
+
     /// Enable/disable Django-parity auto-call in the sidecar walk
     /// (ADR-024 kill-switch; wired from
     /// `LIVEVIEW_CONFIG["template_auto_call"]`).
@@ -116,6 +136,16 @@ impl Context {
         }
     }
 
+    /// Attach an already-shared sidecar (no per-render copy of the map
+    /// or `clone_ref` of its objects). An empty map clears it.
+    pub fn set_shared_raw_py_objects(&mut self, objects: Arc<HashMap<String, Py<PyAny>>>) {
+        if objects.is_empty() {
+            self.raw_py_objects = None;
+        } else {
+            self.raw_py_objects = Some(objects);
+        }
+    }
+
     /// Does this context have any raw Python objects attached?
     pub fn has_raw_py_objects(&self) -> bool {
         self.raw_py_objects.is_some()
@@ -168,25 +198,10 @@ impl Context {
 
         if parts.len() == 1 {
             // Simple lookup
-            for frame in self.stack.iter().rev() {
-                if let Some(value) = frame.get(key) {
-                    return Some(value);
-                }
-            }
-            None
+            self.lookup(key)
         } else {
             // Nested lookup
-            let first = parts[0];
-            let mut current = None;
-
-            for frame in self.stack.iter().rev() {
-                if let Some(value) = frame.get(first) {
-                    current = Some(value);
-                    break;
-                }
-            }
-
-            let mut current = current?;
+            let mut current = self.lookup(parts[0])?;
 
             for part in &parts[1..] {
                 // Check if this part is a numeric index (for list access)
@@ -213,6 +228,17 @@ impl Context {
         }
     }
 
+    /// Top-level name lookup: stack frames innermost first, then the
+    /// shared base layer.
+    fn lookup(&self, key: &str) -> Option<&Value> {
+        for frame in self.stack.iter().rev() {
+            if let Some(value) = frame.get(key) {
+                return Some(value);
+            }
+        }
+        self.shared.as_deref()?.get(key)
+    }
+
     pub fn set(&mut self, key: String, value: Value) {
         if let Some(frame) = self.stack.last_mut() {
             frame.insert(key, value);
@@ -435,7 +461,7 @@ impl Context {
     /// This merges all stack frames (with later frames taking precedence)
     /// into a single HashMap. Used for passing context to Python callbacks.
     pub fn to_hashmap(&self) -> HashMap<String, Value> {
-        let mut result = HashMap::new();
+        let mut result = self.shared.as_deref().cloned().unwrap_or_default();
         // Iterate from bottom to top so later frames override earlier ones
         for frame in &self.stack {
             for (key, value) in frame {
@@ -578,4 +604,25 @@ mod tests {
         ctx.pop();
         assert!(matches!(ctx.get("a"), Some(Value::Integer(1))));
     }
+
+    #[test]
+    fn test_context_shared_base_layer() {
+        let mut user = HashMap::new();
+        user.insert("name".to_string(), Value::String("John".to_string()));
+        let mut state = HashMap::new();
+        state.insert("user".to_string(), Value::Object(user));
+        state.insert("a".to_string(), Value::Integer(1));
+        let state = Arc::new(state);
+
+        let mut ctx = Context::from_shared(Arc::clone(&state));
+        assert_eq!(Arc::strong_count(&state), 2, "borrowed, not copied");
+        assert!(matches!(ctx.get("user.name"), Some(Value::String(s)) if s == "John"));
+
+        // Writes shadow the shared layer without touching it.
+        ctx.set("a".to_string(), Value::Integer(2));
+        assert!(matches!(ctx.get("a"), Some(Value::Integer(2))));
+        assert!(matches!(state.get("a"), Some(Value::Integer(1))));
+        assert!(matches!(ctx.to_hashmap().get("a"), Some(Value::Integer(2))));
+        assert!(ctx.to_hashmap().contains_key("user"));
+    }
 }
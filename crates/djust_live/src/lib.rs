@@ -17,12 +17,13 @@ pub mod actors;
 // Fast model serialization for N+1 query prevention
 pub mod model_serializer;
 
+// Interned, hash-keyed, bounded cache of parsed templates
+pub mod template_cache;
+
 use actors::{ActorSupervisor, SessionActorHandle};
-use dashmap::DashMap;
 use djust_core::{Context, Value};
 use djust_templates::inheritance::FilesystemTemplateLoader;
 use djust_templates::loop_cache::{LoopCacheGuard, LoopRenderCache};
-use djust_templates::Template;
 use djust_vdom::{
     cache_ignore_subtree_html, diff, parse_html, parse_html_continue, reset_id_counter,
     splice_ignore_subtrees, sync_ids, try_text_only_vdom_update_inplace, VNode,
@@ -35,10 +36,7 @@ use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use std::sync::Arc;
 use std::time::Duration;
-
-/// Global template cache - parse once, reuse for all sessions
-/// Using Arc<Template> for cheap cloning across threads
-static TEMPLATE_CACHE: Lazy<DashMap<String, Arc<Template>>> = Lazy::new(DashMap::new);
+use template_cache::TemplateHandle;
 
 /// Global supervisor for managing actor lifecycle
 /// Created once with 1-hour TTL
@@ -90,8 +88,13 @@ struct RenderTiming {
 /// A LiveView component that manages state and rendering (Rust backend)
 #[pyclass(name = "RustLiveView")]
 pub struct RustLiveViewBackend {
-    template_source: String,
-    state: HashMap<String, Value>,
+    /// Interned template source (shared with every session on the same
+    /// template) plus its hash, which keys the parsed-template cache.
+    template: TemplateHandle,
+    /// View state. Shared (not copied) with each render's `Context` as its
+    /// base layer; writes go through `Arc::make_mut`, which only copies if
+    /// a render context is still alive.
+    state: Arc<HashMap<String, Value>>,
     last_vdom: Option<VNode>,
     /// Cached HTML from the last render, used for text-only fast path detection.
     /// Not serialized — transient cache that's rebuilt on next render.
@@ -130,7 +133,8 @@ pub struct RustLiveViewBackend {
     /// that are not JSON-serializable (e.g. Django model instances).
     /// Not persisted across MessagePack serialize/deserialize —
     /// Python re-populates it on each sync cycle.
-    raw_py_values: Option<HashMap<String, Py<PyAny>>>,
+    /// Shared with each render's `Context` like `state`.
+    raw_py_values: Option<Arc<HashMap<String, Py<PyAny>>>>,
     /// Per-item loop render cache (#1967). PERSISTENT across
     /// `render_with_diff` calls — a content-hash → rendered-fragment map that
     /// lets a pure reorder of a keyed list reuse every item subtree instead of
@@ -172,8 +176,8 @@ impl RustLiveViewBackend {
     #[pyo3(signature = (template_source, template_dirs=None))]
     fn new(template_source: String, template_dirs: Option<Vec<String>>) -> Self {
         Self {
-            template_source,
-            state: HashMap::new(),
+            template: TemplateHandle::intern(&template_source),
+            state: Arc::new(HashMap::new()),
             last_vdom: None,
             last_html: None,
             version: 0,
@@ -279,12 +283,12 @@ impl RustLiveViewBackend {
 
     /// Set a state variable
     fn set_state(&mut self, key: String, value: Value) {
-        self.state.insert(key, value);
+        Arc::make_mut(&mut self.state).insert(key, value);
     }
 
     /// Update state with a dictionary
     fn update_state(&mut self, updates: HashMap<String, Value>) {
-        self.state.extend(updates);
+        Arc::make_mut(&mut self.state).extend(updates);
     }
 
     /// Mark context keys as safe (skip auto-escaping).
@@ -304,14 +308,21 @@ impl RustLiveViewBackend {
         if values.is_empty() {
             self.raw_py_values = None;
         } else {
-            self.raw_py_values = Some(values);
+            self.raw_py_values = Some(Arc::new(values));
         }
     }
 
     /// Update the template source while preserving VDOM state
     /// This allows dynamic templates to change without losing diffing capability
     fn update_template(&mut self, new_template_source: String) {
-        self.template_source = new_template_source;
+        if !self.template.is_source(&new_template_source) {
+            let old = std::mem::replace(
+                &mut self.template,
+                TemplateHandle::intern(&new_template_source),
+            );
+            // Hot reload: drop the old version's parse once no session uses it.
+            old.release_superseded();
+        }
         self.node_html_cache = Vec::new(); // Invalidate partial render cache
         self.last_html = None; // Invalidate text fast path cache
         self.fragment_text_map = None; // Invalidate fragment→VDOM map
@@ -323,7 +334,7 @@ impl RustLiveViewBackend {
     }
 
     /// Return the canonical 8-hex template-source hash for this view's
-    /// current `template_source`. The same hash drives the
+    /// current template source. The same hash drives the
     /// `<!--dj-if id="if-<prefix>-N"-->` marker IDs used by the keyed-VDOM
     /// boundary differ (Foundation 1 of #1358) and now the
     /// per-template slot of the Redis state-backend cache key
@@ -332,7 +343,7 @@ impl RustLiveViewBackend {
     /// a fresh cache entry on the next reconnect rather than a stale
     /// diff baseline. Stable across re-renders for the same source.
     fn template_hash(&self) -> String {
-        djust_templates::parser::template_hash_hex(&self.template_source)
+        self.template.hash().to_string()
     }
 
     /// Return the set of fields bound via static `dj-model="<field>"` in this
@@ -358,7 +369,7 @@ impl RustLiveViewBackend {
         // Fail-closed: any error (parse failure, etc.) leaves the auto-allowlist
         // empty rather than over-allowing. The explicit `allowed_model_fields`
         // path on the Python side still applies.
-        djust_templates::extract_dj_model_fields(&self.template_source, Some(&loader))
+        djust_templates::extract_dj_model_fields(self.template.source(), Some(&loader))
             .unwrap_or_default()
     }
 
@@ -379,7 +390,7 @@ impl RustLiveViewBackend {
     /// Get current state
     fn get_state(&self, py: Python) -> PyResult<Py<PyAny>> {
         let dict = PyDict::new(py);
-        for (k, v) in &self.state {
+        for (k, v) in self.state.iter() {
             dict.set_item(k, v.into_pyobject(py)?)?;
         }
         Ok(dict.into())
@@ -393,29 +404,17 @@ impl RustLiveViewBackend {
         self.last_html = None; // Invalidate text fast path cache
         self.text_node_index = None; // Invalidate text-region fast-path index
 
-        // Get template from cache or parse and cache it
-        let template_arc = if let Some(cached) = TEMPLATE_CACHE.get(&self.template_source) {
-            cached.clone()
-        } else {
-            let template = Template::new(&self.template_source)?;
-            let arc = Arc::new(template);
-            TEMPLATE_CACHE.insert(self.template_source.clone(), arc.clone());
-            arc
-        };
+        // Parsed template from the shared cache, keyed by the interned hash
+        let template_arc = self.template.template()?;
 
-        let mut context = Context::from_dict(self.state.clone());
+        let mut context = Context::from_shared(Arc::clone(&self.state));
         for key in &self.safe_keys {
             context.mark_safe(key.clone());
         }
         // Attach Py<PyAny> sidecar so `{{ model.attr }}` falls back
         // to `getattr` when `attr` isn't in the JSON-serialized state.
         if let Some(raw) = &self.raw_py_values {
-            let cloned: HashMap<String, Py<PyAny>> = Python::attach(|py| {
-                raw.iter()
-                    .map(|(k, v)| (k.clone(), v.clone_ref(py)))
-                    .collect()
-            });
-            context.set_raw_py_objects(cloned);
+            context.set_shared_raw_py_objects(Arc::clone(raw));
             // ADR-024: stamp the auto-call kill-switch onto this render's
             // context (only meaningful when a sidecar is attached).
             context.set_auto_call(self.template_auto_call);
@@ -434,29 +433,17 @@ impl RustLiveViewBackend {
 
         let t_start = Instant::now();
 
-        // Get template from cache or parse and cache it
-        let template_arc = if let Some(cached) = TEMPLATE_CACHE.get(&self.template_source) {
-            cached.clone()
-        } else {
-            let template = Template::new(&self.template_source)?;
-            let arc = Arc::new(template);
-            TEMPLATE_CACHE.insert(self.template_source.clone(), arc.clone());
-            arc
-        };
+        // Parsed template from the shared cache, keyed by the interned hash
+        let template_arc = self.template.template()?;
 
-        let mut context = Context::from_dict(self.state.clone());
+        let mut context = Context::from_shared(Arc::clone(&self.state));
         for key in &self.safe_keys {
             context.mark_safe(key.clone());
         }
         // Attach Py<PyAny> sidecar so `{{ model.attr }}` falls back
         // to `getattr` when `attr` isn't in the JSON-serialized state.
         if let Some(raw) = &self.raw_py_values {
-            let cloned: HashMap<String, Py<PyAny>> = Python::attach(|py| {
-                raw.iter()
-                    .map(|(k, v)| (k.clone(), v.clone_ref(py)))
-                    .collect()
-            });
-            context.set_raw_py_objects(cloned);
+            context.set_shared_raw_py_objects(Arc::clone(raw));
             // ADR-024: stamp the auto-call kill-switch onto this render's
             // context (only meaningful when a sidecar is attached).
             context.set_auto_call(self.template_auto_call);
@@ -846,29 +833,17 @@ impl RustLiveViewBackend {
 
         let t_start = Instant::now();
 
-        // Get template from cache or parse and cache it
-        let template_arc = if let Some(cached) = TEMPLATE_CACHE.get(&self.template_source) {
-            cached.clone()
-        } else {
-            let template = Template::new(&self.template_source)?;
-            let arc = Arc::new(template);
-            TEMPLATE_CACHE.insert(self.template_source.clone(), arc.clone());
-            arc
-        };
+        // Parsed template from the shared cache, keyed by the interned hash
+        let template_arc = self.template.template()?;
 
-        let mut context = Context::from_dict(self.state.clone());
+        let mut context = Context::from_shared(Arc::clone(&self.state));
         for key in &self.safe_keys {
             context.mark_safe(key.clone());
         }
         // Attach Py<PyAny> sidecar so `{{ model.attr }}` falls back
         // to `getattr` when `attr` isn't in the JSON-serialized state.
         if let Some(raw) = &self.raw_py_values {
-            let cloned: HashMap<String, Py<PyAny>> = Python::attach(|py| {
-                raw.iter()
-                    .map(|(k, v)| (k.clone(), v.clone_ref(py)))
-                    .collect()
-            });
-            context.set_raw_py_objects(cloned);
+            context.set_shared_raw_py_objects(Arc::clone(raw));
             // ADR-024: stamp the auto-call kill-switch onto this render's
             // context (only meaningful when a sidecar is attached).
             context.set_auto_call(self.template_auto_call);
@@ -1104,8 +1079,8 @@ impl RustLiveViewBackend {
 
         // Convert to serializable struct
         let serializable = SerializableViewState {
-            template_source: self.template_source.clone(),
-            state: self.state.clone(),
+            template_source: self.template.source().to_string(),
+            state: (*self.state).clone(),
             last_vdom: self.last_vdom.clone(),
             version: self.version,
             timestamp: ts,
@@ -1140,8 +1115,8 @@ impl RustLiveViewBackend {
         // Convert back to RustLiveViewBackend
         // Note: template_dirs must be re-set after deserialization via set_template_dirs()
         Ok(Self {
-            template_source: serializable.template_source,
-            state: serializable.state,
+            template: TemplateHandle::intern(&serializable.template_source),
+            state: Arc::new(serializable.state),
             last_vdom: serializable.last_vdom,
             last_html: None, // Transient cache — rebuilt on next render
             version: serializable.version,
@@ -1163,6 +1138,40 @@ impl RustLiveViewBackend {
         })
     }
 
+    /// Return an independent copy of this view without a MessagePack round trip.
+    ///
+    /// Carries exactly what `serialize_msgpack` -> `deserialize_msgpack`
+    /// carries (template source, state, last VDOM, version; timestamp stamped
+    /// now) and resets the same transient fields, so it is a drop-in
+    /// replacement for that round trip in `InMemoryStateBackend.get` (#1353)
+    /// minus the encode/decode of every state value and VDOM node.
+    #[pyo3(name = "clone")]
+    fn clone_view(&self) -> Self {
+        let ts = std::time::SystemTime::now()
+            .duration_since(std::time::UNIX_EPOCH)
+            .unwrap()
+            .as_secs_f64();
+
+        Self {
+            template: self.template.clone(),
+            state: Arc::clone(&self.state),
+            last_vdom: self.last_vdom.clone(),
+            last_html: None,
+            version: self.version,
+            timestamp: ts,
+            template_dirs: Vec::new(),
+            safe_keys: HashSet::new(),
+            last_render_timing: None,
+            node_html_cache: Vec::new(),
+            changed_keys: None,
+            fragment_text_map: None,
+            text_node_index: None,
+            raw_py_values: None,
+            loop_render_cache: LoopRenderCache::new(false),
+            template_auto_call: true,
+        }
+    }
+
     /// Get per-phase timing from the last render_with_diff() call.
     /// Returns a dict with render_ms, parse_ms, diff_ms, serialize_ms, total_ms, html_len.
     fn get_render_timing(&self) -> Option<HashMap<String, f64>> {
@@ -1457,17 +1466,46 @@ fn virtual_keyed_ops_enabled() -> bool {
     djust_vdom::diff::virtual_keyed_ops_enabled()
 }
 
+/// Counters for the process-wide parsed-template cache (`template_cache`).
+///
+/// Keys: `entries`, `capacity`, `hits`, `misses`, `evictions`,
+/// `interned_sources` and `interned_bytes` (template source bytes shared by
+/// all live sessions, counted once per distinct template).
+#[pyfunction]
+fn template_cache_stats() -> HashMap<String, u64> {
+    let stats = template_cache::stats();
+    HashMap::from([
+        ("entries".to_string(), stats.entries as u64),
+        ("capacity".to_string(), stats.capacity as u64),
+        ("hits".to_string(), stats.hits),
+        ("misses".to_string(), stats.misses),
+        ("evictions".to_string(), stats.evictions),
+        (
+            "interned_sources".to_string(),
+            stats.interned_sources as u64,
+        ),
+        ("interned_bytes".to_string(), stats.interned_bytes as u64),
+    ])
+}
+
+/// Bound the parsed-template cache to `capacity` templates (least recently
+/// used are evicted first). Process-global, wired from
+/// `LIVEVIEW_CONFIG['template_cache_size']` in `DjustConfig.ready`.
+#[pyfunction]
+fn set_template_cache_capacity(capacity: usize) {
+    template_cache::set_capacity(capacity);
+}
+
+/// Drop every parsed template (dev hot reload). Returns the number dropped.
+#[pyfunction]
+fn clear_template_cache() -> usize {
+    template_cache::clear()
+}
+
 #[pyfunction]
 fn render_template(template_source: String, context: HashMap<String, Value>) -> PyResult<String> {
     // Get template from cache or parse and cache it
-    let template_arc = if let Some(cached) = TEMPLATE_CACHE.get(&template_source) {
-        cached.clone()
-    } else {
-        let template = Template::new(&template_source)?;
-        let arc = Arc::new(template);
-        TEMPLATE_CACHE.insert(template_source.clone(), arc.clone());
-        arc
-    };
+    let template_arc = template_cache::template_for_source(&template_source)?;
 
     let ctx = Context::from_dict(context);
     let result = template_arc.render(&ctx)?;
@@ -1501,14 +1539,7 @@ fn render_template_with_dirs(
     use djust_templates::inheritance::FilesystemTemplateLoader;
 
     // Get template from cache or parse and cache it
-    let template_arc = if let Some(cached) = TEMPLATE_CACHE.get(&template_source) {
-        cached.clone()
-    } else {
-        let template = Template::new(&template_source)?;
-        let arc = Arc::new(template);
-        TEMPLATE_CACHE.insert(template_source.clone(), arc.clone());
-        arc
-    };
+    let template_arc = template_cache::template_for_source(&template_source)?;
 
     let mut ctx = Context::from_dict(context);
 
@@ -3319,6 +3350,9 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(set_virtual_keyed_ops, m)?)?;
     m.add_function(wrap_pyfunction!(virtual_keyed_ops_enabled, m)?)?;
     m.add_function(wrap_pyfunction!(dj_model_fields_from_template, m)?)?;
+    m.add_function(wrap_pyfunction!(template_cache_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(set_template_cache_capacity, m)?)?;
+    m.add_function(wrap_pyfunction!(clear_template_cache, m)?)?;
 
     // Actor system exports
     m.add_class::<SessionActorHandlePy>()?;
@@ -0,0 +1,261 @@
+//! Process-wide template cache shared by every `RustLiveView` session.
+//!
+//! Sessions hold a [`TemplateHandle`]: the template source interned by its
+//! canonical hash (`template_hash_hex`, the same hash as
+//! `compute_template_hash`), so thousands of sessions on one template share a
+//! single `Arc<str>` instead of each owning a copy of the source. A render
+//! looks the parsed [`Template`] up by that 8-hex hash rather than hashing
+//! the whole source string on every call.
+//!
+//! Parsed templates live in a size-bounded LRU (`DEFAULT_CAPACITY` entries,
+//! adjustable with [`set_capacity`]). Eviction drops only the parsed AST;
+//! sessions keep their interned source and re-parse on their next miss. When
+//! a session switches template (`update_template`, i.e. hot reload) and was
+//! the last holder of the old source, the superseded entry is evicted at
+//! once instead of waiting for the LRU to age it out.
+
+use dashmap::DashMap;
+use djust_core::Result;
+use djust_templates::parser::template_hash_hex;
+use djust_templates::Template;
+use once_cell::sync::Lazy;
+use parking_lot::Mutex;
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::sync::{Arc, Weak};
+
+/// Parsed templates kept by default. Each is one distinct template source
+/// (a view template, an `{% include %}`-free fragment rendered through
+/// `render_template`, ...), so this comfortably covers an app's working set.
+pub const DEFAULT_CAPACITY: usize = 512;
+
+/// Interned sources are pruned of dead entries once the table grows past this.
+const INTERN_PRUNE_THRESHOLD: usize = 1024;
+
+struct CacheEntry {
+    source: Arc<str>,
+    template: Arc<Template>,
+    last_used: AtomicU64,
+}
+
+static CACHE: Lazy<DashMap<String, CacheEntry>> = Lazy::new(DashMap::new);
+static INTERNED: Lazy<Mutex<HashMap<String, Weak<str>>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+static CAPACITY: AtomicUsize = AtomicUsize::new(DEFAULT_CAPACITY);
+/// Logical clock for LRU ordering (a counter, not wall time).
+static TICK: AtomicU64 = AtomicU64::new(0);
+static HITS: AtomicU64 = AtomicU64::new(0);
+static MISSES: AtomicU64 = AtomicU64::new(0);
+static EVICTIONS: AtomicU64 = AtomicU64::new(0);
+
+/// A session's reference to an interned template source.
+#[derive(Clone, Debug)]
+pub struct TemplateHandle {
+    hash: String,
+    source: Arc<str>,
+}
+
+impl TemplateHandle {
+    /// Intern `source`: sessions created from the same source share one
+    /// allocation for as long as any of them is alive.
+    pub fn intern(source: &str) -> Self {
+        let hash = template_hash_hex(source);
+        let mut table = INTERNED.lock();
+        if let Some(existing) = table.get(&hash).and_then(Weak::upgrade) {
+            if *existing == *source {
+                return Self {
+                    hash,
+                    source: existing,
+                };
+            }
+            // 32-bit hash collision with a live template: keep a private
+            // copy rather than displacing the other template's entry.
+            return Self {
+                hash,
+                source: Arc::from(source),
+            };
+        }
+        if table.len() >= INTERN_PRUNE_THRESHOLD {
+            table.retain(|_, weak| weak.strong_count() > 0);
+        }
+        let arc: Arc<str> = Arc::from(source);
+        table.insert(hash.clone(), Arc::downgrade(&arc));
+        Self { hash, source: arc }
+    }
+
+    /// Canonical 8-hex template hash (no re-hash of the source).
+    pub fn hash(&self) -> &str {
+        &self.hash
+    }
+
+    pub fn source(&self) -> &str {
+        &self.source
+    }
+
+    /// Whether this handle holds exactly `source`.
+    pub fn is_source(&self, source: &str) -> bool {
+        *self.source == *source
+    }
+
+    /// The parsed template, from the cache or parsed (and cached) now.
+    pub fn template(&self) -> Result<Arc<Template>> {
+        if let Some(entry) = CACHE.get(&self.hash) {
+            if Arc::ptr_eq(&entry.source, &self.source) || *entry.source == *self.source {
+                entry.last_used.store(next_tick(), Ordering::Relaxed);
+                HITS.fetch_add(1, Ordering::Relaxed);
+                return Ok(entry.template.clone());
+            }
+            // Hash collision: parse without caching.
+            drop(entry);
+            MISSES.fetch_add(1, Ordering::Relaxed);
+            return Ok(Arc::new(Template::new(&self.source)?));
+        }
+        MISSES.fetch_add(1, Ordering::Relaxed);
+        let template = Arc::new(Template::new(&self.source)?);
+        CACHE.insert(
+            self.hash.clone(),
+            CacheEntry {
+                source: self.source.clone(),
+                template: template.clone(),
+                last_used: AtomicU64::new(next_tick()),
+            },
+        );
+        evict_over_capacity();
+        Ok(template)
+    }
+
+    /// Drop the cached parse of a source this handle no longer uses if no
+    /// other session holds it (hot reload: the old version is superseded).
+    pub fn release_superseded(self) {
+        let TemplateHandle { hash, source } = self;
+        drop(source);
+        // The cache entry's own reference is the only one left.
+        if CACHE
+            .remove_if(&hash, |_, entry| Arc::strong_count(&entry.source) == 1)
+            .is_some()
+        {
+            EVICTIONS.fetch_add(1, Ordering::Relaxed);
+        }
+    }
+}
+
+/// Parse-and-cache lookup for callers that hold a raw source rather than a
+/// session handle (`render_template`, `render_template_with_dirs`).
+pub fn template_for_source(source: &str) -> Result<Arc<Template>> {
+    let hash = template_hash_hex(source);
+    if let Some(entry) = CACHE.get(&hash) {
+        if *entry.source == *source {
+            entry.last_used.store(next_tick(), Ordering::Relaxed);
+            HITS.fetch_add(1, Ordering::Relaxed);
+            return Ok(entry.template.clone());
+        }
+    }
+    TemplateHandle::intern(source).template()
+}
+
+fn next_tick() -> u64 {
+    TICK.fetch_add(1, Ordering::Relaxed)
+}
+
+fn evict_over_capacity() {
+    let capacity = CAPACITY.load(Ordering::Relaxed).max(1);
+    while CACHE.len() > capacity {
+        // O(n) scan over at most `capacity + 1` entries, only on insert
+        // past the bound — never on the render hit path.
+        let oldest = CACHE
+            .iter()
+            .min_by_key(|entry| entry.last_used.load(Ordering::Relaxed))
+            .map(|entry| entry.key().clone());
+        match oldest {
+            Some(key) => {
+                if CACHE.remove(&key).is_some() {
+                    EVICTIONS.fetch_add(1, Ordering::Relaxed);
+                }
+            }
+            None => break,
+        }
+    }
+}
+
+/// Set the maximum number of parsed templates kept (minimum 1).
+pub fn set_capacity(capacity: usize) {
+    CAPACITY.store(capacity.max(1), Ordering::Relaxed);
+    evict_over_capacity();
+}
+
+/// Drop every cached parse. Interned sources held by sessions are kept.
+pub fn clear() -> usize {
+    let count = CACHE.len();
+    CACHE.clear();
+    count
+}
+
+/// Snapshot of cache counters.
+pub struct CacheStats {
+    pub entries: usize,
+    pub capacity: usize,
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+    pub interned_sources: usize,
+    pub interned_bytes: usize,
+}
+
+pub fn stats() -> CacheStats {
+    let (interned_sources, interned_bytes) = {
+        let table = INTERNED.lock();
+        table
+            .values()
+            .filter_map(Weak::upgrade)
+            .fold((0, 0), |(n, bytes), source| (n + 1, bytes + source.len()))
+    };
+    CacheStats {
+        entries: CACHE.len(),
+        capacity: CAPACITY.load(Ordering::Relaxed),
+        hits: HITS.load(Ordering::Relaxed),
+        misses: MISSES.load(Ordering::Relaxed),
+        evictions: EVICTIONS.load(Ordering::Relaxed),
+        interned_sources,
+        interned_bytes,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // The cache is process-global; each test uses sources no other test
+    // renders and asserts on its own entries rather than global counts.
+
+    #[test]
+    fn test_intern_shares_one_allocation() {
+        let a = TemplateHandle::intern("<p>intern {{ x }}</p>");
+        let b = TemplateHandle::intern(&String::from("<p>intern {{ x }}</p>"));
+        assert!(Arc::ptr_eq(&a.source, &b.source));
+        assert_eq!(a.hash(), template_hash_hex("<p>intern {{ x }}</p>"));
+    }
+
+    #[test]
+    fn test_template_is_parsed_once() {
+        let handle = TemplateHandle::intern("<p>parse-once {{ x }}</p>");
+        let first = handle.template().unwrap();
+        let second = TemplateHandle::intern("<p>parse-once {{ x }}</p>")
+            .template()
+            .unwrap();
+        assert!(Arc::ptr_eq(&first, &second));
+    }
+
+    #[test]
+    fn test_release_superseded_evicts_only_unshared_sources() {
+        let source = "<p>superseded {{ x }}</p>";
+        let a = TemplateHandle::intern(source);
+        let b = TemplateHandle::intern(source);
+        a.template().unwrap();
+        let hash = a.hash().to_string();
+
+        a.release_superseded();
+        assert!(CACHE.contains_key(&hash), "still used by another session");
+
+        b.release_superseded();
+        assert!(!CACHE.contains_key(&hash));
+    }
+}
@@ -565,7 +565,7 @@ fn node_to_template_string(node: &Node) -> String {
             // For now, skip them as they're handled separately
             String::new()
         }
-        Node::CustomTag { name, args } => {
+        Node::CustomTag { name, args, .. } => {
             // Reconstruct custom tag: {% tagname arg1 arg2 %}
             let mut result = format!("{{% {name}");
             for arg in args {
@@ -619,6 +619,7 @@ fn node_to_template_string(node: &Node) -> String {
             name,
             args,
             children,
+            ..
         } => {
             // Reconstruct block custom tag: {% tagname args %}...{% endtagname %}
             let mut result = format!("{{% {name}");
@@ -23,6 +23,7 @@ pub mod markdown;
 pub mod parser;
 pub mod registry;
 pub mod renderer;
+pub mod tag_args;
 pub mod tags;
 
 pub use markdown::render_markdown;
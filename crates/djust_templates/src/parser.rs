@@ -5,6 +5,7 @@ use djust_core::{DjangoRustError, Result};
 use std::collections::hash_map::DefaultHasher;
 use std::collections::{HashMap, HashSet};
 use std::hash::{Hash, Hasher};
+use std::sync::Arc;
 
 #[derive(Debug, Clone)]
 pub enum Node {
@@ -82,6 +83,9 @@ pub enum Node {
         name: String,
         /// Arguments from the template tag as raw strings
         args: Vec<String>,
+        /// Keyword arguments compiled once at parse time, for handlers
+        /// registered with `prepared_args=True`.
+        plan: Arc<crate::tag_args::ArgPlan>,
     },
     /// Block custom template tag handled by a Python callback with children.
     ///
@@ -94,6 +98,8 @@ pub enum Node {
         name: String,
         /// Arguments from the opening tag as raw strings
         args: Vec<String>,
+        /// Keyword arguments compiled once at parse time (see `CustomTag`).
+        plan: Arc<crate::tag_args::ArgPlan>,
         /// Child nodes (the block body)
         children: Vec<Node>,
     },
@@ -824,6 +830,7 @@ fn parse_token(tokens: &[Token], i: &mut usize) -> Result<Option<Node>> {
                         Ok(Some(Node::BlockCustomTag {
                             name: tag_name.clone(),
                             args: args.clone(),
+                            plan: Arc::new(crate::tag_args::ArgPlan::compile(args)),
                             children,
                         }))
                     } else if crate::registry::handler_exists(tag_name) {
@@ -831,6 +838,7 @@ fn parse_token(tokens: &[Token], i: &mut usize) -> Result<Option<Node>> {
                         Ok(Some(Node::CustomTag {
                             name: tag_name.clone(),
                             args: args.clone(),
+                            plan: Arc::new(crate::tag_args::ArgPlan::compile(args)),
                         }))
                     } else if crate::registry::assign_handler_exists(tag_name) {
                         // Context-mutating assign tag (register_assign_tag_handler)
@@ -1539,12 +1547,7 @@ fn extract_from_nodes(
                 }
                 variables.entry("*".to_string()).or_default();
             }
-            Node::CustomTag { args, name: _ }
-            | Node::BlockCustomTag {
-                args,
-                name: _,
-                children: _,
-            } => {
+            Node::CustomTag { args, .. } | Node::BlockCustomTag { args, .. } => {
                 // Extract variables from custom/block tag arguments
                 for arg in args {
                     if (arg.starts_with('"') && arg.ends_with('"'))
@@ -3133,10 +3136,12 @@ mod dep_tests {
             Node::CustomTag {
                 name: "url".into(),
                 args: vec!["view_name".into()],
+                plan: Default::default(),
             },
             Node::BlockCustomTag {
                 name: "modal".into(),
                 args: vec![],
+                plan: Default::default(),
                 children: vec![],
             },
             Node::WidthRatio {
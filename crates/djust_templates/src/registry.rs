@@ -76,6 +76,32 @@ struct AssignHandlerEntry {
 static ASSIGN_TAG_HANDLERS: Lazy<RwLock<HashMap<String, AssignHandlerEntry>>> =
     Lazy::new(|| RwLock::new(HashMap::new()));
 
+/// Inline / block tags whose handler was registered with
+/// `prepared_args=True`: it receives a `dict` of keyword arguments built
+/// from a precompiled [`crate::tag_args::ArgPlan`] instead of the raw
+/// `["key=value", ...]` string list.
+static PREPARED_ARG_TAGS: Lazy<RwLock<HashSet<String>>> = Lazy::new(|| RwLock::new(HashSet::new()));
+
+fn set_prepared_args(name: &str, prepared_args: bool) -> PyResult<()> {
+    let mut prepared = PREPARED_ARG_TAGS.write().map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Registry lock error: {e}"))
+    })?;
+    if prepared_args {
+        prepared.insert(name.to_string());
+    } else {
+        prepared.remove(name);
+    }
+    Ok(())
+}
+
+/// True if the tag's handler takes prepared keyword arguments (internal Rust API).
+pub fn handler_takes_prepared_args(name: &str) -> bool {
+    PREPARED_ARG_TAGS
+        .read()
+        .map(|prepared| prepared.contains(name))
+        .unwrap_or(false)
+}
+
 /// Register a Python tag handler for a custom template tag.
 ///
 /// The handler must be a Python object with a `render(self, args, context)` method:
@@ -87,6 +113,10 @@ static ASSIGN_TAG_HANDLERS: Lazy<RwLock<HashMap<String, AssignHandlerEntry>>> =
 ///
 /// * `name` - Tag name (e.g., "url", "static")
 /// * `handler` - Python handler object with `render` method
+/// * `prepared_args` - Pass `args` as a `dict` of keyword arguments
+///   (literals decoded, variables resolved) instead of the raw string
+///   list; the arg list is compiled once per tag source. See
+///   [`crate::tag_args`].
 ///
 /// # Example
 ///
@@ -101,7 +131,13 @@ static ASSIGN_TAG_HANDLERS: Lazy<RwLock<HashMap<String, AssignHandlerEntry>>> =
 /// register_tag_handler("url", UrlTagHandler())
 /// ```
 #[pyfunction]
-pub fn register_tag_handler(py: Python<'_>, name: String, handler: Py<PyAny>) -> PyResult<()> {
+#[pyo3(signature = (name, handler, prepared_args=false))]
+pub fn register_tag_handler(
+    py: Python<'_>,
+    name: String,
+    handler: Py<PyAny>,
+    prepared_args: bool,
+) -> PyResult<()> {
     // Verify handler has render method
     let handler_ref = handler.bind(py);
     if !handler_ref.hasattr("render")? {
@@ -114,6 +150,7 @@ pub fn register_tag_handler(py: Python<'_>, name: String, handler: Py<PyAny>) ->
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Registry lock error: {e}"))
     })?;
 
+    set_prepared_args(&name, prepared_args)?;
     registry.insert(name, handler);
     Ok(())
 }
@@ -127,6 +164,7 @@ pub fn unregister_tag_handler(name: &str) -> PyResult<bool> {
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Registry lock error: {e}"))
     })?;
 
+    set_prepared_args(name, false)?;
     Ok(registry.remove(name).is_some())
 }
 
@@ -199,12 +237,17 @@ pub fn clear_tag_handlers() -> PyResult<()> {
 ///   `{% render_template name=... %}`-style template loads. Workaround:
 ///   pre-render child templates in the view and pass the result via
 ///   context.
+///
+/// `prepared_args=True` passes `args` as a `dict` of keyword arguments, as
+/// for [`register_tag_handler`].
 #[pyfunction]
+#[pyo3(signature = (name, end_tag, handler, prepared_args=false))]
 pub fn register_block_tag_handler(
     py: Python<'_>,
     name: String,
     end_tag: String,
     handler: Py<PyAny>,
+    prepared_args: bool,
 ) -> PyResult<()> {
     let handler_ref = handler.bind(py);
     if !handler_ref.hasattr("render")? {
@@ -217,6 +260,7 @@ pub fn register_block_tag_handler(
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Registry lock error: {e}"))
     })?;
 
+    set_prepared_args(&name, prepared_args)?;
     registry.insert(name, (end_tag, handler));
     Ok(())
 }
@@ -228,6 +272,7 @@ pub fn unregister_block_tag_handler(name: &str) -> PyResult<bool> {
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Registry lock error: {e}"))
     })?;
 
+    set_prepared_args(name, false)?;
     Ok(registry.remove(name).is_some())
 }
 
@@ -495,6 +540,104 @@ pub fn call_handler_with_py_sidecar(
     })
 }
 
+/// Call a handler registered with `prepared_args=True` (internal Rust API).
+///
+/// `kwargs` come from [`crate::tag_args::ArgPlan`] resolution and are
+/// passed as a `dict` in place of the raw arg list: `render(kwargs,
+/// context)` for inline tags, `render(kwargs, content, context)` for block
+/// tags (`content` is `Some`). Unresolved bare names pick up the
+/// raw-Python sidecar object of that name, as `context.get(name, name)` did
+/// in the string path.
+pub fn call_prepared_handler(
+    name: &str,
+    kwargs: &[(String, crate::tag_args::PreparedArg)],
+    content: Option<&str>,
+    context: &HashMap<String, djust_core::Value>,
+    raw_py_objects: Option<&HashMap<String, pyo3::Py<PyAny>>>,
+) -> Result<String, String> {
+    use crate::tag_args::PreparedArg;
+
+    let handler = if content.is_some() {
+        let registry = BLOCK_TAG_HANDLERS
+            .read()
+            .map_err(|e| format!("Registry lock error: {e}"))?;
+        let (_, handler_ref) = registry
+            .get(name)
+            .ok_or_else(|| format!("No block handler registered for tag: {name}"))?;
+        Python::attach(|py| handler_ref.clone_ref(py))
+    } else {
+        let registry = TAG_HANDLERS
+            .read()
+            .map_err(|e| format!("Registry lock error: {e}"))?;
+        let handler_ref = registry
+            .get(name)
+            .ok_or_else(|| format!("No handler registered for tag: {name}"))?;
+        Python::attach(|py| handler_ref.clone_ref(py))
+    };
+
+    Python::attach(|py| {
+        use pyo3::IntoPyObject;
+
+        let py_kwargs = pyo3::types::PyDict::new(py);
+        for (key, arg) in kwargs {
+            let set = match arg {
+                PreparedArg::Value(value) => {
+                    let py_value = value
+                        .clone()
+                        .into_pyobject(py)
+                        .map_err(|e| format!("Failed to convert arg '{key}': {e}"))?;
+                    py_kwargs.set_item(key, py_value)
+                }
+                PreparedArg::Name(var) => match raw_py_objects.and_then(|raw| raw.get(var)) {
+                    Some(obj) => py_kwargs.set_item(key, obj.bind(py)),
+                    None => py_kwargs.set_item(key, var),
+                },
+            };
+            set.map_err(|e| format!("Failed to set arg '{key}': {e}"))?;
+        }
+
+        let py_context = pyo3::types::PyDict::new(py);
+        for (key, value) in context {
+            let py_value = value
+                .clone()
+                .into_pyobject(py)
+                .map_err(|e| format!("Failed to convert value for key '{key}': {e}"))?;
+            py_context
+                .set_item(key, py_value)
+                .map_err(|e| format!("Failed to set context key '{key}': {e}"))?;
+        }
+        if let Some(raw) = raw_py_objects {
+            for (key, obj) in raw {
+                py_context
+                    .set_item(key, obj.bind(py))
+                    .map_err(|e| format!("Failed to set raw context key '{key}': {e}"))?;
+            }
+        }
+
+        let handler_ref = handler.bind(py);
+        let result = match content {
+            Some(content) => handler_ref.call_method1("render", (py_kwargs, content, py_context)),
+            None => handler_ref.call_method1("render", (py_kwargs, py_context)),
+        }
+        .map_err(|e| {
+            let traceback = e
+                .traceback(py)
+                .map(|tb| tb.format().unwrap_or_default())
+                .unwrap_or_default();
+            format!(
+                "Handler '{}' raised exception: {}\n{}",
+                name,
+                e.value(py),
+                traceback
+            )
+        })?;
+
+        result
+            .extract::<String>()
+            .map_err(|_| format!("Handler '{name}' render() must return a string"))
+    })
+}
+
 // ============================================================================
 // Assign Tag Handler API (context-mutating tags)
 // ============================================================================
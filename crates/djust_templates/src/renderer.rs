@@ -275,6 +275,44 @@ fn resolve_tag_arg(arg: &str, context: &Context) -> String {
     }
 }
 
+/// Resolve a precompiled [`crate::tag_args::ArgPlan`] for a prepared handler.
+///
+/// Produces the values the string path delivered after `_parse_args`, minus
+/// the text round trip. `filter_aware` selects the operand resolver of the
+/// node kind: `Node::CustomTag` resolves through the filter-aware
+/// [`get_value`], `Node::BlockCustomTag` through plain context lookup (as
+/// [`resolve_tag_arg`] does). An operand that does not resolve falls back to
+/// its decoded literal, or to the bare name.
+fn resolve_prepared_args(
+    plan: &crate::tag_args::ArgPlan,
+    context: &Context,
+    filter_aware: bool,
+) -> Vec<(String, crate::tag_args::PreparedArg)> {
+    use crate::tag_args::{normalize_resolved, PlanValue, PreparedArg};
+
+    plan.kwargs
+        .iter()
+        .map(|(key, value)| {
+            let arg = match value {
+                PlanValue::Literal(v) => PreparedArg::Value(v.clone()),
+                PlanValue::Expr { expr, fallback } => {
+                    let resolved = if filter_aware {
+                        get_value(expr, context).ok()
+                    } else {
+                        context.get(expr).cloned()
+                    };
+                    match (resolved, fallback) {
+                        (Some(v), _) => PreparedArg::Value(normalize_resolved(v)),
+                        (None, Some(literal)) => PreparedArg::Value(literal.clone()),
+                        (None, None) => PreparedArg::Name(expr.clone()),
+                    }
+                }
+            };
+            (key.clone(), arg)
+        })
+        .collect()
+}
+
 /// Resolve an [`Node::AssignTag`]'s args, honoring the handler's declared
 /// `RESOLVE_ARG_POSITIONS` policy (#2041).
 ///
@@ -1230,11 +1268,26 @@ pub fn render_node_with_loader<L: TemplateLoader>(
         Node::BlockCustomTag {
             name,
             args,
+            plan,
             children,
         } => {
             // Render children first to get block content
             let content = render_nodes_with_loader(children, context, loader)?;
 
+            if crate::registry::handler_takes_prepared_args(name) {
+                let kwargs = resolve_prepared_args(plan, context, false);
+                return crate::registry::call_prepared_handler(
+                    name,
+                    &kwargs,
+                    Some(&content),
+                    &context.to_hashmap(),
+                    context.raw_py_objects(),
+                )
+                .map_err(|e| {
+                    DjangoRustError::TemplateError(format!("Block tag '{}' error: {}", name, e))
+                });
+            }
+
             // Resolve variable references in args through the SAME shared
             // helper as `Node::AssignTag`. This inline resolver used to be a
             // hand-copied twin of `resolve_tag_arg` that (crucially) skipped
@@ -1292,7 +1345,25 @@ pub fn render_node_with_loader<L: TemplateLoader>(
             Ok(String::new())
         }
 
-        Node::CustomTag { name, args } => {
+        Node::CustomTag { name, plan, .. }
+            if crate::registry::handler_takes_prepared_args(name) =>
+        {
+            // Prepared handler: resolve the parse-time plan straight into
+            // keyword values — no text encoding, no Python-side re-parse.
+            let kwargs = resolve_prepared_args(plan, context, true);
+            crate::registry::call_prepared_handler(
+                name,
+                &kwargs,
+                None,
+                &context.to_hashmap(),
+                context.raw_py_objects(),
+            )
+            .map_err(|e| {
+                DjangoRustError::TemplateError(format!("Custom tag '{}' error: {}", name, e))
+            })
+        }
+
+        Node::CustomTag { name, args, .. } => {
             // Call Python handler for custom tags (e.g., {% url %}, {% static %})
             //
             // The handler is looked up in the registry and called with:
@@ -0,0 +1,219 @@
+//! Precompiled argument plans for custom tag handlers.
+//!
+//! Component tags (`{% dj_button label=row.name variant="primary" %}`)
+//! historically reached Python as raw `["label=Ada", "variant='primary'"]`
+//! strings: the renderer resolved each variable, re-encoded the value as
+//! text (JSON for lists/objects), and the Python handler's `_parse_args`
+//! split, stripped, number-sniffed and `json.loads`-ed every arg again —
+//! once per tag instance per render.
+//!
+//! Handlers registered with `prepared_args=True` skip that round trip. The
+//! tag's raw arg list is compiled into an [`ArgPlan`] (keys split, quotes
+//! stripped, literals decoded, variable references isolated) once, when the
+//! template is parsed, and stored on the `CustomTag` / `BlockCustomTag`
+//! node; at render time only the variable references are resolved and the
+//! handler receives a ready `dict` of keyword arguments.
+//!
+//! The decoding rules mirror `djust.components.rust_handlers._parse_args`
+//! so a handler sees the same values on either path — including for
+//! resolved strings, which `_parse_args` number-sniffed after the text
+//! round trip (a context value `"42"` arrives as `42`). The one difference:
+//! a resolved string that names another context variable is not looked up
+//! a second time.
+
+use djust_core::Value;
+
+/// One `key=value` argument's value, as compiled from the template source.
+#[derive(Debug, Clone, PartialEq)]
+pub enum PlanValue {
+    /// Quoted string literal — value known at compile time.
+    Literal(Value),
+    /// Unquoted operand resolved against the render context.
+    ///
+    /// `fallback` is the value `_parse_args` would decode from the raw
+    /// text when the operand does not resolve (`True`, `42`, `[1, 2]` …);
+    /// `None` means "bare name": look it up in the raw-Python sidecar, else
+    /// pass the name through as a string.
+    Expr {
+        expr: String,
+        fallback: Option<Value>,
+    },
+}
+
+/// A tag's keyword arguments in template order. Positional args are not
+/// part of the plan — `_parse_args` ignores them too.
+#[derive(Debug, Clone, PartialEq, Default)]
+pub struct ArgPlan {
+    pub kwargs: Vec<(String, PlanValue)>,
+}
+
+/// A resolved argument handed to a prepared handler.
+#[derive(Debug, Clone, PartialEq)]
+pub enum PreparedArg {
+    Value(Value),
+    /// Unresolved bare name: the sidecar object of that name, else the
+    /// name itself as a string.
+    Name(String),
+}
+
+fn is_quoted(s: &str) -> bool {
+    s.len() >= 2
+        && ((s.starts_with('"') && s.ends_with('"')) || (s.starts_with('\'') && s.ends_with('\'')))
+}
+
+/// Decode an unquoted operand the way `_parse_args` does.
+///
+/// Returns `None` for a bare name (variable reference).
+pub fn classify_literal(val: &str) -> Option<Value> {
+    if (val.starts_with('[') && val.ends_with(']')) || (val.starts_with('{') && val.ends_with('}'))
+    {
+        return serde_json::from_str::<Value>(val).ok();
+    }
+    match val {
+        "True" | "true" => return Some(Value::Bool(true)),
+        "False" | "false" => return Some(Value::Bool(false)),
+        "" => return Some(Value::String(String::new())),
+        "None" | "null" => return Some(Value::Null),
+        _ => {}
+    }
+    if let Ok(i) = val.parse::<i64>() {
+        return Some(Value::Integer(i));
+    }
+    if let Ok(f) = val.parse::<f64>() {
+        return Some(Value::Float(f));
+    }
+    None
+}
+
+impl ArgPlan {
+    /// Compile a tag's raw arg list.
+    pub fn compile(args: &[String]) -> Self {
+        let kwargs = args
+            .iter()
+            .filter_map(|arg| {
+                let eq_pos = arg.find('=')?;
+                let key = arg[..eq_pos].trim().to_string();
+                let val = arg[eq_pos + 1..].trim();
+                let value = if is_quoted(val) {
+                    PlanValue::Literal(Value::String(val[1..val.len() - 1].to_string()))
+                } else {
+                    PlanValue::Expr {
+                        expr: val.to_string(),
+                        fallback: classify_literal(val),
+                    }
+                };
+                Some((key, value))
+            })
+            .collect();
+        ArgPlan { kwargs }
+    }
+}
+
+/// Normalize a context value to what the string path delivered.
+///
+/// The text encoding rendered `None` as the empty string and integral
+/// floats without a fraction (`50.0` → `"50"` → `int`), and `_parse_args`
+/// then decoded string values as if they were template source (`"42"` →
+/// `42`, `"'hi'"` → `hi`, `"[1]"` → `[1]`); prepared handlers see the
+/// same.
+pub fn normalize_resolved(value: Value) -> Value {
+    match value {
+        Value::Null => Value::String(String::new()),
+        Value::String(s) => {
+            let val = s.trim();
+            if is_quoted(val) {
+                Value::String(val[1..val.len() - 1].to_string())
+            } else {
+                classify_literal(val).unwrap_or(Value::String(s))
+            }
+        }
+        Value::Float(f) if f.is_finite() && f.fract() == 0.0 && f.abs() < 9.0e15 => {
+            Value::Integer(f as i64)
+        }
+        other => other,
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn args(v: &[&str]) -> Vec<String> {
+        v.iter().map(|s| s.to_string()).collect()
+    }
+
+    #[test]
+    fn compile_splits_keys_and_strips_quotes() {
+        let plan = ArgPlan::compile(&args(&["title='Hello'", " variant = \"primary\" ", "row"]));
+        assert_eq!(
+            plan.kwargs,
+            vec![
+                (
+                    "title".to_string(),
+                    PlanValue::Literal(Value::String("Hello".to_string()))
+                ),
+                (
+                    "variant".to_string(),
+                    PlanValue::Literal(Value::String("primary".to_string()))
+                ),
+            ]
+        );
+    }
+
+    #[test]
+    fn compile_predecodes_unquoted_literals() {
+        let plan = ArgPlan::compile(&args(&[
+            "open=True",
+            "size=10",
+            "ratio=0.5",
+            "items=[1, 2]",
+            "missing=None",
+            "label=row.name",
+        ]));
+        let fallbacks: Vec<Option<Value>> = plan
+            .kwargs
+            .iter()
+            .map(|(_, v)| match v {
+                PlanValue::Expr { fallback, .. } => fallback.clone(),
+                PlanValue::Literal(_) => panic!("unquoted arg compiled as literal"),
+            })
+            .collect();
+        assert_eq!(
+            fallbacks,
+            vec![
+                Some(Value::Bool(true)),
+                Some(Value::Integer(10)),
+                Some(Value::Float(0.5)),
+                Some(Value::List(vec![Value::Integer(1), Value::Integer(2)])),
+                Some(Value::Null),
+                None,
+            ]
+        );
+    }
+
+    #[test]
+    fn normalize_matches_text_encoding() {
+        assert_eq!(
+            normalize_resolved(Value::Null),
+            Value::String(String::new())
+        );
+        assert_eq!(normalize_resolved(Value::Float(50.0)), Value::Integer(50));
+        assert_eq!(normalize_resolved(Value::Float(0.25)), Value::Float(0.25));
+    }
+
+    #[test]
+    fn normalize_decodes_resolved_strings_like_parse_args() {
+        let s = |v: &str| Value::String(v.to_string());
+        assert_eq!(normalize_resolved(s("42")), Value::Integer(42));
+        assert_eq!(normalize_resolved(s("0.5")), Value::Float(0.5));
+        assert_eq!(normalize_resolved(s("True")), Value::Bool(true));
+        assert_eq!(normalize_resolved(s("None")), Value::Null);
+        assert_eq!(normalize_resolved(s("'hi'")), s("hi"));
+        assert_eq!(
+            normalize_resolved(s("[1, 2]")),
+            Value::List(vec![Value::Integer(1), Value::Integer(2)])
+        );
+        assert_eq!(normalize_resolved(s("Ada")), s("Ada"));
+        assert_eq!(normalize_resolved(s("[not json")), s("[not json"));
+    }
+}
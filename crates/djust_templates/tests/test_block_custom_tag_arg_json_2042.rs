@@ -29,9 +29,11 @@ use djust_core::{Context, Value};
 use djust_templates::parser::Node;
 use djust_templates::registry;
 use djust_templates::renderer::render_nodes;
+use djust_templates::tag_args::ArgPlan;
 use pyo3::ffi::c_str;
 use pyo3::prelude::*;
 use std::collections::HashMap;
+use std::sync::Arc;
 
 /// Build the context shared by every case: a list, an object, and two scalars.
 fn block_ctx() -> Context {
@@ -55,9 +57,11 @@ fn block_ctx() -> Context {
 /// Render a single `Node::BlockCustomTag` with the given args and return the
 /// handler output (the echo handler returns its first resolved arg).
 fn render_block(tag: &str, ctx: &Context, args: &[&str]) -> String {
+    let args: Vec<String> = args.iter().map(|a| a.to_string()).collect();
     let node = Node::BlockCustomTag {
         name: tag.to_string(),
-        args: args.iter().map(|a| a.to_string()).collect(),
+        plan: Arc::new(ArgPlan::compile(&args)),
+        args,
         children: vec![],
     };
     render_nodes(std::slice::from_ref(&node), ctx).expect("render block custom tag")
@@ -79,8 +83,14 @@ fn block_custom_tag_arg_resolution_json_encodes_structured_values() {
         )
         .expect("compile echo block handler module");
         let handler: Py<PyAny> = module.getattr("EchoArg").unwrap().call0().unwrap().unbind();
-        registry::register_block_tag_handler(py, tag.to_string(), format!("end{tag}"), handler)
-            .expect("register echo block handler");
+        registry::register_block_tag_handler(
+            py,
+            tag.to_string(),
+            format!("end{tag}"),
+            handler,
+            false,
+        )
+        .expect("register echo block handler");
     });
 
     let ctx = block_ctx();
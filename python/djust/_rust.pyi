@@ -222,6 +222,25 @@ def compute_template_hash(source: str) -> str:
     """
     ...
 
+def template_cache_stats() -> Dict[str, int]:
+    """Counters of the process-wide parsed-template cache.
+
+    Keys: ``entries``, ``capacity``, ``hits``, ``misses``, ``evictions``,
+    ``interned_sources`` and ``interned_bytes`` (template source bytes
+    shared by all live sessions, counted once per distinct template).
+    """
+
+def set_template_cache_capacity(capacity: int) -> None:
+    """Bound the parsed-template cache to ``capacity`` entries (least
+    recently used are evicted first).
+
+    Process-global. Django applies it once at startup from
+    `LIVEVIEW_CONFIG['template_cache_size']`; see `DjustConfig.ready`.
+    """
+
+def clear_template_cache() -> int:
+    """Drop every parsed template (dev hot reload). Returns the number dropped."""
+
 def set_virtual_keyed_ops(enabled: bool) -> None:
     """Enable/disable `[dj-virtual]` keyed splice ops in the differ (ADR-026).
 
@@ -844,6 +863,19 @@ class RustLiveView:
         """
         ...
 
+    def clone(self) -> "RustLiveView":
+        """
+        Return an independent copy of this view without a MessagePack round trip.
+
+        Carries the same fields as ``deserialize_msgpack(serialize_msgpack())``
+        (template source, state, last VDOM, version) and resets the same
+        transient caches — ``template_dirs`` must be re-set by the caller.
+
+        Returns:
+            A new ``RustLiveView`` that shares no mutable state with ``self``.
+        """
+        ...
+
     def get_timestamp(self) -> float:
         """
         Return the Unix timestamp (seconds since epoch) embedded when this view
@@ -98,6 +98,18 @@ class DjustConfig(AppConfig):
                 "[djust] applying virtual_keyed_ops to the Rust differ failed"
             )
 
+        # Same shape for the (also process-global) parsed-template cache bound.
+        try:
+            from djust import _rust
+            from djust.config import config as _cfg
+
+            if hasattr(_rust, "set_template_cache_capacity"):
+                _rust.set_template_cache_capacity(int(_cfg.get("template_cache_size")))
+        except Exception:  # noqa: BLE001 - never let a flag break startup
+            logging.getLogger("djust").exception(
+                "[djust] applying template_cache_size to the Rust template cache failed"
+            )
+
         import os
 
         if not os.environ.get("PYTEST_CURRENT_TEST"):
@@ -26,7 +26,9 @@ Usage:
 """
 
 import logging
-from typing import Any, List, Optional, Union, cast
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
@@ -34,6 +36,12 @@ from django.http import Http404
 
 logger = logging.getLogger(__name__)
 
+# View-level auth verdicts memoized for the duration of one ``mount_batch``
+# (see :func:`mount_batch_auth_cache`). ``None`` outside a batch.
+_batch_auth_verdicts: ContextVar[Optional[Dict[Tuple[Any, ...], Any]]] = ContextVar(
+    "djust_batch_auth_verdicts", default=None
+)
+
 
 def check_view_auth(view_instance: Any, request: Any) -> Optional[str]:
     """Check view-level auth. Returns None if OK, or a redirect URL if denied.
@@ -439,7 +447,11 @@ def run_pre_mount_auth(view_instance: Any, request: Any) -> Optional[str]:
     they previously wrapped ``check_view_auth`` / ``_ensure_tenant`` individually.
     """
     # 1 + 2. View-level auth (login / permission / custom / Django mixins).
-    redirect_url = check_view_auth(view_instance, request)
+    verdicts = _batch_auth_verdicts.get()
+    if verdicts is None or request is None:
+        redirect_url = check_view_auth(view_instance, request)
+    else:
+        redirect_url = _batched_check_view_auth(verdicts, view_instance, request)
     if redirect_url:
         # Auth denied via redirect — skip tenant resolve/bind, mirroring the
         # pre-existing per-transport early return on denial.
@@ -455,6 +467,39 @@ def run_pre_mount_auth(view_instance: Any, request: Any) -> Optional[str]:
     return None  # Mount may proceed.
 
 
+@contextmanager
+def mount_batch_auth_cache() -> Iterator[None]:
+    """Share view-level auth verdicts across the mounts of one ``mount_batch``.
+
+    A lazily-hydrated page often batches several instances of the same child
+    view class; inside this block :func:`run_pre_mount_auth` evaluates
+    :func:`check_view_auth` once per (view class, request path, user) and
+    replays the verdict — including a raised ``PermissionDenied`` — for the
+    rest. Tenant resolution is never cached.
+    """
+    token = _batch_auth_verdicts.set({})
+    try:
+        yield
+    finally:
+        _batch_auth_verdicts.reset(token)
+
+
+def _batched_check_view_auth(
+    verdicts: Dict[Any, Any], view_instance: Any, request: Any
+) -> Optional[str]:
+    user = getattr(request, "user", None)
+    key = (type(view_instance), request.get_full_path(), getattr(user, "pk", None))
+    if key not in verdicts:
+        try:
+            verdicts[key] = (check_view_auth(view_instance, request), None)
+        except PermissionDenied as exc:
+            verdicts[key] = (None, exc)
+    redirect_url, denied = verdicts[key]
+    if denied is not None:
+        raise denied
+    return cast(Optional[str], redirect_url)
+
+
 def check_view_auth_lightweight(view_instance: Any, request: Any) -> bool:
     """Return True if ``view_instance`` is allowed to mount under ``request``.
 
@@ -1,13 +1,15 @@
 """
 djust.backends — Pluggable backend implementations for presence, channels, etc.
 
-Configured via DJUST_CONFIG['PRESENCE_BACKEND']:
+Configured via DJUST_CONFIG['PRESENCE_BACKEND'] / DJUST_CONFIG['RATE_LIMIT_BACKEND']:
     'memory'  — In-process dict (default, single-node only)
     'redis'   — Redis-backed (multi-node production)
 """
 
 from .base import PresenceBackend
+from .rate_limit import RateLimitBackend
 
 __all__ = [
     "PresenceBackend",
+    "RateLimitBackend",
 ]
@@ -2,6 +2,7 @@
 Abstract base class for presence backends.
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -12,6 +13,11 @@ class PresenceBackend(ABC):
 
     Subclasses must implement all abstract methods to provide
     presence tracking functionality.
+
+    The live-cursor methods (``set_cursors`` / ``get_cursors`` /
+    ``remove_cursor``) have a Django-cache default so existing third-party
+    backends keep working; the bundled backends override them with
+    per-user storage.
     """
 
     @abstractmethod
@@ -48,3 +54,35 @@ class PresenceBackend(ABC):
     def health_check(self) -> Dict[str, Any]:
         """Check backend health."""
         raise NotImplementedError
+
+    # ------------------------------------------------------------------ #
+    # Live cursors
+    # ------------------------------------------------------------------ #
+
+    def set_cursors(
+        self, presence_key: str, cursors: Dict[str, Dict[str, Any]], ttl: float
+    ) -> None:
+        """Store cursor records (``user_id -> {"x", "y", "timestamp", "meta"}``)."""
+        from django.core.cache import cache
+
+        cache_key = f"djust_cursors:{presence_key}"
+        stored = cache.get(cache_key, {})
+        stored.update(cursors)
+        cache.set(cache_key, stored, timeout=int(ttl) + 5)
+
+    def get_cursors(self, presence_key: str, ttl: float) -> Dict[str, Dict[str, Any]]:
+        """Cursor records updated within the last ``ttl`` seconds."""
+        from django.core.cache import cache
+
+        cutoff = time.time() - ttl
+        stored = cache.get(f"djust_cursors:{presence_key}", {})
+        return {uid: rec for uid, rec in stored.items() if rec.get("timestamp", 0) > cutoff}
+
+    def remove_cursor(self, presence_key: str, user_id: str) -> None:
+        """Drop one user's cursor record."""
+        from django.core.cache import cache
+
+        cache_key = f"djust_cursors:{presence_key}"
+        stored = cache.get(cache_key, {})
+        if stored.pop(user_id, None) is not None:
+            cache.set(cache_key, stored)
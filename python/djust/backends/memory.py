@@ -42,6 +42,7 @@ class InMemoryPresenceBackend(PresenceBackend):
         self._heartbeats: Dict[tuple, float] = {}
         self._timeout = timeout
         self._lock = RLock()
+        self._cursors: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
     def join(self, presence_key: str, user_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
         record = {
@@ -98,6 +99,32 @@ class InMemoryPresenceBackend(PresenceBackend):
                 self._groups.pop(presence_key, None)
         return removed
 
+    def set_cursors(
+        self, presence_key: str, cursors: Dict[str, Dict[str, Any]], ttl: float
+    ) -> None:
+        with self._lock:
+            self._cursors.setdefault(presence_key, {}).update(cursors)
+
+    def get_cursors(self, presence_key: str, ttl: float) -> Dict[str, Dict[str, Any]]:
+        cutoff = time.time() - ttl
+        with self._lock:
+            room = self._cursors.get(presence_key)
+            if not room:
+                return {}
+            for uid in [uid for uid, rec in room.items() if rec["timestamp"] <= cutoff]:
+                del room[uid]
+            if not room:
+                del self._cursors[presence_key]
+            return dict(room)
+
+    def remove_cursor(self, presence_key: str, user_id: str) -> None:
+        with self._lock:
+            room = self._cursors.get(presence_key)
+            if room is not None:
+                room.pop(user_id, None)
+                if not room:
+                    del self._cursors[presence_key]
+
     def health_check(self) -> Dict[str, Any]:
         with self._lock:
             total = sum(len(g) for g in self._groups.values())
@@ -0,0 +1,294 @@
+"""
+Rate-limit backends: where ``@rate_limit`` buckets and per-IP connection
+counts live.
+
+Configured via DJUST_CONFIG['RATE_LIMIT_BACKEND']:
+    'memory' (default) — process-local buckets and counters
+    'redis'            — cluster-wide, shared by every worker
+
+With the in-memory backend each ASGI worker enforces its own budget, so 24
+workers let a ``@rate_limit(rate=10)`` handler through 240 times a second and
+``max_connections_per_ip`` is per process. The Redis backend keeps one bucket
+per ``(caller, handler)`` for the whole cluster.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from ..rate_limit import IPConnectionTracker, _HANDLER_BUCKET_CAP, _local_handler_consume
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """
+    Abstract base class for rate-limit backends.
+
+    ``consume`` is the per-caller ``@rate_limit`` token bucket shared by WS,
+    SSE and the HTTP API (see :func:`djust.rate_limit.handler_rate_check`);
+    ``connect`` / ``disconnect`` / ``add_cooldown`` back the per-IP
+    connection cap (:data:`djust.rate_limit.ip_tracker`).
+
+    Backends that do network I/O set ``blocking = True``; async callers
+    (the WS consumer) then run them in a worker thread instead of on the
+    event loop.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def consume(self, caller: str, handler_name: str, rate: float, burst: int) -> bool:
+        """Take one token from the ``(caller, handler_name)`` bucket."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def connect(self, ip: str, max_per_ip: int) -> bool:
+        """Register a connection. False if the IP is at its cap or cooling down."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def disconnect(self, ip: str) -> None:
+        """Release a connection registered with :meth:`connect`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_cooldown(self, ip: str, seconds: float) -> None:
+        """Refuse new connections from ``ip`` for ``seconds``."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Drop per-process state (used by tests)."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Process-local buckets and connection counts (the historical behaviour).
+
+    Limitations:
+        - Single-process only — every worker enforces its own budget.
+    """
+
+    def __init__(self) -> None:
+        self._ips = IPConnectionTracker()
+
+    def consume(self, caller: str, handler_name: str, rate: float, burst: int) -> bool:
+        return _local_handler_consume(caller, handler_name, rate, burst)
+
+    def connect(self, ip: str, max_per_ip: int) -> bool:
+        return self._ips.connect(ip, max_per_ip)
+
+    def disconnect(self, ip: str) -> None:
+        self._ips.disconnect(ip)
+
+    def add_cooldown(self, ip: str, seconds: float) -> None:
+        self._ips.add_cooldown(ip, seconds)
+
+
+# Token bucket, refilled from the Redis clock so workers on different hosts
+# agree on elapsed time. Grants up to ARGV[3] tokens (a lease) and returns
+# how many were granted.
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+-- A non-positive rate never refills; keep the bucket for an hour instead of
+-- dividing by zero in the TTL.
+local ttl = 3600000
+if rate > 0 then
+    ttl = math.ceil(burst / rate * 1000) + 1000
+else
+    rate = 0
+end
+local tokens = tonumber(b[1])
+local ts = tonumber(b[2])
+if tokens == nil or ts == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(want, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', string.format('%.6f', tokens),
+           'ts', string.format('%.6f', now))
+redis.call('PEXPIRE', KEYS[1], ttl)
+return granted
+"""
+
+# -1 = cooling down, 0 = at the cap, 1 = registered.
+_CONNECT_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return -1
+end
+local n = tonumber(redis.call('GET', KEYS[1]) or '0')
+if n >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+_DISCONNECT_SCRIPT = """
+local n = redis.call('DECR', KEYS[1])
+if n <= 0 then
+    redis.call('DEL', KEYS[1])
+end
+return n
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Cluster-wide rate limiting on Redis.
+
+    Redis keys used::
+
+        djust:ratelimit:bucket:{caller}:{handler} — hash (tokens, ts)
+        djust:ratelimit:conn:{ip}                 — connection count
+        djust:ratelimit:cooldown:{ip}             — set while cooling down
+
+    Every bucket update is one atomic Lua call. To avoid a Redis round trip
+    per event, a worker takes a *lease* of up to ``lease_size`` tokens at a
+    time — never more than ``lease_ttl`` seconds of refill — and spends it
+    locally; unspent leased tokens lapse after ``lease_ttl``. Leased tokens
+    come out of the shared bucket, so the cluster never exceeds the
+    configured rate; low-rate handlers (less than one token per
+    ``lease_ttl``) always go to Redis and stay exact.
+
+    Connection counts expire ``connection_ttl`` seconds after the last
+    connect so a crashed worker cannot pin an IP at its cap forever.
+
+    Every call is bounded by ``socket_timeout`` seconds. If Redis is slow or
+    unreachable the backend logs a warning and fails open to process-local
+    limits for that call rather than stalling or failing every event. The
+    client is synchronous, so the backend is ``blocking``: the WS consumer
+    runs it off the event loop.
+
+    Requires: pip install redis
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        key_prefix: str = "djust:ratelimit",
+        lease_size: int = 16,
+        lease_ttl: float = 0.25,
+        connection_ttl: int = 3600,
+        socket_timeout: float = 0.5,
+    ) -> None:
+        try:
+            import redis as redis_lib
+        except ImportError:
+            raise ImportError(
+                "redis is required for RedisRateLimitBackend. Install with: pip install redis"
+            )
+
+        self._client = redis_lib.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+        self._prefix = key_prefix
+        self._lease_size = max(1, int(lease_size))
+        self._lease_ttl = lease_ttl
+        self._connection_ttl = connection_ttl
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+        self._connect = self._client.register_script(_CONNECT_SCRIPT)
+        self._disconnect = self._client.register_script(_DISCONNECT_SCRIPT)
+        # (caller, handler) -> [tokens left, expires at]
+        self._leases: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._leases_lock = threading.Lock()
+        self._fallback = InMemoryRateLimitBackend()
+
+        try:
+            self._client.ping()
+            logger.info("RedisRateLimitBackend connected to %s", redis_url)
+        except Exception as e:
+            logger.error("RedisRateLimitBackend failed to connect: %s", e)
+            raise
+
+    def _lease_for(self, rate: float, burst: int) -> int:
+        return max(1, min(self._lease_size, int(rate * self._lease_ttl), int(burst)))
+
+    def consume(self, caller: str, handler_name: str, rate: float, burst: int) -> bool:
+        key = (caller, handler_name)
+        want = self._lease_for(rate, burst)
+        if want > 1:
+            now = time.monotonic()
+            with self._leases_lock:
+                lease = self._leases.get(key)
+                if lease is not None and lease[0] >= 1 and lease[1] > now:
+                    lease[0] -= 1
+                    return True
+
+        try:
+            granted = int(
+                self._take(
+                    keys=[f"{self._prefix}:bucket:{caller}:{handler_name}"],
+                    args=[rate, burst, want],
+                )
+            )
+        except Exception as e:
+            logger.warning("Rate-limit Redis call failed, using local bucket: %s", e)
+            return self._fallback.consume(caller, handler_name, rate, burst)
+
+        if granted <= 0:
+            return False
+        if granted > 1:
+            with self._leases_lock:
+                self._leases[key] = [granted - 1, time.monotonic() + self._lease_ttl]
+                self._leases.move_to_end(key)
+                while len(self._leases) > _HANDLER_BUCKET_CAP:
+                    self._leases.popitem(last=False)
+        return True
+
+    def connect(self, ip: str, max_per_ip: int) -> bool:
+        try:
+            result = self._connect(
+                keys=[f"{self._prefix}:conn:{ip}", f"{self._prefix}:cooldown:{ip}"],
+                args=[max_per_ip, self._connection_ttl],
+            )
+        except Exception as e:
+            logger.warning("Rate-limit Redis call failed, using local tracker: %s", e)
+            return self._fallback.connect(ip, max_per_ip)
+        return int(result) == 1
+
+    def disconnect(self, ip: str) -> None:
+        try:
+            self._disconnect(keys=[f"{self._prefix}:conn:{ip}"])
+        except Exception as e:
+            logger.warning("Rate-limit Redis call failed, using local tracker: %s", e)
+            self._fallback.disconnect(ip)
+
+    def add_cooldown(self, ip: str, seconds: float) -> None:
+        try:
+            self._client.set(f"{self._prefix}:cooldown:{ip}", "1", px=max(1, int(seconds * 1000)))
+        except Exception as e:
+            logger.warning("Rate-limit Redis call failed, using local tracker: %s", e)
+            self._fallback.add_cooldown(ip, seconds)
+
+    def reset(self) -> None:
+        with self._leases_lock:
+            self._leases.clear()
+
+    def health_check(self) -> Dict[str, Any]:
+        start = time.time()
+        try:
+            self._client.ping()
+            return {
+                "status": "healthy",
+                "backend": "redis",
+                "latency_ms": round((time.time() - start) * 1000, 2),
+            }
+        except Exception as e:
+            return {"status": "unhealthy", "backend": "redis", "error": str(e)}
@@ -29,8 +29,10 @@ class RedisPresenceBackend(PresenceBackend):
     Redis-backed presence store using sorted sets.
 
     Redis keys used per presence group:
-        djust:presence:{key}:zset   — sorted set (user_id → heartbeat timestamp)
-        djust:presence:{key}:meta   — hash (user_id → JSON metadata)
+        djust:presence:{key}:zset    — sorted set (user_id → heartbeat timestamp)
+        djust:presence:{key}:meta    — hash (user_id → JSON metadata)
+        djust:presence:{key}:cursors — hash (user_id → JSON cursor record),
+                                       each field expiring on its own (HEXPIRE)
 
     Benefits over the Django-cache approach:
         - Atomic operations (no read-modify-write races)
@@ -55,6 +57,9 @@ class RedisPresenceBackend(PresenceBackend):
         self._client = redis_lib.from_url(redis_url, decode_responses=True)
         self._prefix = key_prefix
         self._timeout = timeout
+        # Per-field TTL needs Redis >= 7.4 (HEXPIRE); older servers fall back
+        # to the key TTL plus the timestamp filter in get_cursors().
+        self._field_ttl = True
 
         # Verify connection
         try:
@@ -70,6 +75,9 @@ class RedisPresenceBackend(PresenceBackend):
     def _meta_key(self, presence_key: str) -> str:
         return f"{self._prefix}:{presence_key}:meta"
 
+    def _cursor_key(self, presence_key: str) -> str:
+        return f"{self._prefix}:{presence_key}:cursors"
+
     def join(self, presence_key: str, user_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
         now = time.time()
         record = {
@@ -161,6 +169,51 @@ class RedisPresenceBackend(PresenceBackend):
         logger.debug("Cleaned %d stale presences from %s", len(stale), presence_key)
         return len(stale)
 
+    def set_cursors(
+        self, presence_key: str, cursors: Dict[str, Dict[str, Any]], ttl: float
+    ) -> None:
+        if not cursors:
+            return
+        key = self._cursor_key(presence_key)
+        seconds = max(1, int(ttl))
+        pipe = self._client.pipeline()
+        pipe.hset(key, mapping={uid: json.dumps(rec) for uid, rec in cursors.items()})
+        pipe.expire(key, seconds + 5)
+        # Per-field TTLs need redis-py 5.1+ and a 7.4+ server; otherwise fall
+        # back to the key TTL from now on.
+        self._field_ttl = self._field_ttl and hasattr(pipe, "hexpire")
+        if self._field_ttl:
+            pipe.hexpire(key, seconds, *cursors)
+        results = pipe.execute(raise_on_error=False)
+        for result in results[:2]:
+            if isinstance(result, Exception):
+                raise result
+        if self._field_ttl and isinstance(results[2], Exception):
+            logger.debug("HEXPIRE unavailable, using key TTL for cursors: %s", results[2])
+            self._field_ttl = False
+
+    def get_cursors(self, presence_key: str, ttl: float) -> Dict[str, Dict[str, Any]]:
+        key = self._cursor_key(presence_key)
+        cutoff = time.time() - ttl
+        cursors: Dict[str, Dict[str, Any]] = {}
+        stale = []
+        for uid, raw in self._client.hgetall(key).items():
+            try:
+                record = json.loads(raw)
+            except (json.JSONDecodeError, TypeError):
+                stale.append(uid)
+                continue
+            if record.get("timestamp", 0) > cutoff:
+                cursors[uid] = record
+            else:
+                stale.append(uid)
+        if stale:
+            self._client.hdel(key, *stale)
+        return cursors
+
+    def remove_cursor(self, presence_key: str, user_id: str) -> None:
+        self._client.hdel(self._cursor_key(presence_key), user_id)
+
     def health_check(self) -> Dict[str, Any]:
         start = time.time()
         try:
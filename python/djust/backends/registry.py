@@ -1,16 +1,23 @@
 """
-Global presence backend registry.
+Global presence and rate-limit backend registries.
 
 Reads DJUST_CONFIG['PRESENCE_BACKEND'] from Django settings:
     'memory' (default) — InMemoryPresenceBackend
     'redis'            — RedisPresenceBackend
+
+Reads DJUST_CONFIG['RATE_LIMIT_BACKEND'] from Django settings:
+    'memory' (default) — InMemoryRateLimitBackend
+    'redis'            — RedisRateLimitBackend
 """
 
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from .base import PresenceBackend
 from ..utils import BackendRegistry
 
+if TYPE_CHECKING:
+    from .rate_limit import RateLimitBackend
+
 
 def _create_presence_backend(backend_type: str, config: dict) -> PresenceBackend:
     """Factory that creates the appropriate presence backend from config."""
@@ -59,3 +66,60 @@ def set_presence_backend(backend: PresenceBackend) -> None:
 def reset_presence_backend() -> None:
     """Reset to force re-initialization on next access."""
     _registry.reset()
+
+
+def _create_rate_limit_backend(backend_type: str, config: dict) -> "RateLimitBackend":
+    """Factory that creates the appropriate rate-limit backend from config."""
+    if backend_type == "redis":
+        from .rate_limit import RedisRateLimitBackend
+
+        redis_url = config.get(
+            "RATE_LIMIT_REDIS_URL",
+            config.get("REDIS_URL", "redis://localhost:6379/0"),
+        )
+        return RedisRateLimitBackend(
+            redis_url=redis_url,
+            key_prefix=config.get("RATE_LIMIT_REDIS_PREFIX", "djust:ratelimit"),
+            lease_size=config.get("RATE_LIMIT_LEASE_SIZE", 16),
+            lease_ttl=config.get("RATE_LIMIT_LEASE_TTL", 0.25),
+            socket_timeout=config.get("RATE_LIMIT_REDIS_TIMEOUT", 0.5),
+        )
+    else:
+        from .rate_limit import InMemoryRateLimitBackend
+
+        return InMemoryRateLimitBackend()
+
+
+_rate_limit_registry = BackendRegistry(
+    config_key="RATE_LIMIT_BACKEND",
+    default_type="memory",
+    factory=_create_rate_limit_backend,
+    name="rate-limit",
+)
+
+
+def get_rate_limit_backend() -> "RateLimitBackend":
+    """
+    Get or initialize the configured rate-limit backend.
+
+    Configuration in settings.py::
+
+        DJUST_CONFIG = {
+            'RATE_LIMIT_BACKEND': 'redis',
+            'RATE_LIMIT_REDIS_URL': 'redis://localhost:6379/3',
+            'RATE_LIMIT_LEASE_SIZE': 16,    # max tokens reserved per Redis call
+            'RATE_LIMIT_LEASE_TTL': 0.25,   # seconds a reservation stays usable
+            'RATE_LIMIT_REDIS_TIMEOUT': 0.5,  # seconds before failing open to local limits
+        }
+    """
+    return cast("RateLimitBackend", _rate_limit_registry.get())
+
+
+def set_rate_limit_backend(backend: "RateLimitBackend") -> None:
+    """Manually set the rate-limit backend (useful for testing)."""
+    _rate_limit_registry.set(backend)
+
+
+def reset_rate_limit_backend() -> None:
+    """Reset to force re-initialization on next access."""
+    _rate_limit_registry.reset()
@@ -0,0 +1,292 @@
+"""
+Per-key assign tracking for ``LiveView.track_assigns`` views.
+
+The default change detection (``websocket._snapshot_assigns``) fingerprints
+every assign before and after each event — O(state), and blind to in-place
+mutations past 100 list items / 50 dict keys. Views that opt in get an
+``AssignTracker`` instead: ``__setattr__`` / ``__delattr__`` and tracked
+container wrappers bump a per-key version the moment a key changes, so the
+snapshot is a copy of that small version map and large collections are
+tracked exactly.
+
+``TrackedList`` / ``TrackedDict`` / ``TrackedSet`` are plain ``list`` /
+``dict`` / ``set`` subclasses (they serialize, JSON-encode and cross into
+Rust unchanged, and pickle / copy back to the plain type). Containers are
+wrapped when assigned, recursively through nested lists / dicts / sets, so
+``self.todos[3]["done"] = True`` marks ``todos``. Because wrapping copies
+the container, mutate it through the view attribute (``self.items``), not
+through a reference taken before the assignment.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, Set
+
+__all__ = [
+    "AssignTracker",
+    "TrackedDict",
+    "TrackedList",
+    "TrackedSet",
+    "tracked_delattr",
+    "tracked_setattr",
+]
+
+_MISSING = object()
+
+# Values compared by equality on reassignment; everything else by identity
+# (mirrors ``websocket._IMMUTABLE_TYPES``).
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), bytes, tuple, frozenset)
+
+
+class AssignTracker:
+    """Per-view version map of changed assigns.
+
+    ``versions`` maps an attribute name to a counter bumped on every change;
+    ``_snapshot_assigns`` copies it, so two snapshots differ exactly on the
+    keys that changed in between.
+    """
+
+    __slots__ = ("versions", "_seq", "ignored")
+
+    def __init__(self, ignored: Iterable[str] = ()) -> None:
+        self.versions: Dict[str, int] = {}
+        self._seq = 0
+        self.ignored: FrozenSet[str] = frozenset(ignored)
+
+    def mark(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._seq += 1
+            self.versions[key] = self._seq
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self.versions)
+
+    def wrap(self, value: Any, keys: Set[str]) -> Any:
+        """Return ``value`` with exact list / dict / set containers replaced
+        by tracked copies reporting to ``keys`` (shared, not copied, so an
+        alias assigned to a second attribute reports to both)."""
+        cls = type(value)
+        if cls in _TRACKED_TYPES:
+            if value._tracker is self:
+                value._keys.update(keys)
+                return value
+            cls = _TRACKED_TYPES[cls]
+        elif cls in _WRAPPERS:
+            cls = _WRAPPERS[cls]
+        else:
+            return value
+        return cls(self, keys, value)
+
+
+def _bind(container: Any, tracker: AssignTracker, keys: Set[str]) -> None:
+    container._tracker = tracker
+    container._keys = keys
+
+
+class TrackedList(list):
+    """``list`` that marks its owning assign(s) dirty on mutation."""
+
+    __slots__ = ("_tracker", "_keys")
+
+    def __init__(self, tracker: AssignTracker, keys: Set[str], items: Iterable[Any] = ()) -> None:
+        _bind(self, tracker, keys)
+        super().__init__(tracker.wrap(item, keys) for item in items)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (list, (list(self),))
+
+    def _changed(self) -> None:
+        self._tracker.mark(self._keys)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = [self._tracker.wrap(v, self._keys) for v in value]
+        else:
+            value = self._tracker.wrap(value, self._keys)
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other: Iterable[Any]) -> "TrackedList":  # type: ignore[override,misc]
+        self.extend(other)
+        return self
+
+    def __imul__(self, n: Any) -> "TrackedList":  # type: ignore[override,misc]
+        super().__imul__(n)
+        self._changed()
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(self._tracker.wrap(value, self._keys))
+        self._changed()
+
+    def extend(self, values: Iterable[Any]) -> None:
+        super().extend([self._tracker.wrap(v, self._keys) for v in values])
+        self._changed()
+
+    def insert(self, index: Any, value: Any) -> None:
+        super().insert(index, self._tracker.wrap(value, self._keys))
+        self._changed()
+
+    def pop(self, index: Any = -1) -> Any:
+        value = super().pop(index)
+        self._changed()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
+class TrackedDict(dict):
+    """``dict`` that marks its owning assign(s) dirty on mutation."""
+
+    __slots__ = ("_tracker", "_keys")
+
+    def __init__(self, tracker: AssignTracker, keys: Set[str], items: Any = ()) -> None:
+        _bind(self, tracker, keys)
+        super().__init__((k, tracker.wrap(v, keys)) for k, v in dict(items).items())
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (dict, (dict(self),))
+
+    def _changed(self) -> None:
+        self._tracker.mark(self._keys)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, self._tracker.wrap(value, self._keys))
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "TrackedDict":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        super().update(
+            (k, self._tracker.wrap(v, self._keys)) for k, v in dict(*args, **kwargs).items()
+        )
+        self._changed()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+class TrackedSet(set):
+    """``set`` that marks its owning assign(s) dirty on mutation."""
+
+    __slots__ = ("_tracker", "_keys")
+
+    def __init__(self, tracker: AssignTracker, keys: Set[str], items: Iterable[Any] = ()) -> None:
+        _bind(self, tracker, keys)
+        super().__init__(items)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (set, (set(self),))
+
+    def _changed(self) -> None:
+        self._tracker.mark(self._keys)
+
+
+def _mutator(name: str) -> Any:
+    base = getattr(set, name)
+
+    def method(self: TrackedSet, *args: Any) -> Any:
+        result = base(self, *args)
+        self._changed()
+        # In-place operators must return self so ``s |= x`` keeps the wrapper.
+        return self if name.startswith("__i") else result
+
+    method.__name__ = name
+    return method
+
+
+for _name in (
+    "add",
+    "discard",
+    "remove",
+    "pop",
+    "clear",
+    "update",
+    "difference_update",
+    "intersection_update",
+    "symmetric_difference_update",
+    "__ior__",
+    "__iand__",
+    "__isub__",
+    "__ixor__",
+):
+    setattr(TrackedSet, _name, _mutator(_name))
+
+_WRAPPERS: Dict[type, type] = {list: TrackedList, dict: TrackedDict, set: TrackedSet}
+_TRACKED_TYPES: Dict[type, type] = {
+    TrackedList: TrackedList,
+    TrackedDict: TrackedDict,
+    TrackedSet: TrackedSet,
+}
+
+
+def tracked_setattr(self: Any, name: str, value: Any) -> None:
+    """``__setattr__`` installed on ``track_assigns`` views."""
+    state = self.__dict__
+    tracker = state.get("_assign_tracker")
+    if (
+        tracker is None
+        or "_framework_attrs" not in state  # still in __init__: framework slots
+        or name in tracker.ignored
+        or name in state["_framework_attrs"]
+    ):
+        object.__setattr__(self, name, value)
+        return
+
+    old = state.get(name, _MISSING)
+    value = tracker.wrap(value, {name})
+    object.__setattr__(self, name, value)
+    if old is value:
+        return
+    if type(old) in _TRACKED_TYPES and old._tracker is tracker:
+        # The replaced container no longer backs this assign.
+        old._keys.discard(name)
+    if type(old) is type(value) and isinstance(value, _IMMUTABLE_TYPES) and old == value:
+        return
+    tracker.mark((name,))
+
+
+def tracked_delattr(self: Any, name: str) -> None:
+    """``__delattr__`` installed on ``track_assigns`` views."""
+    object.__delattr__(self, name)
+    tracker = self.__dict__.get("_assign_tracker")
+    if tracker is not None and name not in tracker.ignored:
+        tracker.mark((name,))
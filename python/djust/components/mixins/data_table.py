@@ -32,7 +32,8 @@ import io
 import json
 import math
 import re
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from djust.components.utils import format_cell, interpolate_color_gradient
 from djust.decorators import event_handler
@@ -189,6 +190,51 @@ def _safe_eval_arithmetic(expression: str, namespace: Dict[str, Any]) -> float:
     return parser.parse()
 
 
+# Server-mode caches: distinct filter signatures kept for counts / facets /
+# stats before the oldest is evicted.
+_TABLE_COUNT_CACHE_MAX = 32
+
+
+def _keyset_after(fields: List[str], values: Tuple[Any, ...], desc: bool) -> Any:
+    """``Q`` matching rows strictly after ``values`` in ``fields`` order."""
+    from django.db.models import Q
+
+    op = "lt" if desc else "gt"
+    after = Q(**{f"{fields[0]}__{op}": values[0]})
+    if len(fields) > 1:
+        after |= Q(**{fields[0]: values[0], f"{fields[1]}__{op}": values[1]})
+    return after
+
+
+def _is_numeric_column(qs: Any, key: str) -> bool:
+    """True when ``key`` on ``qs`` is a numeric field or annotation.
+
+    Unknown keys count as numeric so the aggregate reports the database's
+    own error rather than silently dropping ``avg`` / ``sum``.
+    """
+    from django.core.exceptions import FieldDoesNotExist
+    from django.db import models
+
+    annotation = qs.query.annotations.get(key)
+    if annotation is not None:
+        field = getattr(annotation, "output_field", None)
+    else:
+        try:
+            field = qs.model._meta.get_field(key)
+        except FieldDoesNotExist:
+            return True
+    return isinstance(field, (models.IntegerField, models.FloatField, models.DecimalField))
+
+
+def _stat_number(value: Any) -> Any:
+    """Return numeric aggregate results (incl. ``Decimal``) as float; others unchanged."""
+    from decimal import Decimal
+
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
 # Minimal context returned by ``DataTableMixin.get_table_context()`` when
 # ``init_table_state()`` hasn't been called yet (e.g. during the pre-mount
 # ``get_context_data()`` build of the initial Rust VDOM snapshot — see
@@ -425,6 +471,13 @@ class DataTableMixin:
     table_row_click_value_key = "id"  # which row key to send as data-value
     table_row_url = ""  # if set, row becomes a static link (Option A in #1111)
 
+    # Server-mode (database-side) pipeline configuration
+    table_search_mode = "icontains"  # "icontains", or "fulltext" / "trigram" on PostgreSQL
+    table_trigram_threshold = 0.3  # minimum word similarity for "trigram" search
+    table_keyset_pagination = True  # seek past the previous page instead of a deep OFFSET
+    table_facet_limit = 50  # most frequent values per facet column (0 = unlimited)
+    table_count_cache_ttl = 30.0  # seconds counts/facets/stats are reused (0 = no cache)
+
     def init_table_state(self) -> None:
         """Initialize instance state. Call from mount()."""
         # Resolve None class-level defaults to fresh instances
@@ -1333,14 +1386,41 @@ class DataTableMixin:
         return []
 
     def _apply_table_search(self, qs: Any) -> Any:
-        """Apply global search across searchable fields."""
+        """Apply global search across searchable fields.
+
+        ``table_search_mode`` selects the strategy: ``"icontains"`` (an OR
+        of ``__icontains`` lookups, any backend), ``"fulltext"`` (one
+        ``SearchVector`` match, GIN-indexable) or ``"trigram"`` (word
+        similarity, needs the ``pg_trgm`` extension). The PostgreSQL modes
+        fall back to ``"icontains"`` on other databases.
+        """
         if not self.table_search_query or not self.table_searchable_fields:
             return qs
+        from django.db import connections
         from django.db.models import Q
 
+        fields = list(self.table_searchable_fields)
+        query = self.table_search_query
+        mode = self.table_search_mode
+        if mode in ("fulltext", "trigram") and connections[qs.db].vendor == "postgresql":
+            if mode == "fulltext":
+                from django.contrib.postgres.search import SearchQuery, SearchVector
+
+                return qs.alias(_dj_search=SearchVector(*fields)).filter(
+                    _dj_search=SearchQuery(query, search_type="websearch")
+                )
+            from django.contrib.postgres.search import TrigramWordSimilarity
+            from django.db.models.functions import Greatest
+
+            similarities = [TrigramWordSimilarity(query, field) for field in fields]
+            similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+            return qs.alias(_dj_similarity=similarity).filter(
+                _dj_similarity__gte=self.table_trigram_threshold
+            )
+
         q = Q()
-        for field in self.table_searchable_fields:
-            q |= Q(**{f"{field}__icontains": self.table_search_query})
+        for field in fields:
+            q |= Q(**{f"{field}__icontains": query})
         return qs.filter(q)
 
     def _apply_table_filters(self, qs: Any) -> Any:
@@ -1389,8 +1469,200 @@ class DataTableMixin:
             self.get_column_stats()
 
     def refresh_table_server(self) -> None:
-        """Override this in server_mode to populate table_rows, table_total_pages, etc.
+        """Database-side pipeline, called by refresh_table() when table_server_mode is True.
+
+        Search, filters, ordering and pagination run as SQL, facet counts as
+        ``values().annotate(Count)`` and column stats as one ``aggregate()``
+        over the whole filtered queryset (not just the visible page). The
+        total count, facets and stats are cached per filter signature for
+        ``table_count_cache_ttl`` seconds, so paging and re-sorting only
+        fetch the page. With ``table_keyset_pagination`` a page is fetched
+        by seeking past the last row of the nearest page already visited,
+        so stepping through deep pages never scans a large OFFSET. Keyset
+        only helps sequential paging: jumping straight to a far page still
+        OFFSETs over the pages between it and the nearest visited one (or
+        the start).
+
+        Override to populate ``table_rows``, ``table_total_pages``, etc.
+        yourself; call ``invalidate_table_cache()`` after writes that change
+        the table's rows.
+        """
+        from django.db.models import QuerySet
 
-        Called by refresh_table() when table_server_mode is True.
+        qs = self.get_table_queryset()
+        if not isinstance(qs, QuerySet):
+            self.table_rows = list(qs)
+            self.table_total_pages = 1
+            return
+        qs = self._apply_table_filters(self._apply_table_search(qs))
+        if self.table_page_size > 0:
+            total = self._table_cached("count", qs.count)
+            self.table_total_pages = max(1, math.ceil(total / self.table_page_size))
+            self.table_rows = self._fetch_table_page(qs)
+        else:
+            self.table_rows = list(self._apply_table_sort(qs).values())
+        if self.table_facets:
+            self.table_facet_counts = self._table_cached(
+                "facets", lambda: self.get_queryset_facet_counts(qs)
+            )
+        if self.table_show_stats:
+            self.table_column_stats = self._table_cached(
+                "stats", lambda: self.get_queryset_column_stats(qs)
+            )
+
+    def get_queryset_facet_counts(self, qs: Any) -> Dict[str, Any]:
+        """Compute facet counts for filterable columns with one GROUP BY each.
+
+        Keeps the ``table_facet_limit`` most frequent values per column.
         """
-        pass
+        from django.db.models import Count
+
+        counts: Dict[str, Any] = {}
+        for col in self.table_columns or []:
+            if not isinstance(col, dict) or not col.get("filterable", False):
+                continue
+            key = col.get("key", "")
+            groups = qs.order_by().values(key).annotate(_dj_count=Count("pk"))
+            groups = groups.order_by("-_dj_count", key)
+            if self.table_facet_limit > 0:
+                groups = groups[: self.table_facet_limit]
+            col_counts: Dict[str, int] = {}
+            for group in groups:
+                # str(None) == "None": NULLs get the same bucket as in
+                # get_facet_counts.
+                val = str(group[key])
+                if val:
+                    col_counts[val] = col_counts.get(val, 0) + group["_dj_count"]
+            counts[key] = col_counts
+        return counts
+
+    def get_queryset_column_stats(self, qs: Any) -> Dict[str, Any]:
+        """Compute column statistics for ``stats`` columns in one ``aggregate()``.
+
+        ``avg`` and ``sum`` are only aggregated for numeric columns (``None``
+        otherwise). Numeric results are returned as floats; ``min`` / ``max``
+        of other columns (dates, strings) are passed through unchanged.
+        """
+        from django.db.models import Avg, Count, Max, Min, Sum
+
+        keys = [
+            col.get("key", "")
+            for col in self.table_columns or []
+            if isinstance(col, dict) and col.get("stats", False)
+        ]
+        if not keys:
+            return {}
+        aggregates: Dict[str, Any] = {}
+        numeric = [_is_numeric_column(qs, key) for key in keys]
+        for i, key in enumerate(keys):
+            aggregates[f"min_{i}"] = Min(key)
+            aggregates[f"max_{i}"] = Max(key)
+            aggregates[f"count_{i}"] = Count(key)
+            if numeric[i]:
+                aggregates[f"avg_{i}"] = Avg(key)
+                aggregates[f"sum_{i}"] = Sum(key)
+        result = qs.order_by().aggregate(**aggregates)
+        stats: Dict[str, Dict[str, Any]] = {}
+        for i, key in enumerate(keys):
+            count = result[f"count_{i}"]
+            if not count:
+                stats[key] = {"min": None, "max": None, "avg": None, "sum": None, "count": 0}
+                continue
+            avg = _stat_number(result.get(f"avg_{i}"))
+            stats[key] = {
+                "min": _stat_number(result[f"min_{i}"]),
+                "max": _stat_number(result[f"max_{i}"]),
+                "avg": round(avg, 2) if isinstance(avg, float) else avg,
+                "sum": _stat_number(result.get(f"sum_{i}")),
+                "count": count,
+            }
+        return stats
+
+    def invalidate_table_cache(self) -> None:
+        """Drop cached server-mode counts, facets, stats and keyset cursors."""
+        self._table_count_cache = {}
+        self._table_cursors = {}
+
+    def _table_filter_signature(self) -> Tuple[Any, ...]:
+        return (
+            self.table_search_mode,
+            self.table_search_query,
+            tuple(sorted((str(k), str(v)) for k, v in self.table_filters.items() if v)),
+        )
+
+    def _table_cached(self, part: str, compute: Callable[[], Any]) -> Any:
+        """Return ``compute()``, reused while the filter signature is unchanged."""
+        ttl = self.table_count_cache_ttl
+        if not ttl or ttl <= 0:
+            return compute()
+        cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = getattr(self, "_table_count_cache", {})
+        self._table_count_cache = cache
+        key = (part,) + self._table_filter_signature()
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        value = compute()
+        cache.pop(key, None)
+        if len(cache) >= _TABLE_COUNT_CACHE_MAX:
+            cache.pop(next(iter(cache)))
+        cache[key] = (now, value)
+        return value
+
+    def _table_seek_fields(self, qs: Any) -> Optional[List[str]]:
+        """Return the ``[sort field, pk]`` ordering keyset pagination seeks on.
+
+        ``None`` means the ordering cannot be seeked and OFFSET is used: a
+        nullable or relational sort column (NULL placement and related-model
+        ordering differ per backend), or no sort with the queryset's own
+        ordering, which is kept as-is.
+        """
+        from django.core.exceptions import FieldDoesNotExist
+
+        meta = qs.model._meta
+        pk = meta.pk.attname
+        sort = self.table_sort_by
+        if not sort:
+            return None if qs.ordered else [pk]
+        if sort in ("pk", meta.pk.name, pk):
+            return [pk]
+        try:
+            field = meta.get_field(sort)
+        except FieldDoesNotExist:
+            return None
+        if not getattr(field, "concrete", False) or field.is_relation or field.null:
+            return None
+        return [field.attname, pk]
+
+    def _fetch_table_page(self, qs: Any) -> List[Dict[str, Any]]:
+        """Fetch the rows of ``table_page``, by keyset when possible.
+
+        The seek starts from the nearest lower page whose cursor is known;
+        the pages in between are skipped with an OFFSET, so a deep jump
+        with no visited page near it costs what plain OFFSET paging does.
+        """
+        size = self.table_page_size
+        page = max(1, self.table_page)
+        fields = self._table_seek_fields(qs) if self.table_keyset_pagination else None
+        if fields is None:
+            start = (page - 1) * size
+            return list(self._apply_table_sort(qs)[start : start + size].values())
+
+        desc = self.table_sort_desc and bool(self.table_sort_by)
+        qs = qs.order_by(*(f"-{f}" if desc else f for f in fields))
+        signature = self._table_filter_signature() + (tuple(fields), desc)
+        cursors: Dict[Tuple[Any, ...], Tuple[Any, ...]] = getattr(self, "_table_cursors", {})
+        self._table_cursors = cursors
+        # A cursor is the seek key of the last row on an already-fetched page.
+        known = [p for (sig, p) in cursors if sig == signature and p < page]
+        start = (page - 1) * size
+        if known:
+            nearest = max(known)
+            qs = qs.filter(_keyset_after(fields, cursors[(signature, nearest)], desc))
+            start = (page - 1 - nearest) * size
+        rows = list(qs[start : start + size].values())
+        if len(rows) == size:
+            for key in [k for k in cursors if k[0] != signature]:
+                del cursors[key]
+            cursors[(signature, page)] = tuple(rows[-1][f] for f in fields)
+        return rows
@@ -43,13 +43,21 @@ from djust.components.utils import (
 # ---------------------------------------------------------------------------
 
 
-def _parse_args(args: list[str], context: dict[str, object]) -> dict[str, object]:
+def _parse_args(
+    args: "list[str] | dict[str, object]", context: dict[str, object]
+) -> dict[str, object]:
     """Parse handler arg list ["key='val'", "key2=var"] into a dict.
 
     Resolves variable references against the template context dict.
     Values that are JSON-encoded lists/objects (from the Rust engine's
     variable resolution) are deserialized automatically.
+
+    Handlers registered with ``prepared_args=True`` already receive the
+    dict — compiled once per tag by the Rust engine — and it is returned
+    as-is.
     """
+    if isinstance(args, dict):
+        return args
 
     result: dict[str, object] = {}
     for arg in args:
@@ -2011,11 +2019,25 @@ BLOCK_HANDLERS = [
 ]
 
 
+# Handlers that read their raw arg list rather than going through
+# _parse_args; they keep the ["key=value", ...] string form.
+_RAW_ARG_TAGS = frozenset({"kbd"})
+
+
+def _supports_prepared_args(register: Any) -> bool:
+    """True if the compiled engine accepts ``prepared_args=`` (older builds don't)."""
+    return "prepared_args" in (getattr(register, "__text_signature__", None) or "")
+
+
 def register_with_rust_engine() -> None:
     """Register all component tag handlers with the Rust template engine.
 
     Called from DjustComponentsConfig.ready(). Safe to call multiple times
     (subsequent calls overwrite existing registrations).
+
+    Handlers are registered with ``prepared_args=True`` where the engine
+    supports it: each tag's arguments are compiled once and arrive as a
+    ready dict instead of strings that ``_parse_args`` re-parses per call.
     """
     try:
         from djust._rust import (  # type: ignore[import]
@@ -2027,11 +2049,18 @@ def register_with_rust_engine() -> None:
         # Django template engine with {% load djust_components %})
         return
 
+    prepared = _supports_prepared_args(register_tag_handler)
     for tag_name, handler in INLINE_HANDLERS:
-        register_tag_handler(tag_name, handler)
+        if prepared and tag_name not in _RAW_ARG_TAGS:
+            register_tag_handler(tag_name, handler, prepared_args=True)
+        else:
+            register_tag_handler(tag_name, handler)
 
     for tag_name, end_tag, handler in BLOCK_HANDLERS:
-        register_block_tag_handler(tag_name, end_tag, handler)
+        if prepared and tag_name not in _RAW_ARG_TAGS:
+            register_block_tag_handler(tag_name, end_tag, handler, prepared_args=True)
+        else:
+            register_block_tag_handler(tag_name, end_tag, handler)
 
     # Component system (v0.5.0): {% call %}, {% component %}, {% slot %},
     # {% render_slot %}. Registered here so the tags are available without
@@ -0,0 +1,91 @@
+"""Component tag handlers take precompiled (prepared) keyword arguments.
+
+With ``prepared_args=True`` the Rust engine compiles a tag's arg list once
+and passes a dict; ``_parse_args`` returns it unchanged, so handlers render
+the same markup from either form.
+"""
+
+from unittest.mock import patch
+
+from djust.components import rust_handlers
+from djust.components.rust_handlers import CardHandler, DjButtonHandler, _parse_args
+
+
+def test_parse_args_returns_prepared_dict_as_is():
+    kwargs = {"title": "Hi", "open": True, "items": [1, 2]}
+    assert _parse_args(kwargs, {}) is kwargs
+
+
+def test_string_path_number_sniffs_resolved_values():
+    # The engine inlines a resolved string "42" as ``count=42``; _parse_args
+    # decodes it to an int. The prepared plan applies the same decoding to
+    # resolved strings (tag_args::normalize_resolved), so both paths agree.
+    assert _parse_args(["count=42", "ratio=0.5", "open=true"], {}) == {
+        "count": 42,
+        "ratio": 0.5,
+        "open": True,
+    }
+
+
+def test_prepared_and_string_args_render_identically():
+    context = {"row_title": "Row 7"}
+    string_args = ["title=Row 7", "variant='outlined'", 'class="wide"']
+    prepared = {"title": "Row 7", "variant": "outlined", "class": "wide"}
+    assert CardHandler().render(string_args, "<p>x</p>", context) == CardHandler().render(
+        prepared, "<p>x</p>", context
+    )
+
+    string_args = ["label='Save'", "variant='primary'", "disabled=True"]
+    prepared = {"label": "Save", "variant": "primary", "disabled": True}
+    assert DjButtonHandler().render(string_args, context) == DjButtonHandler().render(
+        prepared, context
+    )
+
+
+def _recorder(calls, signature):
+    def register(*args, **kwargs):
+        calls.append((args, kwargs))
+
+    register.__text_signature__ = signature
+    return register
+
+
+def test_registration_opts_into_prepared_args_when_supported():
+    inline, block = [], []
+    with (
+        patch(
+            "djust._rust.register_tag_handler",
+            _recorder(inline, "(name, handler, prepared_args=False)"),
+            create=True,
+        ),
+        patch(
+            "djust._rust.register_block_tag_handler",
+            _recorder(block, "(name, end_tag, handler, prepared_args=False)"),
+            create=True,
+        ),
+    ):
+        rust_handlers.register_with_rust_engine()
+
+    by_tag = {args[0]: kwargs for args, kwargs in inline}
+    assert by_tag["dj_button"] == {"prepared_args": True}
+    # kbd reads its raw positional args
+    assert by_tag["kbd"] == {}
+    block_by_tag = {args[0]: kwargs for args, kwargs in block}
+    assert block_by_tag["card"] == {"prepared_args": True}
+
+
+def test_registration_keeps_string_args_on_older_engines():
+    inline, block = [], []
+    with (
+        patch(
+            "djust._rust.register_tag_handler", _recorder(inline, "(name, handler)"), create=True
+        ),
+        patch(
+            "djust._rust.register_block_tag_handler",
+            _recorder(block, "(name, end_tag, handler)"),
+            create=True,
+        ),
+    ):
+        rust_handlers.register_with_rust_engine()
+
+    assert all(kwargs == {} for _, kwargs in inline + block)
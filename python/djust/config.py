@@ -143,6 +143,11 @@ class LiveViewConfig:
         "jit_cache_backend": "filesystem",  # 'filesystem' or 'redis'
         "jit_cache_dir": "__pycache__/djust_serializers",  # Filesystem cache directory
         "jit_redis_url": "redis://localhost:6379/0",  # Redis URL for production
+        # Rows fetched + serialized per batch when JIT-serializing a QuerySet.
+        # Only one chunk of model instances is alive at a time, so peak memory
+        # for large exports is bounded by the serialized dicts, not the models.
+        # 0 disables chunking (single ``list(queryset)``).
+        "jit_chunk_size": 2000,
         "serialization_max_depth": 3,  # Max depth for nested model serialization (e.g., lease.tenant.user = 3 levels)
         # Serialization behavior (issue #292)
         # When False (default): non-serializable values are converted via str() fallback with a warning log
@@ -200,6 +205,11 @@ class LiveViewConfig:
         # to the existing patch-failure path — the client requests recovery HTML
         # and morphs — rather than breaking. Set this to False to opt out.
         "virtual_keyed_ops": True,
+        # Parsed templates kept by the Rust template cache (process-wide, LRU).
+        # Template sources themselves are interned and shared by every session
+        # on the same template; this bounds only the parsed ASTs. Applied once
+        # at startup (``DjustConfig.ready``).
+        "template_cache_size": 512,
         # Django-parity template auto-call (ADR-024). When True (default),
         # the Rust engine's sidecar getattr walk invokes callables exactly
         # like Django's Variable._resolve_lookup ({{ user.get_full_name }},
@@ -208,6 +218,82 @@ class LiveViewConfig:
         # the pre-ADR plain-getattr behavior — a kill-switch only, not a
         # feature toggle (candidate for removal at 2.0).
         "template_auto_call": True,
+        # Zero-copy patch passthrough. ``render_with_diff()`` returns its VDOM
+        # patches as a JSON string; by default the consumer parses it into
+        # Python lists and ``send_json`` encodes the whole frame again. When
+        # True, the event / tick / broadcast / db_notify paths wrap the Rust
+        # string in ``serialization.RawJSON`` and ``encode_frame`` splices it
+        # into the frame envelope verbatim — no per-patch dict allocation and
+        # no decode/re-encode round trip. Wire bytes are equivalent JSON (key
+        # order within the envelope may differ). Default OFF while it soaks.
+        "patch_passthrough": False,
+        # Patch-vs-HTML cost model (``serialization.prefer_html_frame``): a
+        # render goes out as a full ``html_update`` instead of patches when the
+        # HTML is smaller than this fraction of the encoded patch JSON. Used by
+        # the event, tick, broadcast and db_notify paths. 0 disables the
+        # fallback (always send patches).
+        "html_fallback_ratio": 0.7,
+        # Render-once fan-out for ``shared_broadcast = True`` views: how long a
+        # consumer that cannot lead a shared render (its Rust baseline is stale
+        # after forwarding a previous shared frame) waits for another consumer
+        # in the process to publish the render before rendering for itself.
+        "shared_broadcast_wait_ms": 250,
+        # Coalescing mailbox for ``server_push`` / ``db_notify`` (#813). Pushes
+        # that arrive while the render lock is busy merge into a per-consumer
+        # mailbox (state last-write-wins, handler / handle_info calls queued)
+        # and drain in one render when it frees. ``push_max_latency_ms`` bounds
+        # how long a pending batch may wait for the lock before it is dropped;
+        # ``push_mailbox_max_calls`` bounds the queued calls (oldest dropped
+        # first). Drops are counted in ``djust.push.mailbox_stats``.
+        "push_max_latency_ms": 2000,
+        "push_mailbox_max_calls": 256,
+        # Fused event turn: for a sync handler on a view without time-travel,
+        # ``enable_state_snapshot`` or pending ``wait_for_event`` waiters, the
+        # handler, change detection and ``render_with_diff`` run in ONE
+        # executor call instead of one ``sync_to_async`` hop each. False keeps
+        # the per-step hops. See ``scripts/bench_fused_event_turn.py``.
+        "fused_event_pipeline": True,
+        # Per-(view, event) render-cost breakdown (``djust.observability.
+        # render_costs``): each event turn records handler / snapshot /
+        # context / normalize / sync / render / diff / encode / send time
+        # into log-bucketed histograms, served at
+        # ``/_djust/observability/render_costs/``. Costs a ``perf_counter``
+        # pair per phase; False turns the scopes into no-ops.
+        "render_profiling": True,
+        # Prometheus / OpenMetrics exporter (``djust.metrics.metrics_view``).
+        # Hot-path counters and fixed-bucket histograms for connections,
+        # events, render latency, frame bytes, full-HTML fallbacks and
+        # state-backend latency. False makes every instrument a no-op and the
+        # endpoint a 404. ``metrics_auth_token`` (if set) is required as
+        # ``Authorization: Bearer <token>`` on scrapes.
+        "metrics_enabled": True,
+        "metrics_auth_token": None,
+        # Live cursors (``djust.presence.CursorTracker``): moves are coalesced
+        # per room and written to the presence backend + broadcast as one
+        # ``cursor_frame`` event at most this many times per second. 0 or
+        # None flushes every move immediately.
+        "cursor_broadcast_hz": 20,
+        # Shared tick scheduler (``djust.tick``): ``tick_interval`` views are
+        # bucketed by interval on one timer wheel per event loop, phase-spread
+        # across the interval, and each due slot ticks + renders in a single
+        # executor submission. Lag / skipped ticks are in
+        # ``djust.tick.tick_stats``. Opt-in: a slow ``handle_tick`` holds up
+        # the rest of its slot. False runs one ``_run_tick`` task per
+        # connection.
+        "tick_scheduler": False,
+        # Idle-session hibernation (``djust.hibernation``): after this many
+        # seconds without an event or a render, a WebSocket view's Rust state
+        # (VDOM, render caches) is compressed into a msgpack+zstd blob and
+        # freed, then restored on the next render. 0 disables. Ticking and
+        # actor views are never hibernated.
+        "hibernate_after_s": 0,
+        # zstd level for hibernated views (1-22).
+        "hibernate_compression_level": 3,
+        # How many ``mount_batch`` entries mount concurrently. Each entry runs
+        # on its own ViewRuntime and collects its own frames, so independent
+        # lazy children overlap their channel-layer / session / DB waits; the
+        # batch still answers with one combined frame. 1 mounts sequentially.
+        "mount_batch_concurrency": 4,
         # #1987: TYPE-based serialization floor (defense-in-depth over the
         # name/method floor). A list of Django field CLASS names (matched
         # anywhere in a field's MRO) to always exclude from client-bound
@@ -0,0 +1,196 @@
+"""
+Idle-session hibernation for WebSocket live views.
+
+A connected view keeps its whole Rust render state resident — the last VDOM,
+the last HTML, the per-node HTML cache and the text-node indexes — for as long
+as the socket is open, even when the tab has sat in the background for hours.
+With ``LIVEVIEW_CONFIG['hibernate_after_s']`` set, a view that has handled no
+event and sent no render for that long is hibernated: its ``RustLiveView`` is serialized with
+``serialize_msgpack`` (template, state, last VDOM, version), zstd-compressed in
+the state backends' framing and dropped, taking the transient render caches
+with it. The next render of any kind — a user event, ``server_push``,
+``db_notify`` or a broadcast — restores it first
+(``RustBridgeMixin._initialize_rust_view``) and diffs against the restored
+VDOM, so the client only ever sees ordinary patches.
+
+One sweeper task per event loop checks its consumers every
+``min(hibernate_after_s / 4, 60)`` seconds and hibernates the idle ones one at
+a time. Each view is serialized in a worker thread outside the
+thread-sensitive executor, so a sweep never queues behind (or ahead of) view
+renders, and only that view's render lock is held — from before the
+serialization starts until it has finished, even if the sweep is cancelled
+meanwhile. Views that tick or run on the actor system are never hibernated.
+Counters live in :data:`hibernation_stats`.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger(__name__)
+
+MAX_SWEEP_S = 60.0
+"""Longest gap between two sweeps, in seconds."""
+
+hibernation_stats: Dict[str, int] = {
+    "hibernated": 0,
+    "rehydrated": 0,
+    "failed": 0,
+    "state_bytes": 0,
+    "stored_bytes": 0,
+}
+"""Process-wide hibernation counters.
+
+``hibernated`` / ``rehydrated`` — views put to sleep / woken; ``failed`` —
+hibernations or restores that raised (a failed restore rebuilds the view and
+the client gets a full ``html_update``); ``state_bytes`` / ``stored_bytes`` —
+serialized and compressed size of every hibernated view, summed.
+"""
+
+_Entry = Tuple[Any, "asyncio.Future[None]"]
+
+
+def _hibernate_after() -> float:
+    from .config import config
+
+    return float(config.get("hibernate_after_s", 0) or 0)
+
+
+def _is_eligible(consumer: Any, view: Any) -> bool:
+    """Whether ``view`` holds a Rust view this module may drop."""
+    if getattr(view, "_rust_view", None) is None:
+        return False
+    # Ticking views render on a timer anyway; actor views keep their Rust
+    # state in the session actor, not on the view.
+    return not (consumer._tick_task or consumer.use_actors)
+
+
+def _hibernate_view(view: Any) -> None:
+    """Hibernate one view; runs in a worker thread."""
+    try:
+        view._hibernate_rust_view()
+    except Exception as e:  # noqa: BLE001 — one view must not stop the sweep
+        hibernation_stats["failed"] += 1
+        logger.exception("Error hibernating %s: %s", view.__class__.__name__, e)
+
+
+async def _hibernate_one(consumer: Any, view: Any) -> None:
+    """Hibernate ``view`` under ``consumer``'s render lock.
+
+    The lock is released by the worker's completion, not by this coroutine:
+    if the sweep is cancelled while the thread is serializing, the view stays
+    locked until the thread is done with it.
+    """
+    lock = consumer._render_lock
+    await lock.acquire()
+    try:
+        work = asyncio.ensure_future(sync_to_async(_hibernate_view, thread_sensitive=False)(view))
+    except BaseException:
+        lock.release()
+        raise
+    work.add_done_callback(lambda _work: lock.release())
+    await asyncio.shield(work)
+
+
+async def _sweep(entries: List[_Entry], after: float) -> None:
+    """Hibernate the views of ``entries`` idle for at least ``after`` seconds."""
+    for consumer, handle in entries:
+        if handle.done():
+            continue
+        view = consumer.view_instance
+        if not view or not _is_eligible(consumer, view):
+            continue
+        if time.monotonic() - consumer._last_active_at < after:
+            continue
+        if consumer._processing_user_event or consumer._render_lock.locked():
+            continue
+        await _hibernate_one(consumer, view)
+
+
+class _Sweeper:
+    """The consumers registered on one event loop and their sweep task."""
+
+    def __init__(self, scheduler: "HibernationScheduler", loop: Any) -> None:
+        self.scheduler = scheduler
+        self.loop = loop
+        self.entries: List[_Entry] = []
+        self.busy = False
+        self.task = loop.create_task(self._run())
+
+    def add(self, consumer: Any, handle: "asyncio.Future[None]") -> None:
+        entry = (consumer, handle)
+        self.entries.append(entry)
+        handle.add_done_callback(lambda _: self._discard(entry))
+
+    def _discard(self, entry: _Entry) -> None:
+        self.entries.remove(entry)
+        if self.entries:
+            return
+        if self.scheduler._sweepers.get(self.loop) is self:
+            del self.scheduler._sweepers[self.loop]
+        if not self.busy:
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        try:
+            while self.entries:
+                after = _hibernate_after()
+                await asyncio.sleep(min(after / 4, MAX_SWEEP_S) if after > 0 else MAX_SWEEP_S)
+                after = _hibernate_after()
+                if after <= 0 or not self.entries:
+                    continue
+                self.busy = True
+                try:
+                    await _sweep(list(self.entries), after)
+                finally:
+                    self.busy = False
+        except asyncio.CancelledError:
+            pass  # Last consumer unregistered, or the loop is shutting down
+
+
+class HibernationScheduler:
+    """Tracks WebSocket consumers per event loop; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._sweepers: Dict[Any, _Sweeper] = {}
+
+    def register(self, consumer: Any) -> "asyncio.Future[None]":
+        """Watch ``consumer`` for idleness on the running loop.
+
+        Returns a future that stays pending while the consumer is watched;
+        cancel it to unregister. Consumers keep it as ``_hibernation_task``
+        and cancel it on disconnect. The consumer's current ``view_instance``
+        is looked up at every sweep, so a ``live_redirect`` needs no
+        re-registration.
+        """
+        loop = asyncio.get_running_loop()
+        sweeper = self._sweepers.get(loop)
+        if sweeper is None:
+            sweeper = self._sweepers[loop] = _Sweeper(self, loop)
+        handle: "asyncio.Future[None]" = loop.create_future()
+        sweeper.add(consumer, handle)
+        return handle
+
+    @property
+    def registered(self) -> int:
+        """Number of consumers currently watched, across all loops."""
+        return sum(len(sweeper.entries) for sweeper in self._sweepers.values())
+
+
+hibernation_scheduler = HibernationScheduler()
+
+
+def maybe_register(consumer: Any) -> Optional["asyncio.Future[None]"]:
+    """Start watching ``consumer`` if hibernation is enabled and it is not yet.
+
+    Also restarts its idle clock: a fresh mount counts as activity.
+    """
+    if _hibernate_after() <= 0:
+        return None
+    consumer._last_active_at = time.monotonic()
+    if getattr(consumer, "_hibernation_task", None) is None:
+        consumer._hibernation_task = hibernation_scheduler.register(consumer)
+    return consumer._hibernation_task
@@ -15,10 +15,12 @@ The emitter provides three responsibilities:
    signal to all in-flight thunks via a per-request token plus a
    ``cancelled`` flag, used by the ASGI disconnect handler in
    :meth:`RequestMixin.aget`.
-3. **Lazy thunk registry** — a placeholder API surface
-   (:meth:`register_thunk`) used by PR-B's ``{% live_render lazy=True %}``
-   tag. PR-A does not invoke any thunks; it only wires the registry so
-   the contract is locked in advance.
+3. **Lazy thunk registry** — :meth:`register_thunk`, fed by PR-B's
+   ``{% live_render lazy=True %}`` tag, plus the budget the lazy phase of
+   :meth:`TemplateMixin.arender_chunks` runs them under: at most
+   ``max_concurrency`` at once, until ``deadline`` (see
+   :setting:`DJUST_LAZY_CONCURRENCY` / :setting:`DJUST_LAZY_DEADLINE_S`).
+   Per-thunk wall times land in :attr:`ChunkEmitter.thunk_timings`.
 
 The emitter is per-request: a fresh instance is constructed inside
 :meth:`RequestMixin.aget` and stashed on the LiveView instance as
@@ -29,8 +31,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator
-from typing import Any, Awaitable, Callable, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,10 @@ logger = logging.getLogger(__name__)
 # client where ``emit()`` should block instead of buffering unbounded.
 DEFAULT_CHUNK_QUEUE_MAX = 8
 
+# Default number of lazy thunks rendering at once. Each one holds a worker
+# thread (and, if it queries, a database connection) for its whole render.
+DEFAULT_LAZY_CONCURRENCY = 8
+
 
 # Sentinel passed through the queue to signal end-of-stream to the consumer.
 # Bytes are never None in normal flow, so None is unambiguous.
@@ -52,23 +59,60 @@ def _get_queue_max_from_settings() -> int:
     Falls back to :data:`DEFAULT_CHUNK_QUEUE_MAX` when Django is not
     configured (test bootstrap edge cases) or the setting is missing.
     """
+    return _get_positive_int_setting("DJUST_LAZY_CHUNK_QUEUE_MAX", DEFAULT_CHUNK_QUEUE_MAX)
+
+
+def _get_concurrency_from_settings() -> int:
+    """Read ``DJUST_LAZY_CONCURRENCY`` from Django settings.
+
+    Falls back to :data:`DEFAULT_LAZY_CONCURRENCY` like
+    :func:`_get_queue_max_from_settings`.
+    """
+    return _get_positive_int_setting("DJUST_LAZY_CONCURRENCY", DEFAULT_LAZY_CONCURRENCY)
+
+
+def _get_positive_int_setting(name: str, default: int) -> int:
     try:
         from django.conf import settings
 
-        value = getattr(settings, "DJUST_LAZY_CHUNK_QUEUE_MAX", DEFAULT_CHUNK_QUEUE_MAX)
+        value = getattr(settings, name, default)
         if isinstance(value, int) and value > 0:
             return value
         logger.warning(
-            "DJUST_LAZY_CHUNK_QUEUE_MAX must be a positive int; got %r — "
-            "falling back to default %d",
+            "%s must be a positive int; got %r — falling back to default %d",
+            name,
             value,
-            DEFAULT_CHUNK_QUEUE_MAX,
+            default,
         )
     except Exception:
         # Settings not configured (shouldn't happen in real requests, but
         # guards tests that import this module before Django is ready).
-        logger.debug("Django settings not available; using default queue max")
-    return DEFAULT_CHUNK_QUEUE_MAX
+        logger.debug("Django settings not available; using default %s", name)
+    return default
+
+
+def _get_deadline_from_settings() -> Optional[float]:
+    """Read ``DJUST_LAZY_DEADLINE_S`` from Django settings.
+
+    ``None`` (the default) means no deadline: the lazy phase runs until
+    every thunk has finished or hit its own ``timeout_s``.
+    """
+    try:
+        from django.conf import settings
+
+        value = getattr(settings, "DJUST_LAZY_DEADLINE_S", None)
+    except Exception:
+        return None
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+        return float(value)
+    logger.warning(
+        "DJUST_LAZY_DEADLINE_S must be a positive number or None; got %r — "
+        "running without a deadline",
+        value,
+    )
+    return None
 
 
 class ChunkEmitterCancelled(Exception):
@@ -87,8 +131,12 @@ class ChunkEmitter:
 
     - A bounded :class:`asyncio.Queue` of pre-rendered chunks (bytes).
     - An ordered registry of "thunks" — async callables that PR-B's
-      ``{% live_render lazy=True %}`` tag registers for deferred render.
-      PR-A does not call thunks; the registry is API surface only.
+      ``{% live_render lazy=True %}`` tag registers for deferred render,
+      run by :meth:`TemplateMixin.arender_chunks` under
+      ``max_concurrency`` and ``deadline``.
+    - ``thunk_timings`` — ``{view_id: (outcome, seconds)}`` for every
+      thunk of the lazy phase, ``outcome`` being ``"streamed"``,
+      ``"failed"`` or ``"deferred"`` (missed the deadline).
     - A ``request_token`` :class:`asyncio.Event` that thunks can await to
       detect cancellation cooperatively (PR-C will wire this).
     - A ``cancelled`` boolean flag set by :meth:`cancel`.
@@ -99,7 +147,14 @@ class ChunkEmitter:
     ``StreamingHttpResponse`` via the ASGI handler.
     """
 
-    def __init__(self, request: Any, *, max_queue: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        request: Any,
+        *,
+        max_queue: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        deadline_s: Optional[float] = None,
+    ) -> None:
         """Create a chunk emitter bound to a request.
 
         :param request: The :class:`HttpRequest` for the current GET.
@@ -107,12 +162,27 @@ class ChunkEmitter:
             (auth, session, language).
         :param max_queue: Override the queue size. Defaults to
             :setting:`DJUST_LAZY_CHUNK_QUEUE_MAX` from settings.
+        :param max_concurrency: Override how many lazy thunks render at
+            once. Defaults to :setting:`DJUST_LAZY_CONCURRENCY`.
+        :param deadline_s: Override the lazy-phase deadline, in seconds
+            from now. Defaults to :setting:`DJUST_LAZY_DEADLINE_S`
+            (``None``: no deadline).
         """
         self.request = request
         if max_queue is None:
             max_queue = _get_queue_max_from_settings()
+        if max_concurrency is None:
+            max_concurrency = _get_concurrency_from_settings()
+        if deadline_s is None:
+            deadline_s = _get_deadline_from_settings()
         self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
         self._thunks: List[Tuple[str, Callable[..., Awaitable[bytes]]]] = []
+        self.max_concurrency: int = max_concurrency
+        # Monotonic clock, like the event loop's.
+        self.deadline: Optional[float] = (
+            time.monotonic() + deadline_s if deadline_s is not None else None
+        )
+        self.thunk_timings: Dict[str, Tuple[str, float]] = {}
         # ``request_token`` is ``set()`` on cancel. Thunks await
         # ``token.wait()`` (with timeout) to detect disconnect.
         self.request_token: asyncio.Event = asyncio.Event()
@@ -144,18 +214,32 @@ class ChunkEmitter:
     def register_thunk(self, view_id: str, thunk_fn: Callable[..., Awaitable[bytes]]) -> None:
         """Register a lazy thunk to be flushed after the parent shell.
 
-        PR-A defines this as API surface only — no caller in the
-        framework invokes thunks yet. PR-B's
-        ``{% live_render ... lazy=True %}`` tag will register one thunk
-        per lazy slot here.
+        PR-B's ``{% live_render ... lazy=True %}`` tag registers one thunk
+        per lazy slot here (via :meth:`RequestMixin._transfer_lazy_thunks`).
 
         :param view_id: Stable identifier for the lazy slot
             (matches ``<dj-lazy-slot data-id=...>``).
         :param thunk_fn: Async callable returning the rendered chunk
-            bytes for the slot's filled content.
+            bytes for the slot's filled content. It may carry a
+            ``deadline_fallback`` attribute: a plain callable returning
+            the chunk to send instead when the thunk misses
+            :attr:`deadline`.
         """
         self._thunks.append((view_id, thunk_fn))
 
+    def time_left(self) -> Optional[float]:
+        """Seconds until :attr:`deadline` (never negative); ``None`` without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def record_thunk(self, view_id: str, outcome: str, seconds: float) -> None:
+        """Store a thunk's wall time in :attr:`thunk_timings` and the metrics."""
+        from . import metrics
+
+        self.thunk_timings[view_id] = (outcome, seconds)
+        metrics.lazy_render_duration.observe(seconds, outcome)
+
     @property
     def thunks(self) -> List[Tuple[str, Callable[..., Awaitable[bytes]]]]:
         """Read-only view of registered thunks (for testing/PR-B wiring)."""
@@ -422,6 +422,16 @@ class LiveView(  # type: ignore[misc]  # StreamsMixin(sync) + StreamingMixin(asy
     # tracked for v0.6.2 as Phase 2.
     streaming_render: bool = False
 
+    # Send the page shell before ``mount()`` (``streaming_render`` on ASGI).
+    # The shell — everything before ``<div dj-root>`` — is rendered from the
+    # template with only the context processors and ``get_shell_context_data()``
+    # and flushed while ``mount()``, ``get_context_data()`` and the render run,
+    # so the ``<head>`` and its CSS load in parallel with a slow mount. Nothing
+    # outside ``dj-root`` may depend on mount state, and the status line leaves
+    # with the shell: an ``on_mount`` redirect becomes a client-side redirect.
+    # Views whose shell cannot render pre-mount fall back to the usual stream.
+    streaming_shell_first: bool = False
+
     # Time-travel debugging (v0.6.1 — dev-only).
     #
     # Opt-in per-view flag that enables a per-instance ring buffer of
@@ -437,6 +447,37 @@ class LiveView(  # type: ignore[misc]  # StreamsMixin(sync) + StreamingMixin(asy
     # :mod:`djust.time_travel` for the recording machinery.
     time_travel_enabled: bool = False
 
+    # Render-once fan-out for ``push_to_view`` broadcasts.
+    #
+    # Opt-in per-view flag for views whose rendered output depends only on
+    # broadcast (session-independent) state — ops walls, public dashboards.
+    # When True, consumers in the same process that start a ``server_push``
+    # from identical rendered HTML share ONE render + diff: the first consumer
+    # renders, the rest forward its patches verbatim. A consumer that
+    # forwarded patches re-renders lazily, sending one full ``html_update`` on
+    # its next own render. Per-session output ({% csrf_token %}, the user's
+    # name) keeps base HTML distinct and simply disables sharing for that
+    # session; per-session output that only APPEARS after a push would be
+    # shared incorrectly — don't opt in for such views.
+    # See :class:`djust.push.SharedBroadcastRenders`.
+    shared_broadcast: bool = False
+
+    # Per-key change tracking (opt-in). When True, assignments and in-place
+    # mutations of list / dict / set assigns record the changed key as they
+    # happen (see :mod:`djust.change_tracking`), replacing the per-event
+    # before/after fingerprint scan of every assign. Exact for collections of
+    # any size. Assigned containers are stored as tracked copies — mutate them
+    # through ``self.<name>``, not through a reference taken before assigning.
+    track_assigns: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, "track_assigns", False) and "__setattr__" not in cls.__dict__:
+            from .change_tracking import tracked_delattr, tracked_setattr
+
+            cls.__setattr__ = tracked_setattr  # type: ignore[assignment,method-assign]
+            cls.__delattr__ = tracked_delattr  # type: ignore[assignment,method-assign]
+
     # ============================================================================
     # AS_VIEW DISPATCH (PR-B for v0.9.0 streaming, ADR-015)
     # ============================================================================
@@ -597,6 +638,17 @@ class LiveView(  # type: ignore[misc]  # StreamsMixin(sync) + StreamingMixin(asy
         # user state). #1393 snapshot-order invariant.
         self._mounted_from_restore: bool = False
 
+        # Per-key change tracker for ``track_assigns`` views (None otherwise).
+        # Framework slot: assigned BEFORE the _framework_attrs snapshot so it is
+        # never serialized as user-private state (#1393 snapshot-order invariant).
+        self._assign_tracker: Any = None
+        if getattr(self.__class__, "track_assigns", False):
+            from .change_tracking import AssignTracker
+
+            self._assign_tracker = AssignTracker(
+                _FRAMEWORK_INTERNAL_ATTRS | set(getattr(self, "static_assigns", ()) or ())
+            )
+
         # Snapshot framework-set attrs so we can distinguish them from
         # user-defined _private attrs set in mount() or event handlers.
         #
@@ -694,6 +694,50 @@ def create_server() -> "FastMCP":
             return json.dumps({"error": r.text, "status": r.status_code})
         return cast(str, r.text)
 
+    @mcp.tool()
+    def get_render_costs(view_class: str = "", event: str = "") -> str:
+        """Per-(view class, event) breakdown of where an event turn's time goes.
+
+        Args:
+            view_class: Filter to one view class name. Empty string = no filter.
+            event: Filter to one event name. Empty string = no filter.
+
+        Returns JSON: {count, stats:[{view_class, event, turns, total,
+        other, phases:{handler|snapshot|context|normalize|sync|render|diff|
+        encode|send: {count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}},
+        bytes_sent:{mean, p50, p99, max}}]}.
+
+        Rows sorted by total p90 descending. Answers "is this slow event
+        Python context building or Rust diffing?" without a profiler:
+        compare ``context`` / ``normalize`` against ``render`` / ``diff``.
+        """
+        import os
+
+        try:
+            import requests
+        except ImportError:
+            return json.dumps({"error": "`requests` package not installed in the MCP environment"})
+
+        base = os.environ.get("DJUST_DEV_SERVER_URL", "http://127.0.0.1:8000").rstrip("/")
+        url = f"{base}/_djust/observability/render_costs/"
+        params: dict[str, object] = {}
+        if view_class:
+            params["view_class"] = view_class
+        if event:
+            params["event"] = event
+        try:
+            r = requests.get(url, params=params, timeout=5)
+        except requests.RequestException as e:
+            return json.dumps(
+                {
+                    "error": f"request failed: {e}",
+                    "hint": f"Is the dev server running? Tried {url}.",
+                }
+            )
+        if r.status_code != 200:
+            return json.dumps({"error": r.text, "status": r.status_code})
+        return cast(str, r.text)
+
     @mcp.tool()
     def get_sql_queries_since(
         since_ms: int = 0,
@@ -0,0 +1,568 @@
+"""
+Prometheus / OpenMetrics exporter for djust runtime and backend metrics.
+
+Two kinds of numbers are exported:
+
+* **Hot-path instruments** — counters and fixed-bucket histograms updated
+  inline: connections, events, event-turn and Rust render latency, outbound
+  frame sizes, full-HTML fallbacks (DJE-053), render-lock timeouts,
+  state-backend latency and lazy ``{% live_render %}`` child latency. Each
+  update is a dict lookup and a few integer adds under a per-metric lock, so
+  they stay on at full production load.
+* **Scrape-time collectors** — the counters djust already keeps
+  (``djust.push.mailbox_stats``, ``djust.sse.sse_outbox_stats``,
+  ``djust.tick.tick_stats``, shared-broadcast and actor counts, state-backend
+  compression stats) are read only when the endpoint is scraped.
+
+Usage::
+
+    # urls.py
+    from djust.metrics import metrics_view
+
+    urlpatterns = [
+        path("metrics/", metrics_view),
+        ...
+    ]
+
+The endpoint serves the Prometheus text format (0.0.4), or OpenMetrics 1.0
+when the scraper asks for ``application/openmetrics-text``. It is not
+DEBUG-gated: set ``LIVEVIEW_CONFIG['metrics_auth_token']`` to require an
+``Authorization: Bearer <token>`` header, or restrict the route at the
+proxy. ``LIVEVIEW_CONFIG['metrics_enabled'] = False`` turns every instrument
+into a no-op and the endpoint into a 404.
+
+Custom collectors (a callable returning :class:`MetricFamily` objects) can
+be added with :func:`register_collector`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+"""Seconds. Event turns, renders and state-backend calls."""
+
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152)
+"""Bytes. Outbound frames."""
+
+Labels = Tuple[str, ...]
+
+
+def _enabled() -> bool:
+    from djust.config import config
+
+    return bool(config.get("metrics_enabled", True))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass
+class MetricFamily:
+    """One exported metric: ``kind`` is ``counter``, ``gauge`` or ``histogram``.
+
+    ``samples`` maps label values (in ``labelnames`` order) to the value; for
+    histograms the value is ``(cumulative bucket counts, sum, count)``.
+    """
+
+    name: str
+    kind: str
+    help: str
+    labelnames: Tuple[str, ...] = ()
+    samples: Dict[Labels, Any] = field(default_factory=dict)
+    buckets: Tuple[float, ...] = ()
+
+    def render(self, openmetrics: bool) -> List[str]:
+        base = self.name
+        if self.kind == "counter" and base.endswith("_total"):
+            base = base[: -len("_total")]
+        type_name = base if openmetrics else self.name
+        lines = [f"# HELP {type_name} {self.help}", f"# TYPE {type_name} {self.kind}"]
+        for labels, value in sorted(self.samples.items()):
+            if self.kind == "histogram":
+                counts, total, count = value
+                for bound, cumulative in zip(self.buckets + (float("inf"),), counts):
+                    le = 'le="%s"' % _format_value(bound)
+                    lines.append(
+                        f"{base}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                    )
+                lines.append(f"{base}_sum{_format_labels(self.labelnames, labels)} {total!r}")
+                lines.append(f"{base}_count{_format_labels(self.labelnames, labels)} {count}")
+            else:
+                name = f"{base}_total" if self.kind == "counter" else base
+                lines.append(
+                    f"{name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                )
+        return lines
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter. ``name`` should end in ``_total``."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        if not _enabled():
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def collect(self) -> MetricFamily:
+        with self._lock:
+            samples = dict(self._values)
+        return MetricFamily(self.name, self.kind, self.help, self.labelnames, samples)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Value that goes up and down (active connections)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram; ``observe`` is one bisect plus three adds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last = +Inf), sum, count]
+        self._data: Dict[Labels, List[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        if not _enabled():
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._data.get(labels)
+            if data is None:
+                data = self._data[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            data[0][index] += 1
+            data[1] += value
+            data[2] += 1
+
+    def count(self, *labels: str) -> int:
+        data = self._data.get(labels)
+        return data[2] if data else 0
+
+    def collect(self) -> MetricFamily:
+        samples: Dict[Labels, Any] = {}
+        with self._lock:
+            for labels, (counts, total, count) in self._data.items():
+                cumulative, running = [], 0
+                for c in counts:
+                    running += c
+                    cumulative.append(running)
+                samples[labels] = (cumulative, total, count)
+        return MetricFamily(self.name, self.kind, self.help, self.labelnames, samples, self.buckets)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_metrics: List[_Metric] = []
+_collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+
+def _register(metric: Any) -> Any:
+    _metrics.append(metric)
+    return metric
+
+
+def register_collector(collector: Callable[[], Iterable[MetricFamily]]) -> None:
+    """Add a scrape-time collector returning :class:`MetricFamily` objects."""
+    _collectors.append(collector)
+
+
+connections_opened = _register(
+    Counter("djust_connections_opened_total", "Accepted live connections.", ("transport",))
+)
+connections_active = _register(
+    Gauge("djust_connections_active", "Open live connections.", ("transport",))
+)
+events_total = _register(Counter("djust_events_total", "Event turns dispatched.", ("transport",)))
+event_duration = _register(
+    Histogram(
+        "djust_event_duration_seconds",
+        "Wall time of an event turn (handler, render and send).",
+        ("transport",),
+    )
+)
+render_duration = _register(
+    Histogram("djust_render_duration_seconds", "Rust render + diff time per render.")
+)
+frame_bytes = _register(
+    Histogram(
+        "djust_frame_bytes",
+        "Size of outbound frames.",
+        ("transport", "type"),
+        buckets=SIZE_BUCKETS,
+    )
+)
+full_html_fallbacks = _register(
+    Counter(
+        "djust_full_html_fallbacks_total",
+        "Renders sent as full HTML instead of patches (DJE-053).",
+        ("reason",),
+    )
+)
+render_lock_timeouts = _register(
+    Counter(
+        "djust_render_lock_timeouts_total",
+        "Out-of-band renders abandoned because the render lock stayed busy.",
+        ("source",),
+    )
+)
+state_backend_duration = _register(
+    Histogram(
+        "djust_state_backend_duration_seconds",
+        "State backend load/save latency.",
+        ("backend", "op"),
+    )
+)
+
+lazy_render_duration = _register(
+    Histogram(
+        "djust_lazy_render_duration_seconds",
+        "Wall time of a lazy {% live_render %} child on a streamed GET.",
+        ("outcome",),
+    )
+)
+
+_FRAME_TYPES = frozenset({"patch", "html_update", "mount", "noop", "error"})
+
+
+def frame_type_label(frame: Dict[str, Any]) -> str:
+    """Bounded ``type`` label for :data:`frame_bytes` (unknown types → ``other``)."""
+    frame_type = frame.get("type")
+    return frame_type if frame_type in _FRAME_TYPES else "other"
+
+
+class _Timer:
+    __slots__ = ("_hist", "_labels", "_start")
+
+    def __init__(self, hist: Histogram, labels: Labels) -> None:
+        self._hist = hist
+        self._labels = labels
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._hist.observe(time.perf_counter() - self._start, *self._labels)
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_TIMER = _NoTimer()
+
+
+def time_state_backend(backend: str, op: str) -> Any:
+    """Context manager timing a state-backend call into
+    ``djust_state_backend_duration_seconds``."""
+    if not _enabled():
+        return _NO_TIMER
+    return _Timer(state_backend_duration, (backend, op))
+
+
+# ---------------------------------------------------------------------------
+# Scrape-time collectors
+# ---------------------------------------------------------------------------
+
+
+def _counter_dict_families(
+    prefix: str, stats: Dict[str, Any], counters: Dict[str, str], gauges: Dict[str, str]
+) -> List[MetricFamily]:
+    families = []
+    for key, help in counters.items():
+        families.append(
+            MetricFamily(f"{prefix}_{key}_total", "counter", help, samples={(): stats[key]})
+        )
+    for key, help in gauges.items():
+        families.append(MetricFamily(f"{prefix}_{key}", "gauge", help, samples={(): stats[key]}))
+    return families
+
+
+def _collect_runtime() -> List[MetricFamily]:
+    from djust.hibernation import hibernation_stats
+    from djust.push import mailbox_stats, shared_renders
+    from djust.sse import sse_outbox_stats
+    from djust.tick import tick_stats
+
+    families = _counter_dict_families(
+        "djust_push_mailbox",
+        mailbox_stats,
+        {
+            "pushes": "server_push / db_notify messages accepted.",
+            "merged": "Pushes folded into an already pending batch.",
+            "dropped": "Pushes dropped (queue overflow or max latency).",
+            "renders": "Mailbox batches rendered.",
+        },
+        {},
+    )
+    families += _counter_dict_families(
+        "djust_shared_broadcast",
+        shared_renders.stats,
+        {
+            "renders": "Broadcast renders computed once and shared.",
+            "reused": "Broadcast frames reused from another connection's render.",
+            "fallbacks": "Broadcast receivers that had to render locally.",
+        },
+        {},
+    )
+    families += _counter_dict_families(
+        "djust_sse_outbox",
+        sse_outbox_stats,
+        {
+            "frames": "SSE frames accepted.",
+            "coalesced": "SSE VDOM frames folded into a queued full render.",
+            "dropped": "SSE frames dropped on overflow.",
+            "disconnects": "SSE streams closed on overflow.",
+        },
+        {"high_water": "Deepest SSE outbox seen."},
+    )
+    families += _counter_dict_families(
+        "djust_tick",
+        tick_stats,
+        {
+            "ticks": "handle_tick calls.",
+            "renders": "Tick frames sent.",
+            "skipped": "View ticks skipped (user event, busy lock or lag).",
+        },
+        {},
+    )
+    families += _counter_dict_families(
+        "djust_hibernation",
+        hibernation_stats,
+        {
+            "hibernated": "Idle views hibernated.",
+            "rehydrated": "Hibernated views restored.",
+            "failed": "Hibernations or restores that failed.",
+            "state_bytes": "Serialized bytes of hibernated views.",
+            "stored_bytes": "Compressed bytes of hibernated views.",
+        },
+        {},
+    )
+    families.append(
+        MetricFamily(
+            "djust_tick_lag_seconds_max",
+            "gauge",
+            "Worst tick scheduler slot lag.",
+            samples={(): tick_stats["lag_ms_max"] / 1000.0},
+        )
+    )
+    return families
+
+
+def _collect_actors() -> List[MetricFamily]:
+    try:
+        from djust._rust import get_actor_stats
+    except ImportError:
+        return []
+    stats = get_actor_stats()
+    return [
+        MetricFamily(
+            "djust_actor_sessions",
+            "gauge",
+            "Active actor sessions.",
+            samples={(): stats.active_sessions},
+        )
+    ]
+
+
+def _collect_template_cache() -> List[MetricFamily]:
+    try:
+        from djust._rust import template_cache_stats
+    except ImportError:
+        return []
+    return _counter_dict_families(
+        "djust_template_cache",
+        template_cache_stats(),
+        {
+            "hits": "Parsed-template cache hits.",
+            "misses": "Parsed-template cache misses (template parsed).",
+            "evictions": "Parsed templates evicted (LRU bound or hot reload).",
+        },
+        {
+            "entries": "Parsed templates cached.",
+            "capacity": "Parsed-template cache bound.",
+            "interned_sources": "Distinct template sources held by sessions.",
+            "interned_bytes": "Bytes of template source held by sessions.",
+        },
+    )
+
+
+def _collect_state_backend() -> List[MetricFamily]:
+    from djust.state_backends import get_backend
+    from djust.state_backends.memory import InMemoryStateBackend
+
+    backend = get_backend()
+    families = []
+    if isinstance(backend, InMemoryStateBackend):
+        # Redis get_stats() SCANs the keyspace; only the in-memory count is
+        # cheap enough to read on every scrape.
+        families.append(
+            MetricFamily(
+                "djust_state_sessions",
+                "gauge",
+                "Sessions held by the in-memory state backend.",
+                samples={(): backend.get_stats()["total_sessions"]},
+            )
+        )
+    compression = getattr(backend, "get_compression_stats", None)
+    if compression is not None:
+        stats = compression()
+        if stats.get("enabled"):
+            families += _counter_dict_families(
+                "djust_state_compression",
+                stats,
+                {
+                    "compressed_count": "States stored compressed.",
+                    "uncompressed_count": "States stored uncompressed.",
+                    "total_bytes_saved": "Bytes saved by state compression.",
+                },
+                {},
+            )
+    return families
+
+
+register_collector(_collect_runtime)
+register_collector(_collect_actors)
+register_collector(_collect_template_cache)
+register_collector(_collect_state_backend)
+
+
+def collect() -> List[MetricFamily]:
+    """Every metric family: instruments first, then collector output."""
+    families = [metric.collect() for metric in _metrics]
+    for collector in list(_collectors):
+        try:
+            families.extend(collector())
+        except Exception:  # noqa: BLE001 — one broken source must not fail the scrape
+            logger.debug("metrics collector %r failed", collector, exc_info=True)
+    return families
+
+
+def render_metrics(openmetrics: bool = False) -> str:
+    """Render every metric in Prometheus text (default) or OpenMetrics format."""
+    lines: List[str] = []
+    for family in collect():
+        lines.extend(family.render(openmetrics))
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def metrics_view(request: Any) -> Any:
+    """Serve :func:`render_metrics` for a Prometheus scraper."""
+    import hmac
+
+    from django.http import Http404, HttpResponse
+
+    from djust.config import config
+
+    if not _enabled():
+        raise Http404("metrics disabled")
+    token: Optional[str] = config.get("metrics_auth_token")
+    if token:
+        supplied = request.META.get("HTTP_AUTHORIZATION", "")
+        if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+            return HttpResponse(status=401)
+    openmetrics = "application/openmetrics-text" in request.META.get("HTTP_ACCEPT", "")
+    return HttpResponse(
+        render_metrics(openmetrics=openmetrics),
+        content_type=OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+def _reset_metrics() -> None:
+    """Test-only reset of the hot-path instruments."""
+    for metric in _metrics:
+        metric._reset()
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from django.db import models
 from django.test.signals import setting_changed
 
+from ..observability.render_costs import render_phase
 from ..serialization import normalize_django_value
 from ..utils import is_model_list
 
@@ -222,83 +223,97 @@ class ContextMixin:
                     break
 
         if has_db_values:
-            try:
-                template_content = self._get_template_content()
-                if template_content:
-                    # Extract variable paths once for list[Model] optimization
-                    from ..mixins.jit import _cached_extract_template_variables
-
-                    variable_paths_map = _cached_extract_template_variables(template_content)
-
-                    # Compute template hash once for codegen cache keys
-                    import hashlib
-                    from ..session_utils import _jit_serializer_cache, _get_model_hash
-                    from ..optimization.codegen import generate_serializer_code, compile_serializer
-
-                    template_hash = hashlib.sha256(template_content.encode()).hexdigest()[:8]
-
-                    for key, value in list(context.items()):
-                        if isinstance(value, QuerySet):
-                            serialized = self._jit_serialize_queryset(value, template_content, key)
-                            context[key] = serialized
-                            jit_serialized_keys.add(key)
-
-                            if isinstance(serialized, list):
-                                count_key = f"{key}_count"
-                                if count_key not in context:
-                                    context[count_key] = len(serialized)
-
-                        elif isinstance(value, models.Model):
-                            context[key] = self._jit_serialize_model(value, template_content, key)
-                            jit_serialized_keys.add(key)
-
-                        elif is_model_list(value):
-                            # Re-fetch with select_related/prefetch_related/annotations
-                            # to avoid N+1 queries during serialization
-                            from ..optimization.query_optimizer import (
-                                analyze_queryset_optimization,
-                                optimize_queryset,
-                            )
-
-                            model_class = value[0].__class__
-                            paths = variable_paths_map.get(key, []) if variable_paths_map else []
-                            optimization = (
-                                analyze_queryset_optimization(model_class, paths) if paths else None
-                            )
-
-                            if optimization and (
-                                optimization.select_related
-                                or optimization.prefetch_related
-                                or optimization.annotations
-                            ):
-                                pks = [obj.pk for obj in value]
-                                qs = model_class._default_manager.filter(pk__in=pks)
-                                qs = optimize_queryset(qs, optimization)
-                                pk_map = {obj.pk: obj for obj in qs}
-                                value = [pk_map[pk] for pk in pks if pk in pk_map]
-
-                            if paths:
-                                # Use codegen serializer directly — avoids DjangoJSONEncoder fallback
-                                model_hash = _get_model_hash(model_class)
-                                cache_key = (template_hash, key, model_hash, "list")
-                                if cache_key in _jit_serializer_cache:
-                                    serializer, _ = _jit_serializer_cache[cache_key]
+            # JIT serialization (and the queries it runs) is reported as the
+            # ``normalize`` phase of the event turn, not ``context``.
+            with render_phase("normalize"):
+                try:
+                    template_content = self._get_template_content()
+                    if template_content:
+                        # Extract variable paths once for list[Model] optimization
+                        from ..mixins.jit import _cached_extract_template_variables
+
+                        variable_paths_map = _cached_extract_template_variables(template_content)
+
+                        # Compute template hash once for codegen cache keys
+                        import hashlib
+                        from ..session_utils import _jit_serializer_cache, _get_model_hash
+                        from ..optimization.codegen import (
+                            generate_serializer_code,
+                            compile_serializer,
+                        )
+
+                        template_hash = hashlib.sha256(template_content.encode()).hexdigest()[:8]
+
+                        for key, value in list(context.items()):
+                            if isinstance(value, QuerySet):
+                                serialized = self._jit_serialize_queryset(
+                                    value, template_content, key
+                                )
+                                context[key] = serialized
+                                jit_serialized_keys.add(key)
+
+                                if isinstance(serialized, list):
+                                    count_key = f"{key}_count"
+                                    if count_key not in context:
+                                        context[count_key] = len(serialized)
+
+                            elif isinstance(value, models.Model):
+                                context[key] = self._jit_serialize_model(
+                                    value, template_content, key
+                                )
+                                jit_serialized_keys.add(key)
+
+                            elif is_model_list(value):
+                                # Re-fetch with select_related/prefetch_related/annotations
+                                # to avoid N+1 queries during serialization
+                                from ..optimization.query_optimizer import (
+                                    analyze_queryset_optimization,
+                                    optimize_queryset,
+                                )
+
+                                model_class = value[0].__class__
+                                paths = (
+                                    variable_paths_map.get(key, []) if variable_paths_map else []
+                                )
+                                optimization = (
+                                    analyze_queryset_optimization(model_class, paths)
+                                    if paths
+                                    else None
+                                )
+
+                                if optimization and (
+                                    optimization.select_related
+                                    or optimization.prefetch_related
+                                    or optimization.annotations
+                                ):
+                                    pks = [obj.pk for obj in value]
+                                    qs = model_class._default_manager.filter(pk__in=pks)
+                                    qs = optimize_queryset(qs, optimization)
+                                    pk_map = {obj.pk: obj for obj in qs}
+                                    value = [pk_map[pk] for pk in pks if pk in pk_map]
+
+                                if paths:
+                                    # Use codegen serializer directly — avoids DjangoJSONEncoder fallback
+                                    model_hash = _get_model_hash(model_class)
+                                    cache_key = (template_hash, key, model_hash, "list")
+                                    if cache_key in _jit_serializer_cache:
+                                        serializer, _ = _jit_serializer_cache[cache_key]
+                                    else:
+                                        func_name = f"serialize_{key}_{template_hash}"
+                                        code = generate_serializer_code(
+                                            model_class.__name__, paths, func_name
+                                        )
+                                        serializer = compile_serializer(code, func_name)
+                                        _jit_serializer_cache[cache_key] = (serializer, None)
+                                    context[key] = [serializer(item) for item in value]
                                 else:
-                                    func_name = f"serialize_{key}_{template_hash}"
-                                    code = generate_serializer_code(
-                                        model_class.__name__, paths, func_name
-                                    )
-                                    serializer = compile_serializer(code, func_name)
-                                    _jit_serializer_cache[cache_key] = (serializer, None)
-                                context[key] = [serializer(item) for item in value]
-                            else:
-                                context[key] = [
-                                    self._jit_serialize_model(item, template_content, key)
-                                    for item in value
-                                ]
-                            jit_serialized_keys.add(key)
-            except Exception as e:
-                logger.warning("JIT auto-serialization failed: %s", e, exc_info=True)
+                                    context[key] = [
+                                        self._jit_serialize_model(item, template_content, key)
+                                        for item in value
+                                    ]
+                                jit_serialized_keys.add(key)
+                except Exception as e:
+                    logger.warning("JIT auto-serialization failed: %s", e, exc_info=True)
 
         # Auto-add count for plain lists
         for key, value in list(context.items()):
@@ -73,7 +73,11 @@ def _cached_extract_template_variables(template_content: str) -> Optional[dict]:
 
 
 try:
-    from ..optimization.query_optimizer import analyze_queryset_optimization, optimize_queryset
+    from ..optimization.query_optimizer import (
+        analyze_queryset_optimization,
+        iter_queryset_chunks,
+        optimize_queryset,
+    )
     from ..optimization.codegen import generate_serializer_code, compile_serializer
 
     JIT_AVAILABLE = True
@@ -246,8 +250,7 @@ class JITMixin:
             # Try Rust serializer first, fall back to Python codegen if incomplete
             from djust._rust import serialize_queryset
 
-            items = list(queryset)
-            result = serialize_queryset(items, paths_for_var)
+            from ..config import config
 
             # Check if Rust serializer captured all expected paths
             # (Rust can't access @property attributes, only model fields)
@@ -257,18 +260,28 @@ class JITMixin:
                     set(p.split(".")[0] for p in paths_for_var)
                 )
             expected_keys = _expected_keys_cache[ek_cache_key]
-            if result and len(result[0]) < expected_keys:
-                # Heuristic: if the first item has fewer top-level keys than expected,
-                # Rust likely can't access some paths (e.g. @property). A nullable FK
-                # on item 0 could cause a false positive, but the codegen fallback is
-                # correct (just slightly slower), so this is an acceptable trade-off.
-
-                func_name = f"serialize_{variable_name}_{template_hash}"
-                code = generate_serializer_code(model_class.__name__, paths_for_var, func_name)
-                serializer = compile_serializer(code, func_name)
-                result = [serializer(obj) for obj in items]
 
-            from ..config import config
+            # Fetch + serialize one chunk at a time so only ``jit_chunk_size``
+            # model instances are alive at once, not the whole result set.
+            chunk_size = int(config.get("jit_chunk_size", 2000) or 0)
+            serializer = None
+            result: List[Any] = []
+            for items in iter_queryset_chunks(queryset, chunk_size):
+                if serializer is not None:
+                    result.extend(serializer(obj) for obj in items)
+                    continue
+                rows = serialize_queryset(items, paths_for_var)
+                if not result and rows and len(rows[0]) < expected_keys:
+                    # Heuristic: if the first item has fewer top-level keys than expected,
+                    # Rust likely can't access some paths (e.g. @property). A nullable FK
+                    # on item 0 could cause a false positive, but the codegen fallback is
+                    # correct (just slightly slower), so this is an acceptable trade-off.
+
+                    func_name = f"serialize_{variable_name}_{template_hash}"
+                    code = generate_serializer_code(model_class.__name__, paths_for_var, func_name)
+                    serializer = compile_serializer(code, func_name)
+                    rows = [serializer(obj) for obj in items]
+                result.extend(rows)
 
             if config.get("jit_debug"):
                 logger.debug(
@@ -42,9 +42,27 @@ from ..hooks import run_on_mount_hooks
 if TYPE_CHECKING:
     from django.http import HttpRequest
 
+    from ..http_streaming import ChunkEmitter
+
 logger = logging.getLogger(__name__)
 
 
+def _client_redirect_chunk(request: "HttpRequest", url: str) -> bytes:
+    """A redirect for a streamed page whose status line has already been sent."""
+    from django.utils.html import escape
+
+    from ..security import escape_json_for_script
+    from ..utils import get_csp_nonce
+
+    nonce = get_csp_nonce(request)
+    nonce_attr = ' nonce="' + escape(nonce) + '"' if nonce else ""
+    return (
+        f"<script{nonce_attr}>window.location.replace("
+        f"{escape_json_for_script(json.dumps(url))});</script>"
+        f'<noscript><meta http-equiv="refresh" content="0;url={escape(url)}"></noscript>'
+    ).encode("utf-8")
+
+
 class RequestMixin:
     """HTTP handling: get, post."""
 
@@ -70,7 +88,11 @@ class RequestMixin:
 
         def _split_for_streaming(self, full_html: str) -> Tuple[str, str, str]: ...
 
-        async def arender_chunks(self, full_html: str, emitter: Any) -> None: ...
+        async def arender_chunks(
+            self, full_html: str, emitter: Any, shell_sent: bool = False
+        ) -> None: ...
+
+        def render_streaming_shell(self, request: Any) -> Optional[str]: ...
 
         def get_debug_update(self) -> Dict[str, Any]: ...
 
@@ -146,14 +168,9 @@ class RequestMixin:
         # Check login_required / permission_required (matches WebSocket path).
         # Without this, views with login_required=True render their full HTML
         # to unauthenticated users on the initial HTTP GET.
-        from ..auth import check_view_auth
-
-        redirect_url = check_view_auth(self, request)
-        if redirect_url:
-            from django.utils.http import urlencode
-
-            next_url = f"{redirect_url}?{urlencode({'next': request.get_full_path()})}"
-            return HttpResponseRedirect(next_url)
+        auth_redirect = self._auth_redirect(request)
+        if auth_redirect is not None:
+            return auth_redirect
 
         # Initialize temporary assigns with default values before mount
         self._initialize_temporary_assigns()
@@ -354,6 +371,19 @@ class RequestMixin:
             return self._make_streaming_response(html)
         return HttpResponse(html)
 
+    def _auth_redirect(self, request: "HttpRequest") -> Optional[HttpResponseRedirect]:
+        """Login redirect for ``login_required`` / ``permission_required``, or ``None``."""
+        from ..auth import check_view_auth
+
+        redirect_url = check_view_auth(self, request)
+        if not redirect_url:
+            return None
+        from django.utils.http import urlencode
+
+        return HttpResponseRedirect(
+            f"{redirect_url}?{urlencode({'next': request.get_full_path()})}"
+        )
+
     def _make_streaming_response(self, full_html: str) -> StreamingHttpResponse:
         """Return a chunked ``StreamingHttpResponse`` for the initial GET.
 
@@ -440,6 +470,8 @@ class RequestMixin:
           gracefully-degrade contract per ADR-015 risk #10.
         * ASGI deployment with ``streaming_render = True`` —
           shell-then-body chunks via the async iterator.
+        * ... and ``streaming_shell_first = True`` — the shell is sent
+          before ``mount()`` runs (:meth:`_aget_shell_first`).
 
         ASGI disconnect handling: a background task polls
         ``request.is_disconnected()`` (Django 5.x) and calls
@@ -456,6 +488,13 @@ class RequestMixin:
         if not self._is_asgi_context(request):
             return await sync_to_async(self.get)(request, *args, **kwargs)
 
+        if getattr(self, "streaming_render", False) and getattr(
+            self, "streaming_shell_first", False
+        ):
+            early = await self._aget_shell_first(request, *args, **kwargs)
+            if early is not None:
+                return early
+
         # Run the existing sync GET pipeline to produce the fully-rendered
         # HTML and any redirect / error responses. We do this in a thread
         # via sync_to_async so the per-request mount/render work doesn't
@@ -482,37 +521,13 @@ class RequestMixin:
         if not getattr(self, "streaming_render", False):
             return sync_response
 
-        # Pull the rendered HTML out of the response. For an HttpResponse
-        # this is .content; for a Phase-1 StreamingHttpResponse it's the
-        # joined sync iterator.
-        if isinstance(sync_response, StreamingHttpResponse):
-            html_bytes = b"".join(
-                chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
-                for chunk in sync_response.streaming_content
-            )
-        else:
-            html_bytes = sync_response.content
-
-        try:
-            full_html = html_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            full_html = html_bytes.decode("utf-8", errors="replace")
+        full_html = self._response_html(sync_response)
 
         emitter = ChunkEmitter(request)
         # Stash on the view so PR-B's lazy thunks can find it from the
         # template-tag render path.
         self._chunk_emitter = emitter
-
-        # PR-B (ADR-015): the live_render tag stashes lazy thunks on
-        # ``self._lazy_thunks`` during the sync ``get()`` render (the
-        # tag has no access to the emitter at render time because aget
-        # constructs the emitter AFTER ``sync_to_async(self.get)``
-        # returns). Transfer the stash to the emitter so phase-5 of
-        # ``arender_chunks`` can invoke them.
-        stashed_thunks = getattr(self, "_lazy_thunks", None) or []
-        self._lazy_thunks = []  # reset to defend against view-instance re-use
-        for view_id, thunk_fn in stashed_thunks:
-            emitter.register_thunk(view_id, thunk_fn)
+        self._transfer_lazy_thunks(emitter)
 
         # Producer task: render chunks into the emitter's queue.
         # ``arender_chunks`` is a regular coroutine that pushes via
@@ -526,7 +541,176 @@ class RequestMixin:
             finally:
                 await emitter.close()
 
-        produce_task = asyncio.ensure_future(_produce())
+        response = self._emitter_response(request, emitter, _produce())
+        # Copy any cookies/headers the sync_response set (CSRF cookie etc.)
+        # so we don't drop them by re-wrapping.
+        for header, value in sync_response.items():
+            if header.lower() in {"content-length", "content-type"}:
+                continue
+            response[header] = value
+        for cookie in sync_response.cookies.values():
+            response.cookies[cookie.key] = cookie
+
+        return response
+
+    async def _aget_shell_first(
+        self, request: "HttpRequest", *args: Any, **kwargs: Any
+    ) -> Optional[HttpResponse]:
+        """``streaming_shell_first`` GET: flush the shell, then mount and stream the body.
+
+        The shell from :meth:`TemplateMixin.render_streaming_shell` is the
+        first chunk, sent before ``mount()``; the sync :meth:`get` then runs
+        in a thread and its output is streamed from ``<div dj-root>`` on,
+        followed by the lazy-child fills as usual. The auth redirect is
+        decided before anything is sent. Everything ``get()`` decides later
+        arrives after the ``200`` status line: an ``on_mount`` redirect is
+        sent as a client-side redirect, an error response's body is
+        streamed as-is under the ``200`` (its status is only logged), and
+        headers or cookies that ``get()`` / ``mount()`` set on its response
+        cannot be sent any more — they are dropped with a warning. Returns
+        ``None`` when the view has no separable shell, so the caller streams
+        the usual way.
+        """
+        from asgiref.sync import sync_to_async
+
+        from ..http_streaming import ChunkEmitter, ChunkEmitterCancelled
+
+        auth_redirect = await sync_to_async(self._auth_redirect)(request)
+        if auth_redirect is not None:
+            return auth_redirect
+        shell = await sync_to_async(self.render_streaming_shell)(request)
+        if shell is None:
+            return None
+        # Headers and cookies leave with the shell, before get() runs: the
+        # session and CSRF cookie have to exist now.
+        await sync_to_async(self._prepare_shell_first_request)(request)
+
+        emitter = ChunkEmitter(request)
+        self._chunk_emitter = emitter
+
+        async def _produce() -> None:
+            try:
+                await emitter.emit(shell.encode("utf-8"))
+                await asyncio.sleep(0)
+                sync_response = await sync_to_async(self._get_after_shell)(request, *args, **kwargs)
+                self._warn_dropped_after_shell(sync_response)
+                if isinstance(sync_response, HttpResponseRedirect):
+                    await emitter.emit(_client_redirect_chunk(request, sync_response.url))
+                elif getattr(sync_response, "status_code", 200) >= 400:
+                    logger.warning(
+                        "streaming_shell_first: %s returned %s after the shell was sent; "
+                        "streaming its body under status 200",
+                        self.__class__.__name__,
+                        sync_response.status_code,
+                    )
+                    await emitter.emit(self._response_html(sync_response).encode("utf-8"))
+                else:
+                    self._transfer_lazy_thunks(emitter)
+                    await self.arender_chunks(
+                        self._response_html(sync_response), emitter, shell_sent=True
+                    )
+            except ChunkEmitterCancelled:
+                logger.debug("streaming_shell_first: cancelled mid-stream")
+            except Exception:
+                logger.exception("streaming_shell_first GET raised after the shell was sent")
+                await emitter.cancel("producer_error")
+            finally:
+                await emitter.close()
+
+        response = self._emitter_response(request, emitter, _produce())
+        response["X-Djust-Shell-First"] = "1"
+        return response
+
+    def _warn_dropped_after_shell(self, response: HttpResponse) -> None:
+        """Log the headers and cookies ``get()`` set after the shell was sent.
+
+        The CSRF cookie and its ``Vary: Cookie`` from ``ensure_csrf_cookie``
+        are not reported: :meth:`_prepare_shell_first_request` already had
+        the middleware put them on the shell response.
+        """
+        from django.conf import settings
+
+        headers = [
+            header
+            for header, value in response.items()
+            if header.lower() not in {"content-length", "content-type", "location"}
+            and not header.lower().startswith("x-djust-")
+            and not (header.lower() == "vary" and value.lower() == "cookie")
+        ]
+        cookies = [key for key in response.cookies if key != settings.CSRF_COOKIE_NAME]
+        if headers or cookies:
+            logger.warning(
+                "streaming_shell_first: %s set headers %s and cookies %s after the "
+                "shell was sent; they were dropped",
+                self.__class__.__name__,
+                headers,
+                cookies,
+            )
+
+    def _prepare_shell_first_request(self, request: "HttpRequest") -> None:
+        """Create the session and request the CSRF cookie ahead of ``get()``."""
+        from django.middleware.csrf import get_token
+
+        if not request.session.session_key:
+            request.session.create()
+        # What ``ensure_csrf_cookie`` on get() would otherwise do after the
+        # response has already left.
+        get_token(request)
+
+    def _get_after_shell(self, request: "HttpRequest", *args: Any, **kwargs: Any) -> HttpResponse:
+        """Run :meth:`get` and save the session it wrote to.
+
+        ``SessionMiddleware`` saved the session when the streaming response
+        was returned — before ``get()`` stored the view state in it.
+        """
+        response = self.get(request, *args, **kwargs)
+        if request.session.modified:
+            request.session.save()
+        return response
+
+    @staticmethod
+    def _response_html(response: HttpResponse) -> str:
+        """The rendered HTML of a ``get()`` response.
+
+        For an HttpResponse this is .content; for a Phase-1
+        StreamingHttpResponse it's the joined sync iterator.
+        """
+        if isinstance(response, StreamingHttpResponse):
+            html_bytes = b"".join(
+                chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+                for chunk in response.streaming_content
+            )
+        else:
+            html_bytes = response.content
+
+        try:
+            return html_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            return html_bytes.decode("utf-8", errors="replace")
+
+    def _transfer_lazy_thunks(self, emitter: "ChunkEmitter") -> None:
+        """Move the lazy thunks stashed during ``get()`` onto ``emitter``.
+
+        PR-B (ADR-015): the live_render tag stashes lazy thunks on
+        ``self._lazy_thunks`` during the sync ``get()`` render (the tag has
+        no access to the emitter at render time because aget constructs the
+        emitter AFTER ``sync_to_async(self.get)`` returns). Transfer the
+        stash to the emitter so phase-5 of ``arender_chunks`` can invoke
+        them.
+        """
+        stashed_thunks = getattr(self, "_lazy_thunks", None) or []
+        self._lazy_thunks = []  # reset to defend against view-instance re-use
+        for view_id, thunk_fn in stashed_thunks:
+            emitter.register_thunk(view_id, thunk_fn)
+
+    def _emitter_response(
+        self, request: "HttpRequest", emitter: "ChunkEmitter", producer: Any
+    ) -> StreamingHttpResponse:
+        """Start ``producer`` and return a response streaming ``emitter``.
+
+        ``producer`` is the coroutine that fills the emitter and closes it.
+        """
+        produce_task = asyncio.ensure_future(producer)
 
         # Disconnect watcher: poll request.is_disconnected() (Django 5.x).
         # Older Django versions don't expose it; we degrade silently.
@@ -580,15 +764,6 @@ class RequestMixin:
         response["X-Djust-Streaming"] = "1"
         # PR-A marker so callers can tell the async path was used.
         response["X-Djust-Streaming-Phase"] = "2"
-        # Copy any cookies/headers the sync_response set (CSRF cookie etc.)
-        # so we don't drop them by re-wrapping.
-        for header, value in sync_response.items():
-            if header.lower() in {"content-length", "content-type"}:
-                continue
-            response[header] = value
-        for cookie in sync_response.cookies.values():
-            response.cookies[cookie.key] = cookie
-
         return response
 
     def post(self, request: "HttpRequest", *args: Any, **kwargs: Any) -> HttpResponse:
@@ -7,6 +7,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union
 from urllib.parse import parse_qs, urlencode
 
+from ..observability.render_costs import render_phase
 from ..security import sanitize_for_log
 from ..serialization import normalize_django_value
 from ..utils import get_template_dirs
@@ -269,6 +270,7 @@ class RustBridgeMixin:
         # instantiated standalone). See streaming.py for the same pattern.
         request: Any
         _rust_view: Any
+        _hibernated_rust_view: Optional[bytes]
         _websocket_session_id: Optional[str]
         _django_session_key: Optional[str]
         _cached_csrf_token: Optional[str]
@@ -333,6 +335,64 @@ class RustBridgeMixin:
             enabled = True
         rust_view.set_template_auto_call(enabled)
 
+    def _hibernate_rust_view(self) -> int:
+        """Compress the Rust view into a blob and drop it (idle hibernation).
+
+        Serializes with ``serialize_msgpack`` (template, state, last VDOM,
+        version) and zstd-compresses the bytes; the transient render caches
+        are simply freed. The next ``_initialize_rust_view`` restores it — see
+        :mod:`djust.hibernation`. Returns the stored size, 0 if there was no
+        Rust view to hibernate.
+        """
+        rust_view = self._rust_view
+        if rust_view is None:
+            return 0
+        from ..config import config
+        from ..hibernation import hibernation_stats
+        from ..state_backends.base import compress_blob
+
+        state = rust_view.serialize_msgpack()
+        blob = compress_blob(state, int(config.get("hibernate_compression_level", 3)))
+        self._hibernated_rust_view = blob
+        self._rust_view = None
+        # A restored view has no raw-value sidecar, so the first sync after
+        # waking must send the whole context. Dropping the fingerprint forces
+        # that and stops these dicts pinning context values meanwhile.
+        self._prev_context_refs = {}
+        self._prev_context_immutables = {}
+        self._prev_context_containers = {}
+        hibernation_stats["hibernated"] += 1
+        hibernation_stats["state_bytes"] += len(state)
+        hibernation_stats["stored_bytes"] += len(blob)
+        return len(blob)
+
+    def _rehydrate_rust_view(self) -> bool:
+        """Restore a view hibernated by :meth:`_hibernate_rust_view`.
+
+        Returns False if the view is not hibernated or the restore failed, in
+        which case the caller builds a fresh Rust view (no diff baseline, so
+        the next frame is a full ``html_update``).
+        """
+        blob = getattr(self, "_hibernated_rust_view", None)
+        if blob is None:
+            return False
+        self._hibernated_rust_view = None
+        from ..hibernation import hibernation_stats
+        from ..state_backends.base import decompress_blob
+
+        try:
+            self._rust_view = RustLiveView.deserialize_msgpack(decompress_blob(blob))
+        except Exception:  # noqa: BLE001 - fall back to a fresh view
+            hibernation_stats["failed"] += 1
+            logger.exception("[LiveView] Restoring hibernated view failed; rebuilding")
+            return False
+        # Same transient settings a backend cache hit re-applies.
+        self._rust_view.set_template_dirs(get_template_dirs())
+        self._apply_loop_render_cache_flag()
+        self._apply_template_auto_call_flag()
+        hibernation_stats["rehydrated"] += 1
+        return True
+
     def _initialize_rust_view(self, request: Any = None) -> None:
         """Initialize the Rust LiveView backend"""
 
@@ -346,6 +406,9 @@ class RustBridgeMixin:
         # Python-rendered paths.
         _ensure_custom_filters_bridged()
 
+        if self._rust_view is None and self._rehydrate_rust_view():
+            return
+
         if self._rust_view is None:
             # Derive the per-template 8-hex hash for the cache key (#1362
             # section 1) — operators no longer need to set
@@ -424,7 +487,9 @@ class RustBridgeMixin:
                     self._apply_loop_render_cache_flag()
                     self._apply_template_auto_call_flag()
                     logger.debug("[LiveView] Cache HIT! Using cached RustLiveView")
-                    backend.set(self._cache_key, cached_view)
+                    # Nothing changed since the load — a delta-capable
+                    # backend only refreshes the TTL instead of rewriting.
+                    backend.set_delta(self._cache_key, cached_view, ())
                     return
                 else:
                     logger.debug("[LiveView] Cache MISS! Will create new RustLiveView")
@@ -459,7 +524,9 @@ class RustBridgeMixin:
                     self._apply_loop_render_cache_flag()
                     self._apply_template_auto_call_flag()
                     logger.debug("[LiveView] Cache HIT! Using cached RustLiveView")
-                    backend.set(self._cache_key, cached_view)
+                    # Nothing changed since the load — a delta-capable
+                    # backend only refreshes the TTL instead of rewriting.
+                    backend.set_delta(self._cache_key, cached_view, ())
                     return
                 else:
                     logger.debug("[LiveView] Cache MISS! Will create new RustLiveView")
@@ -492,6 +559,28 @@ class RustBridgeMixin:
                 backend = get_backend()
                 backend.set(self._cache_key, self._rust_view)
 
+    def _persist_state_delta(self, changed_keys: List[str]) -> None:
+        """Save the keys just synced to Rust as fragments of the cached view.
+
+        Only active when the state backend persists per-key deltas
+        (``REDIS_DELTA_ENABLED``); other backends keep saving the whole
+        view at creation time only. A failed save is logged, never raised —
+        the in-process view is still authoritative for this connection.
+        """
+        from ..state_backend import get_backend
+
+        backend = get_backend()
+        if not getattr(backend, "delta_enabled", False):
+            return
+        try:
+            backend.set_delta(self._cache_key, self._rust_view, changed_keys)
+        except Exception:
+            logger.warning(
+                "Failed to persist state delta for %s",
+                sanitize_for_log(self._cache_key),
+                exc_info=True,
+            )
+
     def _get_cached_template_hash_slot(self) -> str:
         """Return the ``_t<8hex>`` cache-key slot for this view's template.
 
@@ -669,9 +758,11 @@ class RustBridgeMixin:
             from ..components.base import Component, LiveComponent
             from django import forms
 
-            full_context = (
-                preloaded_context if preloaded_context is not None else self.get_context_data()
-            )
+            if preloaded_context is not None:
+                full_context = preloaded_context
+            else:
+                with render_phase("context"):
+                    full_context = self.get_context_data()
 
             # Defensive normalize pass for DB values added after super() (#1205, #1207).
             # When a user overrides ``get_context_data`` and sets a raw DB
@@ -702,10 +793,11 @@ class RustBridgeMixin:
                 _key: _val for _key, _val in full_context.items() if isinstance(_val, _DjModel)
             }
 
-            for _key, _val in list(full_context.items()):
-                _normalized = _normalize_db_values(_val)
-                if _normalized is not _val:
-                    full_context[_key] = _normalized
+            with render_phase("normalize"):
+                for _key, _val in list(full_context.items()):
+                    _normalized = _normalize_db_values(_val)
+                    if _normalized is not _val:
+                        full_context[_key] = _normalized
 
             # Apply Django context processors so context-processor vars
             # (e.g. djust theming's {{ theme_panel }} / {{ theme_head }})
@@ -994,7 +1086,8 @@ class RustBridgeMixin:
 
             # Skip normalize_django_value when context only has JSON-native types
             if needs_normalize:
-                json_compatible_context = normalize_django_value(rendered_context)
+                with render_phase("normalize"):
+                    json_compatible_context = normalize_django_value(rendered_context)
             else:
                 json_compatible_context = rendered_context
 
@@ -1087,23 +1180,30 @@ class RustBridgeMixin:
                 if _candidate:
                     user_changed = _candidate
 
-            self._rust_view.update_state(json_compatible_context)
-            if safe_keys:
-                self._rust_view.mark_safe_keys(safe_keys)
-
-            # Always call set_raw_py_values (even when empty) so stale
-            # objects from a previous render are cleared.
-            if sidecar is not None:
-                try:
-                    self._rust_view.set_raw_py_values(sidecar)
-                except Exception:
-                    logging.getLogger("djust.rust_bridge").warning(
-                        "set_raw_py_values failed; template getattr fallback disabled this cycle",
-                        exc_info=True,
-                    )
-
-            if user_changed is not None:
-                self._rust_view.set_changed_keys(user_changed)
+            with render_phase("sync"):
+                self._rust_view.update_state(json_compatible_context)
+                if safe_keys:
+                    self._rust_view.mark_safe_keys(safe_keys)
+
+                # Always call set_raw_py_values (even when empty) so stale
+                # objects from a previous render are cleared.
+                if sidecar is not None:
+                    try:
+                        self._rust_view.set_raw_py_values(sidecar)
+                    except Exception:
+                        logging.getLogger("djust.rust_bridge").warning(
+                            "set_raw_py_values failed; template getattr fallback disabled "
+                            "this cycle",
+                            exc_info=True,
+                        )
+
+                if user_changed is not None:
+                    self._rust_view.set_changed_keys(user_changed)
+
+            if self._cache_key:
+                self._persist_state_delta(
+                    [k for k in json_compatible_context if k not in _skip_keys]
+                )
 
             # Mark static assigns as sent — subsequent syncs will skip them
             if getattr(self, "static_assigns", None) and not getattr(
@@ -7,8 +7,13 @@ import json
 import logging
 import os
 import re
-from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, TYPE_CHECKING
 
+from .. import metrics
+from ..observability.render_costs import add_phase_ms
 from ..utils import get_template_dirs
 
 if TYPE_CHECKING:  # pragma: no cover — imported only for type hints
@@ -66,6 +71,26 @@ _SCRIPT_BLOCK_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 
+# Resolved template sources shared by the mounts of one ``mount_batch`` (see
+# :func:`mount_batch_template_cache`). ``None`` outside a batch.
+_batch_templates: ContextVar[Optional[Dict[Tuple[type, str], Tuple[str, Optional[str]]]]] = (
+    ContextVar("djust_batch_templates", default=None)
+)
+
+
+@contextmanager
+def mount_batch_template_cache() -> Iterator[None]:
+    """Load and resolve each view class's template once per ``mount_batch``.
+
+    Scoped to the batch rather than the process so template edits are picked
+    up on the next mount without any invalidation hook.
+    """
+    token = _batch_templates.set({})
+    try:
+        yield
+    finally:
+        _batch_templates.reset(token)
+
 
 class TemplateMixin:
     """Template-related methods: get_template, render, render_full_template, render_with_diff,
@@ -115,7 +140,25 @@ class TemplateMixin:
 
         For templates with inheritance, extracts only [dj-root] content
         for VDOM tracking to avoid tracking the entire document.
+
+        Inside :func:`mount_batch_template_cache` a ``template_name`` is loaded
+        and resolved once per view class and replayed for the batch's other
+        instances (``_full_template`` included).
         """
+        cache = _batch_templates.get()
+        if cache is None or self.template or not self.template_name:
+            return self._load_template_source()
+        key = (type(self), self.template_name)
+        hit = cache.get(key)
+        if hit is None:
+            source = self._load_template_source()
+            cache[key] = (source, getattr(self, "_full_template", None))
+            return source
+        self._full_template = hit[1]
+        return hit[0]
+
+    def _load_template_source(self) -> str:
+        """Uncached body of :meth:`get_template`."""
         if self.template:
             return self.template
         elif self.template_name:
@@ -476,6 +519,7 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
         self,
         full_html: str,
         emitter: "ChunkEmitter",
+        shell_sent: bool = False,
     ) -> None:
         """Async-generator producer that pushes shell-then-body chunks.
 
@@ -514,6 +558,9 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
             via ``emitter.__aiter__`` to the consumer (typically the
             ``StreamingHttpResponse`` async iterator wired in
             :meth:`RequestMixin.aget`).
+        :param shell_sent: ``True`` when the shell already went out ahead of
+            ``mount()`` (:meth:`render_streaming_shell`,
+            ``streaming_shell_first``); chunk 1 is then skipped.
         :returns: ``None``. This is a coroutine, not an async generator —
             chunks are delivered exclusively via ``emitter.emit()``.
         """
@@ -557,7 +604,7 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
 
         try:
             # 1. Shell: <!DOCTYPE>, <head>, <body>, top chrome.
-            if shell_open:
+            if shell_open and not shell_sent:
                 await emitter.emit(shell_open.encode("utf-8"))
             # Yield to the loop so ASGI can flush the shell over the wire
             # before we proceed. PR-B uses this same await as the boundary
@@ -594,9 +641,17 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
         # max(thunk_durations) instead of sum(thunk_durations). Client-
         # side reconciliation is keyed by slot id (``data-target``) so
         # out-of-order arrival is correct by construction.
+        #
+        # At most ``emitter.max_concurrency`` thunks render at once. When
+        # ``emitter.deadline`` passes, the unfinished ones are cancelled
+        # and their ``deadline_fallback`` chunk is sent instead (see
+        # ``_emit_deferred``).
         if not emitter.thunks:
             return
 
+        slots = asyncio.Semaphore(emitter.max_concurrency)
+        lazy_start = time.monotonic()
+
         # Per-thunk wrapper returns ``(view_id, result, exc)`` so the
         # surfacing task is unambiguously identified at completion
         # time. A naive ``next(t for t in task_to_id if t.done() and
@@ -604,18 +659,22 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
         # exception task — on multi-failure that attributes the wrong
         # view_id. Wrapping packages the identity at thunk-start time.
         async def _wrap(view_id: str, thunk_fn: Any) -> Tuple[str, Any, Optional[Exception]]:
-            try:
-                result = await thunk_fn()
-            except asyncio.CancelledError:
-                # Re-raise so as_completed sees the cancellation
-                # propagate; otherwise the wrapped task swallows the
-                # cancel signal and the caller can't tell.
-                raise
-            except ChunkEmitterCancelled:
-                raise
-            except Exception as exc:  # noqa: BLE001 — captured for logging
-                return (view_id, None, exc)
-            return (view_id, result, None)
+            async with slots:
+                started = time.monotonic()
+                try:
+                    result = await thunk_fn()
+                except asyncio.CancelledError:
+                    # Re-raise so as_completed sees the cancellation
+                    # propagate; otherwise the wrapped task swallows the
+                    # cancel signal and the caller can't tell.
+                    raise
+                except ChunkEmitterCancelled:
+                    raise
+                except Exception as exc:  # noqa: BLE001 — captured for logging
+                    emitter.record_thunk(view_id, "failed", time.monotonic() - started)
+                    return (view_id, None, exc)
+                emitter.record_thunk(view_id, "streamed", time.monotonic() - started)
+                return (view_id, result, None)
 
         thunk_tasks = [
             asyncio.ensure_future(_wrap(view_id, thunk_fn)) for view_id, thunk_fn in emitter.thunks
@@ -657,7 +716,34 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
                     # Swallow — we cancelled these tasks ourselves.
                     pass
 
-        as_completed_iter = asyncio.as_completed(thunk_tasks)
+        async def _emit_deferred() -> None:
+            """Send the fallback chunk of every thunk that missed the deadline.
+
+            Runs after ``_cancel_pending``. A thunk that finished in the
+            window between the timeout and the cancel is not deferred; it
+            already went out or is emitted here from its task result.
+            """
+            waited = time.monotonic() - lazy_start
+            for task, (view_id, thunk_fn) in zip(thunk_tasks, emitter.thunks):
+                if view_id in emitted:
+                    continue
+                if task.done() and not task.cancelled():
+                    _view_id, chunk_bytes, exc = task.result()
+                    if exc is None and chunk_bytes is not None:
+                        await emitter.emit(chunk_bytes)
+                    continue
+                emitter.record_thunk(view_id, "deferred", waited)
+                fallback = getattr(thunk_fn, "deadline_fallback", None)
+                if fallback is not None:
+                    await emitter.emit(fallback())
+            logger.debug(
+                "arender_chunks: lazy deadline passed after %.3fs; deferred %s",
+                waited,
+                [v for v, (outcome, _s) in emitter.thunk_timings.items() if outcome == "deferred"],
+            )
+
+        emitted: Set[str] = set()
+        as_completed_iter = asyncio.as_completed(thunk_tasks, timeout=emitter.time_left())
         try:
             for completed in as_completed_iter:
                 if emitter.cancelled:
@@ -675,6 +761,13 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
                     view_id, chunk_bytes, exc = await completed
                 except ChunkEmitterCancelled:
                     raise
+                except asyncio.TimeoutError:
+                    # ``emitter.deadline`` passed; every later ``completed``
+                    # raises the same, so drain them and send fallbacks.
+                    _cancel_pending()
+                    await _drain_iterator(as_completed_iter)
+                    await _emit_deferred()
+                    return
                 except asyncio.CancelledError:
                     # Suppressing CancelledError is safe HERE because
                     # this is an INNER thunk task being cancelled by
@@ -685,6 +778,7 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
                     # then the outer ``except ChunkEmitterCancelled``
                     # branch. Re-raising here would short-circuit that.
                     continue
+                emitted.add(view_id)
                 if exc is not None:
                     logger.exception(
                         "arender_chunks: lazy thunk raised for view_id=%s; "
@@ -722,6 +816,73 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
                 # Best-effort drain — never raise from finally.
                 pass
 
+    def get_shell_context_data(self) -> Dict[str, Any]:
+        """Extra context for the page shell of a ``streaming_shell_first`` view.
+
+        Called before ``mount()``, so it must not read mount state. The
+        context processors' output is added on top. Default: ``{}``.
+        """
+        return {}
+
+    def render_streaming_shell(self, request: "HttpRequest") -> Optional[str]:
+        """Render the page shell (everything before ``<div dj-root>``) without mounting.
+
+        Used by :meth:`RequestMixin.aget` for ``streaming_shell_first`` views
+        so the ``<head>`` reaches the browser while ``mount()`` runs. The
+        ``dj-root`` subtree is cut out of the template source before the
+        render, so nothing inside it (``{% live_render %}`` children
+        included) is evaluated. Returns ``None`` — stream the usual way —
+        when the view has no separable shell: a ``template`` property, a
+        ``wrapper_template``, no ``<div dj-root>``, or a shell that does
+        not render without mount state.
+        """
+        if getattr(self, "wrapper_template", None) or isinstance(
+            getattr(type(self), "template", None), property
+        ):
+            return None
+        try:
+            self.get_template()
+            source = getattr(self, "_full_template", None) or self.template
+            root = _DJ_ROOT_RE.search(source) if source else None
+            if root is None:
+                return None
+            _close_start, close_end = TemplateMixin._find_closing_div_pos(source, root.end())
+            if close_end is None:
+                return None
+            shell_source = source[: root.start()] + "<div dj-root></div>" + source[close_end:]
+
+            from django.http import HttpRequest
+
+            from djust._rust import RustLiveView
+
+            from ..mixins.rust_bridge import _collect_safe_keys
+            from ..serialization import normalize_django_value
+
+            context = self._apply_context_processors(dict(self.get_shell_context_data()), request)
+            json_compatible_context = normalize_django_value(
+                {k: v for k, v in context.items() if not isinstance(v, HttpRequest)}
+            )
+            safe_keys = []
+            for key, value in json_compatible_context.items():
+                safe_keys.extend(_collect_safe_keys(value, key))
+
+            temp_rust = RustLiveView(shell_source, get_template_dirs())
+            temp_rust.update_state(json_compatible_context)
+            if safe_keys:
+                temp_rust.mark_safe_keys(safe_keys)
+            shell_html = temp_rust.render()
+        except Exception:  # noqa: BLE001 — fall back to the mount-first stream
+            logger.warning(
+                "streaming_shell_first: shell of %s does not render before mount; "
+                "streaming after mount instead",
+                self.__class__.__name__,
+                exc_info=True,
+            )
+            return None
+
+        root = _DJ_ROOT_RE.search(shell_html)
+        return shell_html[: root.start()] if root else None
+
     def _split_for_streaming(self, full_html: str) -> Tuple[str, str, str]:
         """Split rendered HTML into ``(shell_open, main_content, shell_close)``.
 
@@ -1161,6 +1322,14 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
 
         logger.debug("[LiveView] _rust_view after init: %s", self._rust_view)
 
+        # A ``shared_broadcast`` view that forwarded another consumer's patches
+        # still holds its pre-push VDOM. Drop that baseline so this render
+        # ships full HTML instead of patches against the wrong tree.
+        if getattr(self, "_shared_baseline_stale", False) and self._rust_view is not None:
+            self._rust_view.reset()
+            self._shared_baseline_stale = False
+            self._shared_resync_pending = True
+
         # Skip sync if already done this cycle (avoids double-sync which
         # causes false-positive id() changes and defeats the text fast path).
         if not getattr(self, "_sync_done_this_cycle", False):
@@ -1200,6 +1369,11 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
             )
         html, patches_json, version = result
 
+        if getattr(self, "shared_broadcast", False):
+            from ..push import shared_renders
+
+            shared_renders.note_render(self, html)
+
         # Record dj-model auto-allowlist from the TEMPLATE SOURCE (CWE-915
         # mass-assignment guard). This is the dominant render path — HTTP-GET
         # baseline, every WS mount, and every WS event re-render all funnel
@@ -1212,6 +1386,12 @@ Object.assign(window.handlerMetadata, {json.dumps(metadata)});
 
         # Capture per-phase Rust timing (render, parse, diff, serialize)
         self._rust_render_timing = self._rust_view.get_render_timing()
+        if isinstance(self._rust_render_timing, dict):
+            timing = self._rust_render_timing
+            add_phase_ms("render", timing.get("render_ms", 0.0))
+            add_phase_ms("diff", timing.get("parse_ms", 0.0) + timing.get("diff_ms", 0.0))
+            add_phase_ms("encode", timing.get("serialize_ms", 0.0))
+            metrics.render_duration.observe(timing.get("total_ms", 0.0) / 1000.0)
 
         logger.debug(
             "[LiveView] Rendered HTML length: %d chars, starts with: %s...",
@@ -0,0 +1,378 @@
+"""
+Per-(view class, event) render-cost breakdown.
+
+``timings.py`` answers "how long did the handler take"; this module answers
+"where did the rest of the event turn go". The runtime opens a
+:func:`render_cost_scope` around every event turn (WS and SSE), and the
+pipeline stages record their share of it:
+
+    handler    the event handler itself (fed by ``record_handler_timing``)
+    snapshot   pre/post assigns snapshot + changed-key detection
+    context    ``get_context_data()``
+    normalize  JIT QuerySet/Model serialization + ``normalize_django_value``
+    sync       pushing state into the Rust view (``update_state`` & co.)
+    render     Rust template render
+    diff       Rust HTML parse + VDOM diff
+    encode     Rust patch serialization + outbound frame JSON encoding
+    send       handing the frame to the transport
+
+Nested phases are *exclusive* — JIT serialization inside
+``get_context_data`` counts as ``normalize``, not ``context`` — so the phases
+of one turn add up to at most its wall time; the remainder (auth, locks,
+executor hops) is reported as ``other``.
+
+Samples go into :class:`LogHistogram` — fixed-memory, log-bucketed
+histograms in the spirit of HdrHistogram — so recording is O(1), nothing is
+ever sorted, and percentiles cover every turn since the process started
+rather than the last 100. Recording costs a ``perf_counter`` pair per phase;
+set ``LIVEVIEW_CONFIG['render_profiling'] = False`` to turn the scopes into
+no-ops.
+
+The MCP reads the aggregate via /_djust/observability/render_costs/.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+PHASES = (
+    "handler",
+    "snapshot",
+    "context",
+    "normalize",
+    "sync",
+    "render",
+    "diff",
+    "encode",
+    "send",
+)
+
+# Distinct (view_class, event) pairs kept; least recently recorded evicted.
+_MAX_PROFILES = 512
+
+# Sub-bucket resolution: 2**5 = 32 linear buckets per power of two below the
+# first octave, 16 per octave above it — ~3% worst-case relative error.
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT >> 1
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF_COUNT + (value >> shift) - _HALF_COUNT
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < _SUB_COUNT:
+        return index, index
+    shift, offset = divmod(index - _SUB_COUNT, _HALF_COUNT)
+    shift += 1
+    mantissa = offset + _HALF_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LogHistogram:
+    """Log-linear histogram of non-negative integers (HdrHistogram-style).
+
+    Values below 32 get exact buckets; above that every power-of-two range
+    is split into 16 equal buckets, so a percentile is accurate to ~3% of
+    its value regardless of magnitude. Buckets are stored sparsely — a
+    histogram of millisecond-scale microsecond samples holds a few dozen
+    ints. Not thread-safe on its own; the module lock guards it.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        value = max(0, int(value))
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, pct: float) -> int:
+        """Value at or below which ``pct`` (0..100) percent of samples fall.
+
+        Reported as the midpoint of the bucket holding that rank, clamped to
+        the exact min/max. Empty histogram → 0.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lo, hi = _bucket_bounds(index)
+                return int(min(self.max, max(self.min, (lo + hi) // 2)))
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class _EventProfile:
+    __slots__ = ("turns", "phases", "total", "other", "bytes_sent", "last_ms")
+
+    def __init__(self) -> None:
+        self.turns = 0
+        self.phases: Dict[str, LogHistogram] = {}
+        self.total = LogHistogram()
+        self.other = LogHistogram()
+        self.bytes_sent = LogHistogram()
+        self.last_ms = 0
+
+
+_profiles: "OrderedDict[Tuple[str, str], _EventProfile]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _current_task() -> Optional["asyncio.Task[Any]"]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # no running loop: a sync caller or executor thread
+        return None
+
+
+class RenderCost:
+    """Phase durations accumulated over one event turn (milliseconds).
+
+    Only the task that opened the turn records into it. Tasks spawned inside
+    the scope (``start_async``, background pushes …) inherit the contextvar,
+    so every recorder checks the owner first — otherwise they could add
+    phases to a finished turn, or interleave their phases with the owner's
+    on ``_stack``. Executor threads (``sync_to_async`` hops) have no task of
+    their own and record for the turn that awaits them.
+    """
+
+    __slots__ = ("phases", "bytes_sent", "_stack", "_owner", "_open")
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        self.bytes_sent = 0
+        # [phase, start, time spent in nested phases]
+        self._stack: List[List[Any]] = []
+        self._owner = _current_task()
+        self._open = True
+
+    def _accepts(self) -> bool:
+        if not self._open:
+            return False
+        if self._owner is None:
+            return True
+        task = _current_task()
+        return task is None or task is self._owner
+
+    def add(self, phase: str, ms: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + ms
+        if self._stack:
+            # Externally measured time (Rust timings, handler duration)
+            # reported while a phase is open belongs to it exclusively.
+            self._stack[-1][2] += ms
+
+
+_current: "contextvars.ContextVar[Optional[RenderCost]]" = contextvars.ContextVar(
+    "djust_render_cost", default=None
+)
+
+
+class _Phase:
+    __slots__ = ("_cost", "_name")
+
+    def __init__(self, cost: RenderCost, name: str) -> None:
+        self._cost = cost
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._cost._stack.append([self._name, time.perf_counter(), 0.0])
+
+    def __exit__(self, *exc: Any) -> None:
+        stack = self._cost._stack
+        name, start, nested = stack.pop()
+        elapsed = (time.perf_counter() - start) * 1000
+        self._cost.phases[name] = self._cost.phases.get(name, 0.0) + elapsed - nested
+        if stack:
+            stack[-1][2] += elapsed
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+def _recording_cost() -> Optional[RenderCost]:
+    cost = _current.get()
+    if cost is None or not cost._accepts():
+        return None
+    return cost
+
+
+def render_phase(name: str) -> Any:
+    """Context manager timing ``name`` into the current turn's cost.
+
+    A shared no-op object outside a :func:`render_cost_scope` (ticks, pushes,
+    HTTP GET), so instrumented code pays one contextvar read. Also a no-op
+    in a task the turn's owner spawned (see :class:`RenderCost`).
+    """
+    cost = _recording_cost()
+    if cost is None:
+        return _NO_PHASE
+    return _Phase(cost, name)
+
+
+def add_phase_ms(name: str, ms: float) -> None:
+    """Attribute an externally measured duration to the current turn."""
+    cost = _recording_cost()
+    if cost is not None:
+        cost.add(name, float(ms))
+
+
+def add_bytes_sent(nbytes: int) -> None:
+    """Count outbound frame bytes against the current turn."""
+    cost = _recording_cost()
+    if cost is not None:
+        cost.bytes_sent += nbytes
+
+
+def _profiling_enabled() -> bool:
+    try:
+        from djust.config import config
+
+        return bool(config.get("render_profiling", True))
+    except Exception:  # noqa: BLE001 — telemetry must never break the event turn
+        return False
+
+
+@contextmanager
+def render_cost_scope(view_class: str, event: str) -> Iterator[Optional[RenderCost]]:
+    """Collect the phases of one event turn and fold them into the histograms."""
+    if not _profiling_enabled():
+        yield None
+        return
+    cost = RenderCost()
+    token = _current.set(cost)
+    start = time.perf_counter()
+    try:
+        yield cost
+    finally:
+        _current.reset(token)
+        cost._open = False
+        record_render_cost(view_class, event, cost, (time.perf_counter() - start) * 1000)
+
+
+def _us(ms: float) -> int:
+    return int(round(ms * 1000))
+
+
+def record_render_cost(view_class: str, event: str, cost: RenderCost, total_ms: float) -> None:
+    """Fold one finished turn into the ``(view_class, event)`` histograms."""
+    key = (view_class, event)
+    with _lock:
+        profile = _profiles.get(key)
+        if profile is None:
+            profile = _profiles[key] = _EventProfile()
+            while len(_profiles) > _MAX_PROFILES:
+                _profiles.popitem(last=False)
+        else:
+            _profiles.move_to_end(key)
+        profile.turns += 1
+        profile.last_ms = int(time.time() * 1000)
+        profile.total.record(_us(total_ms))
+        profile.other.record(_us(max(0.0, total_ms - sum(cost.phases.values()))))
+        profile.bytes_sent.record(cost.bytes_sent)
+        for phase, ms in cost.phases.items():
+            hist = profile.phases.get(phase)
+            if hist is None:
+                hist = profile.phases[phase] = LogHistogram()
+            hist.record(_us(ms))
+
+
+def _ms_summary(hist: LogHistogram) -> Dict[str, Any]:
+    return {
+        "count": hist.count,
+        "mean_ms": round(hist.mean() / 1000, 3),
+        "p50_ms": round(hist.percentile(50) / 1000, 3),
+        "p90_ms": round(hist.percentile(90) / 1000, 3),
+        "p99_ms": round(hist.percentile(99) / 1000, 3),
+        "max_ms": round(hist.max / 1000, 3),
+    }
+
+
+def get_render_cost_stats(
+    view_class: Optional[str] = None,
+    event: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Aggregate per-(view class, event) phase breakdowns.
+
+    Args:
+        view_class: If set, only rows for this view class name.
+        event: If set, only rows for this event name.
+
+    Each row: {view_class, event, turns, last_ms, total, other, phases:
+    {phase: {count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}}, bytes_sent:
+    {mean, p50, p99, max}}. Phases appear in pipeline order and only if
+    recorded. Sorted by total p90 descending.
+    """
+    rows: List[Dict[str, Any]] = []
+    with _lock:
+        for (v_class, ev), profile in _profiles.items():
+            if view_class and v_class != view_class:
+                continue
+            if event and ev != event:
+                continue
+            rows.append(
+                {
+                    "view_class": v_class,
+                    "event": ev,
+                    "turns": profile.turns,
+                    "last_ms": profile.last_ms,
+                    "total": _ms_summary(profile.total),
+                    "other": _ms_summary(profile.other),
+                    "phases": {
+                        phase: _ms_summary(profile.phases[phase])
+                        for phase in PHASES
+                        if phase in profile.phases
+                    },
+                    "bytes_sent": {
+                        "mean": round(profile.bytes_sent.mean()),
+                        "p50": profile.bytes_sent.percentile(50),
+                        "p99": profile.bytes_sent.percentile(99),
+                        "max": profile.bytes_sent.max,
+                    },
+                }
+            )
+    rows.sort(key=lambda r: r["total"]["p90_ms"], reverse=True)
+    return rows
+
+
+def _clear_render_costs() -> None:
+    """Test-only reset."""
+    with _lock:
+        _profiles.clear()
@@ -21,6 +21,7 @@ from djust.observability.registry import (
     get_registered_session_count,
     get_view_for_session,
 )
+from djust.observability.render_costs import get_render_cost_stats
 from djust.observability.sql import get_queries_since
 from djust.observability.timings import get_timing_stats
 from djust.observability.tracebacks import get_recent_tracebacks
@@ -284,6 +285,32 @@ def handler_timings(request: HttpRequest) -> HttpResponse:
     return JsonResponse({"count": len(rows), "stats": rows})
 
 
+@csrf_exempt
+@require_GET
+def render_costs(request: HttpRequest) -> HttpResponse:
+    """Return the per-(view class, event) render-cost breakdown.
+
+    Query params:
+        view_class (optional): filter to one view class name.
+        event (optional): filter to one event name.
+
+    Each row: {view_class, event, turns, last_ms, total, other, phases,
+    bytes_sent}. ``phases`` maps handler / snapshot / context / normalize /
+    sync / render / diff / encode / send to {count, mean_ms, p50_ms, p90_ms,
+    p99_ms, max_ms}; ``other`` is the turn time no phase claimed. Sorted by
+    total p90 descending.
+    """
+    _gate_resp = _gate(request)
+    if _gate_resp is not None:
+        return _gate_resp
+
+    view_class = request.GET.get("view_class", "").strip() or None
+    event = request.GET.get("event", "").strip() or None
+
+    rows = get_render_cost_stats(view_class=view_class, event=event)
+    return JsonResponse({"count": len(rows), "stats": rows})
+
+
 @csrf_exempt
 def reset_view_state(request: HttpRequest) -> HttpResponse:
     """Replay `view.mount()` on the registered instance — resets all public
@@ -4,8 +4,9 @@ Django ORM Query Optimizer
 Analyzes variable access paths and generates optimal select_related/prefetch_related calls.
 """
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterator, List, Set
 from django.db import models
+from django.db.models import QuerySet
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models.fields.related import (
     ForeignKey,
@@ -150,3 +151,39 @@ def optimize_queryset(queryset: Any, optimization: QueryOptimization) -> Any:
         queryset = queryset.prefetch_related(*optimization.prefetch_related)
 
     return queryset
+
+
+def iter_queryset_chunks(queryset: Any, chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Yield a QuerySet's rows as lists of at most ``chunk_size`` instances.
+
+    Streams through ``QuerySet.iterator(chunk_size=...)`` so only one chunk
+    of model instances is alive at a time (``prefetch_related`` lookups are
+    applied per chunk). A QuerySet whose result cache is already populated
+    is sliced from the cache rather than queried again. Other iterables are
+    materialized and sliced, and a non-positive ``chunk_size`` yields
+    everything as a single list.
+
+    Example:
+        >>> for rows in iter_queryset_chunks(Lease.objects.all(), 2000):
+        ...     out.extend(serialize_queryset(rows, paths))
+    """
+    streamable = isinstance(queryset, QuerySet) and queryset._result_cache is None
+    if chunk_size <= 0 or not streamable:
+        rows = list(queryset)
+        if chunk_size <= 0:
+            if rows:
+                yield rows
+            return
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size]
+        return
+
+    chunk: List[Any] = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -47,12 +47,16 @@ under the ``"meta"`` key — access it as ``p.meta.name`` / ``p["meta"]["name"]`
 never ``p.name``.
 """
 
+import asyncio
+import contextvars
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
-from django.core.cache import cache
+from asgiref.sync import SyncToAsync, async_to_sync, sync_to_async
+
+from .config import config as djust_config
 
 from .decorators import event_handler
 from .push import push_to_view
@@ -480,8 +484,182 @@ class PresenceMixin:
 
 
 # Cursor tracking for live cursors (bonus feature)
+class _CursorRoom:
+    """Per-room aggregation state: moves since the last frame."""
+
+    __slots__ = ("pending", "broadcast", "last_flush", "flush_lock")
+
+    def __init__(self) -> None:
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.broadcast = False
+        self.last_flush = 0.0
+        self.flush_lock = threading.Lock()
+
+
+class CursorAggregator:
+    """Coalesces cursor moves per room and flushes them at a fixed frame rate.
+
+    Every move lands in the room's pending map (last position per user
+    wins). A room is flushed — one ``set_cursors`` backend write and, if any
+    move asked for it, one ``cursor_frame`` broadcast — at most once per
+    frame: immediately when the previous frame is older than the frame
+    interval, otherwise by the flusher task at the end of the frame, which
+    :meth:`submit` starts on the event loop whenever it queues a move. With
+    ``LIVEVIEW_CONFIG['cursor_broadcast_hz']`` at 20, a 50-user room costs
+    at most 20 writes and 20 broadcasts per second instead of one of each
+    per mouse move.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rooms: Dict[str, _CursorRoom] = {}
+        self._flusher: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def frame_interval(self) -> float:
+        hz = djust_config.get("cursor_broadcast_hz", 20)
+        return 1.0 / hz if hz and hz > 0 else 0.0
+
+    def submit(
+        self, presence_key: str, user_id: str, record: Dict[str, Any], broadcast: bool
+    ) -> bool:
+        """Record a move. Returns True if the room is due and should flush now.
+
+        A move that is not due is left for the flusher, which is started
+        here so the last move of a burst still goes out at the end of its
+        frame — from the loop or from a ``sync_to_async`` worker (the usual
+        ``@event_handler`` path). With no event loop to run on, the move
+        stays pending until the next due move or an explicit :meth:`flush`.
+        """
+        with self._lock:
+            room = self._rooms.get(presence_key)
+            if room is None:
+                room = self._rooms[presence_key] = _CursorRoom()
+            room.pending[user_id] = record
+            room.broadcast = room.broadcast or broadcast
+            due = time.monotonic() - room.last_flush >= self.frame_interval
+        if not due:
+            self._schedule_flusher()
+        return due
+
+    def pending(self, presence_key: str) -> Dict[str, Dict[str, Any]]:
+        """Moves not yet flushed for a room."""
+        with self._lock:
+            room = self._rooms.get(presence_key)
+            return dict(room.pending) if room else {}
+
+    def discard(self, presence_key: str, user_id: str) -> None:
+        with self._lock:
+            room = self._rooms.get(presence_key)
+            if room is not None:
+                room.pending.pop(user_id, None)
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return any(room.pending for room in self._rooms.values())
+
+    def flush(self, presence_key: str) -> None:
+        """Write and broadcast a room's pending moves as one frame (sync)."""
+        with self._lock:
+            room = self._rooms.get(presence_key)
+        if room is None:
+            return
+        with room.flush_lock:
+            with self._lock:
+                records, room.pending = room.pending, {}
+                broadcast, room.broadcast = room.broadcast, False
+                room.last_flush = time.monotonic()
+            if not records:
+                return
+            PresenceManager._backend().set_cursors(
+                presence_key, records, CursorTracker.CURSOR_TIMEOUT
+            )
+            if broadcast:
+                _broadcast_cursor_frame(presence_key, records)
+
+    def _due_rooms(self) -> List[str]:
+        now = time.monotonic()
+        interval = self.frame_interval
+        due = []
+        with self._lock:
+            for key, room in list(self._rooms.items()):
+                if room.pending:
+                    if now - room.last_flush >= interval:
+                        due.append(key)
+                elif now - room.last_flush > CursorTracker.CURSOR_TIMEOUT:
+                    del self._rooms[key]  # idle room
+        return due
+
+    def ensure_flusher(self) -> None:
+        """Start the flusher task on the running loop if moves are pending."""
+        if not self.has_pending():
+            return
+        loop = asyncio.get_running_loop()
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+        # A fresh context: the flusher outlives the move that started it and
+        # must not inherit its request- or executor-scoped context variables.
+        self._flusher = contextvars.Context().run(loop.create_task, self._run())
+
+    def _schedule_flusher(self) -> None:
+        """Run :meth:`ensure_flusher` on the event loop, from any thread."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self.ensure_flusher()
+            return
+        # A sync_to_async worker: the loop awaiting it is recorded on the
+        # thread, exactly where async_to_sync looks for it.
+        loop = getattr(SyncToAsync.threadlocal, "main_event_loop", None)
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self.ensure_flusher)
+        except RuntimeError:
+            pass  # the loop closed in between; the next move retries
+
+    async def _run(self) -> None:
+        while self.has_pending():
+            await asyncio.sleep(self.frame_interval or 0)
+            for key in self._due_rooms():
+                try:
+                    await sync_to_async(self.flush)(key)
+                except Exception as exc:  # noqa: BLE001 — one room must not stop the rest
+                    logger.warning("Cursor flush failed for %s: %s", key, exc)
+
+
+def _broadcast_cursor_frame(presence_key: str, records: Dict[str, Dict[str, Any]]) -> None:
+    """Send one ``cursor_frame`` presence event: ``[[user_id, x, y, meta], ...]``."""
+    channel_layer = get_channel_layer()
+    if not channel_layer:
+        return
+    message = {
+        "type": "presence_event",
+        "event": "cursor_frame",
+        "payload": {
+            "cursors": [
+                [uid, rec["x"], rec["y"], rec.get("meta") or {}] for uid, rec in records.items()
+            ]
+        },
+    }
+    async_to_sync(channel_layer.group_send)(
+        PresenceManager.presence_group_name(presence_key), message
+    )
+
+
+cursor_aggregator = CursorAggregator()
+
+
 class CursorTracker:
-    """Manages live cursor positions for collaborative features."""
+    """Manages live cursor positions for collaborative features.
+
+    Positions are stored per user in the presence backend (a Redis hash
+    field per user with its own TTL on the Redis backend) and written in
+    frames by :data:`cursor_aggregator` rather than once per move.
+    """
 
     CURSOR_KEY_PREFIX = "djust_cursors"
     CURSOR_TIMEOUT = 10  # seconds
@@ -493,50 +671,40 @@ class CursorTracker:
 
     @classmethod
     def update_cursor(
-        cls, presence_key: str, user_id: str, x: int, y: int, meta: Optional[Dict[str, Any]] = None
+        cls,
+        presence_key: str,
+        user_id: str,
+        x: int,
+        y: int,
+        meta: Optional[Dict[str, Any]] = None,
+        broadcast: bool = False,
     ) -> None:
-        """Update cursor position for a user."""
-        cache_key = cls.cursor_cache_key(presence_key)
-        cursors = cache.get(cache_key, {})
+        """Update cursor position for a user.
 
-        cursors[user_id] = {
+        With ``broadcast=True`` the room's next frame is also sent to the
+        presence group as a ``cursor_frame`` event.
+        """
+        record = {
             "x": x,
             "y": y,
             "timestamp": time.time(),
             "meta": meta or {},
         }
-
-        cache.set(cache_key, cursors, timeout=cls.CURSOR_TIMEOUT + 5)
+        if cursor_aggregator.submit(presence_key, user_id, record, broadcast):
+            cursor_aggregator.flush(presence_key)
 
     @classmethod
     def get_cursors(cls, presence_key: str) -> Dict[str, Dict[str, Any]]:
-        """Get all active cursor positions."""
-        cache_key = cls.cursor_cache_key(presence_key)
-        cursors = cache.get(cache_key, {})
-
-        # Clean up stale cursors
-        now = time.time()
-        active_cursors = {}
-
-        for user_id, cursor_data in cursors.items():
-            if (now - cursor_data["timestamp"]) < cls.CURSOR_TIMEOUT:
-                active_cursors[user_id] = cursor_data
-
-        # Update cache if we cleaned up stale cursors
-        if len(active_cursors) != len(cursors):
-            cache.set(cache_key, active_cursors, timeout=cls.CURSOR_TIMEOUT + 5)
-
-        return active_cursors
+        """Get all active cursor positions, including moves not yet flushed."""
+        cursors = PresenceManager._backend().get_cursors(presence_key, cls.CURSOR_TIMEOUT)
+        cursors.update(cursor_aggregator.pending(presence_key))
+        return cursors
 
     @classmethod
     def remove_cursor(cls, presence_key: str, user_id: str) -> None:
         """Remove cursor for a user."""
-        cache_key = cls.cursor_cache_key(presence_key)
-        cursors = cache.get(cache_key, {})
-
-        if user_id in cursors:
-            del cursors[user_id]
-            cache.set(cache_key, cursors, timeout=cls.CURSOR_TIMEOUT + 5)
+        cursor_aggregator.discard(presence_key, user_id)
+        PresenceManager._backend().remove_cursor(presence_key, user_id)
 
 
 class LiveCursorMixin(PresenceMixin):
@@ -560,17 +728,10 @@ class LiveCursorMixin(PresenceMixin):
         presence_key = self.get_presence_key()
         meta = self._presence_meta or {}
 
-        CursorTracker.update_cursor(presence_key, self._presence_user_id, x, y, meta)
-
-        # Broadcast to other users in the presence group
-        self.broadcast_to_presence(
-            "cursor_move",
-            {
-                "user_id": self._presence_user_id,
-                "x": x,
-                "y": y,
-                "meta": meta,
-            },
+        # Stored and broadcast to the presence group in per-room frames
+        # (``cursor_frame`` events), not one write + broadcast per move.
+        CursorTracker.update_cursor(
+            presence_key, self._presence_user_id, x, y, meta, broadcast=True
         )
 
     def get_cursors(self) -> Dict[str, Dict[str, Any]]:
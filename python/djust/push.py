@@ -5,9 +5,16 @@ Allows background tasks (Celery, management commands, cron jobs) to push
 state updates to connected LiveView clients.
 """
 
+import asyncio
 import contextvars
+import hashlib
+import json
 import re
-from typing import Any, Optional
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
@@ -120,3 +127,282 @@ async def apush_to_view(
         "sender_channel": origin_channel.get(),
     }
     await channel_layer.group_send(group, message)
+
+
+# ---------------------------------------------------------------------------
+# Render-once fan-out for shared broadcasts
+# ---------------------------------------------------------------------------
+#
+# ``push_to_view`` reaches every consumer in the view group, and each one
+# applies the state, syncs it to Rust and calls ``render_with_diff`` — N
+# identical renders for N viewers of the same dashboard. Views that opt in
+# with ``shared_broadcast = True`` promise their rendered output is a function
+# of broadcast (session-independent) state only. For those, consumers in the
+# same process that start from the same rendered HTML ("base token") reuse
+# ONE render: the first consumer with a valid Rust baseline renders + diffs,
+# the rest send its patch JSON verbatim.
+#
+# A consumer that sent a shared frame without rendering has a stale Rust
+# baseline (its VDOM is still pre-push). It is marked stale and its next own
+# render resets the Rust view, so that render ships a full ``html_update``
+# instead of patches against the wrong baseline. Stale consumers never lead a
+# shared render; they wait (bounded) for a consumer that can.
+
+
+@dataclass(frozen=True)
+class SharedRender:
+    """One precomputed broadcast render, reused by every matching subscriber."""
+
+    html: str
+    """Pre-strip HTML returned by ``render_with_diff()``."""
+
+    patches: Optional[str]
+    """Rust patch JSON, or ``None`` when the leader had no baseline to diff."""
+
+    token: str
+    """Base token of ``html`` — the next push's base for every reuser."""
+
+
+class _SharedEntry:
+    __slots__ = ("future", "rendering", "created")
+
+    def __init__(self) -> None:
+        self.future: "asyncio.Future[Optional[SharedRender]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.rendering = False
+        self.created = time.monotonic()
+
+
+class SharedBroadcastRenders:
+    """Process-local coordinator for ``shared_broadcast`` views.
+
+    Entries are keyed by ``(view class, push digest, base token)`` and kept in a
+    bounded LRU so a burst of pushes cannot grow it without limit. A second
+    index tracks which live views hold a *valid* Rust baseline for each base
+    token, so a stale consumer knows whether a leader can still show up.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str, str], _SharedEntry]" = OrderedDict()
+        self._holders: Dict[Tuple[str, str], "weakref.WeakSet[Any]"] = {}
+        self.stats: Dict[str, int] = {"renders": 0, "reused": 0, "fallbacks": 0}
+
+    # -- tokens ------------------------------------------------------------
+
+    @staticmethod
+    def view_key(view: Any) -> str:
+        cls = type(view)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    @staticmethod
+    def render_token(html: str) -> str:
+        """Digest of the pre-strip HTML a client was last sent."""
+        return hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def push_digest(event: Dict[str, Any]) -> str:
+        """Identity of a ``server_push`` message (state + handler + payload).
+
+        Coalesced mailbox batches (:meth:`PushBatch.as_event`) carry their
+        queued handler calls under ``calls``.
+
+        Two pushes with identical content applied to the same base render to
+        the same result, so content identity is sufficient — no wire-level push
+        id is needed.
+        """
+        body = json.dumps(
+            [event.get("state"), event.get("handler"), event.get("payload"), event.get("calls")],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+    # -- baseline bookkeeping ---------------------------------------------
+
+    def _drop_holder(self, key: str, view: Any) -> None:
+        old = getattr(view, "_shared_render_token", None)
+        holders = self._holders.get((key, old)) if old is not None else None
+        if holders is not None:
+            holders.discard(view)
+            if not holders:
+                del self._holders[(key, old)]
+
+    def note_render(self, view: Any, html: str) -> None:
+        """Record that ``view``'s Rust baseline now matches ``html``."""
+        key = self.view_key(view)
+        self._drop_holder(key, view)
+        token = self.render_token(html)
+        view._shared_render_token = token
+        view._shared_baseline_stale = False
+        self._holders.setdefault((key, token), weakref.WeakSet()).add(view)
+
+    def adopt(self, view: Any, render: SharedRender) -> None:
+        """Record that ``view``'s client received ``render`` without a local render."""
+        self._drop_holder(self.view_key(view), view)
+        view._shared_render_token = render.token
+        view._shared_baseline_stale = True
+
+    def has_holder(self, view: Any, token: str) -> bool:
+        holders = self._holders.get((self.view_key(view), token))
+        return bool(holders)
+
+    # -- entries -----------------------------------------------------------
+
+    def entry(self, view: Any, event: Dict[str, Any], token: str) -> _SharedEntry:
+        """Return (creating if needed) the shared entry for this push + base."""
+        now = time.monotonic()
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if len(self._entries) < self.max_entries and now - oldest.created < self.ttl:
+                break
+            del self._entries[oldest_key]
+            if not oldest.future.done():
+                oldest.future.set_result(None)
+        key = (self.view_key(view), self.push_digest(event), token)
+        found = self._entries.get(key)
+        if found is None or found.future.get_loop() is not asyncio.get_running_loop():
+            found = self._entries[key] = _SharedEntry()
+        else:
+            self._entries.move_to_end(key)
+        return found
+
+    def publish(self, entry: _SharedEntry, render: Optional[SharedRender]) -> None:
+        if not entry.future.done():
+            entry.future.set_result(render)
+
+    def clear(self) -> None:
+        for entry in self._entries.values():
+            if not entry.future.done():
+                entry.future.set_result(None)
+        self._entries.clear()
+        self._holders.clear()
+        for name in self.stats:
+            self.stats[name] = 0
+
+
+shared_renders = SharedBroadcastRenders()
+
+
+# ---------------------------------------------------------------------------
+# Per-consumer coalescing mailbox for server_push / db_notify
+# ---------------------------------------------------------------------------
+#
+# ``server_push`` and ``db_notify`` used to try the consumer's render lock for
+# 100ms and silently drop the update when a user event (or an earlier push)
+# held it (#813). Each consumer now owns a ``PushMailbox``: incoming pushes are
+# merged into it — state last-write-wins per key, handler calls and
+# ``handle_info`` messages queued in arrival order — and one drain task applies
+# everything in a single render once the lock frees. A burst of N NOTIFYs costs
+# one render, not N, and none is lost unless the lock stays busy past
+# ``push_max_latency_ms`` or the call queue overflows ``push_mailbox_max_calls``.
+
+mailbox_stats: Dict[str, int] = {"pushes": 0, "merged": 0, "dropped": 0, "renders": 0}
+"""Process-wide mailbox counters.
+
+``pushes`` — messages accepted; ``merged`` — messages folded into a batch that
+was already pending (each saves a render); ``dropped`` — messages discarded
+(call-queue overflow or max-latency expiry); ``renders`` — drained batches.
+"""
+
+
+@dataclass
+class PushBatch:
+    """Everything one drain applies before its single render."""
+
+    state: Dict[str, Any]
+    """Merged ``server_push`` state, last write wins per key."""
+
+    calls: List[Tuple[str, Any]]
+    """Queued ``("push", (handler, payload))`` / ``("notify", message)`` calls."""
+
+    size: int
+    """Number of channel messages folded into this batch."""
+
+    plain: int = 0
+    """Pushes without a handler call — each always wants a render."""
+
+    def as_event(self) -> Dict[str, Any]:
+        """The batch as a ``server_push``-shaped event (for push digests)."""
+        return {"state": self.state or None, "calls": self.calls}
+
+
+class PushMailbox:
+    """Coalescing buffer between the channel layer and one consumer's render lock."""
+
+    def __init__(self, max_calls: int = 256):
+        self.max_calls = max_calls
+        self._state: Dict[str, Any] = {}
+        self._calls: List[Tuple[str, Any]] = []
+        self._size = 0
+        self._plain = 0
+        self._since: Optional[float] = None
+        self.stats: Dict[str, int] = {"pushes": 0, "merged": 0, "dropped": 0, "renders": 0}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def pending_since(self) -> Optional[float]:
+        """``time.monotonic()`` of the oldest undelivered message, or None."""
+        return self._since
+
+    def _count(self, name: str, n: int = 1) -> None:
+        self.stats[name] += n
+        mailbox_stats[name] += n
+
+    def _accept(self) -> None:
+        self._count("pushes")
+        if self._size:
+            self._count("merged")
+        else:
+            self._since = time.monotonic()
+        self._size += 1
+
+    def _queue(self, call: Tuple[str, Any]) -> None:
+        if len(self._calls) >= self.max_calls:
+            # Oldest call goes first: its effect is the most likely to have
+            # been superseded by the newer ones behind it.
+            self._calls.pop(0)
+            self._count("dropped")
+        self._calls.append(call)
+
+    def add_push(self, event: Dict[str, Any]) -> None:
+        """Merge a ``server_push`` message (state + optional handler call)."""
+        self._accept()
+        state = event.get("state")
+        if state and isinstance(state, dict):
+            self._state.update(state)
+        handler = event.get("handler")
+        if handler:
+            self._queue(("push", (handler, event.get("payload"))))
+        else:
+            self._plain += 1
+
+    def add_notify(self, message: Dict[str, Any]) -> None:
+        """Queue a ``db_notify`` message for ``handle_info``."""
+        self._accept()
+        self._queue(("notify", message))
+
+    def _reset(self) -> None:
+        self._state, self._calls = {}, []
+        self._size = self._plain = 0
+        self._since = None
+
+    def take(self) -> PushBatch:
+        """Remove and return everything pending as one batch."""
+        batch = PushBatch(state=self._state, calls=self._calls, size=self._size, plain=self._plain)
+        self._reset()
+        if batch.size:
+            self._count("renders")
+        return batch
+
+    def drop(self) -> int:
+        """Discard everything pending; returns the number of messages dropped."""
+        n = self._size
+        self._reset()
+        if n:
+            self._count("dropped", n)
+        return n
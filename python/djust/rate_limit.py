@@ -196,7 +196,60 @@ class IPConnectionTracker:
             self._cooldowns[ip] = time.monotonic() + seconds
 
 
-ip_tracker = IPConnectionTracker()
+class _BackendIPTracker:
+    """``ip_tracker`` facade over the configured rate-limit backend.
+
+    With the default in-memory backend counts are per process (an
+    :class:`IPConnectionTracker`); with ``RATE_LIMIT_BACKEND = 'redis'`` the
+    per-IP cap and cooldowns apply across the cluster.
+    """
+
+    def connect(self, ip: str, max_per_ip: int) -> bool:
+        from .backends.registry import get_rate_limit_backend
+
+        return get_rate_limit_backend().connect(ip, max_per_ip)
+
+    async def aconnect(self, ip: str, max_per_ip: int) -> bool:
+        """:meth:`connect` for async callers — keeps network I/O off the loop."""
+        return await _backend_call("connect", ip, max_per_ip)
+
+    async def adisconnect(self, ip: str) -> None:
+        await _backend_call("disconnect", ip)
+
+    async def aadd_cooldown(self, ip: str, seconds: float) -> None:
+        await _backend_call("add_cooldown", ip, seconds)
+
+    def disconnect(self, ip: str) -> None:
+        from .backends.registry import get_rate_limit_backend
+
+        get_rate_limit_backend().disconnect(ip)
+
+    def add_cooldown(self, ip: str, seconds: float) -> None:
+        from .backends.registry import get_rate_limit_backend
+
+        get_rate_limit_backend().add_cooldown(ip, seconds)
+
+
+async def _backend_call(method: str, *args: Any) -> Any:
+    """Call a rate-limit backend method from async code.
+
+    The in-memory backend is a few dict operations and runs inline; a
+    ``blocking`` backend (Redis) runs in a worker thread so a slow round trip
+    never stalls the event loop. ``thread_sensitive=False`` keeps these calls
+    out of the single thread-sensitive executor that renders views.
+    """
+    from .backends.registry import get_rate_limit_backend
+
+    backend = get_rate_limit_backend()
+    fn = getattr(backend, method)
+    if getattr(backend, "blocking", False):
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(fn, thread_sensitive=False)(*args)
+    return fn(*args)
+
+
+ip_tracker = _BackendIPTracker()
 
 
 def get_rate_limit_settings(handler: Any) -> Optional[dict]:
@@ -224,7 +277,7 @@ def get_rate_limit_settings(handler: Any) -> Optional[dict]:
 #   * API — a process-level dict in ``api/dispatch.py``.
 #
 # A caller could therefore sum allowances across both connection count and
-# transport. This module-level store is the SINGLE source of truth for the
+# transport. This store is the SINGLE source of truth for the
 # per-handler ``@rate_limit``: one ``(caller_key, handler_name)`` bucket shared
 # by all three transports, so a given caller has ONE budget per handler
 # regardless of connection count or transport.
@@ -288,14 +341,34 @@ def handler_rate_check(caller: str, handler_name: str, settings: Optional[dict])
 
     Returns:
         True if allowed (or no per-handler limit), False if rate-limited.
+
+    Buckets live in the configured rate-limit backend
+    (``DJUST_CONFIG['RATE_LIMIT_BACKEND']``): process-local by default,
+    cluster-wide with ``'redis'``.
     """
     if not settings:
         return True
+    from .backends.registry import get_rate_limit_backend
+
+    return get_rate_limit_backend().consume(
+        caller, handler_name, settings["rate"], settings["burst"]
+    )
+
+
+async def ahandler_rate_check(caller: str, handler_name: str, settings: Optional[dict]) -> bool:
+    """:func:`handler_rate_check` for async callers (the WS/SSE event path)."""
+    if not settings:
+        return True
+    return await _backend_call("consume", caller, handler_name, settings["rate"], settings["burst"])
+
+
+def _local_handler_consume(caller: str, handler_name: str, rate: float, burst: int) -> bool:
+    """Process-local ``(caller, handler)`` bucket — the in-memory backend's store."""
     key = (caller, handler_name)
     with _handler_buckets_lock:
         bucket = _handler_buckets.get(key)
         if bucket is None:
-            bucket = TokenBucket(rate=settings["rate"], burst=settings["burst"])
+            bucket = TokenBucket(rate=rate, burst=burst)
             _handler_buckets[key] = bucket
             # LRU eviction: cap the dict so a hostile caller cycling identities
             # cannot inflate memory without bound.
@@ -309,5 +382,8 @@ def handler_rate_check(caller: str, handler_name: str, settings: Optional[dict])
 
 def reset_handler_buckets() -> None:
     """Clear the shared per-caller @rate_limit state — used by tests."""
+    from .backends.registry import get_rate_limit_backend
+
     with _handler_buckets_lock:
         _handler_buckets.clear()
+    get_rate_limit_backend().reset()
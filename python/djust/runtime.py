@@ -42,6 +42,7 @@ import inspect
 import json
 import logging
 import time
+from dataclasses import dataclass
 from typing import (
     Any,
     AsyncIterator,
@@ -51,14 +52,18 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Tuple,
+    Union,
     runtime_checkable,
 )
 
 from asgiref.sync import sync_to_async
 
+from . import metrics
+from .observability.render_costs import add_phase_ms, render_cost_scope, render_phase
 from .rate_limit import ConnectionRateLimiter
 from .security import handle_exception, sanitize_for_log
-from .serialization import fast_json_loads
+from .serialization import RawJSON, fast_json_loads, patches_for_wire, prefer_html_frame
 from .validation import validate_handler_params
 from .websocket_utils import (
     _call_handler,
@@ -121,6 +126,12 @@ def maybe_start_tick_task(consumer: Any, view_class: Any) -> bool:
     (#2124). A test that duplicates the rule passes even when the runtime stops
     applying it, which is the decorative-pin failure mode (#1859).
 
+    With ``LIVEVIEW_CONFIG['tick_scheduler']`` on (default off) the consumer
+    joins the process-wide :data:`djust.tick.tick_scheduler` instead of
+    running its own ``_run_tick`` loop; ``_tick_task`` then holds the
+    scheduler registration, which the usual ``cancel()`` + ``await`` teardown
+    releases.
+
     Returns whether a task was started.
     """
     tick_interval = getattr(view_class, "tick_interval", None)
@@ -132,10 +143,75 @@ def maybe_start_tick_task(consumer: Any, view_class: Any) -> bool:
     if view_class.handle_tick is _LV.handle_tick:
         return False
 
-    consumer._tick_task = asyncio.create_task(consumer._run_tick(tick_interval))
+    from .config import config as djust_config
+
+    if djust_config.get("tick_scheduler", False):
+        from .tick import tick_scheduler
+
+        consumer._tick_task = tick_scheduler.register(consumer, tick_interval)
+    else:
+        consumer._tick_task = asyncio.create_task(consumer._run_tick(tick_interval))
     return True
 
 
+@dataclass
+class _FusedEventTurn:
+    """What one :func:`_run_fused_event_turn` executor call produced."""
+
+    handler_ms: float = 0.0
+    handler_error: Optional[Exception] = None
+    skip_render: bool = False
+    force_html: bool = False
+    rendered: Optional[Tuple[str, Optional[str], int]] = None
+    render_error: Optional[Exception] = None
+    render_ms: float = 0.0
+
+
+def _run_fused_event_turn(
+    view: Any,
+    handler: Callable[..., Any],
+    params: Optional[Dict[str, Any]],
+    detect_skip_render: Callable[[], Tuple[bool, bool]],
+) -> _FusedEventTurn:
+    """Run a sync handler, change detection and ``render_with_diff`` in one call.
+
+    The synchronous segment of an event turn, executed by
+    :meth:`ViewRuntime._dispatch_event_render` as a single ``sync_to_async``
+    submission instead of one per step. ``detect_skip_render`` is the spine's
+    own skip decision, returning ``(skip_render, force_html)``;
+    ``render_with_diff`` already includes the Rust state sync. Exceptions are
+    captured on the result and re-raised on the loop side so the error frames
+    are unchanged.
+    """
+    turn = _FusedEventTurn()
+    start = time.perf_counter()
+    try:
+        if params:
+            handler(**params)
+        else:
+            handler()
+    except Exception as exc:  # noqa: BLE001 — reported by the caller
+        turn.handler_error = exc
+        return turn
+    turn.handler_ms = (time.perf_counter() - start) * 1000
+
+    turn.skip_render, turn.force_html = detect_skip_render()
+    if turn.skip_render:
+        return turn
+
+    # Consume the explicit full-HTML request before rendering, as
+    # _render_and_send does on the unfused path.
+    if turn.force_html and getattr(view, "_force_full_html", False):
+        view._force_full_html = False
+    start = time.perf_counter()
+    try:
+        turn.rendered = view.render_with_diff()
+    except Exception as exc:  # noqa: BLE001 — reported by the caller
+        turn.render_error = exc
+    turn.render_ms = (time.perf_counter() - start) * 1000
+    return turn
+
+
 # ------------------------------------------------------------------ #
 # Transport Protocol + adapters
 # ------------------------------------------------------------------ #
@@ -662,6 +738,9 @@ class WSConsumerTransport:
     JSON-mode behavior is preserved verbatim.
     """
 
+    # ``transport`` label on the djust.metrics event instruments.
+    metrics_label = "ws"
+
     def __init__(self, consumer: Any):
         self._consumer = consumer
 
@@ -746,13 +825,6 @@ class WSConsumerTransport:
         """
         consumer = self._consumer
 
-        # Reset the per-mount sticky auto-reattach tracker (websocket.py:2082): each
-        # mount starts with an empty set; the template tag pushes ids onto it as it
-        # claims survivors. The live_redirect path also resets it before calling the
-        # shim (websocket.py:3768), but a plain mount needs the reset too — and this
-        # hook fires for EVERY runtime mount, so it is the single source post-flip.
-        consumer._sticky_auto_reattached = set()
-
         # Real-scope path + query string for path-aware VDOM cache keys
         # (websocket.py:2153-2156). The runtime stamped ``page_url`` + ``""``; the
         # WS bespoke path sources these from the handshake ``scope`` so /emails/ and
@@ -761,6 +833,13 @@ class WSConsumerTransport:
         view_instance._websocket_path = scope.get("path", "/")
         view_instance._websocket_query_string = scope.get("query_string", b"").decode("utf-8")
 
+        # Every group join below awaits, and concurrent mount_batch entries
+        # (``_mount_batch_concurrently``) run this hook for sibling views on
+        # the same consumer. So the joins use locals only, and the consumer
+        # attributes are written together at the end with no await in between:
+        # one mount's wiring can never be interleaved with (or half-reset by)
+        # a sibling's, and the last mount to finish owns all of it.
+
         # The dotted view path is the client-supplied frame value
         # (``data["view"]``), stashed on the view by ``dispatch_mount`` as
         # ``_djust_mount_view_path``. The bespoke path keyed the server-push group
@@ -769,26 +848,23 @@ class WSConsumerTransport:
         # value — so they MUST agree byte-for-byte. The consumer also stashes it as
         # ``_view_path`` (websocket.py:2172) for server-push introspection.
         dotted = getattr(view_instance, "_djust_mount_view_path", None) or ""
-        consumer._view_path = dotted
 
         # Join per-view channel group for server-push (websocket.py:2169-2174).
         from .push import view_group_name
 
-        consumer._view_group = view_group_name(dotted)
-        await consumer.channel_layer.group_add(consumer._view_group, consumer.channel_name)
+        view_group = view_group_name(dotted)
+        await consumer.channel_layer.group_add(view_group, consumer.channel_name)
 
         # Join presence group if the view supports presence tracking
         # (websocket.py:2176-2184).
-        consumer._presence_group = None
+        presence_group = None
         if hasattr(view_instance, "get_presence_key"):
             try:
                 from .presence import PresenceManager
 
                 presence_key = view_instance.get_presence_key()
-                consumer._presence_group = PresenceManager.presence_group_name(presence_key)
-                await consumer.channel_layer.group_add(
-                    consumer._presence_group, consumer.channel_name
-                )
+                presence_group = PresenceManager.presence_group_name(presence_key)
+                await consumer.channel_layer.group_add(presence_group, consumer.channel_name)
             except Exception as e:  # noqa: BLE001
                 logger.warning("Error setting up presence group: %s", e)
 
@@ -798,7 +874,7 @@ class WSConsumerTransport:
         # fans out to views listening on another. Reads ``_listen_channels``
         # PRE-mount() — preserve the bespoke ordering EXACTLY (only non-empty on a
         # session-restore branch that repopulated it).
-        consumer._db_notify_channels = set()
+        db_notify_channels: set[str] = set()
         listen_channels = getattr(view_instance, "_listen_channels", None)
         if listen_channels:
             for ch in listen_channels:
@@ -806,14 +882,36 @@ class WSConsumerTransport:
                     await consumer.channel_layer.group_add(
                         f"djust_db_notify_{ch}", consumer.channel_name
                     )
-                    consumer._db_notify_channels.add(ch)
+                    db_notify_channels.add(ch)
                 except Exception as e:  # noqa: BLE001
                     logger.warning("Error joining db_notify group for %s: %s", ch, e)
 
+        # Reset the per-mount sticky auto-reattach tracker (websocket.py:2082): each
+        # mount starts with an empty set; the template tag pushes ids onto it as it
+        # claims survivors. The live_redirect path also resets it before calling the
+        # shim (websocket.py:3768), but a plain mount needs the reset too — and this
+        # hook fires for EVERY runtime mount, so it is the single source post-flip.
+        # (Survivors are only staged by live_redirect_mount, which never batches,
+        # so concurrent batch entries always see — and leave — an empty set.)
+        consumer._sticky_auto_reattached = set()
+        consumer._view_path = dotted
+        consumer._view_group = view_group
+        consumer._presence_group = presence_group
+        consumer._db_notify_channels = db_notify_channels
+
         # Start periodic tick if the subclass overrides handle_tick
-        # (websocket.py:2202-2208).
+        # (websocket.py:2202-2208). A sibling batch entry may already have
+        # started one; the consumer keeps a single tick, owned by the last mount.
         view_class = type(view_instance)
-        maybe_start_tick_task(consumer, view_class)
+        previous_tick = getattr(consumer, "_tick_task", None)
+        if maybe_start_tick_task(consumer, view_class) and previous_tick is not None:
+            if getattr(consumer, "_mounting_in_batch", False):
+                previous_tick.cancel()
+
+        # Watch for idleness (no-op unless hibernate_after_s is set).
+        from .hibernation import maybe_register
+
+        maybe_register(consumer)
 
         # Set the use_actors flag off the view class (websocket.py:2211) so
         # disconnect's actor cleanup guard reflects reality. The actor HANDLE is
@@ -1091,6 +1189,7 @@ class WSConsumerTransport:
             PerformanceTracker.set_current(None)
             _djust_push.origin_channel.reset(_origin_token)
             consumer._processing_user_event = False
+            consumer._last_active_at = time.monotonic()
             consumer._render_lock.release()
 
     def uses_actors(self, view: Any) -> bool:
@@ -1516,6 +1615,8 @@ class SSESessionTransport:
     drains them and writes ``data:`` lines to the client.
     """
 
+    metrics_label = "sse"
+
     def __init__(self, session: Any):
         self._session = session
 
@@ -1533,7 +1634,8 @@ class SSESessionTransport:
 
     async def send(self, data: Dict[str, Any]) -> None:
         # SSESession.push is a sync method (it uses queue.put_nowait).
-        self._session.push(data)
+        with render_phase("send"):
+            self._session.push(data)
 
     async def send_error(self, error: str, **kwargs: Any) -> None:
         await self._session.send_error(error, **kwargs)
@@ -1549,7 +1651,12 @@ class SSESessionTransport:
         clients are calibrated to the Rust counter. Returning it unchanged keeps SSE
         behavior identical. (If SSE ever adopts a consumer-owned counter, this is the
         single place to wire it — tracked alongside #1858.)
+
+        The raw render is kept on the session as ``_last_render`` so the
+        bounded outbox can build an ``html_update`` recovery frame when it
+        collapses buffered ``patch`` frames (see ``sse.SSEOutbox``).
         """
+        self._session._last_render = (rust_version, html)
         return rust_version
 
     def build_request(self) -> Optional[Any]:
@@ -2729,8 +2836,17 @@ class ViewRuntime:
             )
             return
 
-        async with self.transport.event_context(self.view_instance):
-            await self._dispatch_event_render(data)
+        # Per-(view, event) phase breakdown for /_djust/observability/render_costs/.
+        # Opened outside event_context so lock waits show up as ``other``.
+        transport_label = getattr(self.transport, "metrics_label", "other")
+        metrics.events_total.inc(transport_label)
+        start = time.perf_counter()
+        try:
+            with render_cost_scope(self.view_instance.__class__.__name__, str(data.get("event"))):
+                async with self.transport.event_context(self.view_instance):
+                    await self._dispatch_event_render(data)
+        finally:
+            metrics.event_duration.observe(time.perf_counter() - start, transport_label)
 
     def _event_routes_to_sticky_child(self, data: Dict[str, Any]) -> bool:
         """Return whether the event targets a sticky-child LiveView (not the top view).
@@ -2921,7 +3037,8 @@ class ViewRuntime:
         # Snapshot pre-handler assigns for change detection.
         from .websocket import _compute_changed_keys, _snapshot_assigns
 
-        pre_assigns = _snapshot_assigns(view)
+        with render_phase("snapshot"):
+            pre_assigns = _snapshot_assigns(view)
         # Identity snapshot for the #700 push_commands-only auto-skip below:
         # {attr: id(value)} over the public assigns. Immune to the deep-copy
         # sentinel false-positives _snapshot_assigns can produce for non-copyable
@@ -2931,16 +3048,75 @@ class ViewRuntime:
         _fw_attrs: frozenset[str] = getattr(view, "_framework_attrs", frozenset())
         pre_identity = {k: id(v) for k, v in view.__dict__.items() if k not in _fw_attrs}
 
+        def detect_skip_render() -> Tuple[bool, bool]:
+            # Auto-detect unchanged state. Never auto-skip when the view explicitly
+            # requested a full-HTML render (``_force_full_html``) — mirrors the WS
+            # ``force_html`` guard on the skip path (websocket.py:3851-3852). The
+            # render branch consumes + resets the flag (see _render_and_send).
+            skip_render = getattr(view, "_skip_render", False)
+            force_html = getattr(view, "_force_full_html", False)
+            if not skip_render and not force_html:
+                with render_phase("snapshot"):
+                    post_assigns = _snapshot_assigns(view)
+                    if pre_assigns == post_assigns:
+                        skip_render = True
+                    else:
+                        view._changed_keys = _compute_changed_keys(pre_assigns, post_assigns)
+
+            # #700: push_commands-only handlers auto-skip the render. When push events
+            # are pending and the *identity* of every public attr is unchanged, the
+            # handler only emitted push commands (no state mutation) so a VDOM
+            # re-render is wasted work (and can trigger morphdom recovery during
+            # tours). Identity comparison sidesteps the assigns-snapshot
+            # false-positives on non-copyable attrs. Mirrors WS handle_event
+            # websocket.py:3867-3891. Guarded by force_html so an explicit
+            # full-HTML request still renders.
+            if not skip_render and not force_html:
+                pending = getattr(view, "_pending_push_events", None)
+                if pending:
+                    post_identity = {
+                        k: id(v) for k, v in view.__dict__.items() if k not in _fw_attrs
+                    }
+                    if pre_identity == post_identity:
+                        skip_render = True
+            return skip_render, force_html
+
         # Call handler. The time-travel record is finalized + pushed in the
         # ``finally`` for BOTH the success and the raising path (mirrors WS
         # ``_handle_event_inner`` websocket.py:3625-3635, which records in a
         # finally so permission-denied / raising handlers still appear in the
         # debug panel). On a raise we set ``_tt_error`` and return early after
         # sending the error frame.
+        #
+        # Fused turn: a sync handler on a view with no time-travel recording,
+        # no state-snapshot save and no pending waiters has nothing that must
+        # run on the loop between the handler and the render, so handler +
+        # change detection + ``render_with_diff`` run as ONE executor call
+        # (:func:`_run_fused_event_turn`) instead of one hop each.
+        from .config import config as djust_config
+
+        fused_turn: Optional[_FusedEventTurn] = None
+        fuse = (
+            _tt_snapshot is None
+            and not inspect.iscoroutinefunction(handler)
+            and not getattr(view, "enable_state_snapshot", False)
+            and not getattr(view, "_waiters", None)
+            and djust_config.get("fused_event_pipeline", True)
+        )
         _handler_start = time.perf_counter()
         try:
             try:
-                await _call_handler(handler, coerced_params if coerced_params else None)
+                if fuse:
+                    fused_turn = await sync_to_async(_run_fused_event_turn)(
+                        view,
+                        handler,
+                        coerced_params if coerced_params else None,
+                        detect_skip_render,
+                    )
+                    if fused_turn.handler_error is not None:
+                        raise fused_turn.handler_error
+                else:
+                    await _call_handler(handler, coerced_params if coerced_params else None)
             except Exception as exc:
                 _tt_error = str(exc)[:200]
                 response = handle_exception(
@@ -2965,13 +3141,15 @@ class ViewRuntime:
         # WS-scoped (SSE no-op). Called defensively (mirroring the existing
         # ``on_view_mounted`` / ``on_event_recorded`` hook calls) so a partial test
         # transport without the hook is a no-op. Best-effort by hook contract.
+        _handler_ms = (
+            fused_turn.handler_ms
+            if fused_turn is not None
+            else (time.perf_counter() - _handler_start) * 1000.0
+        )
+        add_phase_ms("handler", _handler_ms)
         on_handler_timing = getattr(self.transport, "on_handler_timing", None)
         if on_handler_timing is not None:
-            on_handler_timing(
-                view,
-                event_name,
-                (time.perf_counter() - _handler_start) * 1000.0,
-            )
+            on_handler_timing(view, event_name, _handler_ms)
 
         # Waiter notification (ADR-002 Phase 1b): resolve any pending
         # wait_for_event waiters on the view whose event_name matches. Runs AFTER
@@ -3006,33 +3184,12 @@ class ViewRuntime:
         ):
             await self._persist_state_after_event(target_view, event_name)
 
-        # Auto-detect unchanged state. Never auto-skip when the view explicitly
-        # requested a full-HTML render (``_force_full_html``) — mirrors the WS
-        # ``force_html`` guard on the skip path (websocket.py:3851-3852). The
-        # render branch consumes + resets the flag (see _render_and_send).
-        skip_render = getattr(view, "_skip_render", False)
-        force_html = getattr(view, "_force_full_html", False)
-        if not skip_render and not force_html:
-            post_assigns = _snapshot_assigns(view)
-            if pre_assigns == post_assigns:
-                skip_render = True
-            else:
-                view._changed_keys = _compute_changed_keys(pre_assigns, post_assigns)
-
-        # #700: push_commands-only handlers auto-skip the render. When push events
-        # are pending and the *identity* of every public attr is unchanged, the
-        # handler only emitted push commands (no state mutation) so a VDOM
-        # re-render is wasted work (and can trigger morphdom recovery during
-        # tours). Identity comparison sidesteps the assigns-snapshot
-        # false-positives on non-copyable attrs. Mirrors WS handle_event
-        # websocket.py:3867-3891. Guarded by force_html so an explicit
-        # full-HTML request still renders.
-        if not skip_render and not force_html:
-            pending = getattr(view, "_pending_push_events", None)
-            if pending:
-                post_identity = {k: id(v) for k, v in view.__dict__.items() if k not in _fw_attrs}
-                if pre_identity == post_identity:
-                    skip_render = True
+        # Change detection (auto-skip on unchanged assigns, #700 push-only skip).
+        # A fused turn already ran it on the executor thread.
+        if fused_turn is not None:
+            skip_render, force_html = fused_turn.skip_render, fused_turn.force_html
+        else:
+            skip_render, force_html = detect_skip_render()
 
         has_async = getattr(view, "_async_pending", None) is not None
 
@@ -3090,6 +3247,7 @@ class ViewRuntime:
             has_async=has_async,
             force_html=force_html,
             event_ref=event_ref,
+            prerendered=fused_turn,
         )
 
         # Dispatch background work UNCONDITIONALLY after the render (WS parity,
@@ -3824,11 +3982,9 @@ class ViewRuntime:
             wire_version = self.transport.next_client_version(html, version)
 
             if patches is not None:
-                if isinstance(patches, str):
-                    patches = fast_json_loads(patches)
                 msg: Dict[str, Any] = {
                     "type": "patch",
-                    "patches": patches,
+                    "patches": patches_for_wire(patches),
                     "version": wire_version,
                     "event_name": "url_change",
                 }
@@ -4149,6 +4305,7 @@ class ViewRuntime:
         has_async: bool = False,
         force_html: bool = False,
         event_ref: Optional[int] = None,
+        prerendered: Optional[_FusedEventTurn] = None,
     ) -> None:
         """Re-render after an event handler and emit the appropriate frame.
 
@@ -4165,6 +4322,10 @@ class ViewRuntime:
 
         ``event_ref`` (#560): echoed back on every emitted frame so the client
         can match the response to its pending event request.
+
+        ``prerendered``: a fused turn that already ran ``render_with_diff`` on
+        the executor (see :func:`_run_fused_event_turn`); its result (or
+        render error) is used instead of rendering again.
         """
         # Bind the mounted view to a non-None local. _render_and_send is only
         # entered after a view-mounted check (and inside event_context, which holds
@@ -4187,7 +4348,16 @@ class ViewRuntime:
         # is true. Cheap (one ``perf_counter`` pair) so it stays unconditional.
         _render_start = time.perf_counter()
         try:
-            html, patches, version = await sync_to_async(view.render_with_diff)()
+            if prerendered is None:
+                html, patches, version = await sync_to_async(view.render_with_diff)()
+            elif prerendered.render_error is not None:
+                raise prerendered.render_error
+            elif prerendered.rendered is not None:
+                html, patches, version = prerendered.rendered
+            else:
+                # A fused turn that decided to skip never reaches here; render
+                # now rather than trust a turn that produced nothing.
+                html, patches, version = await sync_to_async(view.render_with_diff)()
         except Exception as exc:
             response = handle_exception(
                 exc,
@@ -4198,7 +4368,11 @@ class ViewRuntime:
             )
             await self.transport.send(response)
             return
-        _render_ms = (time.perf_counter() - _render_start) * 1000
+        _render_ms = (
+            prerendered.render_ms
+            if prerendered is not None
+            else (time.perf_counter() - _render_start) * 1000
+        )
 
         def _send_event_frame(frame: Dict[str, Any]) -> Dict[str, Any]:
             """Stamp the render duration + invoke the DEBUG ``on_event_frame`` fold
@@ -4242,21 +4416,21 @@ class ViewRuntime:
         wire_version = self.transport.next_client_version(html, version)
 
         if patches is not None:
-            patch_list: Optional[List] = (
-                fast_json_loads(patches) if isinstance(patches, str) else patches
-            )
+            # ``patches_for_wire`` keeps the Rust JSON string as a ``RawJSON``
+            # fragment under ``patch_passthrough`` (never decoded) and parses it
+            # otherwise.
+            patch_list: Optional[Union[List, RawJSON]] = patches_for_wire(patches)
 
-            # Patch compression (mirror sse.py legacy)
-            PATCH_THRESHOLD = 100
+            # Patch compression: send the cheaper frame by encoded size (the
+            # Rust JSON length — no re-encode, no patch-count threshold).
             _compressed_patch_count: Optional[int] = None
-            if patch_list and len(patch_list) > PATCH_THRESHOLD:
-                patches_size = len(patches.encode("utf-8")) if isinstance(patches, str) else 0
-                html_size = len(html.encode("utf-8")) if html else 0
-                if patches_size and html_size < patches_size * 0.7:
-                    if hasattr(view, "_rust_view") and view._rust_view:
-                        view._rust_view.reset()
+            # The Rust VDOM is kept: its baseline already is the HTML sent, so
+            # the next event diffs against the tree the client lands on (same
+            # as the out-of-band ``_send_render_result`` path).
+            if patch_list and prefer_html_frame(html, patches):
+                if isinstance(patch_list, list):
                     _compressed_patch_count = len(patch_list)
-                    patch_list = None
+                patch_list = None
 
             if patch_list is not None:
                 msg: Dict[str, Any] = {
@@ -4284,6 +4458,7 @@ class ViewRuntime:
                 # (websocket.py:4129). DJE-053 does NOT fire on this branch (it had
                 # patches; compression chose HTML), matching the WS bespoke gate.
                 # Called defensively (partial test transports are a no-op).
+                metrics.full_html_fallbacks.inc("patch_compression")
                 _on_render = getattr(self.transport, "on_render_emitted", None)
                 if _on_render is not None:
                     _on_render(
@@ -4353,6 +4528,8 @@ class ViewRuntime:
                     _ctx_snapshot = await sync_to_async(view.get_context_data)()
                 except Exception:  # noqa: BLE001 — snapshot is best-effort DEBUG metadata
                     _ctx_snapshot = None
+            if _reason != "first_render":
+                metrics.full_html_fallbacks.inc(_reason)
             _on_render = getattr(self.transport, "on_render_emitted", None)
             if _on_render is not None:
                 _on_render(
@@ -4705,10 +4882,9 @@ class ViewRuntime:
         wire_version = self.transport.next_client_version(html, version)
 
         if patches is not None:
-            patch_list = fast_json_loads(patches) if isinstance(patches, str) else patches
             msg: Dict[str, Any] = {
                 "type": "patch",
-                "patches": patch_list,
+                "patches": patches_for_wire(patches),
                 "version": wire_version,
                 "event_name": event_name,
                 "source": "async",
@@ -242,6 +242,133 @@ def fast_json_loads(s: Union[str, bytes]) -> Any:
     return json.loads(s)
 
 
+class RawJSON:
+    """A pre-encoded JSON fragment spliced verbatim into an outbound frame.
+
+    ``RustLiveView.render_with_diff()`` already returns its patches as a JSON
+    string. Decoding that into Python lists only for ``send_json`` to encode it
+    again costs a dict allocation per patch on every frame. Wrapping the string
+    in ``RawJSON`` lets :func:`encode_frame` splice it into the envelope
+    (``type``/``version``/``ref``/``source``) as-is.
+
+    Nested ``RawJSON`` values (e.g. patches echoed into the DEBUG ``_debug``
+    payload) still serialize correctly: :class:`DjangoJSONEncoder` decodes them.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.text[:60]!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and other.text == self.text
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def is_empty_list(self) -> bool:
+        """True when the fragment is the empty patch list ``[]``."""
+        return self.text.strip() == "[]"
+
+    def decode(self) -> Any:
+        """Materialize the fragment as Python objects (debug / fallback paths)."""
+        return fast_json_loads(self.text)
+
+
+def patch_passthrough_enabled() -> bool:
+    """Whether ``LIVEVIEW_CONFIG['patch_passthrough']`` is on."""
+    from .config import config
+
+    return bool(config.get("patch_passthrough", False))
+
+
+def patches_for_wire(patches: Union[str, bytes, list, None]) -> Union[list, RawJSON, None]:
+    """Prepare ``render_with_diff()`` patches for an outbound frame.
+
+    With ``patch_passthrough`` enabled, the Rust JSON string is wrapped in a
+    :class:`RawJSON` and never decoded; otherwise it is parsed with
+    :func:`fast_json_loads` (the historical behavior). Lists and ``None`` pass
+    through unchanged.
+    """
+    if patches is None or isinstance(patches, (list, RawJSON)):
+        return patches
+    if patch_passthrough_enabled():
+        if isinstance(patches, bytes):
+            patches = patches.decode("utf-8")
+        return RawJSON(patches)
+    return fast_json_loads(patches)
+
+
+# Below this many bytes of patch JSON both frames are cheap; keep patches.
+_HTML_FALLBACK_MIN_PATCH_BYTES = 1024
+
+
+def _utf8_len(text: str) -> int:
+    # ``isascii`` is a flag check on CPython; only non-ASCII text is encoded.
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def encoded_patch_size(patches: Union[str, bytes, list, RawJSON, None]) -> int:
+    """Wire size of a patch list in UTF-8 bytes.
+
+    ``render_with_diff()`` already returns the diff serialized, so for the
+    Rust string (or its :class:`RawJSON` wrapper) this is a length read —
+    plus one encode when the text is not ASCII. Decoded lists are re-encoded
+    — only non-Rust callers hand those in.
+    """
+    if patches is None:
+        return 0
+    if isinstance(patches, RawJSON):
+        return _utf8_len(patches.text)
+    if isinstance(patches, bytes):
+        return len(patches)
+    if isinstance(patches, str):
+        return _utf8_len(patches)
+    return len(json.dumps(patches, cls=DjangoJSONEncoder))
+
+
+def prefer_html_frame(html: Optional[str], patches: Union[str, bytes, list, RawJSON, None]) -> bool:
+    """Whether a full ``html_update`` is cheaper on the wire than ``patches``.
+
+    The one patch-vs-HTML cost model for the WebSocket and SSE render paths
+    (event, tick, broadcast, db_notify): HTML wins when its UTF-8 size is
+    smaller than ``html_fallback_ratio`` (default 0.7) times the encoded
+    patch size, and only once the patches pass 1 KB. The margin keeps
+    near-ties on patches, which preserve focus, scroll and client-side DOM
+    state that an ``html_update`` morph can disturb.
+    """
+    from .config import config
+
+    ratio = config.get("html_fallback_ratio", 0.7)
+    if not ratio or not html or patches is None:
+        return False
+    patch_size = encoded_patch_size(patches)
+    if patch_size < _HTML_FALLBACK_MIN_PATCH_BYTES:
+        return False
+    return _utf8_len(html) < patch_size * ratio
+
+
+def encode_frame(data: Dict[str, Any]) -> str:
+    """Encode an outbound frame dict to JSON text.
+
+    Identical to ``json.dumps(data, cls=DjangoJSONEncoder)`` except that
+    top-level :class:`RawJSON` values are spliced in verbatim instead of being
+    decoded and re-encoded.
+    """
+    raw = [key for key, value in data.items() if isinstance(value, RawJSON)]
+    if not raw:
+        return json.dumps(data, cls=DjangoJSONEncoder)
+    envelope = {key: value for key, value in data.items() if not isinstance(value, RawJSON)}
+    body = json.dumps(envelope, cls=DjangoJSONEncoder)
+    spliced = ",".join(f"{json.dumps(key)}:{data[key].text}" for key in raw)
+    if body == "{}":
+        return "{" + spliced + "}"
+    return body[:-1] + "," + spliced + "}"
+
+
 class DjangoJSONEncoder(json.JSONEncoder):
     """
     Custom JSON encoder that handles common Django and Python types.
@@ -287,6 +414,11 @@ class DjangoJSONEncoder(json.JSONEncoder):
         if isinstance(obj, AsyncResult):
             return obj.to_dict()
 
+        # Pre-encoded patch fragment nested below the top level of a frame
+        # (top-level fragments are spliced by ``encode_frame`` instead).
+        if isinstance(obj, RawJSON):
+            return obj.decode()
+
         # Handle Component and LiveComponent instances (render to HTML)
         # Import from both old and new locations for compatibility
         from .components.base import Component, LiveComponent
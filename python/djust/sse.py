@@ -61,9 +61,10 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
+from . import metrics
 from .rate_limit import ConnectionRateLimiter
 from .security import sanitize_for_log
-from .serialization import DjangoJSONEncoder
+from .serialization import encode_frame
 from .websocket import (
     _is_allowed_origin,
 )
@@ -110,12 +111,245 @@ def _max_sessions_total() -> int:
     return int(getattr(settings, "DJUST_SSE_MAX_SESSIONS_TOTAL", _MAX_SESSIONS_TOTAL))
 
 
+# ---- Per-session outbound buffer bound --------------------------------------
+# A stalled client (mobile on a bad network) stops draining its stream while
+# ticks, broadcasts and async completions keep pushing frames. The outbox caps
+# how many frames a session may hold; on overflow the policy decides:
+#
+#   * "coalesce" (default) — every buffered VDOM frame (``patch`` /
+#     ``html_update``) collapses into ONE ``html_update`` recovery frame carrying
+#     the latest rendered HTML; VDOM frames pushed while it is still queued are
+#     folded into it. If the buffer is still over the cap, the oldest non-VDOM
+#     frames are dropped.
+#   * "disconnect" — the buffer is discarded and the stream closed; the client
+#     reconnects and remounts.
+_MAX_QUEUED_FRAMES = 256
+_OVERFLOW_POLICY = "coalesce"
+_OVERFLOW_POLICIES = ("coalesce", "disconnect")
+
+_VDOM_FRAME_TYPES = ("patch", "html_update")
+
+sse_outbox_stats: Dict[str, int] = {
+    "frames": 0,
+    "coalesced": 0,
+    "dropped": 0,
+    "disconnects": 0,
+    "high_water": 0,
+}
+"""Process-wide SSE outbox counters.
+
+``frames`` — frames accepted; ``coalesced`` — VDOM frames folded into a
+recovery frame; ``dropped`` — frames discarded (non-VDOM overflow, a
+disconnect's buffer, or pushes after it); ``disconnects`` — streams closed by
+the "disconnect" policy; ``high_water`` — deepest buffer seen by any session.
+"""
+
+
+def _max_queued_frames() -> int:
+    """Per-session outbound frame cap (settings-overridable)."""
+    from django.conf import settings
+
+    return int(getattr(settings, "DJUST_SSE_MAX_QUEUED_FRAMES", _MAX_QUEUED_FRAMES))
+
+
+def _overflow_policy() -> str:
+    """Outbox overflow policy (settings-overridable); unknown values coalesce."""
+    from django.conf import settings
+
+    policy = getattr(settings, "DJUST_SSE_OVERFLOW_POLICY", _OVERFLOW_POLICY)
+    if policy not in _OVERFLOW_POLICIES:
+        logger.warning(
+            "DJUST_SSE_OVERFLOW_POLICY=%r is not one of %s; using %r",
+            policy,
+            _OVERFLOW_POLICIES,
+            _OVERFLOW_POLICY,
+        )
+        return _OVERFLOW_POLICY
+    return policy
+
+
+def _is_vdom_frame(msg: Any) -> bool:
+    return (
+        isinstance(msg, dict)
+        and msg.get("type") in _VDOM_FRAME_TYPES
+        and isinstance(msg.get("version"), int)
+    )
+
+
+class _RecoveryFrame:
+    """Placeholder for a run of collapsed VDOM frames.
+
+    Holds the version span it replaces, the HTML of the newest one and the
+    newest event ``ref`` among them; turned into a real ``html_update`` when
+    the stream dequeues it.
+    """
+
+    __slots__ = ("first_version", "last_version", "html", "raw", "event_name", "ref")
+
+    def __init__(self, first_version: int) -> None:
+        self.first_version = first_version
+        self.last_version = first_version
+        self.html: Optional[str] = None
+        self.raw = False
+        self.event_name: Optional[str] = None
+        self.ref: Optional[int] = None
+
+
+class SSEOutbox(asyncio.Queue):
+    """Bounded outbound frame buffer for one :class:`SSESession`.
+
+    Drop-in for the ``asyncio.Queue`` the stream generator drains
+    (``put_nowait`` / ``get`` / ``get_nowait`` / ``empty`` / ``qsize``); the
+    bound and the overflow policy live in the ``_put`` / ``_get`` hooks. The
+    ``None`` close sentinel always bypasses the bound.
+
+    The client accepts a VDOM frame only when its version is exactly one past
+    the last one applied. A recovery frame replacing versions ``a..b`` is
+    therefore stamped ``a``, and every later VDOM frame is renumbered down by
+    the ``b - a`` versions it skipped.
+    """
+
+    def __init__(
+        self,
+        session: "SSESession",
+        max_frames: Optional[int] = None,
+        policy: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self._session = session
+        self.max_frames = max(1, max_frames if max_frames is not None else _max_queued_frames())
+        self.policy = policy or _overflow_policy()
+        self.closed = False
+        self.stats: Dict[str, int] = {key: 0 for key in sse_outbox_stats}
+        self._recovery: Optional[_RecoveryFrame] = None
+        self._version_shift = 0
+
+    def _count(self, name: str, n: int = 1) -> None:
+        self.stats[name] += n
+        sse_outbox_stats[name] += n
+
+    def _put(self, item: Any) -> None:
+        if item is None:
+            self._queue.append(None)
+            return
+        if self.closed:
+            self._count("dropped")
+            return
+        self._count("frames")
+        if self._recovery is not None and _is_vdom_frame(item):
+            self._absorb(self._recovery, item)
+            return
+        self._queue.append(item)
+        if len(self._queue) > self.max_frames:
+            self._overflow()
+        depth = len(self._queue)
+        if depth > self.stats["high_water"]:
+            self.stats["high_water"] = depth
+            if depth > sse_outbox_stats["high_water"]:
+                sse_outbox_stats["high_water"] = depth
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        if item is self._recovery and item is not None:
+            self._recovery = None
+            return self._materialise(item)
+        if self._version_shift and _is_vdom_frame(item):
+            item = {**item, "version": item["version"] - self._version_shift}
+        return item
+
+    # ------------------------------------------------------------------ #
+    # Overflow
+    # ------------------------------------------------------------------ #
+
+    def _overflow(self) -> None:
+        if self.policy == "disconnect":
+            self._disconnect()
+            return
+
+        if self._recovery is None:
+            vdom_at = [i for i, msg in enumerate(self._queue) if _is_vdom_frame(msg)]
+            if vdom_at:
+                recovery = _RecoveryFrame(self._queue[vdom_at[0]]["version"])
+                for i in vdom_at:
+                    self._absorb(recovery, self._queue[i])
+                # The recovery frame takes the newest VDOM frame's slot, so
+                # frames pushed after that render still arrive after its HTML.
+                self._queue[vdom_at[-1]] = recovery
+                for i in reversed(vdom_at[:-1]):
+                    del self._queue[i]
+                self._recovery = recovery
+
+        while len(self._queue) > self.max_frames:
+            for i, msg in enumerate(self._queue):
+                if msg is not self._recovery and msg is not None:
+                    del self._queue[i]
+                    self._count("dropped")
+                    break
+            else:
+                break
+
+    def _absorb(self, recovery: _RecoveryFrame, msg: Dict[str, Any]) -> None:
+        recovery.last_version = msg["version"]
+        recovery.event_name = msg.get("event_name")
+        if msg.get("ref") is not None:
+            # The client acks one ref per frame; the newest event response
+            # is the one whose state the recovery HTML shows.
+            recovery.ref = msg["ref"]
+        if msg["type"] == "html_update":
+            # Already stripped and extracted by the runtime.
+            recovery.html, recovery.raw = msg.get("html"), False
+        else:
+            # Patch frames carry no HTML; the transport kept the raw render
+            # that produced this version (SSESessionTransport.next_client_version).
+            version, html = getattr(self._session, "_last_render", (None, None))
+            if version == msg["version"]:
+                recovery.html, recovery.raw = html, True
+            else:
+                recovery.html, recovery.raw = None, False
+        self._count("coalesced")
+
+    def _disconnect(self) -> None:
+        self._count("dropped", len(self._queue))
+        self._count("disconnects")
+        self._queue.clear()
+        self._queue.append(None)
+        self._recovery = None
+        self.closed = True
+        self._session.active = False
+        logger.warning(
+            "SSE: session %s exceeded %d queued frames; closing stream",
+            sanitize_for_log(self._session.session_id),
+            self.max_frames,
+        )
+
+    def _materialise(self, recovery: _RecoveryFrame) -> Dict[str, Any]:
+        version = recovery.first_version - self._version_shift
+        self._version_shift += recovery.last_version - recovery.first_version
+        html = recovery.html
+        view = self._session.view_instance
+        if html is not None and recovery.raw:
+            if view is None or not hasattr(view, "_extract_liveview_content"):
+                html = None
+            else:
+                html = view._extract_liveview_content(view._strip_comments_and_whitespace(html))
+        if html is None:
+            # No HTML for the newest state (shouldn't happen for runtime frames):
+            # a full page reload is the only safe recovery.
+            return {"type": "reload"}
+        msg: Dict[str, Any] = {"type": "html_update", "html": html, "version": version}
+        if recovery.event_name:
+            msg["event_name"] = recovery.event_name
+        if recovery.ref is not None:
+            msg["ref"] = recovery.ref
+        return msg
+
+
 class SSESession:
     """
     Per-connection state for a single SSE client.
 
-    Holds the mounted LiveView instance and an asyncio Queue used to pass
-    server-side update messages to the SSE stream generator.
+    Holds the mounted LiveView instance and a bounded :class:`SSEOutbox` used
+    to pass server-side update messages to the SSE stream generator.
 
     Also exposes the minimal interface required by ``_validate_event_security``
     (``send_error``, ``close``, ``_client_ip``) so that security utilities from
@@ -125,8 +359,8 @@ class SSESession:
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.view_instance: Optional[Any] = None
-        self.queue: asyncio.Queue = asyncio.Queue()
         self.active = True
+        self.queue: SSEOutbox = SSEOutbox(self)
         self._rate_limiter: ConnectionRateLimiter = ConnectionRateLimiter()
         self._client_ip: Optional[str] = None
 
@@ -169,7 +403,10 @@ class SSESession:
     # ------------------------------------------------------------------ #
 
     def push(self, msg: Dict[str, Any]) -> None:
-        """Enqueue a message to be sent to the SSE client."""
+        """Enqueue a message to be sent to the SSE client.
+
+        Subject to the outbox bound — see :class:`SSEOutbox`.
+        """
         self.queue.put_nowait(msg)
 
     def shutdown(self) -> None:
@@ -496,6 +733,8 @@ class DjustSSEStreamView(View):
         mounted = session.runtime.view_instance is not None
         if mounted:
             _sse_sessions[session_id] = session
+            metrics.connections_opened.inc("sse")
+            metrics.connections_active.inc("sse")
         else:
             # Failed/unauthorized/redirecting mount: do NOT register the session
             # (no POST can drive it; it isn't counted against the caps). The
@@ -503,6 +742,11 @@ class DjustSSEStreamView(View):
             # closes promptly.
             session.shutdown()
 
+        def data_line(msg: Dict[str, Any]) -> str:
+            frame = encode_frame(msg)
+            metrics.frame_bytes.observe(len(frame), "sse", metrics.frame_type_label(msg))
+            return f"data: {frame}\n\n"
+
         async def event_stream() -> AsyncIterator[str]:
             # Send connection acknowledgment immediately
             yield f"data: {json.dumps({'type': 'sse_connect', 'session_id': session_id})}\n\n"
@@ -516,7 +760,7 @@ class DjustSSEStreamView(View):
                     msg = session.queue.get_nowait()
                     if msg is None:
                         break
-                    yield f"data: {json.dumps(msg, cls=DjangoJSONEncoder)}\n\n"
+                    yield data_line(msg)
 
                 while session.active:
                     try:
@@ -526,7 +770,7 @@ class DjustSSEStreamView(View):
                         if msg is None:
                             # Sentinel: stream closed deliberately
                             break
-                        yield f"data: {json.dumps(msg, cls=DjangoJSONEncoder)}\n\n"
+                        yield data_line(msg)
                     except asyncio.TimeoutError:
                         # SSE keepalive comment — prevents proxy timeout
                         yield ": keepalive\n\n"
@@ -536,6 +780,7 @@ class DjustSSEStreamView(View):
                     # session (only meaningful for registered/mounted sessions).
                     await asyncio.sleep(_SESSION_LINGER_S)
                     _sse_sessions.pop(session_id, None)
+                    metrics.connections_active.dec("sse")
                 logger.debug("SSE: session %s closed", sanitize_for_log(session_id))
 
         response = StreamingHttpResponse(
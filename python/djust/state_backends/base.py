@@ -3,8 +3,9 @@ Base state backend ABC and shared constants.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Iterable, Tuple
 from djust._rust import RustLiveView
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,54 @@ except ImportError:
     logger.debug("zstd not available - install with: pip install zstandard")
 
 
+_tls = threading.local()
+
+
+def compress_blob(data: bytes, level: int = 3) -> bytes:
+    """zstd-compress ``data`` with the backends' marker-byte framing.
+
+    Same format as ``RedisStateBackend._compress`` (``COMPRESSION_MARKER`` +
+    zstd frame, or ``NO_COMPRESSION_MARKER`` + raw bytes when zstandard is not
+    installed or compression would not save space), without its size
+    threshold. zstd compressors are not thread-safe, so each thread keeps its
+    own per level.
+    """
+    if not ZSTD_AVAILABLE:
+        return NO_COMPRESSION_MARKER + data
+    compressors = getattr(_tls, "compressors", None)
+    if compressors is None:
+        compressors = _tls.compressors = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        import zstandard
+
+        compressor = compressors[level] = zstandard.ZstdCompressor(level=level)
+    compressed: bytes = compressor.compress(data)
+    if len(compressed) < len(data):
+        return COMPRESSION_MARKER + compressed
+    return NO_COMPRESSION_MARKER + data
+
+
+def decompress_blob(blob: bytes) -> bytes:
+    """Inverse of :func:`compress_blob`."""
+    marker, payload = blob[:1], blob[1:]
+    if marker == NO_COMPRESSION_MARKER:
+        return payload
+    if marker != COMPRESSION_MARKER:
+        raise ValueError("Unknown compression marker %r" % marker)
+    if not ZSTD_AVAILABLE:
+        raise ValueError(
+            "Received compressed data but zstandard is not available. "
+            "Install with: pip install zstandard"
+        )
+    decompressor = getattr(_tls, "decompressor", None)
+    if decompressor is None:
+        import zstandard
+
+        decompressor = _tls.decompressor = zstandard.ZstdDecompressor()
+    return bytes(decompressor.decompress(payload))
+
+
 class DjustPerformanceWarning(UserWarning):
     """Warning for potential performance issues in djust LiveViews."""
 
@@ -73,6 +122,35 @@ class StateBackend(ABC):
         """
         pass
 
+    #: True when :meth:`set_delta` persists per-key fragments instead of the
+    #: whole view; the runtime then saves the changed keys after every sync.
+    delta_enabled: bool = False
+
+    def set_delta(
+        self,
+        key: str,
+        view: RustLiveView,
+        changed_keys: Optional[Iterable[str]],
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Store a RustLiveView whose state differs from the stored copy only in
+        ``changed_keys``.
+
+        Backends that can persist per-key fragments override this so a save
+        costs what changed rather than the whole view. The default writes the
+        full view via :meth:`set`.
+
+        Args:
+            key: Unique session key
+            view: RustLiveView instance to store
+            changed_keys: State keys changed since the last save. ``None``
+                means unknown (a full write); an empty iterable means nothing
+                changed (backends may just refresh the TTL).
+            ttl: Same as :meth:`set`
+        """
+        self.set(key, view, ttl)
+
     @abstractmethod
     def delete(self, key: str) -> bool:
         """
@@ -8,12 +8,29 @@ import warnings
 from threading import RLock
 from typing import Optional, Dict, Any, Tuple
 from djust._rust import RustLiveView
+from djust.metrics import time_state_backend
 from djust.profiler import profiler
 
 from .base import StateBackend, DjustPerformanceWarning, DEFAULT_STATE_SIZE_WARNING_KB
 
 logger = logging.getLogger(__name__)
 
+# Extension builds that predate ``RustLiveView.clone`` fall back to the
+# msgpack round trip in ``_clone_view``.
+_HAS_NATIVE_CLONE = hasattr(RustLiveView, "clone")
+
+
+def _clone_view(view: RustLiveView) -> RustLiveView:
+    """Return an isolated copy of ``view`` (#1353).
+
+    ``RustLiveView.clone()`` copies the Rust structs directly; the
+    ``serialize_msgpack`` / ``deserialize_msgpack`` round trip carries the
+    same fields but encodes and decodes every state value and VDOM node.
+    """
+    if _HAS_NATIVE_CLONE:
+        return view.clone()
+    return RustLiveView.deserialize_msgpack(view.serialize_msgpack())
+
 
 class InMemoryStateBackend(StateBackend):
     """
@@ -85,38 +102,37 @@ class InMemoryStateBackend(StateBackend):
         active mutable borrow via the ``Context::resolve_dotted_via_getattr``
         sidecar fallback path.
 
-        We use ``serialize_msgpack`` / ``deserialize_msgpack`` for
-        cloning because (a) ``RustLiveView`` is a Rust extension type
-        that doesn't expose a Python ``__copy__`` / ``__deepcopy__``,
-        and (b) the round-trip already exists for Redis storage and is
-        battle-tested. Note that ``template_dirs``, ``last_html``,
-        ``last_render_timing``, ``node_html_cache`` (transient render
-        caches) and ``raw_py_values`` (Python references) are not
-        carried across the round-trip — callers re-populate the
-        template dirs via ``set_template_dirs`` and the rest are
-        rebuilt on the next render.
+        Cloning goes through ``RustLiveView.clone()``, which copies the
+        Rust structs directly instead of paying Redis-level MessagePack
+        encode + decode on every read; builds without it fall back to the
+        ``serialize_msgpack`` / ``deserialize_msgpack`` round trip (see
+        ``_clone_view``). Both carry the same fields: ``template_dirs``,
+        ``last_html``, ``last_render_timing``, ``node_html_cache``
+        (transient render caches) and ``raw_py_values`` (Python
+        references) are not carried — callers re-populate the template
+        dirs via ``set_template_dirs`` and the rest are rebuilt on the
+        next render.
 
         Args:
             key: Session key to retrieve
 
         Returns:
             Tuple of (RustLiveView, timestamp) if found, None otherwise.
-            The returned view is a fresh deserialize — mutating it does
-            not affect other callers or the cached canonical state.
+            The returned view is a fresh clone — mutating it does not
+            affect other callers or the cached canonical state.
         """
-        with profiler.profile(profiler.OP_STATE_LOAD):
+        with profiler.profile(profiler.OP_STATE_LOAD), time_state_backend("memory", "load"):
             with self._lock:
                 cached = self._cache.get(key)
                 if cached is None:
                     return None
                 view, timestamp = cached
 
-            # Round-trip outside the lock: serialize/deserialize is
-            # purely CPU work on independent bytes; holding the cache
-            # lock across it would serialize all gets unnecessarily.
+            # Clone outside the lock: it is purely CPU work on the view;
+            # holding the cache lock across it would serialize all gets
+            # unnecessarily.
             try:
-                serialized = view.serialize_msgpack()
-                clone = RustLiveView.deserialize_msgpack(serialized)
+                clone = _clone_view(view)
             except Exception:
                 # Round-trip failed (msgpack schema drift after a hot-swap,
                 # corrupt payload, etc). Returning the shared ref is
@@ -141,8 +157,8 @@ class InMemoryStateBackend(StateBackend):
                         self._cache.pop(key, None)
                         self._state_sizes.pop(key, None)
                 logger.exception(
-                    "InMemoryStateBackend.get: serialize/deserialize round-trip "
-                    "failed for key '%s'; entry discarded — caller should remount",
+                    "InMemoryStateBackend.get: clone failed for key '%s'; "
+                    "entry discarded — caller should remount",
                     key,
                 )
                 return None
@@ -190,7 +206,7 @@ class InMemoryStateBackend(StateBackend):
                 stacklevel=3,
             )
 
-        with profiler.profile(profiler.OP_STATE_SAVE):
+        with profiler.profile(profiler.OP_STATE_SAVE), time_state_backend("memory", "save"):
             with self._lock:
                 self._cache[key] = (view, timestamp)
                 if state_size > 0:
@@ -5,8 +5,12 @@ Redis-backed state backend for production horizontal scaling.
 import logging
 import threading
 import time
-from typing import Optional, Dict, Any, Tuple, cast
+from typing import Optional, Dict, Any, Iterable, Tuple, cast
+
+import msgpack
+
 from djust._rust import RustLiveView
+from djust.metrics import time_state_backend
 from djust.profiler import profiler
 
 from .base import (
@@ -23,6 +27,14 @@ if ZSTD_AVAILABLE:
 
 logger = logging.getLogger(__name__)
 
+# Delta-mode hash layout: one Redis hash per session holding the compressed
+# base snapshot, the timestamp of the latest write, the number of fragments
+# written since the base, and one msgpack fragment per changed state key.
+_BASE_FIELD = b"__base__"
+_TS_FIELD = b"__ts__"
+_DELTAS_FIELD = b"__deltas__"
+_FRAGMENT_PREFIX = b"s:"
+
 
 class RedisStateBackend(StateBackend):
     """
@@ -47,6 +59,15 @@ class RedisStateBackend(StateBackend):
             compression_enabled=True,  # Enable zstd compression
             compression_threshold_kb=10,  # Compress states > 10KB
         )
+
+    Delta mode (``delta_enabled=True``) stores each session as a Redis hash:
+    a base snapshot (the full ``serialize_msgpack`` blob) plus one msgpack
+    fragment per state key written by :meth:`set_delta`, so a save costs what
+    changed instead of the whole view. Every ``delta_compaction_interval``
+    delta writes the hash is rewritten from a fresh base snapshot. ``get``
+    reads base + fragments with a single ``HGETALL``. Only state is stored per
+    key — a view rebuilt from fragments has its VDOM baseline reset, so its
+    next render ships full HTML instead of patches against the older base.
     """
 
     _DELETE_BATCH_SIZE = 1000  # max keys per pipeline flush in delete_all()
@@ -59,6 +80,8 @@ class RedisStateBackend(StateBackend):
         compression_enabled: bool = True,
         compression_threshold_kb: int = DEFAULT_COMPRESSION_THRESHOLD_KB,
         compression_level: int = 3,
+        delta_enabled: bool = False,
+        delta_compaction_interval: int = 32,
     ):
         """
         Initialize Redis backend with optional compression.
@@ -70,6 +93,9 @@ class RedisStateBackend(StateBackend):
             compression_enabled: Enable zstd compression (default: True)
             compression_threshold_kb: Compress states larger than this (default: 10KB)
             compression_level: zstd compression level 1-22 (default: 3, higher = slower but smaller)
+            delta_enabled: Store base snapshot + per-key fragments in a hash
+                (default: False — one blob per session, as before)
+            delta_compaction_interval: Delta writes between base rewrites (default: 32)
         """
         try:
             import redis
@@ -87,6 +113,10 @@ class RedisStateBackend(StateBackend):
         self._compression_threshold = compression_threshold_kb * 1024
         self._compression_level = compression_level
 
+        # Delta persistence settings
+        self._delta_enabled = delta_enabled
+        self._delta_compaction_interval = max(1, delta_compaction_interval)
+
         # zstd compressor/decompressor objects are NOT thread-safe when
         # shared across threads — see python-zstandard #244 + djust #1430.
         # Stash one per thread in a threading.local so concurrent
@@ -118,12 +148,23 @@ class RedisStateBackend(StateBackend):
             "uncompressed_count": 0,
             "total_bytes_saved": 0,
         }
+        self._delta_stats = {
+            "base_writes": 0,
+            "delta_writes": 0,
+            "delta_bytes": 0,
+            "compactions": 0,
+        }
 
     @property
     def key_prefix(self) -> str:
         """Return the Redis key prefix for this backend instance."""
         return self._key_prefix
 
+    @property
+    def delta_enabled(self) -> bool:
+        """True when saves go through the delta-mode hash layout."""
+        return getattr(self, "_delta_enabled", False)
+
     def _make_key(self, key: str) -> str:
         """Add prefix to key."""
         return f"{self._key_prefix}{key}"
@@ -233,7 +274,12 @@ class RedisStateBackend(StateBackend):
         """
         redis_key = self._make_key(key)
 
-        with profiler.profile(profiler.OP_STATE_LOAD):
+        if getattr(self, "_delta_enabled", False):
+            hit = self._get_delta(key, redis_key)
+            if hit is not False:
+                return hit
+
+        with profiler.profile(profiler.OP_STATE_LOAD), time_state_backend("redis", "load"):
             try:
                 # Get serialized view
                 data = self._client.get(redis_key)
@@ -256,6 +302,132 @@ class RedisStateBackend(StateBackend):
                 logger.error("Failed to deserialize from Redis key '%s': %s", key, e)
                 return None
 
+    def _get_delta(self, key: str, redis_key: str) -> Any:
+        """Read a delta-mode hash: base snapshot + per-key fragments.
+
+        Returns ``False`` when the key holds a plain (non-delta) blob so the
+        caller falls back to the ``GET`` path — a backend switched to delta
+        mode keeps reading sessions written before the switch.
+        """
+        import redis
+
+        with profiler.profile(profiler.OP_STATE_LOAD), time_state_backend("redis", "load"):
+            try:
+                fields = self._client.hgetall(redis_key)
+            except redis.ResponseError:
+                return False  # WRONGTYPE: a pre-delta string value
+            except Exception as e:
+                logger.error("Failed to read Redis key '%s': %s", key, e)
+                return None
+            base = fields.get(_BASE_FIELD) if fields else None
+            if not base:
+                return None
+
+            try:
+                with profiler.profile(profiler.OP_COMPRESSION):
+                    base = self._decompress(base)
+                with profiler.profile(profiler.OP_SERIALIZATION):
+                    view = RustLiveView.deserialize_msgpack(base)
+                    fragments = {
+                        field[len(_FRAGMENT_PREFIX) :].decode("utf-8"): msgpack.unpackb(
+                            value, raw=False
+                        )
+                        for field, value in fields.items()
+                        if field.startswith(_FRAGMENT_PREFIX)
+                    }
+                if fragments:
+                    view.update_state(fragments)
+                    # The base VDOM predates the fragments; diffing the next
+                    # render against it would produce wrong patches.
+                    view.reset()
+                ts = fields.get(_TS_FIELD)
+                timestamp = float(ts) if ts else view.get_timestamp()
+                return (view, timestamp)
+            except Exception as e:
+                logger.error("Failed to deserialize from Redis key '%s': %s", key, e)
+                return None
+
+    def _expire(self, pipe: Any, redis_key: str, ttl: int) -> None:
+        if ttl > 0:
+            pipe.expire(redis_key, ttl)
+        else:
+            pipe.persist(redis_key)
+
+    def _set_base(self, key: str, view: RustLiveView, ttl: int) -> None:
+        """Rewrite a delta-mode hash from a fresh base snapshot (compaction)."""
+        redis_key = self._make_key(key)
+        with profiler.profile(profiler.OP_SERIALIZATION):
+            serialized = view.serialize_msgpack()
+        with profiler.profile(profiler.OP_COMPRESSION):
+            data = self._compress(serialized)
+
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(redis_key)
+        pipe.hset(redis_key, mapping={_BASE_FIELD: data, _TS_FIELD: repr(time.time())})
+        self._expire(pipe, redis_key, ttl)
+        pipe.execute()
+        self._delta_stats["base_writes"] += 1
+
+    def set_delta(
+        self,
+        key: str,
+        view: RustLiveView,
+        changed_keys: Optional[Iterable[str]],
+        ttl: Optional[int] = None,
+    ) -> None:
+        """
+        Store only the state keys that changed since the last save.
+
+        In delta mode each changed key is written as its own msgpack fragment
+        into the session hash (``HSET``), alongside a TTL refresh, in one
+        transaction. An empty ``changed_keys`` just refreshes the TTL. Falls
+        back to a full :meth:`set` when delta mode is off, ``changed_keys`` is
+        ``None``, the base snapshot is missing, or the compaction interval is
+        reached.
+        """
+        if not getattr(self, "_delta_enabled", False) or changed_keys is None:
+            self.set(key, view, ttl)
+            return
+
+        import redis
+
+        redis_key = self._make_key(key)
+        if ttl is None:
+            ttl = self._default_ttl
+        keys = sorted(set(changed_keys))
+
+        with profiler.profile(profiler.OP_STATE_SAVE), time_state_backend("redis", "save"):
+            fragments: Dict[bytes, bytes] = {}
+            if keys:
+                with profiler.profile(profiler.OP_SERIALIZATION):
+                    state = view.get_state()
+                    for name in keys:
+                        if name in state:
+                            fragments[_FRAGMENT_PREFIX + name.encode("utf-8")] = msgpack.packb(
+                                state[name], use_bin_type=True, default=str
+                            )
+
+            pipe = self._client.pipeline(transaction=True)
+            pipe.hexists(redis_key, _BASE_FIELD)
+            if fragments:
+                pipe.hset(redis_key, mapping={**fragments, _TS_FIELD: repr(time.time())})
+                pipe.hincrby(redis_key, _DELTAS_FIELD, 1)
+            self._expire(pipe, redis_key, ttl)
+            try:
+                results = pipe.execute()
+            except redis.ResponseError:
+                results = [False]  # WRONGTYPE: a pre-delta blob — rewrite as a hash
+
+            if not results[0]:
+                self.set(key, view, ttl)
+                return
+            if fragments:
+                self._delta_stats["delta_writes"] += 1
+                self._delta_stats["delta_bytes"] += sum(len(v) for v in fragments.values())
+                if results[2] >= self._delta_compaction_interval:
+                    self._delta_stats["compactions"] += 1
+                    self._set_base(key, view, ttl)
+
     def set(self, key: str, view: RustLiveView, ttl: Optional[int] = None) -> None:
         """
         Store in Redis using native Rust serialization with optional compression.
@@ -271,7 +443,16 @@ class RedisStateBackend(StateBackend):
         if ttl is None:
             ttl = self._default_ttl
 
-        with profiler.profile(profiler.OP_STATE_SAVE):
+        if getattr(self, "_delta_enabled", False):
+            with profiler.profile(profiler.OP_STATE_SAVE), time_state_backend("redis", "save"):
+                try:
+                    self._set_base(key, view, ttl)
+                except Exception as e:
+                    logger.error("Failed to serialize to Redis key '%s': %s", key, e)
+                    raise
+            return
+
+        with profiler.profile(profiler.OP_STATE_SAVE), time_state_backend("redis", "save"):
             try:
                 # Serialize using Rust's native MessagePack serialization
                 # Timestamp is automatically embedded in the serialized data
@@ -338,6 +519,13 @@ class RedisStateBackend(StateBackend):
             logger.exception("delete_all failed for prefix %s", self._key_prefix)
             return 0
 
+    def _is_hash(self, redis_key: Any) -> bool:
+        """True when ``redis_key`` holds a delta-mode hash rather than a blob."""
+        key_type = self._client.type(redis_key)
+        if isinstance(key_type, bytes):
+            key_type = key_type.decode()
+        return key_type == "hash"
+
     def get_stats(self) -> Dict[str, Any]:
         """Get Redis backend statistics."""
         try:
@@ -372,12 +560,18 @@ class RedisStateBackend(StateBackend):
                 # Sample first 100 keys for performance (deserialization has cost)
                 for key in keys[:100]:
                     try:
-                        data = self._client.get(key)
-                        if data:
+                        if self._is_hash(key):
+                            # Delta-mode session: the hash carries its save time.
+                            ts = self._client.hget(key, _TS_FIELD)
+                            timestamp = float(ts) if ts else 0
+                        else:
+                            data = self._client.get(key)
+                            if not data:
+                                continue
                             view = RustLiveView.deserialize_msgpack(data)
                             timestamp = view.get_timestamp()
-                            if timestamp > 0:  # Valid timestamp (not initialized views)
-                                ages.append(current_time - timestamp)
+                        if timestamp > 0:  # Valid timestamp (not initialized views)
+                            ages.append(current_time - timestamp)
                     except Exception:
                         # Skip keys that fail to deserialize
                         pass
@@ -506,11 +700,13 @@ class RedisStateBackend(StateBackend):
                 except Exception:
                     # Fallback: get actual data size
                     try:
-                        data = self._client.get(key)
-                        if data:
-                            sizes.append(
-                                (key.decode() if isinstance(key, bytes) else key, len(data))
-                            )
+                        if self._is_hash(key):
+                            size = sum(len(v) for v in self._client.hvals(key))
+                        else:
+                            data = self._client.get(key)
+                            size = len(data) if data else 0
+                        if size:
+                            sizes.append((key.decode() if isinstance(key, bytes) else key, size))
                     except Exception:
                         pass  # Skip keys that fail to read (expired or deleted)
 
@@ -574,6 +770,22 @@ class RedisStateBackend(StateBackend):
                 "error": str(e),
             }
 
+    def get_delta_stats(self) -> Dict[str, Any]:
+        """
+        Get delta-persistence statistics for this backend.
+
+        Returns:
+            Dictionary with ``enabled``, ``compaction_interval``, and counters:
+            ``base_writes`` (full snapshots, including compactions),
+            ``delta_writes`` / ``delta_bytes`` (fragment writes and their
+            payload size) and ``compactions``.
+        """
+        return {
+            "enabled": getattr(self, "_delta_enabled", False),
+            "compaction_interval": getattr(self, "_delta_compaction_interval", None),
+            **getattr(self, "_delta_stats", {}),
+        }
+
     def get_compression_stats(self) -> Dict[str, Any]:
         """
         Get compression statistics for this backend.
@@ -31,6 +31,8 @@ def _create_state_backend(backend_type: str, config: Dict[str, Any]) -> StateBac
             compression_enabled=compression_enabled,
             compression_threshold_kb=compression_threshold_kb,
             compression_level=compression_level,
+            delta_enabled=config.get("REDIS_DELTA_ENABLED", False),
+            delta_compaction_interval=config.get("REDIS_DELTA_COMPACTION_INTERVAL", 32),
         )
     else:
         return InMemoryStateBackend(
@@ -74,6 +76,9 @@ def get_backend() -> StateBackend:
             'COMPRESSION_ENABLED': True,  # Enable zstd compression
             'COMPRESSION_THRESHOLD_KB': 10,  # Compress states > 10KB
             'COMPRESSION_LEVEL': 3,  # zstd level 1-22 (higher = slower but smaller)
+            # Delta persistence (Redis only): base snapshot + per-key fragments
+            'REDIS_DELTA_ENABLED': False,
+            'REDIS_DELTA_COMPACTION_INTERVAL': 32,  # delta writes between base rewrites
         }
 
     Top-level alias form (also honoured, #1354):
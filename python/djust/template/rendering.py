@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, cast
 
 from django.db import models
 from django.db.models import QuerySet
@@ -29,7 +30,11 @@ logger = logging.getLogger(__name__)
 # Try to import JIT optimization utilities
 try:
     from djust._rust import extract_template_variables, serialize_queryset
-    from djust.optimization.query_optimizer import analyze_queryset_optimization, optimize_queryset
+    from djust.optimization.query_optimizer import (
+        analyze_queryset_optimization,
+        iter_queryset_chunks,
+        optimize_queryset,
+    )
     from djust.serialization import DjangoJSONEncoder, normalize_django_value
 
     # Import from the true source module (re-exported via djust.live_view for
@@ -47,6 +52,136 @@ except ImportError:
     _jit_serializer_cache = {}  # Fallback empty cache when JIT not available
 
 
+class _UrlTagPlan(NamedTuple):
+    """A pre-parsed ``{% url %}`` tag.
+
+    ``tokens`` holds one ``(kwarg_name, literal, var_path)`` triple per
+    argument: ``kwarg_name`` is ``None`` for positional args, and exactly one
+    of ``literal`` (quoted string / integer, already converted) or
+    ``var_path`` (dotted context lookup, pre-split) is set.
+    """
+
+    url_name: str
+    tokens: Tuple[Tuple[Optional[str], Any, Optional[Tuple[str, ...]]], ...]
+    as_variable: Optional[str]
+    original: str
+
+
+class _CompiledTemplate(NamedTuple):
+    """Inheritance-resolved source plus its ``{% url %}`` plan.
+
+    ``deps`` records ``(path, st_mtime_ns)`` for every parent template read
+    while resolving ``{% extends %}``; the entry is stale once any of them
+    changes on disk.
+    """
+
+    source: str
+    url_plan: Tuple[Any, ...]
+    deps: Tuple[Tuple[str, int], ...]
+
+
+# Compiled templates keyed by (template source, template dirs). Keying on the
+# source rather than the origin name means an edited child template simply
+# misses; edited parents are caught by the mtime check on ``deps``.
+_compiled_templates: Dict[Tuple[str, Tuple[str, ...]], _CompiledTemplate] = {}
+_COMPILED_TEMPLATES_MAX = 256
+
+# reverse() results keyed by (resolver, script prefix, language, name, args,
+# kwargs). The resolver object changes whenever ROOT_URLCONF is overridden or
+# ``clear_url_caches()`` runs, so stale URLconfs never hit.
+_reverse_cache: Dict[Tuple[Any, ...], str] = {}
+_REVERSE_CACHE_MAX = 1024
+
+
+def _deps_fresh(deps: Tuple[Tuple[str, int], ...]) -> bool:
+    for path, mtime_ns in deps:
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _bounded_put(cache: Dict[Any, Any], limit: int, key: Any, value: Any) -> None:
+    if len(cache) >= limit:
+        # Dicts iterate in insertion order: drop the oldest entry.
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+
+def _cached_reverse(url_name: str, args: List[Any], kwargs: Dict[str, Any]) -> str:
+    """``reverse()`` memoized per (name, args, kwargs) for str / int arguments.
+
+    Other argument types (model instances, UUIDs, ...) go straight to
+    ``reverse()`` since their ``str()`` is not guaranteed stable.
+    """
+    from django.urls import get_resolver, get_script_prefix, get_urlconf, reverse
+    from django.utils.translation import get_language
+
+    values = list(args) + list(kwargs.values())
+    if all(type(v) in (str, int) for v in values):
+        key: Optional[Tuple[Any, ...]] = (
+            get_resolver(get_urlconf()),
+            get_script_prefix(),
+            get_language(),
+            url_name,
+            tuple((type(v), v) for v in args),
+            tuple(sorted((k, type(v), v) for k, v in kwargs.items())),
+        )
+        url = _reverse_cache.get(key)
+        if url is not None:
+            return url
+    else:
+        key = None
+
+    url = cast(str, reverse(url_name, args=args or None, kwargs=kwargs or None))
+    if key is not None:
+        _bounded_put(_reverse_cache, _REVERSE_CACHE_MAX, key, url)
+    return url
+
+
+def clear_template_cache() -> int:
+    """
+    Clear compiled template inheritance / ``{% url %}`` plans and memoized
+    ``reverse()`` results.
+
+    Called by Django's autoreloader on file changes (in DEBUG) and by the
+    hot-reload handler. Edited parent templates are also detected by mtime,
+    so production deploys need no explicit call.
+
+    Returns:
+        Number of cache entries cleared
+    """
+    count = len(_compiled_templates) + len(_reverse_cache)
+    _compiled_templates.clear()
+    _reverse_cache.clear()
+    return count
+
+
+def _setup_autoreload_template_cache_clear() -> None:
+    """Register a callback to clear compiled templates when files change."""
+    try:
+        from django.conf import settings
+
+        if not settings.DEBUG:
+            return
+
+        from django.utils.autoreload import file_changed
+
+        def clear_on_file_change(sender: Any, file_path: Any, **kwargs: Any) -> None:
+            # Templates and URLconfs both feed the cache: clear on any change.
+            clear_template_cache()
+
+        file_changed.connect(clear_on_file_change, weak=False)
+    except Exception:
+        # Autoreload signal not available (e.g., settings not configured)
+        pass
+
+
+_setup_autoreload_template_cache_clear()
+
+
 class _TemplateSourceWrapper:
     """
     Wrapper to make DjustTemplate compatible with Django template structure.
@@ -172,8 +307,14 @@ class DjustTemplate:
             if optimization:
                 queryset = optimize_queryset(queryset, optimization)
 
-            # Serialize with Rust (5-10x faster)
-            result = serialize_queryset(list(queryset), paths_for_var)
+            # Serialize with Rust (5-10x faster), one chunk of model
+            # instances at a time to bound peak memory on large querysets
+            from djust.config import config
+
+            chunk_size = int(config.get("jit_chunk_size", 2000) or 0)
+            result: List[Any] = []
+            for items in iter_queryset_chunks(queryset, chunk_size):
+                result.extend(serialize_queryset(items, paths_for_var))
 
             logger.debug(
                 "[JIT] Serialized %s objects for '%s' using Rust", len(result), variable_name
@@ -219,12 +360,13 @@ class DjustTemplate:
                 "__str__": str(model_instance),
             }
 
-    def _resolve_template_inheritance(self) -> str:
+    def _resolve_template_inheritance(self, deps: Optional[List[Tuple[str, int]]] = None) -> str:
         """
         Manually resolve {% extends %} tags by loading parent templates.
 
         This is a workaround until Rust template engine supports template loaders.
-        Returns the fully resolved template string.
+        Returns the fully resolved template string. When ``deps`` is given, the
+        ``(path, st_mtime_ns)`` of every parent read is appended to it.
 
         The algorithm works by:
         1. Finding {% extends 'parent.html' %} at the start of the template
@@ -254,6 +396,8 @@ class DjustTemplate:
             for template_dir in self.backend.template_dirs:
                 parent_path = template_dir / parent_name
                 if parent_path.is_file():
+                    if deps is not None:
+                        deps.append((str(parent_path), parent_path.stat().st_mtime_ns))
                     with open(parent_path, "r", encoding="utf-8") as f:
                         parent_source = f.read()
 
@@ -523,113 +667,123 @@ class DjustTemplate:
         Returns:
             Template string with {% url %} tags replaced by resolved URLs
         """
-        from django.urls import NoReverseMatch, reverse
-
-        def resolve_value(value_str: str, context: Dict[str, Any]) -> Any:
-            """Resolve a value from the context or return the literal value."""
-            value_str = value_str.strip()
-
-            # String literal (single or double quotes)
-            if (value_str.startswith("'") and value_str.endswith("'")) or (
-                value_str.startswith('"') and value_str.endswith('"')
-            ):
-                return value_str[1:-1]
-
-            # Integer literal
-            if value_str.isdigit():
-                return int(value_str)
-
-            # Context variable (possibly with dot notation)
-            if "." in value_str:
-                parts = value_str.split(".")
-                value = context.get(parts[0])
-                for part in parts[1:]:
-                    if value is None:
-                        return None
-                    if isinstance(value, dict):
-                        value = value.get(part)
-                    else:
-                        value = getattr(value, part, None)
-                return value
-            else:
-                return context.get(value_str)
+        return self._apply_url_plan(self._compile_url_plan(template_source), context_dict)
 
-        def replace_url_tag(match: re.Match[str]) -> str:
-            """Replace a single {% url %} tag with its resolved URL."""
-            url_name = match.group(1)
-            args_string = match.group(2) or ""
-            as_variable = match.group(3)
-
-            # Parse arguments and keyword arguments
-            args = []
-            kwargs = {}
-
-            # Tokenize the arguments string
-            if args_string.strip():
-                # Simple tokenization - handle quoted strings and key=value pairs
-                tokens = []
-                current_token = ""
+    @classmethod
+    def _compile_url_plan(cls, template_source: str) -> Tuple[Any, ...]:
+        """
+        Split a template into literal text and pre-parsed ``_UrlTagPlan``
+        entries, so tokenizing the tag arguments happens once per template
+        instead of once per render.
+        """
+        plan: List[Any] = []
+        pos = 0
+        for match in cls._URL_TAG_RE.finditer(template_source):
+            if match.start() > pos:
+                plan.append(template_source[pos : match.start()])
+            plan.append(
+                _UrlTagPlan(
+                    url_name=match.group(1),
+                    tokens=tuple(
+                        cls._parse_url_token(token)
+                        for token in cls._tokenize_url_args(match.group(2) or "")
+                    ),
+                    as_variable=match.group(3),
+                    original=match.group(0),
+                )
+            )
+            pos = match.end()
+        if pos < len(template_source):
+            plan.append(template_source[pos:])
+        return tuple(plan)
+
+    @staticmethod
+    def _tokenize_url_args(args_string: str) -> List[str]:
+        """Split ``{% url %}`` arguments on whitespace, keeping quoted strings whole."""
+        tokens = []
+        current_token = ""
+        in_quotes = False
+        quote_char = None
+
+        for char in args_string:
+            if char in "\"'" and not in_quotes:
+                in_quotes = True
+                quote_char = char
+                current_token += char
+            elif char == quote_char and in_quotes:
                 in_quotes = False
                 quote_char = None
-
-                for char in args_string:
-                    if char in "\"'" and not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                        current_token += char
-                    elif char == quote_char and in_quotes:
-                        in_quotes = False
-                        quote_char = None
-                        current_token += char
-                    elif char.isspace() and not in_quotes:
-                        if current_token:
-                            tokens.append(current_token)
-                            current_token = ""
-                    else:
-                        current_token += char
-
+                current_token += char
+            elif char.isspace() and not in_quotes:
                 if current_token:
                     tokens.append(current_token)
+                    current_token = ""
+            else:
+                current_token += char
+
+        if current_token:
+            tokens.append(current_token)
+        return tokens
+
+    @staticmethod
+    def _parse_url_token(
+        token: str,
+    ) -> Tuple[Optional[str], Any, Optional[Tuple[str, ...]]]:
+        """Classify one token as ``(kwarg_name, literal, var_path)``."""
+        key = None
+        value = token
+        if "=" in token and not token.startswith("'") and not token.startswith('"'):
+            key, value = token.split("=", 1)
+
+        # String literal (single or double quotes)
+        if (value.startswith("'") and value.endswith("'")) or (
+            value.startswith('"') and value.endswith('"')
+        ):
+            return key, value[1:-1], None
+
+        # Integer literal
+        if value.isdigit():
+            return key, int(value), None
+
+        # Context variable (possibly with dot notation)
+        return key, None, tuple(value.split("."))
+
+    @staticmethod
+    def _apply_url_plan(plan: Tuple[Any, ...], context_dict: Dict[str, Any]) -> str:
+        """Render a ``_compile_url_plan`` result against the current context."""
+        from django.urls import NoReverseMatch
+
+        if len(plan) == 1 and isinstance(plan[0], str):
+            return cast(str, plan[0])
+
+        out = []
+        for item in plan:
+            if isinstance(item, str):
+                out.append(item)
+                continue
 
-                # Process tokens into args and kwargs
-                for token in tokens:
-                    if "=" in token and not token.startswith("'") and not token.startswith('"'):
-                        # Keyword argument
-                        key, value = token.split("=", 1)
-                        resolved_value = resolve_value(value, context_dict)
-                        if resolved_value is not None:
-                            kwargs[key] = resolved_value
-                    else:
-                        # Positional argument
-                        resolved_value = resolve_value(token, context_dict)
-                        if resolved_value is not None:
-                            args.append(resolved_value)
-
-            # Check if any args/kwargs couldn't be resolved (value is None)
-            # This happens when the URL references loop variables like post.slug
-            # In this case, leave the original tag - it can't be resolved yet
+            args = []
+            kwargs = {}
             has_unresolved = False
-            if args_string.strip():
-                for token in tokens:
-                    if "=" in token and not token.startswith("'") and not token.startswith('"'):
-                        # Keyword argument
-                        _, value = token.split("=", 1)
-                        if resolve_value(value, context_dict) is None and not (
-                            (value.startswith("'") and value.endswith("'"))
-                            or (value.startswith('"') and value.endswith('"'))
-                            or value.isdigit()
-                        ):
-                            has_unresolved = True
-                            break
-                    else:
-                        # Positional argument
-                        if resolve_value(token, context_dict) is None and not (
-                            (token.startswith("'") and token.endswith("'"))
-                            or (token.startswith('"') and token.endswith('"'))
-                            or token.isdigit()
-                        ):
-                            has_unresolved = True
+            for key, literal, var_path in item.tokens:
+                if var_path is None:
+                    value = literal
+                else:
+                    value = context_dict.get(var_path[0])
+                    for part in var_path[1:]:
+                        if value is None:
                             break
+                        if isinstance(value, dict):
+                            value = value.get(part)
+                        else:
+                            value = getattr(value, part, None)
+                    if value is None:
+                        has_unresolved = True
+                        break
+                if key is None:
+                    args.append(value)
+                else:
+                    kwargs[key] = value
 
             if has_unresolved:
                 # Leave the original tag in place - it references variables
@@ -639,35 +793,57 @@ class DjustTemplate:
                 # {% for %} loops where the variable becomes available).
                 logger.debug(
                     "URL tag with unresolved variables (likely loop variable): %s",
-                    match.group(0),
+                    item.original,
                 )
-                return match.group(0)
+                out.append(item.original)
+                continue
 
             # Resolve the URL
             try:
-                url = cast(
-                    str,
-                    reverse(
-                        url_name, args=args if args else None, kwargs=kwargs if kwargs else None
-                    ),
-                )
-
-                if as_variable:
-                    # Store in context and return empty string
-                    # We'll handle this by adding to context_dict
-                    context_dict[as_variable] = url
-                    return ""
-                else:
-                    return url
+                url = _cached_reverse(item.url_name, args, kwargs)
             except NoReverseMatch as e:
                 # Re-raise to match Django's behavior
                 raise NoReverseMatch(
-                    f"Reverse for '{url_name}' not found. "
-                    f"'{url_name}' is not a valid view function or pattern name."
+                    f"Reverse for '{item.url_name}' not found. "
+                    f"'{item.url_name}' is not a valid view function or pattern name."
                 ) from e
 
-        # Replace all {% url %} tags
-        return self._URL_TAG_RE.sub(replace_url_tag, template_source)
+            if item.as_variable:
+                # Store in context and emit nothing
+                context_dict[item.as_variable] = url
+            else:
+                out.append(url)
+
+        return "".join(out)
+
+    def _compile(self) -> _CompiledTemplate:
+        """
+        Return the inheritance-resolved source and ``{% url %}`` plan for this
+        template, compiling on first use.
+
+        Results are shared across ``DjustTemplate`` instances with the same
+        source and template dirs, and recompiled when a parent template's
+        mtime changes or ``clear_template_cache()`` runs.
+        """
+        key = (self.template_string, tuple(str(d) for d in self.backend.template_dirs))
+        compiled = _compiled_templates.get(key)
+        if compiled is not None and _deps_fresh(compiled.deps):
+            return compiled
+
+        # Resolve template inheritance ({% extends %})
+        # This is a temporary workaround until Rust engine supports template loaders
+        deps: List[Tuple[str, int]] = []
+        try:
+            source = self._resolve_template_inheritance(deps)
+        except Exception as e:
+            # Not cached: a missing parent may appear later.
+            logger.warning("Template inheritance resolution failed: %s", e)
+            source = self.template_string
+            return _CompiledTemplate(source, self._compile_url_plan(source), ())
+
+        compiled = _CompiledTemplate(source, self._compile_url_plan(source), tuple(deps))
+        _bounded_put(_compiled_templates, _COMPILED_TEMPLATES_MAX, key, compiled)
+        return compiled
 
     def render(self, context: Any = None, request: Any = None) -> SafeString:
         """
@@ -683,13 +859,8 @@ class DjustTemplate:
         Returns:
             Rendered HTML as SafeString
         """
-        # Resolve template inheritance ({% extends %})
-        # This is a temporary workaround until Rust engine supports template loaders
-        try:
-            resolved_template = self._resolve_template_inheritance()
-        except Exception as e:
-            logger.warning("Template inheritance resolution failed: %s", e)
-            resolved_template = self.template_string
+        # Resolved {% extends %} chain + pre-parsed {% url %} tags (cached)
+        compiled = self._compile()
 
         # Convert context to dict
         if context is None:
@@ -746,7 +917,7 @@ class DjustTemplate:
 
         # Resolve {% url %} tags (must be done after context is fully prepared)
         # This replaces {% url 'name' args %} with the actual resolved URL
-        resolved_template = self._resolve_url_tags(resolved_template, context_dict)
+        resolved_template = self._apply_url_plan(compiled.url_plan, context_dict)
 
         # Serialize remaining context values (datetime, Decimal, UUID, FieldFile,
         # Form/BoundField, etc.) so all values are JSON-compatible for Rust.
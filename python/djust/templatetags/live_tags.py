@@ -18,6 +18,7 @@ Usage:
 """
 
 import contextlib
+import copy
 import logging
 import re
 import threading
@@ -1325,6 +1326,32 @@ _SCRIPT_OR_COMMENT_RE = re.compile(
 _MASK_PLACEHOLDER_RE = re.compile(r"\x00DJUST_MASK_(\d+)\x00")
 
 
+def _isolated_request(request: Any) -> Any:
+    """Shallow copy of ``request`` with a read-only snapshot of its session.
+
+    Lazy children mount in parallel worker threads and Django's session
+    object is not thread-safe, so each worker gets its own copy. Writes a
+    lazy child makes to ``request.session`` land in that copy and are
+    discarded (the caller logs them); the real session was saved when the
+    streaming response started. Sessions that aren't a ``SessionBase`` are
+    shared as-is. Call from the sync thread — the snapshot may load the
+    session.
+    """
+    from django.contrib.sessions.backends.base import SessionBase
+
+    worker_request = copy.copy(request)
+    session = getattr(request, "session", None)
+    if isinstance(session, SessionBase):
+        data = dict(session.items())
+        snapshot = copy.copy(session)
+        # clear() rebinds the copy's cache instead of emptying the shared one.
+        snapshot.clear()
+        snapshot.update(data)
+        snapshot.modified = False
+        worker_request.session = snapshot
+    return worker_request
+
+
 def _stamp_view_id(html: str, view_id: str) -> str:
     """Inject ``data-djust-embedded="..."`` inside every event-attribute-bearing tag.
 
@@ -1835,10 +1862,16 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
             """
             from asyncio import wait_for, TimeoutError as _AsyncioTimeout
             from asgiref.sync import sync_to_async
+            from channels.db import database_sync_to_async
 
-            def _render_eager() -> str:
+            abandoned = threading.Event()
+
+            def _render_eager(request: Any) -> "tuple[Any, str]":
                 # Eager mount + render path — same as the non-lazy
-                # branch below. Returns the stamped child HTML.
+                # branch below. Runs in a worker thread, so it only
+                # touches the child and its own copy of the request; the
+                # caller registers the child on the parent afterwards.
+                # Returns (child, stamped child HTML).
                 child = child_cls()
                 child.request = request
                 auth_redirect = check_view_auth(child, request)
@@ -1856,12 +1889,10 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
                     enforce_object_permission(child, request)
                 except PermissionDenied:
                     raise PermissionError("child %r denied access (object permission)" % view_path)
-                # Don't re-register the child by view_id — _assign_view_id
-                # already incremented the counter; calling _register_child
-                # here is what locks the slot. The lazy-fill DOM ends up
-                # under [data-djust-embedded="<view_id>"] so events route
-                # correctly.
-                parent._register_child(view_id, child)
+                if abandoned.is_set():
+                    # The thunk timed out or hit the response deadline
+                    # while mount() ran; nobody will read the render.
+                    return None, ""
                 child_context: Dict[str, Any] = {}
                 get_ctx_fn = getattr(child, "get_context_data", None)
                 if callable(get_ctx_fn):
@@ -1896,7 +1927,7 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
                 rendered_stamped = _stamp_view_id(rendered_inner, view_id)
                 # Wrap in a [dj-view] container so events route via
                 # data-djust-embedded just like the eager path.
-                return (
+                return child, (
                     '<div dj-view data-djust-embedded="'
                     + escaped_id
                     + '">'
@@ -1905,10 +1936,31 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
                 )
 
             try:
-                rendered_html = await wait_for(
-                    sync_to_async(_render_eager)(),
+                # thread_sensitive=False: sibling lazy children render in
+                # parallel worker threads instead of queueing on the one
+                # shared sync thread, so N slow children take max(latency)
+                # rather than sum(latency). database_sync_to_async closes
+                # the worker's stale DB connections around the render.
+                # Each worker gets its own request copy and session
+                # snapshot (see _isolated_request).
+                worker_request = await sync_to_async(_isolated_request)(request)
+                child, rendered_html = await wait_for(
+                    database_sync_to_async(_render_eager, thread_sensitive=False)(worker_request),
                     timeout=lazy_config["timeout_s"],
                 )
+                # Register on the event loop, one thunk at a time: the
+                # parent's child registry is not thread-safe. The slot was
+                # reserved by _assign_view_id above; registering is what
+                # routes events to [data-djust-embedded="<view_id>"].
+                parent._register_child(view_id, child)
+                session = getattr(worker_request, "session", None)
+                if session is not getattr(request, "session", None) and session.modified:
+                    logger.warning(
+                        "live_render lazy: child %s wrote to request.session in "
+                        "mount(); lazy children get a read-only session snapshot, "
+                        "so the write was discarded",
+                        child_cls.__name__,
+                    )
                 status = "ok"
                 body = rendered_html
             except _AsyncioTimeout:
@@ -1933,7 +1985,15 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
                     + escape(type(exc).__name__)
                     + "</dj-error>"
                 )
+            finally:
+                # A worker still running after a timeout or deadline
+                # cancellation can't be stopped, but it stops before
+                # rendering and its child is never registered.
+                abandoned.set()
 
+            return _fill_envelope(status, body)
+
+        def _fill_envelope(status: str, body: str) -> bytes:
             # Build the fill envelope. Browsers parse <template> inertly;
             # the inline <script> activator runs at parse time and
             # window.djust.lazyFill('X') from 50-lazy-fill.js performs
@@ -1963,6 +2023,33 @@ def live_render(context: Context, view_path: str, **kwargs: Any) -> Any:
             )
             return envelope.encode("utf-8")
 
+        def _deadline_fill() -> bytes:
+            """Fill sent when the thunk misses the response's lazy deadline
+            (``DJUST_LAZY_DEADLINE_S``).
+
+            Without tag kwargs the slot becomes a ``dj-view`` element with
+            ``dj-lazy="idle"``, which the client mounts over the WebSocket
+            once the page is idle (lazy hydration). Tag kwargs cannot
+            travel that way, so such children get a timeout fill instead.
+            """
+            if captured_kwargs:
+                return _fill_envelope(
+                    "timeout",
+                    '<dj-error aria-live="polite">Lazy child '
+                    + escaped_id
+                    + " missed the response deadline.</dj-error>",
+                )
+            return _fill_envelope(
+                "ok",
+                '<div dj-view="'
+                + escape(view_path)
+                + '" dj-lazy="idle">'
+                + (str(lazy_config["placeholder"]) if lazy_config["placeholder"] else "")
+                + "</div>",
+            )
+
+        _lazy_thunk.deadline_fallback = _deadline_fill  # type: ignore[attr-defined]
+
         # Stash the thunk on the OUTERMOST parent. ``aget`` reads
         # ``self._lazy_thunks`` after sync_to_async(get) returns and
         # transfers them onto the chunk emitter.
@@ -0,0 +1,164 @@
+"""Fused single-hop event turn (``LIVEVIEW_CONFIG['fused_event_pipeline']``).
+
+For a sync handler on a view with no time-travel recording, no
+``enable_state_snapshot`` save and no pending waiters,
+``ViewRuntime._dispatch_event_render`` runs the handler, change detection and
+``render_with_diff`` as ONE ``sync_to_async`` call
+(``djust.runtime._run_fused_event_turn``). These tests drive the REAL runtime
+event path and pin both that the hop count drops and that the emitted frames
+are the ones the per-step path emits.
+"""
+
+import threading
+
+import pytest
+
+from djust import LiveView
+from djust.config import config
+from djust.decorators import event_handler
+from djust.tests.test_transport_behavioral_parity import (
+    _EventSpineMixin,
+    _event_runtime_with_view,
+)
+
+
+class _ThreadRecordingView(_EventSpineMixin, LiveView):
+    """Records which thread the handler and the render ran on."""
+
+    def mount(self, request, **kwargs):
+        self.count = 0
+
+    @event_handler()
+    def bump(self, **kwargs):
+        self._handler_thread = threading.get_ident()
+        self.count += 1
+
+    @event_handler()
+    def touch_nothing(self, **kwargs):
+        pass
+
+    @event_handler()
+    def explode(self, **kwargs):
+        raise ValueError("boom")
+
+    def render_with_diff(self):
+        self._render_thread = threading.get_ident()
+        return ("<div>%s</div>" % self.count, None, 2)
+
+
+class _AsyncHandlerView(_EventSpineMixin, LiveView):
+    @event_handler()
+    async def bump(self, **kwargs):
+        self.count += 1
+
+
+def _view():
+    view = _ThreadRecordingView()
+    view.count = 0
+    return view
+
+
+def _count_hops(monkeypatch):
+    import djust.runtime as rt_mod
+
+    calls = []
+    original = rt_mod.sync_to_async
+
+    def _counting(fn, *args, **kwargs):
+        calls.append(getattr(fn, "__name__", repr(fn)))
+        return original(fn, *args, **kwargs)
+
+    monkeypatch.setattr(rt_mod, "sync_to_async", _counting)
+    return calls
+
+
+class TestFusedEventTurn:
+    @pytest.mark.asyncio
+    async def test_handler_and_render_share_one_executor_call(self, monkeypatch):
+        hops = _count_hops(monkeypatch)
+        runtime, transport = _event_runtime_with_view(_view())
+
+        await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}, "ref": 7})
+
+        assert hops == ["_run_fused_event_turn"]
+        view = runtime.view_instance
+        assert view._handler_thread == view._render_thread
+        (frame,) = [f for f in transport.sent if f.get("type") == "html_update"]
+        assert frame["html"] == "<div>1</div>"
+        assert frame["ref"] == 7
+        assert frame["event_name"] == "bump"
+
+    @pytest.mark.asyncio
+    async def test_gate_off_uses_per_step_hops(self, monkeypatch):
+        """Same event with the flag off — separate handler and render hops, same frame."""
+        hops = _count_hops(monkeypatch)
+        runtime, transport = _event_runtime_with_view(_view())
+
+        config.set("fused_event_pipeline", False)
+        try:
+            await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}, "ref": 7})
+        finally:
+            config.set("fused_event_pipeline", True)
+
+        # The handler hop goes through websocket_utils._call_handler; the
+        # runtime's own hop is the render.
+        assert hops == ["render_with_diff"]
+        (frame,) = [f for f in transport.sent if f.get("type") == "html_update"]
+        assert frame["html"] == "<div>1</div>"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_still_noops(self):
+        runtime, transport = _event_runtime_with_view(_view())
+
+        await runtime.dispatch_event({"type": "event", "event": "touch_nothing", "params": {}})
+
+        assert [f["type"] for f in transport.sent] == ["noop"]
+        assert not hasattr(runtime.view_instance, "_render_thread")
+
+    @pytest.mark.asyncio
+    async def test_handler_error_sends_the_error_frame(self):
+        runtime, transport = _event_runtime_with_view(_view())
+
+        await runtime.dispatch_event({"type": "event", "event": "explode", "params": {}})
+
+        assert [f["type"] for f in transport.sent] == ["error"]
+        assert not hasattr(runtime.view_instance, "_render_thread")
+
+    @pytest.mark.asyncio
+    async def test_async_handler_is_not_fused(self, monkeypatch):
+        hops = _count_hops(monkeypatch)
+        view = _AsyncHandlerView()
+        view.count = 0
+        runtime, transport = _event_runtime_with_view(view)
+
+        await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+
+        assert "_run_fused_event_turn" not in hops
+        assert [f for f in transport.sent if f.get("type") == "html_update"]
+
+    @pytest.mark.asyncio
+    async def test_state_snapshot_views_are_not_fused(self, monkeypatch):
+        hops = _count_hops(monkeypatch)
+        view = _view()
+        view.enable_state_snapshot = True
+        runtime, _transport = _event_runtime_with_view(view)
+        monkeypatch.setattr(runtime, "_persist_state_after_event", _noop_persist)
+
+        await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+
+        assert "_run_fused_event_turn" not in hops
+
+    @pytest.mark.asyncio
+    async def test_empty_fused_turn_renders_instead_of_asserting(self):
+        from djust.runtime import _FusedEventTurn
+
+        runtime, transport = _event_runtime_with_view(_view())
+
+        await runtime._render_and_send(event_name="bump", prerendered=_FusedEventTurn())
+
+        (frame,) = [f for f in transport.sent if f.get("type") == "html_update"]
+        assert frame["html"] == "<div>0</div>"
+
+
+async def _noop_persist(target_view, event_name):
+    return None
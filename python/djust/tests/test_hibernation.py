@@ -0,0 +1,166 @@
+"""
+Idle-session hibernation (djust.hibernation).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from djust import LiveView
+from djust.config import config
+from djust.hibernation import _sweep, hibernation_stats, maybe_register
+from djust.state_backends.base import (
+    COMPRESSION_MARKER,
+    compress_blob,
+    decompress_blob,
+)
+
+
+class _ListView(LiveView):
+    template = (
+        "<div dj-root><h1>{{ title }}</h1>"
+        "<ul>{% for item in items %}<li>{{ item }}</li>{% endfor %}</ul></div>"
+    )
+
+    def mount(self, request, **kwargs):
+        self.title = "ops"
+        self.items = ["row %d" % i for i in range(200)]
+
+
+def _rendered_view():
+    view = _ListView()
+    view.mount(None)
+    view.render_with_diff()
+    return view
+
+
+def _consumer(view, idle_for=3600.0):
+    return SimpleNamespace(
+        view_instance=view,
+        _render_lock=asyncio.Lock(),
+        _processing_user_event=False,
+        _last_active_at=time.monotonic() - idle_for,
+        _tick_task=None,
+        use_actors=False,
+    )
+
+
+def _entry(consumer):
+    return (consumer, asyncio.get_running_loop().create_future())
+
+
+@pytest.fixture
+def hibernate_after():
+    yield
+    config.set("hibernate_after_s", 0)
+
+
+def test_blob_round_trip():
+    data = b"<li>row</li>" * 500
+    blob = compress_blob(data)
+    assert blob[:1] == COMPRESSION_MARKER
+    assert len(blob) < len(data)
+    assert decompress_blob(blob) == data
+    assert decompress_blob(compress_blob(b"x")) == b"x"
+
+
+def test_hibernated_view_wakes_with_its_vdom():
+    view = _rendered_view()
+    before = dict(hibernation_stats)
+
+    stored = view._hibernate_rust_view()
+
+    assert view._rust_view is None
+    assert 0 < stored < hibernation_stats["state_bytes"] - before["state_bytes"]
+    assert hibernation_stats["hibernated"] == before["hibernated"] + 1
+
+    view.title = "ops (2)"
+    _html, patches, _version = view.render_with_diff()
+
+    assert view._hibernated_rust_view is None
+    assert hibernation_stats["rehydrated"] == before["rehydrated"] + 1
+    # Diffed against the restored VDOM: a small patch, not a full re-render.
+    patches = json.loads(patches)
+    assert patches and all(p["type"] != "Replace" for p in patches)
+    assert "ops (2)" in json.dumps(patches)
+
+
+def test_failed_restore_rebuilds_the_view():
+    view = _rendered_view()
+    view._hibernate_rust_view()
+    view._hibernated_rust_view = COMPRESSION_MARKER + b"not zstd"
+    before = hibernation_stats["failed"]
+
+    html, _patches, _version = view.render_with_diff()
+
+    assert hibernation_stats["failed"] == before + 1
+    assert "row 199" in html
+
+
+@pytest.mark.asyncio
+async def test_sweep_hibernates_only_idle_free_views():
+    idle = _consumer(_rendered_view())
+    recent = _consumer(_rendered_view(), idle_for=1)
+    busy = _consumer(_rendered_view())
+    busy._processing_user_event = True
+    ticking = _consumer(_rendered_view())
+    ticking._tick_task = object()
+
+    await _sweep([_entry(c) for c in (idle, recent, busy, ticking)], after=600)
+
+    assert idle.view_instance._rust_view is None
+    assert not idle._render_lock.locked()
+    for consumer in (recent, busy, ticking):
+        assert consumer.view_instance._rust_view is not None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_sweep_keeps_the_lock_until_the_thread_finishes():
+    import threading
+
+    started, release = threading.Event(), threading.Event()
+
+    class _SlowView:
+        _rust_view = object()
+
+        def _hibernate_rust_view(self):
+            started.set()
+            release.wait(5)
+            self._rust_view = None
+
+    first, second = _consumer(_SlowView()), _consumer(_SlowView())
+    sweep = asyncio.ensure_future(_sweep([_entry(first), _entry(second)], after=600))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    # Only the view being serialized is locked.
+    assert first._render_lock.locked()
+    assert not second._render_lock.locked()
+
+    sweep.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await sweep
+    assert first._render_lock.locked()
+
+    release.set()
+    async with first._render_lock:
+        assert first.view_instance._rust_view is None
+    assert second.view_instance._rust_view is not None
+
+
+@pytest.mark.asyncio
+async def test_register_is_gated_on_config(hibernate_after):
+    consumer = SimpleNamespace(_hibernation_task=None)
+    assert maybe_register(consumer) is None
+
+    config.set("hibernate_after_s", 600)
+    handle = maybe_register(consumer)
+    try:
+        assert handle is consumer._hibernation_task
+        assert maybe_register(consumer) is handle
+    finally:
+        handle.cancel()
+    await asyncio.sleep(0)
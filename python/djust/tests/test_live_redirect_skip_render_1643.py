@@ -171,11 +171,18 @@ def test_turn_end_paths_use_single_flush_helper():
 
     # WS-only turn-end paths (no runtime equivalent — server_push / db_notify are
     # the WS tick/broadcast loops; _run_async_work + _dispatch_single_event run on
-    # the consumer).
+    # the consumer). server_push / db_notify only enqueue into the coalescing
+    # mailbox (#813); their turn ends in _apply_push_batch (skip-render) or the
+    # shared _send_render_result (render).
+    for name in ("server_push", "db_notify"):
+        src = inspect.getsource(getattr(ws_mod.LiveViewConsumer, name))
+        assert "_schedule_push_drain" in src, (
+            f"{name} (WS) must hand its message to the push mailbox drain (#813)."
+        )
     for name in (
         "_dispatch_single_event",
-        "server_push",
-        "db_notify",
+        "_apply_push_batch",
+        "_send_render_result",
         "_run_async_work",
     ):
         src = inspect.getsource(getattr(ws_mod.LiveViewConsumer, name))
@@ -0,0 +1,187 @@
+"""
+Prometheus / OpenMetrics exporter (djust.metrics).
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.http import Http404
+from django.test import RequestFactory
+
+from djust import LiveView, metrics
+from djust.config import config
+from djust.decorators import event_handler
+from djust.metrics import (
+    Counter,
+    Histogram,
+    MetricFamily,
+    _reset_metrics,
+    frame_type_label,
+    metrics_view,
+    render_metrics,
+    time_state_backend,
+)
+from djust.tests.test_transport_behavioral_parity import (
+    _EventSpineMixin,
+    _event_runtime_with_view,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    _reset_metrics()
+    yield
+    _reset_metrics()
+    config.set("metrics_enabled", True)
+    config.set("metrics_auth_token", None)
+
+
+# --- Instruments / format ----------------------------------------------------
+
+
+def test_counter_and_histogram_text_format():
+    counter = Counter("demo_things_total", "Things.", ("kind",))
+    counter.inc("a")
+    counter.inc("a", amount=2)
+    hist = Histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        hist.observe(value)
+
+    lines = counter.collect().render(openmetrics=False)
+    assert lines[:2] == ["# HELP demo_things_total Things.", "# TYPE demo_things_total counter"]
+    assert 'demo_things_total{kind="a"} 3' in lines
+
+    lines = hist.collect().render(openmetrics=False)
+    assert 'demo_seconds_bucket{le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{le="1"} 2' in lines
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in lines
+    assert "demo_seconds_count 3" in lines
+    assert "demo_seconds_sum 5.55" in lines
+
+
+def test_openmetrics_counter_family_drops_total_suffix():
+    family = MetricFamily("demo_total", "counter", "Demo.", samples={(): 1})
+    lines = family.render(openmetrics=True)
+    assert "# TYPE demo counter" in lines
+    assert "demo_total 1" in lines
+    assert render_metrics(openmetrics=True).endswith("# EOF\n")
+
+
+def test_label_values_are_escaped():
+    family = MetricFamily("demo", "gauge", "Demo.", ("v",), samples={('a"b\\c',): 1})
+    assert family.render(openmetrics=False)[-1] == 'demo{v="a\\"b\\\\c"} 1'
+
+
+def test_disabled_instruments_are_noops():
+    config.set("metrics_enabled", False)
+    metrics.events_total.inc("ws")
+    metrics.render_duration.observe(0.01)
+    with time_state_backend("memory", "load"):
+        pass
+    config.set("metrics_enabled", True)
+    assert metrics.events_total.value("ws") == 0
+    assert metrics.render_duration.count() == 0
+    assert metrics.state_backend_duration.count("memory", "load") == 0
+
+
+def test_frame_type_label_is_bounded():
+    assert frame_type_label({"type": "patch"}) == "patch"
+    assert frame_type_label({"type": "custom_thing"}) == "other"
+    assert frame_type_label({}) == "other"
+
+
+# --- Collectors --------------------------------------------------------------
+
+
+def test_runtime_collectors_are_exported():
+    from djust.push import mailbox_stats
+
+    before = mailbox_stats["dropped"]
+    mailbox_stats["dropped"] += 2
+    try:
+        text = render_metrics()
+    finally:
+        mailbox_stats["dropped"] = before
+    assert f"djust_push_mailbox_dropped_total {before + 2}" in text
+    assert "djust_sse_outbox_high_water " in text
+    assert "djust_tick_skipped_total " in text
+    assert "djust_shared_broadcast_fallbacks_total " in text
+
+
+def test_state_backend_latency_is_recorded():
+    from djust.state_backends.memory import InMemoryStateBackend
+
+    backend = InMemoryStateBackend()
+    assert backend.get("missing") is None
+    assert metrics.state_backend_duration.count("memory", "load") == 1
+
+
+def test_broken_collector_does_not_fail_scrape(monkeypatch):
+    def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(metrics, "_collectors", metrics._collectors + [broken])
+    assert "djust_events_total" in render_metrics()
+
+
+# --- Runtime event path ------------------------------------------------------
+
+
+class _MetricsView(_EventSpineMixin, LiveView):
+    @event_handler()
+    def bump(self, **kwargs):
+        self.count += 1
+
+    def render_with_diff(self):
+        return ("<div>%s</div>" % self.count, None, 2)
+
+
+@pytest.mark.asyncio
+async def test_event_turn_is_counted_and_timed():
+    view = _MetricsView()
+    view.count = 0
+    runtime, transport = _event_runtime_with_view(view)
+    label = getattr(transport, "metrics_label", "other")
+
+    await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+
+    assert metrics.events_total.value(label) == 1
+    assert metrics.event_duration.count(label) == 1
+    # version 2 with no patches is a real VDOM fallback (DJE-053)
+    assert metrics.full_html_fallbacks.value("no_patches") == 1
+
+
+# --- Endpoint ---------------------------------------------------------------
+
+
+def test_endpoint_serves_prometheus_text():
+    metrics.events_total.inc("ws")
+    resp = metrics_view(RequestFactory().get("/metrics"))
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert 'djust_events_total{transport="ws"} 1' in resp.content.decode()
+
+
+def test_endpoint_negotiates_openmetrics():
+    resp = metrics_view(
+        RequestFactory().get("/metrics", HTTP_ACCEPT="application/openmetrics-text")
+    )
+    assert resp["Content-Type"].startswith("application/openmetrics-text")
+    assert resp.content.decode().endswith("# EOF\n")
+
+
+def test_endpoint_requires_token_when_configured():
+    config.set("metrics_auth_token", "s3cret")
+    factory = RequestFactory()
+    assert metrics_view(factory.get("/metrics")).status_code == 401
+    assert (
+        metrics_view(factory.get("/metrics", HTTP_AUTHORIZATION="Bearer nope")).status_code == 401
+    )
+    ok = metrics_view(factory.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret"))
+    assert ok.status_code == 200
+
+
+def test_endpoint_404_when_disabled():
+    config.set("metrics_enabled", False)
+    with pytest.raises(Http404):
+        metrics_view(RequestFactory().get("/metrics"))
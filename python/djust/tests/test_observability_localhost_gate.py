@@ -59,6 +59,7 @@ def test_all_endpoints_gate_non_localhost():
         views.last_traceback,
         views.log_tail,
         views.handler_timings,
+        views.render_costs,
         views.sql_queries,
         views.reset_view_state,
         views.eval_handler,
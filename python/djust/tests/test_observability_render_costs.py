@@ -0,0 +1,207 @@
+"""
+Per-(view class, event) render-cost breakdown + /render_costs/ endpoint.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from djust import LiveView
+from djust.config import config
+from djust.decorators import event_handler
+from djust.observability.render_costs import (
+    LogHistogram,
+    RenderCost,
+    _clear_render_costs,
+    add_bytes_sent,
+    add_phase_ms,
+    get_render_cost_stats,
+    record_render_cost,
+    render_cost_scope,
+    render_phase,
+)
+from djust.observability.views import render_costs as render_costs_view
+from djust.tests.test_transport_behavioral_parity import (
+    _EventSpineMixin,
+    _event_runtime_with_view,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_render_costs():
+    _clear_render_costs()
+    yield
+    _clear_render_costs()
+
+
+# --- Histogram --------------------------------------------------------------
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(7)
+    values = [rng.randint(0, 2_000_000) for _ in range(5000)]
+    hist = LogHistogram()
+    for v in values:
+        hist.record(v)
+    ordered = sorted(values)
+    for pct in (50, 90, 99):
+        exact = ordered[int(len(ordered) * pct / 100) - 1]
+        assert hist.percentile(pct) == pytest.approx(exact, rel=0.04)
+    assert hist.count == 5000
+    assert hist.max == max(values)
+    assert hist.min == min(values)
+
+
+def test_histogram_small_values_are_exact():
+    hist = LogHistogram()
+    for v in (3, 3, 5, 9):
+        hist.record(v)
+    assert hist.percentile(50) == 3
+    assert hist.percentile(100) == 9
+    assert LogHistogram().percentile(99) == 0
+
+
+# --- Scope / phases ----------------------------------------------------------
+
+
+def _max_total_ms(row):
+    # Histogram buckets are ~3% wide; allow for that on the upper side.
+    return row["total"]["max_ms"] * 1.04 + 0.001
+
+
+def test_nested_phases_are_exclusive():
+    with render_cost_scope("V", "save") as cost:
+        with render_phase("context"):
+            with render_phase("normalize"):
+                add_phase_ms("render", 0)
+        add_phase_ms("render", 4.0)
+        add_bytes_sent(120)
+
+    wall_phases = cost.phases["context"] + cost.phases["normalize"]
+    (row,) = get_render_cost_stats()
+    assert row["view_class"] == "V" and row["event"] == "save"
+    assert row["turns"] == 1
+    assert list(row["phases"]) == ["context", "normalize", "render"]
+    assert row["phases"]["render"]["p50_ms"] == pytest.approx(4.0, rel=0.04)
+    assert row["bytes_sent"]["max"] == 120
+    # Timed phases never claim more than the turn's wall time.
+    assert wall_phases <= _max_total_ms(row)
+
+
+def test_phases_outside_a_scope_are_dropped():
+    with render_phase("render"):
+        pass
+    add_phase_ms("diff", 3.0)
+    add_bytes_sent(10)
+    assert get_render_cost_stats() == []
+
+
+async def test_tasks_spawned_in_a_turn_do_not_record_into_it():
+    import asyncio
+
+    release = asyncio.Event()
+
+    async def background():
+        with render_phase("render"):
+            await release.wait()
+        add_phase_ms("diff", 5.0)
+        add_bytes_sent(10)
+
+    with render_cost_scope("V", "save") as cost:
+        task = asyncio.create_task(background())
+        await asyncio.sleep(0)
+        with render_phase("context"):
+            await asyncio.sleep(0)
+    release.set()
+    await task
+
+    assert set(cost.phases) == {"context"}
+    assert cost.bytes_sent == 0
+    assert cost._stack == []
+
+
+async def test_executor_hops_record_for_the_awaiting_turn():
+    from asgiref.sync import sync_to_async
+
+    def work():
+        with render_phase("normalize"):
+            pass
+
+    with render_cost_scope("V", "save") as cost:
+        await sync_to_async(work)()
+
+    assert "normalize" in cost.phases
+
+
+def test_profiling_disabled_records_nothing():
+    config.set("render_profiling", False)
+    try:
+        with render_cost_scope("V", "save") as cost:
+            add_phase_ms("render", 1.0)
+    finally:
+        config.set("render_profiling", True)
+    assert cost is None
+    assert get_render_cost_stats() == []
+
+
+def test_filters_and_sorting():
+    # Fixed totals: wall-clock sleeps made the order flaky under a loaded runner.
+    for view_class, event, total_ms in (("Fast", "a", 0.5), ("Slow", "a", 20.0), ("Slow", "b", 1)):
+        record_render_cost(view_class, event, RenderCost(), total_ms)
+    rows = get_render_cost_stats(event="a")
+    assert [r["view_class"] for r in rows] == ["Slow", "Fast"]
+    assert [r["event"] for r in get_render_cost_stats(view_class="Slow")] == ["a", "b"]
+
+
+# --- Runtime event path ------------------------------------------------------
+
+
+class _CostView(_EventSpineMixin, LiveView):
+    @event_handler()
+    def bump(self, **kwargs):
+        self.count += 1
+
+    def render_with_diff(self):
+        # Runs on the executor thread — the scope must follow it there.
+        add_phase_ms("render", 2.0)
+        return ("<div>%s</div>" % self.count, None, 2)
+
+
+@pytest.mark.asyncio
+async def test_event_turn_records_phase_breakdown():
+    view = _CostView()
+    view.count = 0
+    runtime, _transport = _event_runtime_with_view(view)
+
+    await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+    await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+
+    (row,) = get_render_cost_stats(view_class="_CostView")
+    assert row["event"] == "bump"
+    assert row["turns"] == 2
+    assert {"handler", "snapshot", "render"} <= set(row["phases"])
+    assert row["phases"]["render"]["count"] == 2
+
+
+# --- Endpoint ---------------------------------------------------------------
+
+
+@override_settings(DEBUG=True)
+def test_endpoint_returns_stats():
+    with render_cost_scope("CounterView", "increment"):
+        add_phase_ms("diff", 1.5)
+    resp = render_costs_view(RequestFactory().get("/?event=increment"))
+    assert resp.status_code == 200
+    data = json.loads(resp.content)
+    assert data["count"] == 1
+    assert data["stats"][0]["phases"]["diff"]["count"] == 1
+
+
+@override_settings(DEBUG=False)
+def test_endpoint_404_when_debug_off():
+    resp = render_costs_view(RequestFactory().get("/"))
+    assert resp.status_code == 404
@@ -0,0 +1,175 @@
+"""Pluggable rate-limit backend (``DJUST_CONFIG['RATE_LIMIT_BACKEND']``).
+
+``handler_rate_check`` and ``ip_tracker`` route through the configured
+backend. The in-memory default keeps the process-local behaviour; the Redis
+backend shares buckets and per-IP counts across workers and reserves tokens
+in leases so hot handlers do not pay a Redis round trip per event.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from djust.backends.rate_limit import InMemoryRateLimitBackend, RedisRateLimitBackend
+from djust.backends.registry import reset_rate_limit_backend, set_rate_limit_backend
+from djust.rate_limit import (
+    ahandler_rate_check,
+    handler_rate_check,
+    ip_tracker,
+    reset_handler_buckets,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_backend():
+    reset_rate_limit_backend()
+    reset_handler_buckets()
+    yield
+    reset_rate_limit_backend()
+    reset_handler_buckets()
+
+
+def _redis_backend(server=None, **kwargs) -> RedisRateLimitBackend:
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    with patch("redis.from_url", return_value=client):
+        return RedisRateLimitBackend(**kwargs)
+
+
+class TestBackendRouting:
+    def test_handler_rate_check_uses_configured_backend(self):
+        backend = MagicMock()
+        backend.consume.return_value = False
+        set_rate_limit_backend(backend)
+
+        assert handler_rate_check("user:1", "send_otp", {"rate": 1, "burst": 2}) is False
+        backend.consume.assert_called_once_with("user:1", "send_otp", 1, 2)
+
+    def test_undecorated_handler_skips_backend(self):
+        backend = MagicMock()
+        set_rate_limit_backend(backend)
+
+        assert handler_rate_check("user:1", "noop", None) is True
+        backend.consume.assert_not_called()
+
+    def test_ip_tracker_uses_configured_backend(self):
+        set_rate_limit_backend(InMemoryRateLimitBackend())
+
+        assert ip_tracker.connect("10.0.0.1", 1) is True
+        assert ip_tracker.connect("10.0.0.1", 1) is False
+        ip_tracker.disconnect("10.0.0.1")
+        assert ip_tracker.connect("10.0.0.1", 1) is True
+        ip_tracker.add_cooldown("10.0.0.2", 60)
+        assert ip_tracker.connect("10.0.0.2", 5) is False
+
+
+class TestAsyncCallers:
+    @pytest.mark.asyncio
+    async def test_blocking_backend_runs_off_the_event_loop(self):
+        import threading
+
+        loop_thread = threading.get_ident()
+        seen = []
+        backend = MagicMock()
+        backend.blocking = True
+        backend.consume.side_effect = lambda *a: seen.append(threading.get_ident()) or True
+        backend.connect.side_effect = lambda *a: seen.append(threading.get_ident()) or True
+        set_rate_limit_backend(backend)
+
+        assert await ahandler_rate_check("user:1", "h", {"rate": 1, "burst": 1}) is True
+        assert await ip_tracker.aconnect("10.0.0.1", 5) is True
+        await ip_tracker.aadd_cooldown("10.0.0.1", 5)
+        await ip_tracker.adisconnect("10.0.0.1")
+
+        assert len(seen) == 2 and loop_thread not in seen
+        backend.add_cooldown.assert_called_once_with("10.0.0.1", 5)
+        backend.disconnect.assert_called_once_with("10.0.0.1")
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_runs_inline(self):
+        set_rate_limit_backend(InMemoryRateLimitBackend())
+
+        assert await ahandler_rate_check("user:1", "h", {"rate": 0.001, "burst": 1}) is True
+        assert await ahandler_rate_check("user:1", "h", {"rate": 0.001, "burst": 1}) is False
+        assert await ahandler_rate_check("user:1", "h", None) is True
+
+
+class TestRedisLeases:
+    def test_hot_handler_reserves_tokens_in_batches(self):
+        backend = _redis_backend(lease_size=8, lease_ttl=1.0)
+        backend._take = MagicMock(side_effect=lambda keys, args: args[2])
+
+        results = [backend.consume("user:1", "drag", rate=100, burst=100) for _ in range(17)]
+
+        assert all(results)
+        # 8 tokens per Redis call: calls at the 1st, 9th and 17th event.
+        assert backend._take.call_count == 3
+        assert backend._take.call_args.kwargs["args"] == [100, 100, 8]
+
+    def test_low_rate_handler_is_exact(self):
+        backend = _redis_backend(lease_size=8, lease_ttl=0.25)
+        backend._take = MagicMock(side_effect=[1, 0])
+
+        assert backend.consume("user:1", "send_otp", rate=1, burst=1) is True
+        assert backend.consume("user:1", "send_otp", rate=1, burst=1) is False
+        assert [c.kwargs["args"][2] for c in backend._take.call_args_list] == [1, 1]
+
+    def test_redis_error_falls_back_to_local_bucket(self):
+        backend = _redis_backend()
+        backend._take = MagicMock(side_effect=ConnectionError("down"))
+
+        assert backend.consume("user:1", "send_otp", rate=1, burst=1) is True
+        assert backend.consume("user:1", "send_otp", rate=1, burst=1) is False
+
+    def test_client_is_bounded_by_socket_timeout(self):
+        pytest.importorskip("redis")
+        with patch("redis.from_url") as from_url:
+            backend = RedisRateLimitBackend(socket_timeout=0.2)
+
+        assert backend.blocking is True
+        kwargs = from_url.call_args.kwargs
+        assert kwargs["socket_timeout"] == 0.2
+        assert kwargs["socket_connect_timeout"] == 0.2
+
+
+class TestRedisScripts:
+    """Exercise the Lua scripts (fakeredis needs ``lupa`` for EVAL)."""
+
+    @pytest.fixture(autouse=True)
+    def _needs_lua(self):
+        pytest.importorskip("lupa")
+
+    def test_bucket_is_shared_across_workers(self):
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        workers = [_redis_backend(server=server, lease_size=1) for _ in range(3)]
+
+        allowed = sum(
+            w.consume("user:1", "send_otp", rate=0.001, burst=5) for _ in range(4) for w in workers
+        )
+        assert allowed == 5
+
+    def test_connection_cap_is_shared_across_workers(self):
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        a, b = _redis_backend(server=server), _redis_backend(server=server)
+
+        assert a.connect("10.0.0.1", 2) is True
+        assert b.connect("10.0.0.1", 2) is True
+        assert a.connect("10.0.0.1", 2) is False
+        b.disconnect("10.0.0.1")
+        assert a.connect("10.0.0.1", 2) is True
+        b.add_cooldown("10.0.0.3", 60)
+        assert a.connect("10.0.0.3", 2) is False
+
+    def test_zero_rate_bucket_does_not_refill(self):
+        backend = _redis_backend(lease_size=1)
+
+        assert backend.consume("user:1", "once", rate=0, burst=1) is True
+        assert backend.consume("user:1", "once", rate=0, burst=1) is False
+        ttl = backend._client.pttl("djust:ratelimit:bucket:user:1:once")
+        assert 0 < ttl <= 3600000
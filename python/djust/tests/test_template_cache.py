@@ -0,0 +1,89 @@
+"""Interned, hash-keyed, bounded Rust template cache (``crates/djust_live/src/template_cache.rs``).
+
+Sessions share one interned copy of each template source and the parsed
+template is cached by the canonical template hash, in an LRU bounded by
+``LIVEVIEW_CONFIG['template_cache_size']``. The Rust-backed tests skip on a
+compiled ``djust._rust`` that predates the cache.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from djust import _rust, metrics
+from djust.metrics import render_metrics
+
+requires_cache = pytest.mark.skipif(
+    not hasattr(_rust, "template_cache_stats"),
+    reason="compiled djust._rust predates the template cache",
+)
+
+
+@pytest.fixture
+def capacity():
+    before = _rust.template_cache_stats()["capacity"]
+    yield
+    _rust.set_template_cache_capacity(before)
+
+
+@requires_cache
+def test_sessions_on_one_template_share_the_source():
+    source = "<div>interned {{ n }}" + " " * 40_000 + "</div>"
+    before = _rust.template_cache_stats()
+    views = [_rust.RustLiveView(source) for _ in range(50)]
+    for view in views:
+        view.update_state({"n": 1})
+        view.render()
+
+    after = _rust.template_cache_stats()
+    assert after["interned_sources"] == before["interned_sources"] + 1
+    assert after["interned_bytes"] - before["interned_bytes"] == len(source)
+    # Parsed once, then served from the cache.
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 49
+    assert views[0].template_hash() == _rust.compute_template_hash(source)
+
+
+@requires_cache
+def test_cache_is_bounded(capacity):
+    _rust.set_template_cache_capacity(2)
+    for i in range(5):
+        _rust.render_template("<p>bounded %d {{ x }}</p>" % i, {"x": i})
+
+    stats = _rust.template_cache_stats()
+    assert stats["capacity"] == 2
+    assert stats["entries"] <= 2
+
+
+@requires_cache
+def test_hot_reload_evicts_the_superseded_version():
+    view = _rust.RustLiveView("<p>v1 hot-reload {{ x }}</p>")
+    view.update_state({"x": 1})
+    view.render()
+    entries = _rust.template_cache_stats()["entries"]
+
+    view.update_template("<p>v2 hot-reload {{ x }}</p>")
+    view.render()
+
+    # v2 was parsed and v1 (used by no other session) dropped.
+    assert _rust.template_cache_stats()["entries"] == entries
+
+
+def test_stats_are_exported_as_metrics(monkeypatch):
+    stats = {
+        "entries": 3,
+        "capacity": 512,
+        "hits": 40,
+        "misses": 3,
+        "evictions": 1,
+        "interned_sources": 3,
+        "interned_bytes": 1200,
+    }
+    monkeypatch.setattr(_rust, "template_cache_stats", lambda: stats, raising=False)
+    metrics._reset_metrics()
+
+    text = render_metrics()
+
+    assert "djust_template_cache_hits_total 40" in text
+    assert "djust_template_cache_evictions_total 1" in text
+    assert "djust_template_cache_interned_bytes 1200" in text
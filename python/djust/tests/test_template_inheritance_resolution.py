@@ -445,3 +445,68 @@ class TestBlockSuperSupport:
             # Should have both parent and child content
             assert "Parent Content" in resolved
             assert "Child Content" in resolved
+
+
+class TestCompiledInheritanceCache:
+    """Resolved {% extends %} chains are cached until a parent changes."""
+
+    def create_template(self, template_string, template_dirs):
+        from djust.template_backend import DjustTemplate
+
+        template = DjustTemplate.__new__(DjustTemplate)
+        template.template_string = template_string
+        template.backend = MockBackend(template_dirs)
+        return template
+
+    def test_resolves_once_per_source(self):
+        import os
+        from unittest.mock import patch
+
+        from djust.template.rendering import DjustTemplate, clear_template_cache
+
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "base.html").write_text("<p>{% block b %}x{% endblock %}</p>")
+            source = '{% extends "base.html" %}{% block b %}child{% endblock %}'
+            resolve = DjustTemplate._resolve_template_inheritance
+
+            with patch.object(
+                DjustTemplate, "_resolve_template_inheritance", autospec=True, side_effect=resolve
+            ) as resolves:
+                first = self.create_template(source, [tmpdir])._compile()
+                second = self.create_template(source, [tmpdir])._compile()
+
+            assert first is second
+            assert first.source == "<p>child</p>"
+            assert resolves.call_count == 1
+            assert first.deps[0][0] == os.path.join(tmpdir, "base.html")
+
+    def test_parent_mtime_change_recompiles(self):
+        import os
+
+        from djust.template.rendering import clear_template_cache
+
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir) / "base.html"
+            base.write_text("<p>{% block b %}x{% endblock %}</p>")
+            template = self.create_template(
+                '{% extends "base.html" %}{% block b %}child{% endblock %}', [tmpdir]
+            )
+            assert template._compile().source == "<p>child</p>"
+
+            base.write_text("<div>{% block b %}x{% endblock %}</div>")
+            stat = base.stat()
+            os.utime(base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert template._compile().source == "<div>child</div>"
+
+    def test_missing_parent_is_not_cached(self):
+        from djust.template.rendering import _compiled_templates, clear_template_cache
+
+        clear_template_cache()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            template = self.create_template('{% extends "base.html" %}', [tmpdir])
+
+            assert template._compile().source == '{% extends "base.html" %}'
+            assert _compiled_templates == {}
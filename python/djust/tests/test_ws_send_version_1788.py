@@ -383,12 +383,11 @@ def test_every_client_checked_send_path_uses_next_version():
     #     handle_time_travel_jump: 1
     #     handle_time_travel_component_jump: 1
     #     handle_forward_replay: 1
-    #     db_notify: 1
-    #     _tick_once: 1 (extracted from _run_tick, #2124)
-    #   ASSIGNMENT (X = self._next_version_armed(html)), 3:
+    #     _send_render_result: 2 (patch + html resync) — shared by server_push,
+    #       db_notify and _tick_once (which each had 1 site before it)
+    #   ASSIGNMENT (X = self._next_version_armed(html)), 2:
     #     _run_async_work success arms: 2
-    #     server_push: 1 (wire_version)
-    # Total armed invocations = 13.
+    # Total armed invocations = 12.
     #
     # #1907 THE FLIP: the 2 ``handle_event`` ASSIGN sites (the event patch +
     # html_update fallback ``wire_version = self._next_version_armed(html)``) were
@@ -400,7 +399,7 @@ def test_every_client_checked_send_path_uses_next_version():
     # wire-version + recovery arming on the WS event path is end-to-end pinned by
     # ``test_recovery_version_staleness_1817`` + ``test_ws_send_version_1788``'s
     # WebsocketCommunicator integration cases (which DID stay green across the flip).
-    EXPECTED_ARMED_INVOCATIONS = 13
+    EXPECTED_ARMED_INVOCATIONS = 12
     assert armed_invocations == EXPECTED_ARMED_INVOCATIONS, (
         f"expected {EXPECTED_ARMED_INVOCATIONS} self._next_version_armed() invocations "
         f"across RENDER-SEND paths; found {armed_invocations} "
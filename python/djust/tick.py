@@ -0,0 +1,234 @@
+"""
+Process-wide tick scheduler for ``tick_interval`` views.
+
+Each WebSocket consumer used to run its own ``asyncio.sleep`` loop
+(``LiveViewConsumer._run_tick``) and pay three executor hops per tick. With
+thousands of connected dashboards that is thousands of timers firing
+independently. The scheduler instead keeps one timer wheel per
+``(event loop, tick_interval)``: the interval is split into up to
+``MAX_SLOTS`` phase slots of at least ``SLOT_MS``, each registered consumer
+joins the least-populated slot (ties broken at random, so views mounted
+together do not tick together), and when a slot comes due every view in it
+ticks in a single ``sync_to_async`` submission — ``handle_tick``, the Rust
+state sync and ``render_with_diff`` for the whole slot — before the frames
+are sent.
+
+The scheduler never waits for a busy view: a view whose render lock is held
+or that is handling a user event skips that tick (#560), as does every view
+in a bucket that falls a whole interval behind. Counters and lag live in
+:data:`tick_stats`.
+
+The views of a slot tick one after another on one executor thread, and the
+wheel waits for a slot before moving to the next, so one slow ``handle_tick``
+delays every view behind it (the missed ticks are then dropped, not queued).
+That is why it is opt-in: enable ``LIVEVIEW_CONFIG['tick_scheduler']`` when
+ticks are short and numerous; off (the default), each consumer runs its own
+``_run_tick`` task.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger(__name__)
+
+SLOT_MS = 50
+"""Finest phase step of a bucket's wheel, in milliseconds."""
+
+MAX_SLOTS = 20
+"""Most phase slots one interval is split into."""
+
+tick_stats: Dict[str, float] = {
+    "ticks": 0,
+    "renders": 0,
+    "skipped": 0,
+    "batches": 0,
+    "lag_ms_last": 0.0,
+    "lag_ms_max": 0.0,
+}
+"""Process-wide scheduler counters.
+
+``ticks`` — ``handle_tick`` calls; ``renders`` — tick frames sent;
+``skipped`` — view ticks not run (user event in progress, render lock held, or
+the bucket fell a whole interval behind); ``batches`` — executor submissions;
+``lag_ms_last`` / ``lag_ms_max`` — how late the latest / worst slot fired.
+"""
+
+_Entry = Tuple[Any, "asyncio.Future[None]"]
+
+
+def _count(name: str, n: int = 1) -> None:
+    tick_stats[name] += n
+
+
+def _record_lag(lag_s: float) -> None:
+    lag_ms = max(0.0, lag_s * 1000.0)
+    tick_stats["lag_ms_last"] = lag_ms
+    if lag_ms > tick_stats["lag_ms_max"]:
+        tick_stats["lag_ms_max"] = lag_ms
+
+
+def _render_batch(jobs: List[Tuple[Callable[[Any], Any], Any]]) -> List[Any]:
+    """Tick every ``(tick_render, view)`` job; runs in the executor."""
+    results: List[Any] = []
+    for tick_render, view in jobs:
+        _count("ticks")
+        try:
+            results.append(tick_render(view))
+        except Exception as e:  # noqa: BLE001 — one view must not stop the slot
+            logger.exception("Error in tick handler: %s", e)
+            results.append(None)
+    return results
+
+
+async def _tick_slot(entries: List[_Entry]) -> None:
+    """Tick the consumers of one due slot in one executor submission."""
+    ready: List[Tuple[Any, Any]] = []
+    try:
+        for consumer, handle in entries:
+            if handle.done():
+                continue
+            view = consumer.view_instance
+            if not view:
+                # The view went away: stop ticking it (the _run_tick ``break``).
+                handle.set_result(None)
+                continue
+            lock = consumer._render_lock
+            if consumer._processing_user_event or lock.locked():
+                logger.debug("[djust] Tick on %s skipped — view busy", view.__class__.__name__)
+                _count("skipped")
+                continue
+            await lock.acquire()
+            ready.append((consumer, view))
+
+        if not ready:
+            return
+        _count("batches")
+        results = await sync_to_async(_render_batch)(
+            [(consumer._tick_render, view) for consumer, view in ready]
+        )
+        for (consumer, _view), result in zip(ready, results):
+            if result is None:
+                continue
+            html, patches, _version = result
+            try:
+                if await consumer._send_render_result(
+                    html, patches, source="tick", event_name="tick"
+                ):
+                    _count("renders")
+            except Exception as e:  # noqa: BLE001
+                logger.exception("Error in tick handler: %s", e)
+    finally:
+        for consumer, _view in ready:
+            consumer._render_lock.release()
+
+
+class _TickBucket:
+    """The timer wheel for one ``tick_interval`` on one event loop."""
+
+    def __init__(self, scheduler: "TickScheduler", key: Tuple[Any, int]) -> None:
+        loop, interval_ms = key
+        self.scheduler = scheduler
+        self.key = key
+        self.interval = interval_ms / 1000.0
+        self.slots: List[List[_Entry]] = [
+            [] for _ in range(max(1, min(interval_ms // SLOT_MS, MAX_SLOTS)))
+        ]
+        self.size = 0
+        self.busy = False
+        self.task = loop.create_task(self._run())
+
+    def add(self, consumer: Any, handle: "asyncio.Future[None]") -> None:
+        fewest = min(len(slot) for slot in self.slots)
+        slot = random.choice([slot for slot in self.slots if len(slot) == fewest])
+        slot.append((consumer, handle))
+        self.size += 1
+        handle.add_done_callback(lambda _: self._discard(slot, (consumer, handle)))
+
+    def _discard(self, slot: List[_Entry], entry: _Entry) -> None:
+        slot.remove(entry)
+        self.size -= 1
+        if self.size:
+            return
+        if self.scheduler._buckets.get(self.key) is self:
+            del self.scheduler._buckets[self.key]
+        if not self.busy:
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        step = self.interval / len(self.slots)
+        deadline = loop.time()
+        index = -1
+        try:
+            while self.size:
+                deadline += step
+                index = (index + 1) % len(self.slots)
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lag = loop.time() - deadline
+                _record_lag(lag)
+                if lag >= self.interval:
+                    # A whole revolution behind: drop the missed ticks rather
+                    # than firing them back to back, and realign the wheel.
+                    _count("skipped", int(lag // self.interval) * self.size)
+                    deadline = loop.time()
+                entries = list(self.slots[index])
+                if not entries:
+                    continue
+                self.busy = True
+                try:
+                    await _tick_slot(entries)
+                finally:
+                    self.busy = False
+        except asyncio.CancelledError:
+            pass  # Last view unregistered, or the loop is shutting down
+
+
+class TickScheduler:
+    """Buckets tick-enabled consumers by interval; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple[Any, int], _TickBucket] = {}
+
+    def register(self, consumer: Any, interval_ms: int) -> "asyncio.Future[None]":
+        """Tick ``consumer`` every ``interval_ms`` on the running loop.
+
+        Returns a future that stays pending while the consumer is scheduled.
+        Cancel it to unregister; it resolves by itself once the consumer has
+        no ``view_instance``. Consumers keep it as ``_tick_task``, so the
+        existing ``cancel()`` + ``await`` teardown unregisters them.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, int(interval_ms))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TickBucket(self, key)
+        handle: "asyncio.Future[None]" = loop.create_future()
+        bucket.add(consumer, handle)
+        return handle
+
+    @property
+    def registered(self) -> int:
+        """Number of consumers currently scheduled, across all buckets."""
+        return sum(bucket.size for bucket in self._buckets.values())
+
+    def bucket_sizes(self) -> Dict[int, List[int]]:
+        """``{interval_ms: [views per slot, ...]}`` for the running loop."""
+        loop: Optional[asyncio.AbstractEventLoop]
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return {
+            interval_ms: [len(slot) for slot in bucket.slots]
+            for (bucket_loop, interval_ms), bucket in self._buckets.items()
+            if bucket_loop is loop
+        }
+
+
+tick_scheduler = TickScheduler()
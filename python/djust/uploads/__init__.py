@@ -34,9 +34,11 @@ Security:
     (or ``escape()``) — never render it with ``|safe`` (see system check S007).
 """
 
+import hashlib
 import io
 import logging
 import os
+import shutil
 import struct
 import tempfile
 import time
@@ -572,6 +574,164 @@ class BufferedUploadWriter(UploadWriter):
         return None
 
 
+def _pwrite(fd: int, data: bytes, offset: int) -> None:
+    """Write all of *data* at *offset* (``os.pwrite`` where available)."""
+    view = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+        return
+    os.lseek(fd, offset, os.SEEK_SET)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _pread(fd: int, size: int, offset: int) -> bytes:
+    """Read up to *size* bytes at *offset* (``os.pread`` where available)."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+class TempFileUploadWriter(UploadWriter):
+    """Writer that assembles an upload in a preallocated temp file.
+
+    The default storage for upload slots without ``writer=``: each chunk is
+    written at its own offset (``chunk_index * stride``) instead of being
+    held in memory, so assembling and finalizing an upload costs one chunk
+    of RAM regardless of file size. A SHA-256 of the file is kept up to date
+    while chunks arrive contiguously.
+
+    ``stride`` is the client's chunk size: the length of chunk 0 once it has
+    arrived (only the last chunk may be shorter), ``chunk_size`` before that.
+    Chunks that would end past ``max_size`` are rejected, so a forged
+    ``chunk_index`` can't grow a sparse file without bound.
+
+    ``close()`` returns ``{"path", "size", "sha256"}``; the file is left on
+    disk for the caller. ``abort()`` removes it.
+    """
+
+    def __init__(
+        self,
+        upload_id: str,
+        filename: str,
+        content_type: str,
+        expected_size: Optional[int] = None,
+        temp_dir: Optional[str] = None,
+        chunk_size: int = 0,
+        max_size: Optional[int] = None,
+    ):
+        super().__init__(upload_id, filename, content_type, expected_size)
+        self.temp_dir = temp_dir
+        self.stride = chunk_size
+        self.max_size = max_size
+        self.path: Optional[str] = None
+        self.size = 0
+        self._fd: Optional[int] = None
+        self._hash = hashlib.sha256()
+        self._hashed_to = 0
+        self._hash_valid = True
+        self._pending: Dict[int, int] = {}  # offset -> length, written ahead of the hash
+
+    def open(self) -> None:
+        fd, self.path = tempfile.mkstemp(dir=self.temp_dir, suffix=Path(self.filename).suffix)
+        self._fd = fd
+        if self.expected_size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, self.expected_size)
+            except OSError:
+                pass  # Preallocation is an optimisation; tmpfs et al. may not support it
+
+    def write_chunk(self, chunk: bytes, chunk_index: int = 0) -> None:
+        if self._fd is None:
+            raise RuntimeError("write_chunk() called on a closed TempFileUploadWriter")
+        if chunk_index == 0:
+            self.stride = len(chunk)
+        elif not self.stride:
+            raise ValueError("Chunk %d arrived before the chunk size is known" % chunk_index)
+        offset = chunk_index * self.stride
+        end = offset + len(chunk)
+        if self.max_size is not None and end > self.max_size:
+            raise ValueError("Chunk %d ends past the size limit" % chunk_index)
+        _pwrite(self._fd, chunk, offset)
+        self.size = max(self.size, end)
+        self._advance_hash(offset, chunk)
+
+    def _advance_hash(self, offset: int, chunk: bytes) -> None:
+        if not self._hash_valid:
+            return
+        if offset < self._hashed_to or offset in self._pending:
+            # A retransmitted/overlapping chunk may have changed hashed bytes.
+            self._hash_valid = False
+            self._pending.clear()
+            return
+        if offset > self._hashed_to:
+            self._pending[offset] = len(chunk)
+            return
+        self._hash.update(chunk)
+        self._hashed_to += len(chunk)
+        while self._hashed_to in self._pending:
+            length = self._pending.pop(self._hashed_to)
+            self._hash.update(_pread(self._fd, length, self._hashed_to))
+            self._hashed_to += length
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the bytes written so far (``size`` bytes)."""
+        if not self._hash_valid or self._hashed_to != self.size:
+            self._rehash()
+        return self._hash.hexdigest()
+
+    def _rehash(self) -> None:
+        digest = hashlib.sha256()
+        offset = 0
+        while offset < self.size:
+            block = _pread(self._fd, min(1 << 20, self.size - offset), offset)
+            if not block:
+                break
+            digest.update(block)
+            offset += len(block)
+        self._hash, self._hashed_to, self._hash_valid = digest, offset, True
+        self._pending.clear()
+
+    def read(self, size: int = -1, offset: int = 0) -> bytes:
+        """Read back written bytes (``size=-1`` reads to the end)."""
+        if self._fd is None:
+            return b""
+        if size < 0:
+            size = self.size - offset
+        return _pread(self._fd, max(0, min(size, self.size - offset)), offset)
+
+    def close(self) -> Any:
+        if self._fd is None:
+            return {"path": self.path, "size": self.size, "sha256": self._hash.hexdigest()}
+        digest = self.sha256
+        try:
+            # Drop the preallocated tail beyond the last written byte.
+            os.ftruncate(self._fd, self.size)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+        return {"path": self.path, "size": self.size, "sha256": digest}
+
+    def abort(self, error: Optional[BaseException]) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+        if self.path:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass  # Best-effort cleanup; temp file may already be removed
+            self.path = None
+
+
 @dataclass
 class UploadConfig:
     """Configuration for an upload slot."""
@@ -645,7 +805,15 @@ class UploadEntry:
     client_name: str  # Original filename
     client_type: str  # MIME type from client
     client_size: int  # Expected size from client
-    _chunks: Dict[int, bytes] = field(default_factory=dict, repr=False)
+    # Chunks are assembled on disk by a TempFileUploadWriter opened on the
+    # first chunk. UploadManager.register_entry fills in the slot's temp dir,
+    # chunk size and size limit; standalone entries use the system temp dir
+    # and learn the chunk size from chunk 0.
+    _spill: Optional["TempFileUploadWriter"] = field(default=None, repr=False)
+    _spill_dir: Optional[str] = field(default=None, repr=False)
+    _chunk_size: int = field(default=0, repr=False)
+    _max_size: Optional[int] = field(default=None, repr=False)
+    _sha256: Optional[str] = field(default=None, repr=False)
     _temp_path: Optional[str] = field(default=None, repr=False)
     _total_received: int = field(default=0, repr=False)
     _complete: bool = field(default=False, repr=False)
@@ -666,11 +834,9 @@ class UploadEntry:
         if self._temp_path and os.path.exists(self._temp_path):
             with open(self._temp_path, "rb") as f:
                 return f.read()
-        # Reassemble from chunks
-        result = bytearray()
-        for i in sorted(self._chunks.keys()):
-            result.extend(self._chunks[i])
-        return bytes(result)
+        if self._spill is not None:
+            return self._spill.read()
+        return b""
 
     @property
     def file(self) -> io.BytesIO:
@@ -722,44 +888,100 @@ class UploadEntry:
     def error(self) -> Optional[str]:
         return self._error
 
+    @property
+    def sha256(self) -> Optional[str]:
+        """Hex SHA-256 of the received bytes, or None before the first chunk."""
+        if self._sha256 is not None:
+            return self._sha256
+        if self._spill is not None:
+            return self._spill.sha256
+        return None
+
     def add_chunk(self, chunk_index: int, data: bytes) -> None:
-        """Add a chunk of data."""
-        self._chunks[chunk_index] = data
+        """Write a chunk at its offset in the entry's temp file.
+
+        Chunk 0 is checked against the declared type's magic bytes so a
+        mismatched upload is rejected before the rest of it is transferred.
+        Failures set :attr:`error` and discard the partial file.
+        """
+        if self._error is not None:
+            return
+        try:
+            if self._spill is None:
+                spill = TempFileUploadWriter(
+                    upload_id=self.ref,
+                    filename=self.client_name,
+                    content_type=self.client_type,
+                    expected_size=self.client_size,
+                    temp_dir=self._spill_dir,
+                    chunk_size=self._chunk_size,
+                    max_size=self._max_size,
+                )
+                spill.open()
+                self._spill = spill
+            self._spill.write_chunk(data, chunk_index=chunk_index)
+        except (OSError, ValueError) as e:
+            self._error = f"Failed to write upload chunk: {e}"
+            self._discard_spill()
+            return
         self._total_received += len(data)
 
+        if chunk_index == 0 and len(data) >= 16:
+            expected_mime = self.client_type or mime_from_extension(self.client_name)
+            if expected_mime and not validate_magic_bytes(data, expected_mime):
+                self._error = f"File content doesn't match expected type: {expected_mime}"
+                self._discard_spill()
+
     def finalize(self, temp_dir: str) -> bool:
         """
-        Write chunks to temp file and validate.
+        Validate the assembled temp file and hand it over as the entry's file.
 
-        Returns True if validation passed.
+        Only the file header is read back, so memory use does not grow with
+        the upload size. Returns True if validation passed.
         """
-        # Reassemble data
-        data = self.data
+        if self._error is not None:
+            return False
+        spill = self._spill
+        size = spill.size if spill is not None else 0
 
         # Size check
-        if len(data) > self.client_size * 1.1:  # 10% tolerance for encoding
-            self._error = f"File too large: {len(data)} bytes (max {self.client_size})"
+        if size > self.client_size * 1.1:  # 10% tolerance for encoding
+            self._error = f"File too large: {size} bytes (max {self.client_size})"
             return False
 
         # Magic bytes validation
         expected_mime = self.client_type or mime_from_extension(self.client_name)
-        if expected_mime and not validate_magic_bytes(data, expected_mime):
+        head = spill.read(64) if spill is not None else b""
+        if expected_mime and not validate_magic_bytes(head, expected_mime):
             self._error = f"File content doesn't match expected type: {expected_mime}"
             return False
 
-        # Write to temp file
         try:
-            fd, path = tempfile.mkstemp(dir=temp_dir, suffix=Path(self.client_name).suffix)
-            with os.fdopen(fd, "wb") as f:
-                f.write(data)
+            if spill is None:
+                fd, path = tempfile.mkstemp(dir=temp_dir, suffix=Path(self.client_name).suffix)
+                os.close(fd)
+                self._sha256 = hashlib.sha256().hexdigest()
+            else:
+                result = spill.close()
+                path, self._sha256 = result["path"], result["sha256"]
+                if os.path.dirname(os.path.abspath(path)) != os.path.abspath(temp_dir):
+                    target = os.path.join(temp_dir, os.path.basename(path))
+                    shutil.move(path, target)
+                    path = target
+                self._spill = None
             self._temp_path = path
-            self._chunks.clear()  # Free memory
             self._complete = True
             return True
         except OSError as e:
             self._error = f"Failed to write temp file: {e}"
+            self._discard_spill()
             return False
 
+    def _discard_spill(self) -> None:
+        if self._spill is not None:
+            self._spill.abort(None)
+            self._spill = None
+
     def cleanup(self) -> None:
         """Remove temp file."""
         if self._temp_path and os.path.exists(self._temp_path):
@@ -767,7 +989,7 @@ class UploadEntry:
                 os.unlink(self._temp_path)
             except OSError:
                 pass  # Best-effort cleanup; temp file may already be removed
-        self._chunks.clear()
+        self._discard_spill()
 
 
 # ============================================================================
@@ -1043,6 +1265,9 @@ class UploadManager:
             client_name=client_name,
             client_type=client_type,
             client_size=client_size,
+            _spill_dir=self._temp_dir,
+            _chunk_size=config.chunk_size,
+            _max_size=config.max_file_size,
         )
         self._entries[ref] = entry
         self._name_to_refs.setdefault(upload_name, []).append(ref)
@@ -1093,6 +1318,9 @@ class UploadManager:
             return entry.progress
 
         entry.add_chunk(chunk_index, data)
+        if entry._error is not None:
+            logger.warning("Upload chunk rejected for %s: %s", ref, entry.error)
+            return None
         return entry.progress
 
     def complete_upload(self, ref: str) -> Optional[UploadEntry]:
@@ -1517,6 +1745,7 @@ __all__ = [
     # Pre-existing public surface
     "UploadWriter",
     "BufferedUploadWriter",
+    "TempFileUploadWriter",
     "UploadConfig",
     "UploadEntry",
     "UploadManager",
@@ -7,11 +7,21 @@ import inspect
 import json
 import logging
 import msgpack
+import time
+from contextvars import ContextVar
 from typing import Any, Awaitable, Callable, ContextManager, Dict, List, Optional
 from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
-from .serialization import DjangoJSONEncoder, fast_json_loads
+from .serialization import (
+    RawJSON,
+    encode_frame,
+    fast_json_loads,
+    patches_for_wire,
+    prefer_html_frame,
+)
 from .validation import validate_handler_params
+from .observability.render_costs import add_bytes_sent, render_phase
+from . import metrics
 from .profiler import profiler
 from .security import handle_exception, sanitize_for_log
 from .config import config as djust_config
@@ -92,6 +102,25 @@ except ImportError:
 _IMMUTABLE_TYPES = (str, int, float, bool, type(None), bytes, tuple, frozenset)
 
 
+class _MountCollector:
+    """Frames captured while one ``mount_batch`` entry mounts (``_mount_one``)."""
+
+    __slots__ = ("frames", "open")
+
+    def __init__(self) -> None:
+        self.frames: List[Dict[str, Any]] = []
+        self.open = True
+
+
+# The collector of the ``_mount_one`` running in the current task. A ContextVar
+# (not a per-call ``send_json`` swap) so batch entries mounting concurrently
+# each capture their own frames. Tasks spawned during a mount inherit it; once
+# that mount finishes the collector is closed and their frames go to the socket.
+_mount_collector: ContextVar[Optional[_MountCollector]] = ContextVar(
+    "djust_mount_collector", default=None
+)
+
+
 def _is_send_after_close_error(exc: RuntimeError) -> bool:
     """True when *exc* is the ASGI server rejecting a send on a closed socket.
 
@@ -337,7 +366,16 @@ def _snapshot_assigns(view_instance: Any) -> Dict[str, Any]:
     NOT help: it is excluded from this snapshot (``_FRAMEWORK_INTERNAL_ATTRS``),
     so the pre/post skip still fires — the render-forcing mechanism is the
     ``_force_full_html`` flag that ``set_changed_keys()`` sets.
+
+    Views with ``track_assigns = True`` skip the scan: their
+    :class:`~djust.change_tracking.AssignTracker` already knows which keys
+    changed, so the snapshot is a copy of its per-key version map and
+    mutations are detected at any collection size.
     """
+    tracker = view_instance.__dict__.get("_assign_tracker")
+    if tracker is not None:
+        return tracker.snapshot()  # type: ignore[no-any-return]
+
     # #762: Filter framework-internal attrs so change detection doesn't fire
     # on attrs like ``template_name`` / ``http_method_names`` that the user
     # never touches.
@@ -599,6 +637,13 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
     - File uploads via binary WebSocket frames
     """
 
+    # Coalescing mailbox for server_push / db_notify (#813) — created lazily
+    # by _get_push_mailbox(); _push_draining is True while a drain is running
+    # or scheduled, so new messages just merge into it.
+    _push_mailbox: Optional[Any] = None
+    _push_drain_task: Optional["asyncio.Future[None]"] = None
+    _push_draining: bool = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.view_instance: Optional[Any] = None
@@ -650,6 +695,10 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         # Track whether a user event is currently being processed so ticks
         # can yield priority to user interactions.
         self._processing_user_event = False
+        # Idle hibernation (djust.hibernation): when the view last handled an
+        # event or sent a render, and its scheduler registration.
+        self._last_active_at = time.monotonic()
+        self._hibernation_task: Optional["asyncio.Future[None]"] = None
 
     async def _flush_push_events(self) -> None:
         """
@@ -1450,7 +1499,9 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         # NON-hot-reload empty patches are still sent: user events that
         # legitimately produce no diff still need an acknowledgment so
         # the client can clear loading state.
-        if hotreload and patches == []:
+        if hotreload and (
+            patches == [] or (isinstance(patches, RawJSON) and patches.is_empty_list())
+        ):
             hotreload_logger.debug(
                 "Suppressing empty-patch hot-reload broadcast (unrelated file: %s)",
                 file_path,
@@ -1461,6 +1512,8 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         # Only patches=None indicates we should send html_update
         if patches is not None:
             if self.use_binary:
+                if isinstance(patches, RawJSON):
+                    patches = patches.decode()
                 patches_data = msgpack.packb(patches)
                 await self._send_frame(bytes_data=patches_data)
             else:
@@ -1525,6 +1578,64 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
             await self.send_json(response)
             await self._flush_all_pending()
 
+    async def _send_render_result(
+        self,
+        html: str,
+        patches: Any,
+        *,
+        source: str,
+        event_name: Optional[str] = None,
+        broadcast: bool = False,
+    ) -> bool:
+        """Send the result of an out-of-band ``render_with_diff()`` (tick / push / notify).
+
+        ``patches`` is the raw Rust value. With a diff it goes out as a
+        ``patch`` frame, or as an ``html_update`` when that is cheaper on the
+        wire (:func:`~djust.serialization.prefer_html_frame`, the same cost
+        model as the event path). Without one, only the pending queues are
+        flushed — unless the render dropped a stale ``shared_broadcast``
+        baseline, in which case the client must receive the full
+        ``html_update`` to land on the tree the next diff is computed against.
+        Frame-sending arms advance the wire version and arm recovery (#1817).
+        Returns whether a frame was sent.
+        """
+        # A view that keeps rendering is not idle (djust.hibernation).
+        self._last_active_at = time.monotonic()
+        view = self.view_instance
+        resync = getattr(view, "_shared_resync_pending", False) is True
+        if resync:
+            view._shared_resync_pending = False
+        if patches is not None and prefer_html_frame(html, patches):
+            # The Rust baseline already is this render, so the html_update
+            # lands the client on the tree the next diff starts from; the
+            # VDOM is not reset (same as the event path).
+            metrics.full_html_fallbacks.inc("patch_compression")
+        elif patches is not None:
+            await self._send_update(
+                patches=patches_for_wire(patches),
+                version=self._next_version_armed(html),
+                event_name=event_name,
+                broadcast=broadcast,
+                source=source,
+            )
+            return True
+        elif not resync:
+            await self._flush_all_pending()
+            return False
+        html_content = html
+        if view is not None and hasattr(view, "_strip_comments_and_whitespace"):
+            html_content = view._strip_comments_and_whitespace(html_content)
+        if view is not None and hasattr(view, "_extract_liveview_content"):
+            html_content = view._extract_liveview_content(html_content)
+        await self._send_update(
+            html=html_content,
+            version=self._next_version_armed(html),
+            event_name=event_name,
+            broadcast=broadcast,
+            source=source,
+        )
+        return True
+
     async def _dispatch_single_event(
         self,
         target_view: Any,
@@ -1803,11 +1914,15 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
             rl_cfg = {}
         if self._client_ip:
             max_per_ip = rl_cfg.get("max_connections_per_ip", 10)
-            if not ip_tracker.connect(self._client_ip, max_per_ip):
+            if not await ip_tracker.aconnect(self._client_ip, max_per_ip):
                 logger.warning("Connection rejected for IP %s (limit or cooldown)", self._client_ip)
                 await self.close(code=4429)
                 return
 
+        metrics.connections_opened.inc("ws")
+        metrics.connections_active.inc("ws")
+        self._metrics_counted = True
+
         # Add to hot reload broadcast group
         await self.channel_layer.group_add("djust_hotreload", self.channel_name)
 
@@ -1853,7 +1968,10 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         # Release IP connection slot
         client_ip = getattr(self, "_client_ip", None)
         if client_ip:
-            ip_tracker.disconnect(client_ip)
+            await ip_tracker.adisconnect(client_ip)
+        if getattr(self, "_metrics_counted", False):
+            self._metrics_counted = False
+            metrics.connections_active.dec("ws")
 
         # Remove from hot reload broadcast group
         await self.channel_layer.group_discard("djust_hotreload", self.channel_name)
@@ -1893,6 +2011,13 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                 pass  # Expected when cancelling a running tick task during disconnect
             self._tick_task = None
 
+        hibernation_task = getattr(self, "_hibernation_task", None)
+        if hibernation_task:
+            hibernation_task.cancel()
+            self._hibernation_task = None
+
+        await self._cancel_push_drain()
+
         # Clean up actor if using actors
         if self.use_actors and self.actor_handle:
             try:
@@ -2003,7 +2128,7 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                                 cooldown = (
                                     _rl.get("reconnect_cooldown", 5) if isinstance(_rl, dict) else 5
                                 )
-                                ip_tracker.add_cooldown(client_ip, cooldown)
+                                await ip_tracker.aadd_cooldown(client_ip, cooldown)
                             await self.close(code=4429)
                             return
                         await self.send_json(
@@ -2036,7 +2161,7 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                     if client_ip:
                         _rl = djust_config.get("rate_limit", {})
                         cooldown = _rl.get("reconnect_cooldown", 5) if isinstance(_rl, dict) else 5
-                        ip_tracker.add_cooldown(client_ip, cooldown)
+                        await ip_tracker.aadd_cooldown(client_ip, cooldown)
                     await self.close(code=4429)
                     return
                 await self.send_json(
@@ -2235,8 +2360,35 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         # an auth/hook block, which dispatch_mount cleared on the runtime).
         self.view_instance = runtime.view_instance
 
+    def _begin_mount_collect(self) -> None:
+        """Install the ``send_json`` router used by ``_mount_one`` (re-entrant).
+
+        The first of any concurrently running ``_mount_one`` calls swaps
+        ``send_json`` for :meth:`_send_or_collect` and sets
+        ``_mounting_in_batch``; the last to finish restores both.
+        """
+        depth = getattr(self, "_mount_collect_depth", 0)
+        if depth == 0:
+            self._mount_collect_send = self.send_json
+            self.send_json = self._send_or_collect  # type: ignore[method-assign]
+            self._mounting_in_batch = True
+        self._mount_collect_depth = depth + 1
+
+    def _end_mount_collect(self) -> None:
+        self._mount_collect_depth -= 1
+        if self._mount_collect_depth == 0:
+            self.send_json = self._mount_collect_send  # type: ignore[method-assign]
+            self._mounting_in_batch = False
+
+    async def _send_or_collect(self, payload: Dict[str, Any]) -> None:
+        collector = _mount_collector.get()
+        if collector is not None and collector.open:
+            collector.frames.append(payload)
+        else:
+            await self._mount_collect_send(payload)
+
     async def _mount_one(
-        self, data_view: Dict[str, Any]
+        self, data_view: Dict[str, Any], runtime: Any = None
     ) -> tuple[bool, Dict[str, Any], Optional[str], Optional[Dict[str, Any]], List[Any]]:
         """Mount + render a single view and return a payload WITHOUT sending.
 
@@ -2269,39 +2421,46 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
 
         Isolation: errors in one view MUST NOT propagate and kill the
         batch (see plan §2.3 "atomicity relaxed").
+
+        ``runtime``: when given, the view mounts on that (fresh) runtime via
+        ``dispatch_mount`` instead of the consumer's shared one — the
+        concurrent path of :meth:`handle_mount_batch`.
         """
         target_id = data_view.get("target_id") or ""
         view_path = data_view.get("view") or ""
 
-        # Temporarily swap send_json with a collector so handle_mount's
-        # frame-sending becomes a frame-collecting call. Restore on exit.
-        captured: list = []
-        orig_send_json = self.send_json
-
-        async def _collect(payload: Dict[str, Any]) -> None:
-            captured.append(payload)
-
-        self.send_json = _collect  # type: ignore[assignment]
+        # Route send_json through the collector so handle_mount's frame-sending
+        # becomes a frame-collecting call for THIS task only. Restore on exit.
+        collector = _MountCollector()
+        token = _mount_collector.set(collector)
         # Signal to handle_mount that it runs inside a multiplexed batch on a
         # shared socket: an auth/hook redirect must NOT close() the socket here
         # (that would kill sibling mounts + the collected navigate[] and
         # reconnect-storm the client). handle_mount still clears view_instance,
         # and the redirect's navigate frame is collected into navigate[] — so a
         # batched login-required view is reported as a redirect, not a bypass.
-        self._mounting_in_batch = True
+        self._begin_mount_collect()
         # Mount-batch is never combined with sticky preservation (sticky
         # only runs through live_redirect_mount which doesn't batch) or
         # state_snapshot (snapshot is for popstate restoration, also
         # live_redirect_mount path). Always pass None for both.
         try:
-            await self.handle_mount(
-                data_view,
-                sticky_preserved=None,
-                state_snapshot=None,
-            )
+            if runtime is None:
+                await self.handle_mount(
+                    data_view,
+                    sticky_preserved=None,
+                    state_snapshot=None,
+                )
+            else:
+                # Concurrent batch entry: a private runtime, so sibling mounts
+                # never share ``runtime.view_instance``. handle_mount_batch reads
+                # the last entry's view back onto the consumer afterwards.
+                await runtime.dispatch_mount(data_view)
+            # dispatch_mount queues mount-time push_event sends fire-and-forget;
+            # yield once so they land in this collector rather than reaching the
+            # socket ahead of the mount_batch frame once the collector closes.
+            await asyncio.sleep(0)
         except Exception as exc:  # noqa: BLE001 — isolate per-view failures
-            self.send_json = orig_send_json  # type: ignore[assignment]
-            self._mounting_in_batch = False
             logger.exception(
                 "mount_batch: _mount_one raised for view %s",
                 sanitize_for_log(view_path),
@@ -2316,10 +2475,10 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                 safe_err = str(exc)[:200]
             return False, {"target_id": target_id, "view": view_path}, safe_err, None, []
         finally:
-            # Only restore if the try-block didn't already restore (else
-            # we'd double-restore harmlessly). Idempotent.
-            self.send_json = orig_send_json  # type: ignore[assignment]
-            self._mounting_in_batch = False
+            collector.open = False
+            _mount_collector.reset(token)
+            self._end_mount_collect()
+        captured = collector.frames
 
         # Extract the successful mount frame; any "error" frame means failure.
         # Fix #4: capture "navigate" frames too — those are emitted when
@@ -2395,6 +2554,13 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
 
         Atomicity is relaxed: one view's failure does NOT abort the
         batch — survivors ship, failures are isolated in ``failed[]``.
+
+        Up to ``mount_batch_concurrency`` entries mount at once (see
+        :meth:`_mount_batch_concurrently`); the reply lists them in request
+        order regardless. View-level auth verdicts and resolved templates are
+        shared across the batch (``mount_batch_auth_cache`` /
+        ``mount_batch_template_cache``), so N instances of one child class
+        pay for them once.
         """
         views_list = data.get("views", [])
         if not isinstance(views_list, list):
@@ -2403,25 +2569,41 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
 
         client_timezone = data.get("client_timezone")
 
-        successes: list = []
-        failures: list = []
-        navigates: list = []
-        all_push_events: list = []
-        for view_data in views_list:
+        results: List[Any] = [None] * len(views_list)
+        entries: List[Any] = []
+        for index, view_data in enumerate(views_list):
             if not isinstance(view_data, dict):
-                failures.append(
-                    {
-                        "target_id": "",
-                        "view": "",
-                        "error": "mount_batch entry is not a dict",
-                    }
+                results[index] = (
+                    False,
+                    {"target_id": "", "view": ""},
+                    "mount_batch entry is not a dict",
+                    None,
+                    [],
                 )
                 continue
             # Propagate shared client_timezone if not per-view.
             if client_timezone and "client_timezone" not in view_data:
                 view_data = dict(view_data)
                 view_data["client_timezone"] = client_timezone
-            ok, payload, err, nav, push_events = await self._mount_one(view_data)
+            entries.append((index, view_data))
+
+        from .auth.core import mount_batch_auth_cache
+        from .mixins.template import mount_batch_template_cache
+
+        concurrency = int(djust_config.get("mount_batch_concurrency", 4) or 1)
+        with mount_batch_auth_cache(), mount_batch_template_cache():
+            if concurrency <= 1 or len(entries) < 2:
+                for index, view_data in entries:
+                    results[index] = await self._mount_one(view_data)
+            else:
+                await self._mount_batch_concurrently(entries, results, concurrency)
+
+        # Aggregate in request order, whatever order the entries finished in.
+        successes: list = []
+        failures: list = []
+        navigates: list = []
+        all_push_events: list = []
+        for ok, payload, err, nav, push_events in results:
             if push_events:
                 all_push_events.extend(push_events)
             if ok:
@@ -2452,6 +2634,33 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         for frame in all_push_events:
             await self.send_json(frame)
 
+    async def _mount_batch_concurrently(
+        self, entries: List[Any], results: List[Any], concurrency: int
+    ) -> None:
+        """Mount ``(index, view_data)`` entries, at most ``concurrency`` at once.
+
+        Each entry gets its own :class:`ViewRuntime` (and, via ``_mount_one``,
+        its own frame collector), so independent children overlap their
+        channel-layer, session and database waits instead of queueing behind
+        one another. The LAST entry mounts alone after the others, so the
+        consumer's post-mount wiring (view group, tick task, ...) and
+        ``view_instance`` end on it exactly as with sequential mounting.
+        """
+        runtimes = {index: self._new_runtime() for index, _ in entries}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def mount(index: int, view_data: Dict[str, Any]) -> None:
+            async with semaphore:
+                results[index] = await self._mount_one(view_data, runtime=runtimes[index])
+
+        *head, (last_index, last_data) = entries
+        await asyncio.gather(*(mount(index, view_data) for index, view_data in head))
+        await mount(last_index, last_data)
+
+        runtime = self._get_runtime()
+        runtime.view_instance = runtimes[last_index].view_instance
+        self.view_instance = runtime.view_instance
+
     async def handle_event(self, data: Dict[str, Any]) -> None:
         """Handle a client event by routing through :class:`ViewRuntime`.
 
@@ -2713,8 +2922,17 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
             logger.debug("Dropping outbound frame: WebSocket closed during send (%s)", exc)
 
     async def send_json(self, data: Dict[str, Any]) -> None:
-        """Send JSON message to client with Django type support"""
-        await self._send_frame(text_data=json.dumps(data, cls=DjangoJSONEncoder))
+        """Send JSON message to client with Django type support.
+
+        Top-level :class:`~djust.serialization.RawJSON` values (pre-encoded
+        patch lists under ``patch_passthrough``) are spliced in verbatim.
+        """
+        with render_phase("encode"):
+            text_data = encode_frame(data)
+        add_bytes_sent(len(text_data))
+        metrics.frame_bytes.observe(len(text_data), "ws", metrics.frame_type_label(data))
+        with render_phase("send"):
+            await self._send_frame(text_data=text_data)
 
     @staticmethod
     def _clear_template_caches() -> int:
@@ -2724,6 +2942,7 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         This ensures hot reload picks up template changes by clearing:
         - Template loader caches (cached_property on loaders)
         - Engine-level template caches
+        - djust's compiled inheritance / {% url %} plans
 
         Supports Django's built-in template backends:
         - django.template.backends.django.DjangoTemplates
@@ -2750,6 +2969,11 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                         "Could not clear template cache for %s: %s", engine.name, e
                     )
 
+        # DjustTemplateBackend's compiled {% extends %} / {% url %} plans
+        from djust.template.rendering import clear_template_cache
+
+        clear_template_cache()
+
         hotreload_logger.debug("Cleared %d template caches", caches_cleared)
         return caches_cleared
 
@@ -2963,27 +3187,35 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         verbs through the runtime.
         """
         if getattr(self, "_runtime", None) is None:
-            from .renderers import get_renderer_factory
-            from .runtime import WSConsumerTransport, ViewRuntime
-
-            # ADR-019 LVN-I PR-3: handshake selects renderer factory by
-            # ``?platform=html|swiftui|compose``. Unknown / missing values
-            # return None → runtime defaults to HtmlRenderer at dispatch.
-            # ``scope["query_string"]`` is bytes per ASGI spec.
-            from urllib.parse import parse_qs
-
-            qs = parse_qs(self.scope.get("query_string", b"").decode("utf-8", errors="ignore"))
-            platform = (qs.get("platform") or [None])[0]
-            renderer_factory = get_renderer_factory(platform)
-
-            self._runtime = ViewRuntime(
-                WSConsumerTransport(self),
-                scope=self.scope,
-                rate_limiter=self._rate_limiter,
-                renderer_factory=renderer_factory,
-            )
+            self._runtime = self._new_runtime()
         return self._runtime
 
+    def _new_runtime(self) -> Any:
+        """Construct a :class:`ViewRuntime` bound to this consumer.
+
+        ``_get_runtime`` memoizes one; ``mount_batch`` builds a private one per
+        concurrently mounting entry.
+        """
+        from .renderers import get_renderer_factory
+        from .runtime import WSConsumerTransport, ViewRuntime
+
+        # ADR-019 LVN-I PR-3: handshake selects renderer factory by
+        # ``?platform=html|swiftui|compose``. Unknown / missing values
+        # return None → runtime defaults to HtmlRenderer at dispatch.
+        # ``scope["query_string"]`` is bytes per ASGI spec.
+        from urllib.parse import parse_qs
+
+        qs = parse_qs(self.scope.get("query_string", b"").decode("utf-8", errors="ignore"))
+        platform = (qs.get("platform") or [None])[0]
+        renderer_factory = get_renderer_factory(platform)
+
+        return ViewRuntime(
+            WSConsumerTransport(self),
+            scope=self.scope,
+            rate_limiter=self._rate_limiter,
+            renderer_factory=renderer_factory,
+        )
+
     #: Inbound frame verbs that ``receive()`` routes through the single
     #: :meth:`ViewRuntime.dispatch_message` chokepoint (#1852) rather than a
     #: bespoke consumer handler. Keeping this as an explicit set lets a
@@ -3148,6 +3380,9 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                 pass  # Expected when cancelling a running tick task
             self._tick_task = None
 
+        # Pending pushes / notifies were addressed to the old view
+        await self._cancel_push_drain()
+
         # Clean up old view
         if old_view:
             # Before cleanup_uploads, drop sticky children from the old
@@ -3907,10 +4142,14 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         Called when external code (Celery tasks, management commands, etc.)
         sends an update via push_to_view().
 
-        Event sequencing: acquires _render_lock to serialize with tick and
-        event handlers. Yields to user events — if a user event is being
-        processed, the broadcast is skipped to avoid version interleaving.
-        Tags updates with source="broadcast" so the client can buffer them.
+        Event sequencing: the push is merged into this consumer's coalescing
+        mailbox (:class:`djust.push.PushMailbox`) and applied under
+        _render_lock by :meth:`_drain_push_mailbox`, serialized with tick and
+        event handlers. While a user event holds the lock, later pushes merge
+        into the pending batch instead of being dropped (#813) — state
+        last-write-wins per key, handler calls queued — and the whole batch
+        renders once when the lock frees. Tags updates with
+        source="broadcast" so the client can buffer them.
 
         Args:
             event: Channel layer event with optional 'state', 'handler', 'payload'
@@ -3935,103 +4174,257 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
                 )
                 return
 
-            # Yield to user events: if a user event is being processed,
-            # skip this broadcast to avoid version interleaving (#560).
-            if self._processing_user_event:
-                logger.debug(
-                    "[djust] server_push on %s skipped — user event in progress",
-                    self.view_instance.__class__.__name__,
-                )
-                return
+            self._get_push_mailbox().add_push(event)
+            await self._schedule_push_drain()
+        except Exception as e:
+            logger.exception("Error in server_push: %s", e)
 
-            # Acquire render lock with timeout to serialize with tick/event
-            # renders. Use same 0.1s timeout as tick loop.
-            try:
-                await asyncio.wait_for(self._render_lock.acquire(), timeout=0.1)
-            except asyncio.TimeoutError:
-                logger.debug(
-                    "[djust] server_push on %s skipped — render lock held",
-                    self.view_instance.__class__.__name__,
-                )
-                return
+    def _get_push_mailbox(self) -> Any:
+        if self._push_mailbox is None:
+            from .push import PushMailbox
 
-            try:
-                # Apply state updates before handler call so the handler can read
-                # the new values. _sync_state_to_rust runs after both to push the
-                # final Python state to Rust for rendering.
-                state = event.get("state")
-                if state and isinstance(state, dict):
-                    # Apply via safe_setattr — the same guard every other
-                    # state-restore sink uses (snapshot restore at ~:2311,
-                    # time_travel.py:276, mixins/request.py). A channel-layer
-                    # attacker (the framework's own stated threat model, see the
-                    # restricted handler path just below) must NOT be able to
-                    # overwrite dunders (__class__/__init__), framework internals
-                    # (_framework_attrs/_components/_rust_view), or private `_`
-                    # state via mass assignment (#F21, CWE-915/CWE-913).
-                    from .security import safe_setattr
-
-                    for key, value in state.items():
-                        safe_setattr(self.view_instance, key, value, allow_private=False)
+            self._push_mailbox = PushMailbox(
+                max_calls=djust_config.get("push_mailbox_max_calls", 256)
+            )
+        return self._push_mailbox
 
+    async def _schedule_push_drain(self) -> None:
+        """Make sure the mailbox gets drained, without blocking the channel loop.
+
+        An uncontended push drains inline (same latency as before the
+        mailbox). When the render lock is busy, the drain moves to a
+        background task so the consumer keeps receiving — and merging —
+        messages meanwhile. A drain already pending picks the new message up.
+        """
+        if self._push_draining:
+            return
+        if self._render_lock.locked() or self._processing_user_event:
+            self._push_draining = True
+            task = asyncio.ensure_future(self._drain_push_mailbox())
+            task.add_done_callback(self._on_push_drain_done)
+            self._push_drain_task = task
+            return
+        self._push_draining = True
+        await self._drain_push_mailbox()
+
+    def _on_push_drain_done(self, task: "asyncio.Future[None]") -> None:
+        """Log a background drain that raised, and clear it so the next push
+        schedules a fresh one instead of merging into a dead batch."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "[djust] push mailbox drain on %s failed",
+                self.view_instance.__class__.__name__ if self.view_instance else "?",
+                exc_info=task.exception(),
+            )
+        if self._push_drain_task is task:
+            self._push_drain_task = None
+            self._push_draining = False
+
+    async def _drain_push_mailbox(self) -> None:
+        """Apply every pending push / notify in one render per lock acquisition.
+
+        A batch that cannot get the lock within ``push_max_latency_ms`` of its
+        oldest message is dropped (counted in ``djust.push.mailbox_stats``)
+        rather than delivered arbitrarily late.
+        """
+        mailbox = self._get_push_mailbox()
+        try:
+            while len(mailbox) and self.view_instance:
+                max_latency = djust_config.get("push_max_latency_ms", 2000) / 1000.0
+                since = mailbox.pending_since or time.monotonic()
+                remaining = max_latency - (time.monotonic() - since)
+                try:
+                    await asyncio.wait_for(self._render_lock.acquire(), timeout=max(remaining, 0.0))
+                except asyncio.TimeoutError:
+                    metrics.render_lock_timeouts.inc("push")
+                    dropped = mailbox.drop()
+                    logger.debug(
+                        "[djust] push mailbox on %s dropped %d message(s) — render "
+                        "lock busy past push_max_latency_ms",
+                        self.view_instance.__class__.__name__,
+                        dropped,
+                    )
+                    return
+                try:
+                    # Yield to user events (#560): a user event owns the
+                    # version sequence while it runs.
+                    if self._processing_user_event:
+                        continue
+                    await self._apply_push_batch(mailbox.take())
+                finally:
+                    self._render_lock.release()
+                    if self._processing_user_event:
+                        await asyncio.sleep(0.01)
+        finally:
+            self._push_draining = False
+            self._push_drain_task = None
+
+    async def _cancel_push_drain(self) -> None:
+        """Cancel a background mailbox drain and discard what it had pending."""
+        task = self._push_drain_task
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass  # Expected when cancelling a waiting drain
+        if self._push_mailbox is not None:
+            self._push_mailbox.drop()
+        self._push_draining = False
+        self._push_drain_task = None
+
+    async def _apply_push_batch(self, batch: Any) -> None:
+        """Apply one coalesced batch and render it once. Caller holds _render_lock."""
+        view = self.view_instance
+        needs_render = batch.plain > 0
+
+        # Apply state updates before handler calls so the handlers can read
+        # the new values. _sync_state_to_rust runs after both to push the
+        # final Python state to Rust for rendering.
+        if batch.state:
+            # Apply via safe_setattr — the same guard every other
+            # state-restore sink uses (snapshot restore at ~:2311,
+            # time_travel.py:276, mixins/request.py). A channel-layer
+            # attacker (the framework's own stated threat model, see the
+            # restricted handler path just below) must NOT be able to
+            # overwrite dunders (__class__/__init__), framework internals
+            # (_framework_attrs/_components/_rust_view), or private `_`
+            # state via mass assignment (#F21, CWE-915/CWE-913).
+            from .security import safe_setattr
+
+            for key, value in batch.state.items():
+                safe_setattr(view, key, value, allow_private=False)
+
+        notified = False
+        for kind, call in batch.calls:
+            if kind == "notify":
+                notified = True
+                handler = getattr(view, "handle_info", None)
+                if handler and callable(handler):
+                    try:
+                        await sync_to_async(handler)(call)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.exception(
+                            "db_notify: handle_info raised on %s: %s",
+                            view.__class__.__name__,
+                            exc,
+                        )
+                        continue
+            else:
                 # Call handler if specified — restricted to handle_* prefixed or
                 # @event_handler-decorated methods to prevent arbitrary method calls
                 # if an attacker gains access to the channel layer backend.
-                handler_name = event.get("handler")
-                if handler_name:
-                    handler_fn = getattr(self.view_instance, handler_name, None)
-                    if handler_fn and callable(handler_fn):
-                        from .decorators import is_event_handler
-
-                        if not (handler_name.startswith("handle_") or is_event_handler(handler_fn)):
-                            logger.warning(
-                                "server_push: blocked handler %r"
-                                " — must be handle_* or @event_handler",
-                                handler_name,
-                            )
-                        else:
-                            payload = event.get("payload") or {}
-                            await sync_to_async(handler_fn)(**payload)
-
-                # Views can set _skip_render = True in a handler to
-                # suppress the re-render cycle (e.g. sender ignoring its own broadcast).
-                if getattr(self.view_instance, "_skip_render", False):
-                    self.view_instance._skip_render = False
-                    await self._flush_all_pending()
-                    await self._send_noop()
-                    return
+                handler_name, payload = call
+                handler_fn = getattr(view, handler_name, None)
+                if handler_fn and callable(handler_fn):
+                    from .decorators import is_event_handler
+
+                    if not (handler_name.startswith("handle_") or is_event_handler(handler_fn)):
+                        logger.warning(
+                            "server_push: blocked handler %r — must be handle_* or @event_handler",
+                            handler_name,
+                        )
+                    else:
+                        await sync_to_async(handler_fn)(**(payload or {}))
 
-                # Sync state and re-render
-                # TODO: add patch compression (PATCH_COUNT_THRESHOLD) matching handle_event
-                if hasattr(self.view_instance, "_sync_state_to_rust"):
-                    await sync_to_async(self.view_instance._sync_state_to_rust)()
+            # Views can set _skip_render = True in a handler to suppress the
+            # re-render cycle (e.g. sender ignoring its own broadcast). The
+            # batch still renders if any other message in it needs one.
+            if getattr(view, "_skip_render", False):
+                view._skip_render = False
+            else:
+                needs_render = True
 
-                html, patches, version = await sync_to_async(self.view_instance.render_with_diff)()
+        if not needs_render:
+            await self._flush_all_pending()
+            await self._send_noop()
+            return
 
-                if patches is not None:
-                    if isinstance(patches, str):
-                        patches = fast_json_loads(patches)
-                    # Store rendered HTML for on-demand recovery, mirroring
-                    # handle_event. Without this, request_html after a failed
-                    # broadcast-triggered patch finds _recovery_html=None and
-                    # forces a page reload. See #1202.
-                    # Consumer-owned wire version + recovery arm in one step
-                    # (#1788, #1817): _recovery_version == this frame's version.
-                    wire_version = self._next_version_armed(html)
-                    await self._send_update(
-                        patches=patches,
-                        version=wire_version,
-                        broadcast=True,
-                        source="broadcast",
-                    )
-                else:
-                    # Even if no patches, flush any push_events and flash messages
-                    await self._flush_all_pending()
+        # Render-once fan-out (``shared_broadcast`` views): reuse
+        # another consumer's render of this same batch when possible.
+        if getattr(view, "shared_broadcast", False):
+            await self._render_shared_broadcast(batch.as_event())
+        else:
+            await self._render_broadcast()
+
+        # v0.7.0 — If handle_info flipped an activity to visible,
+        # drain its queue in the same round-trip. The flush is
+        # async and awaited inline. Safe no-op when no deferred
+        # events exist.
+        if notified and hasattr(view, "_flush_deferred_activity_events"):
+            try:
+                await view._flush_deferred_activity_events(self)
+            except Exception:  # noqa: BLE001
+                logger.exception("dj_activity: deferred-event flush raised (db_notify path)")
+
+    async def _render_broadcast(self) -> tuple[str, Optional[str]]:
+        """Sync state, render and send one ``server_push`` frame.
+
+        Returns the raw ``(html, patches)`` pair from ``render_with_diff()``
+        so the shared-broadcast leader can publish it.
+        """
+        if hasattr(self.view_instance, "_sync_state_to_rust"):
+            await sync_to_async(self.view_instance._sync_state_to_rust)()
+
+        html, patches, version = await sync_to_async(self.view_instance.render_with_diff)()
+
+        # Store rendered HTML for on-demand recovery, mirroring handle_event.
+        # Without this, request_html after a failed broadcast-triggered patch
+        # finds _recovery_html=None and forces a page reload. See #1202.
+        # _send_render_result stamps the consumer-owned wire version and arms
+        # recovery in one step (#1788, #1817).
+        await self._send_render_result(html, patches, source="broadcast", broadcast=True)
+        return html, patches
+
+    async def _render_shared_broadcast(self, event: Dict[str, Any]) -> None:
+        """Render a ``server_push`` once per process for ``shared_broadcast`` views.
+
+        The first consumer with a valid Rust baseline for the current base
+        token renders and publishes; the others forward the published patch
+        JSON without rendering and mark their baseline stale (see
+        :class:`djust.push.SharedBroadcastRenders`). When no leader can show
+        up — or none does within ``shared_broadcast_wait_ms`` — the consumer
+        renders for itself.
+        """
+        from .push import SharedRender, shared_renders
+
+        view = self.view_instance
+        token = getattr(view, "_shared_render_token", None)
+        if token is None:
+            await self._render_broadcast()
+            return
+
+        entry = shared_renders.entry(view, event, token)
+        if not getattr(view, "_shared_baseline_stale", False) and not entry.rendering:
+            entry.rendering = True
+            render: Optional[SharedRender] = None
+            try:
+                html, patches = await self._render_broadcast()
+                render = SharedRender(html=html, patches=patches, token=view._shared_render_token)
+                shared_renders.stats["renders"] += 1
             finally:
-                self._render_lock.release()
+                shared_renders.publish(entry, render)
+            return
 
-        except Exception as e:
-            logger.exception("Error in server_push: %s", e)
+        render = None
+        if entry.rendering or shared_renders.has_holder(view, token):
+            wait_s = djust_config.get("shared_broadcast_wait_ms", 250) / 1000.0
+            try:
+                render = await asyncio.wait_for(asyncio.shield(entry.future), timeout=wait_s)
+            except asyncio.TimeoutError:
+                render = None
+        if render is None or render.patches is None:
+            # No leader, or the leader had no diff baseline either — a
+            # full-HTML frame can't be forwarded as-is, so render locally.
+            shared_renders.stats["fallbacks"] += 1
+            await self._render_broadcast()
+            return
+
+        shared_renders.adopt(view, render)
+        shared_renders.stats["reused"] += 1
+        await self._send_render_result(
+            render.html, render.patches, source="broadcast", broadcast=True
+        )
 
     async def client_push_event(self, event: Dict[str, Any]) -> None:
         """
@@ -4055,24 +4448,22 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         subscribed via ``self.listen(<channel>)`` receives this event.
 
         Flow:
-          1. Dispatch a ``handle_info({"type": "db_notify", ...})`` call on
-             the view (runs under the render lock to serialize with
-             ticks and user events).
-          2. Re-sync state to Rust and emit VDOM patches via the same
-             ``source="broadcast"`` path as ``server_push``.
-
-        **Best-effort under contention (#813).** The render lock is acquired
-        with a 100ms timeout; if a user event or earlier notification is
-        still holding the lock, this db_notify is **silently dropped**
-        (debug-logged). The dropped notification does NOT queue — under
-        bursty notification streams, some re-renders will be skipped. If
-        strict "every notify causes a render" semantics are required,
-        de-dupe by primary key in your ``handle_info`` and use
-        ``self.server_push`` / ``self.live_patch`` from a handler that
-        owns the lock. The tradeoff here is deliberate: NOTIFY messages
-        carry no delivery guarantee anyway (Postgres drops them on
-        connection failure), and silently dropping contended renders is
-        preferable to deadlock or unbounded queue growth.
+          1. Queue a ``handle_info({"type": "db_notify", ...})`` call in the
+             consumer's coalescing mailbox (shared with ``server_push``).
+          2. The mailbox drain runs every queued ``handle_info`` under the
+             render lock, re-syncs state to Rust once and emits VDOM patches
+             via the same ``source="broadcast"`` path as ``server_push``.
+
+        **Coalesced under contention (#813).** Notifications that arrive
+        while a user event or an earlier render holds the lock are no longer
+        dropped: they queue behind it and the whole burst renders once when
+        the lock frees. A batch still waiting after ``push_max_latency_ms`` is
+        dropped (and counted in ``djust.push.mailbox_stats``), as is the
+        oldest queued call once ``push_mailbox_max_calls`` is exceeded —
+        NOTIFY messages carry no delivery guarantee anyway (Postgres drops
+        them on connection failure), so bounded loss beats unbounded queue
+        growth. De-dupe by primary key in ``handle_info`` if a burst can
+        carry repeats.
         """
         if not self.view_instance:
             return
@@ -4082,76 +4473,8 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         message = {"type": "db_notify", "channel": channel, "payload": payload}
 
         try:
-            # Yield to user events: version interleaving is the same risk
-            # as server_push (#560).
-            if self._processing_user_event:
-                logger.debug(
-                    "[djust] db_notify on %s skipped — user event in progress",
-                    self.view_instance.__class__.__name__,
-                )
-                return
-
-            try:
-                await asyncio.wait_for(self._render_lock.acquire(), timeout=0.1)
-            except asyncio.TimeoutError:
-                logger.debug(
-                    "[djust] db_notify on %s skipped — render lock held",
-                    self.view_instance.__class__.__name__,
-                )
-                return
-
-            try:
-                handler = getattr(self.view_instance, "handle_info", None)
-                if handler and callable(handler):
-                    try:
-                        await sync_to_async(handler)(message)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.exception(
-                            "db_notify: handle_info raised on %s: %s",
-                            self.view_instance.__class__.__name__,
-                            exc,
-                        )
-                        return
-
-                if getattr(self.view_instance, "_skip_render", False):
-                    self.view_instance._skip_render = False
-                    await self._flush_all_pending()
-                    await self._send_noop()
-                    return
-
-                if hasattr(self.view_instance, "_sync_state_to_rust"):
-                    await sync_to_async(self.view_instance._sync_state_to_rust)()
-
-                html, patches, version = await sync_to_async(self.view_instance.render_with_diff)()
-
-                if patches is not None:
-                    if isinstance(patches, str):
-                        patches = fast_json_loads(patches)
-                    # Render-send: arm recovery so _recovery_version tracks this
-                    # db_notify broadcast's version (#1817), mirroring server_push.
-                    # ``html`` is the pre-strip render from render_with_diff() above.
-                    await self._send_update(
-                        patches=patches,
-                        version=self._next_version_armed(html),
-                        broadcast=True,
-                        source="broadcast",
-                    )
-                else:
-                    await self._flush_all_pending()
-
-                # v0.7.0 — If handle_info flipped an activity to visible,
-                # drain its queue in the same round-trip. The flush is
-                # async and awaited inline. Safe no-op when no deferred
-                # events exist.
-                if hasattr(self.view_instance, "_flush_deferred_activity_events"):
-                    try:
-                        await self.view_instance._flush_deferred_activity_events(self)
-                    except Exception:  # noqa: BLE001
-                        logger.exception(
-                            "dj_activity: deferred-event flush raised (db_notify path)"
-                        )
-            finally:
-                self._render_lock.release()
+            self._get_push_mailbox().add_notify(message)
+            await self._schedule_push_drain()
         except Exception as e:  # noqa: BLE001
             logger.exception("Error in db_notify: %s", e)
 
@@ -4182,7 +4505,7 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
 
     async def _tick_once(self) -> bool:
         """One tick iteration: run ``handle_tick``, render, send. Returns
-        whether a patch frame was actually sent.
+        whether a frame was actually sent.
 
         Event sequencing (#560):
         - Skips render when handle_tick() doesn't change any public assigns
@@ -4217,6 +4540,7 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
         try:
             await asyncio.wait_for(self._render_lock.acquire(), timeout=0.1)
         except asyncio.TimeoutError:
+            metrics.render_lock_timeouts.inc("tick")
             logger.debug(
                 "[djust] Tick on %s skipped — render lock held",
                 self.view_instance.__class__.__name__,
@@ -4224,54 +4548,58 @@ class LiveViewConsumer(AsyncWebsocketConsumer):
             return False
 
         try:
-            # Snapshot state before tick to detect changes
-            pre_assigns = _snapshot_assigns(self.view_instance)
-
-            await sync_to_async(self.view_instance.handle_tick)()
-
-            # Skip render if tick handler didn't change any state.
-            # Honor _force_full_html (set by set_changed_keys(), #1981)
-            # like the event paths do (runtime.py / handle_event) — an
-            # in-place mutation inside handle_tick is invisible to the
-            # snapshot, so without this guard the hatch would be
-            # silently dropped on the tick path (#1646 parallel-path).
-            post_assigns = _snapshot_assigns(self.view_instance)
-            if pre_assigns == post_assigns and not getattr(
-                self.view_instance, "_force_full_html", False
-            ):
-                logger.debug(
-                    "[djust] Tick on %s produced no state changes, skipping render",
-                    self.view_instance.__class__.__name__,
-                )
+            result = await sync_to_async(self._tick_render)(self.view_instance)
+            if result is None:
                 return False
+            html, patches, _version = result
 
-            if hasattr(self.view_instance, "_sync_state_to_rust"):
-                await sync_to_async(self.view_instance._sync_state_to_rust)()
+            # Render-send: arm recovery so _recovery_version tracks this
+            # tick's version (#1817). ``html`` is the pre-strip render from
+            # render_with_diff() above.
+            return await self._send_render_result(html, patches, source="tick", event_name="tick")
+        finally:
+            self._render_lock.release()
 
-            html, patches, version = await sync_to_async(self.view_instance.render_with_diff)()
+    def _tick_render(self, view: Any) -> Optional[tuple]:
+        """Run ``handle_tick`` on ``view`` and render it; sync, executor-side.
 
-            # Consume the force flag (one render per
-            # set_changed_keys()/_force_full_html, #1981) — mirrors
-            # the runtime's reset in _render_and_send.
-            if getattr(self.view_instance, "_force_full_html", False):
-                self.view_instance._force_full_html = False
+        ``handle_tick``, the Rust state sync and ``render_with_diff`` run in
+        this one call, so a tick costs a single thread-pool hop and the shared
+        scheduler (:mod:`djust.tick`) can batch many views' ticks into one
+        submission. Returns ``render_with_diff()``'s ``(html, patches,
+        version)``, or ``None`` when the tick changed no public assigns. The
+        caller holds ``_render_lock``.
+        """
+        # Snapshot state before tick to detect changes
+        pre_assigns = _snapshot_assigns(view)
+
+        view.handle_tick()
+
+        # Skip render if tick handler didn't change any state.
+        # Honor _force_full_html (set by set_changed_keys(), #1981)
+        # like the event paths do (runtime.py / handle_event) — an
+        # in-place mutation inside handle_tick is invisible to the
+        # snapshot, so without this guard the hatch would be
+        # silently dropped on the tick path (#1646 parallel-path).
+        post_assigns = _snapshot_assigns(view)
+        if pre_assigns == post_assigns and not getattr(view, "_force_full_html", False):
+            logger.debug(
+                "[djust] Tick on %s produced no state changes, skipping render",
+                view.__class__.__name__,
+            )
+            return None
 
-            if patches is not None:
-                if isinstance(patches, str):
-                    patches = fast_json_loads(patches)
-                # Render-send: arm recovery so _recovery_version
-                # tracks this tick's version (#1817). ``html`` is the
-                # pre-strip render from render_with_diff() above.
-                await self._send_update(
-                    patches=patches,
-                    version=self._next_version_armed(html),
-                    event_name="tick",
-                    source="tick",
-                )
-                return True
-            return False
-        finally:
-            self._render_lock.release()
+        if hasattr(view, "_sync_state_to_rust"):
+            view._sync_state_to_rust()
+
+        result = view.render_with_diff()
+
+        # Consume the force flag (one render per
+        # set_changed_keys()/_force_full_html, #1981) — mirrors
+        # the runtime's reset in _render_and_send.
+        if getattr(view, "_force_full_html", False):
+            view._force_full_html = False
+        return result  # type: ignore[no-any-return]
 
     @classmethod
     async def broadcast_reload(cls, file_path: str) -> None:
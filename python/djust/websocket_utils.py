@@ -18,9 +18,9 @@ from .config import config as djust_config
 from .decorators import is_event_handler
 from .rate_limit import (
     ConnectionRateLimiter,
+    ahandler_rate_check,
     caller_key,
     get_rate_limit_settings,
-    handler_rate_check,
     ip_tracker,
 )
 from .security import is_safe_event_name, sanitize_for_log
@@ -213,7 +213,7 @@ async def _validate_event_security(
         client_ip = getattr(ws, "_client_ip", None)
         owner_request = getattr(owner_instance, "request", None)
         key = caller_key(owner_request, client_ip)
-        if not handler_rate_check(key, event_name, rl_settings):
+        if not await ahandler_rate_check(key, event_name, rl_settings):
             rate_limiter.warnings += 1
             logger.warning(
                 "Per-handler rate limit exceeded for '%s' (warning %d/%d)",
@@ -225,7 +225,7 @@ async def _validate_event_security(
                 if client_ip:
                     _rl = djust_config.get("rate_limit", {})
                     cooldown = _rl.get("reconnect_cooldown", 5) if isinstance(_rl, dict) else 5
-                    ip_tracker.add_cooldown(client_ip, cooldown)
+                    await ip_tracker.aadd_cooldown(client_ip, cooldown)
                 await ws.close(code=4429)
                 return None
             await ws.send_error("Rate limit exceeded, event dropped")
@@ -0,0 +1,182 @@
+"""
+Database-side ``DataTableMixin`` server mode.
+
+``refresh_table_server()`` pushes search, filters, pagination, facet counts
+and column stats into SQL, caches counts / facets / stats per filter
+signature, and fetches deep pages by keyset instead of OFFSET.
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from djust.components.mixins.data_table import DataTableMixin
+
+
+class UserTable(DataTableMixin):
+    table_model = User
+    table_server_mode = True
+    table_page_size = 3
+    table_facets = True
+    table_show_stats = True
+    table_searchable_fields = ["username", "email"]
+    table_columns = [
+        {"key": "username", "label": "User", "sortable": True},
+        {"key": "first_name", "label": "Team", "filterable": True},
+        {"key": "id", "label": "ID", "stats": True},
+    ]
+
+
+@pytest.fixture
+def users(db):
+    # Some transactional tests elsewhere leave users behind; counts here
+    # are exact, so start from an empty table (rolled back with the test).
+    User.objects.all().delete()
+    User.objects.bulk_create(
+        [User(username=f"user{i:02d}", first_name="red" if i % 3 else "blue") for i in range(10)]
+    )
+    return list(User.objects.order_by("id").values_list("id", flat=True))
+
+
+@pytest.fixture
+def table(users):
+    view = UserTable()
+    view.init_table_state()
+    return view
+
+
+def _usernames(view):
+    return [row["username"] for row in view.table_rows]
+
+
+class TestServerPipeline:
+    def test_facets_and_stats_cover_whole_filtered_queryset(self, table, users):
+        table.refresh_table()
+
+        assert table.table_total_pages == 4
+        assert len(table.table_rows) == 3
+        assert table.table_facet_counts == {"first_name": {"red": 6, "blue": 4}}
+        stats = table.table_column_stats["id"]
+        assert (stats["min"], stats["max"], stats["count"]) == (users[0], users[-1], 10)
+
+    def test_counts_facets_and_stats_are_cached_per_filter_signature(
+        self, table, django_assert_num_queries
+    ):
+        table.refresh_table()
+
+        with django_assert_num_queries(1):
+            table.on_table_page(2)
+
+        with django_assert_num_queries(4):  # count + facets + stats + page
+            table.on_table_filter("blue", column="first_name")
+        assert table.table_facet_counts == {"first_name": {"blue": 4}}
+
+    def test_null_facet_values_count_under_none_like_the_python_path(self, table):
+        table.table_columns = table.table_columns + [
+            {"key": "last_login", "label": "Last login", "filterable": True}
+        ]
+
+        counts = table.get_queryset_facet_counts(User.objects.all())
+
+        assert counts["last_login"] == {"None": 10}
+        table.table_rows = list(User.objects.values("first_name", "last_login"))
+        assert table.get_facet_counts()["last_login"] == {"None": 10}
+
+    def test_search_falls_back_to_icontains_off_postgres(self, table):
+        table.table_search_mode = "fulltext"
+        table.on_table_search("user0")
+
+        assert len(table.table_rows) == 3
+        assert table.table_total_pages == 4
+
+    def test_invalidate_table_cache(self, table):
+        table.refresh_table()
+        User.objects.create(username="zz")
+
+        table.refresh_table()
+        assert table.table_column_stats["id"]["count"] == 10
+
+        table.invalidate_table_cache()
+        table.refresh_table()
+        assert table.table_column_stats["id"]["count"] == 11
+
+
+class TestKeysetPagination:
+    @pytest.mark.parametrize("sort, desc", [("username", True), ("first_name", False), ("", False)])
+    def test_pages_partition_rows_in_sort_order(self, table, sort, desc):
+        table.table_sort_by = sort
+        table.table_sort_desc = desc
+        pages = {}
+        for page in (1, 2, 3, 4, 2, 4):
+            table.on_table_page(page)
+            pages.setdefault(page, table.table_rows)
+            assert table.table_rows == pages[page]
+
+        rows = [row for page in sorted(pages) for row in pages[page]]
+        assert sorted(row["id"] for row in rows) == sorted(
+            User.objects.values_list("id", flat=True)
+        )
+        key = sort or "id"
+        assert [row[key] for row in rows] == sorted((row[key] for row in rows), reverse=desc)
+
+    def test_jump_seeks_from_nearest_visited_page(self, table):
+        offset = UserTable()
+        offset.table_keyset_pagination = False
+        offset.init_table_state()
+        for view in (table, offset):
+            view.table_sort_by = "username"
+            view.refresh_table()
+            view.on_table_page(4)
+            view.on_table_page(3)
+
+        assert _usernames(table) == _usernames(offset) == ["user06", "user07", "user08"]
+
+    def test_next_page_seeks_past_previous_page(self, table):
+        table.table_sort_by = "username"
+        table.refresh_table()
+
+        with CaptureQueriesContext(connection) as ctx:
+            table.on_table_next()
+
+        page_sql = ctx.captured_queries[-1]["sql"]
+        assert "OFFSET" not in page_sql.upper()
+        assert _usernames(table) == ["user03", "user04", "user05"]
+
+    def test_unseekable_sort_uses_offset(self, table):
+        table.table_sort_by = "last_login"  # nullable
+        table.refresh_table()
+
+        assert table._table_seek_fields(User.objects.all()) is None
+        table.on_table_next()
+        assert len(table.table_rows) == 3
+
+
+class TestColumnStats:
+    def test_non_numeric_columns_pass_min_max_through(self, table, users):
+        table.table_columns = [
+            {"key": "username", "label": "User", "stats": True},
+            {"key": "date_joined", "label": "Joined", "stats": True},
+            {"key": "last_login", "label": "Last login", "stats": True},
+        ]
+        table.refresh_table()
+
+        stats = table.table_column_stats
+        assert (stats["username"]["min"], stats["username"]["max"]) == ("user00", "user09")
+        assert stats["username"]["avg"] is None and stats["username"]["sum"] is None
+        assert stats["date_joined"]["count"] == 10
+        assert stats["date_joined"]["min"] <= stats["date_joined"]["max"]
+        assert stats["last_login"] == {
+            "min": None,
+            "max": None,
+            "avg": None,
+            "sum": None,
+            "count": 0,
+        }
+
+    def test_numeric_columns_are_floats(self, table, users):
+        table.refresh_table()
+
+        stats = table.table_column_stats["id"]
+        assert isinstance(stats["min"], float) and isinstance(stats["avg"], float)
+        assert stats["sum"] == float(sum(users))
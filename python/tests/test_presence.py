@@ -2,11 +2,14 @@
 Tests for the presence tracking system
 """
 
+import asyncio
 import pytest
 import time
 from unittest.mock import Mock, patch
 
+import djust.presence
 from djust.presence import (
+    CursorAggregator,
     PresenceManager,
     PresenceMixin,
     LiveCursorMixin,
@@ -88,9 +91,10 @@ fake_cache = FakeCache()
 
 
 @pytest.fixture(autouse=True)
-def clear_cache():
+def clear_cache(monkeypatch):
     """Reset presence backend before each test"""
     fake_cache.clear()
+    monkeypatch.setattr(djust.presence, "cursor_aggregator", CursorAggregator())
     backend = InMemoryPresenceBackend(timeout=PRESENCE_TIMEOUT)
     set_presence_backend(backend)
     yield
@@ -393,6 +397,133 @@ class TestCursorTracker:
         assert len(active_cursors) == 0
 
 
+class TestCursorAggregation:
+    """Cursor moves are coalesced per room and flushed at a fixed frame rate"""
+
+    def test_moves_within_frame_are_coalesced(self):
+        backend = PresenceManager._backend()
+        CursorTracker.update_cursor("doc:1", "u1", 1, 1)
+        # Leading edge: first move of a frame is written straight away
+        assert backend.get_cursors("doc:1", CursorTracker.CURSOR_TIMEOUT)["u1"]["x"] == 1
+
+        CursorTracker.update_cursor("doc:1", "u1", 2, 2)
+        CursorTracker.update_cursor("doc:1", "u1", 3, 3)
+        # Still within the frame: buffered, but visible through the tracker
+        assert backend.get_cursors("doc:1", CursorTracker.CURSOR_TIMEOUT)["u1"]["x"] == 1
+        assert CursorTracker.get_cursors("doc:1")["u1"]["x"] == 3
+
+        djust.presence.cursor_aggregator.flush("doc:1")
+        assert backend.get_cursors("doc:1", CursorTracker.CURSOR_TIMEOUT)["u1"]["x"] == 3
+
+    @patch("djust.presence.get_channel_layer")
+    @patch("djust.presence.async_to_sync")
+    def test_one_compact_frame_per_room(self, mock_async_to_sync, mock_get_channel_layer):
+        mock_get_channel_layer.return_value = Mock()
+        mock_group_send = Mock()
+        mock_async_to_sync.return_value = mock_group_send
+
+        CursorTracker.update_cursor("doc:1", "u1", 1, 1, broadcast=True)
+        for i in range(10):
+            CursorTracker.update_cursor("doc:1", "u1", 10 + i, 10, broadcast=True)
+            CursorTracker.update_cursor("doc:1", "u2", 20 + i, 20, broadcast=True)
+        assert mock_group_send.call_count == 1
+
+        djust.presence.cursor_aggregator.flush("doc:1")
+        assert mock_group_send.call_count == 2
+        group, message = mock_group_send.call_args[0]
+        assert group == "djust_presence_doc_1"
+        assert message["event"] == "cursor_frame"
+        assert sorted(message["payload"]["cursors"]) == [["u1", 19, 10, {}], ["u2", 29, 20, {}]]
+
+    @patch("djust.presence.get_channel_layer")
+    @patch("djust.presence.async_to_sync")
+    def test_frame_carries_cursor_meta(self, mock_async_to_sync, mock_get_channel_layer):
+        mock_get_channel_layer.return_value = Mock()
+        mock_group_send = Mock()
+        mock_async_to_sync.return_value = mock_group_send
+
+        meta = {"name": "Ada", "color": "#f00"}
+        CursorTracker.update_cursor("doc:1", "u1", 1, 2, meta, broadcast=True)
+
+        _group, message = mock_group_send.call_args[0]
+        assert message["payload"]["cursors"] == [["u1", 1, 2, meta]]
+
+    @pytest.mark.asyncio
+    async def test_flusher_sends_trailing_frame(self, monkeypatch):
+        from djust.config import config as djust_config
+
+        monkeypatch.setitem(djust_config._config, "cursor_broadcast_hz", 100)
+        aggregator = djust.presence.cursor_aggregator
+        backend = PresenceManager._backend()
+
+        CursorTracker.update_cursor("doc:1", "u1", 1, 1)
+        CursorTracker.update_cursor("doc:1", "u1", 2, 2)
+        aggregator.ensure_flusher()
+        await asyncio.wait_for(aggregator._flusher, timeout=2)
+
+        assert not aggregator.has_pending()
+        assert backend.get_cursors("doc:1", CursorTracker.CURSOR_TIMEOUT)["u1"]["x"] == 2
+
+    @pytest.mark.asyncio
+    async def test_moves_from_worker_thread_start_the_flusher(self, monkeypatch):
+        """The ``@event_handler`` path: moves arrive via ``sync_to_async``."""
+        from asgiref.sync import sync_to_async
+
+        from djust.config import config as djust_config
+
+        monkeypatch.setitem(djust_config._config, "cursor_broadcast_hz", 100)
+        aggregator = djust.presence.cursor_aggregator
+        backend = PresenceManager._backend()
+
+        await sync_to_async(CursorTracker.update_cursor)("doc:1", "u1", 1, 1)
+        await sync_to_async(CursorTracker.update_cursor)("doc:1", "u1", 2, 2)
+        await asyncio.sleep(0)
+        assert aggregator._flusher is not None
+        await asyncio.wait_for(aggregator._flusher, timeout=2)
+
+        assert not aggregator.has_pending()
+        assert backend.get_cursors("doc:1", CursorTracker.CURSOR_TIMEOUT)["u1"]["x"] == 2
+
+
+class TestRedisCursorStorage:
+    """Cursor positions live in one Redis hash per room, one field per user"""
+
+    @pytest.fixture
+    def redis_backend(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        from djust.backends.redis import RedisPresenceBackend
+
+        with patch("redis.from_url", return_value=fakeredis.FakeRedis(decode_responses=True)):
+            return RedisPresenceBackend()
+
+    def test_set_get_remove(self, redis_backend):
+        now = time.time()
+        redis_backend.set_cursors(
+            "doc:1",
+            {
+                "u1": {"x": 1, "y": 2, "timestamp": now, "meta": {}},
+                "u2": {"x": 3, "y": 4, "timestamp": now - 60, "meta": {}},
+            },
+            10,
+        )
+        cursors = redis_backend.get_cursors("doc:1", 10)
+        assert list(cursors) == ["u1"]
+        assert cursors["u1"]["y"] == 2
+        # The stale field was pruned from the hash
+        assert redis_backend._client.hkeys(redis_backend._cursor_key("doc:1")) == ["u1"]
+
+        redis_backend.remove_cursor("doc:1", "u1")
+        assert redis_backend.get_cursors("doc:1", 10) == {}
+
+    def test_field_ttl_set_in_the_write_pipeline(self, redis_backend):
+        key = redis_backend._cursor_key("doc:1")
+        redis_backend.set_cursors("doc:1", {"u1": {"x": 1, "y": 2, "timestamp": time.time()}}, 10)
+
+        assert redis_backend._field_ttl is True
+        assert 0 < redis_backend._client.httl(key, "u1")[0] <= 10
+        assert redis_backend._client.ttl(key) > 10
+
+
 class TestLiveCursorMixin:
     """Test the LiveCursorMixin class"""
 
@@ -43,11 +43,13 @@ if not settings.configured:
 from django.test import RequestFactory
 
 from djust.sse import (
+    SSEOutbox,
     SSESession,
     DjustSSEStreamView,
     DjustSSEEventView,
     _get_session,
     _sse_sessions,
+    sse_outbox_stats,
 )
 
 
@@ -122,6 +124,133 @@ class TestSSESession:
         assert session.active is False
 
 
+# ------------------------------------------------------------------ #
+# SSEOutbox (bounded per-session buffer)
+# ------------------------------------------------------------------ #
+
+
+def _outbox_session(max_frames=3, policy="coalesce") -> SSESession:
+    session = SSESession("outbox-id")
+    session.queue = SSEOutbox(session, max_frames=max_frames, policy=policy)
+    session.view_instance = MagicMock()
+    session.view_instance._strip_comments_and_whitespace.side_effect = str.strip
+    session.view_instance._extract_liveview_content.side_effect = lambda html: html
+    return session
+
+
+def _push_patch(session, version):
+    """Push a patch frame the way the runtime does: stash the render, then send."""
+    session._last_render = (version, " <p>v%d</p> " % version)
+    session.push({"type": "patch", "patches": [], "version": version, "event_name": "tick"})
+
+
+class TestSSEOutbox:
+    def test_overflow_collapses_patches_into_one_recovery_frame(self):
+        session = _outbox_session()
+        _push_patch(session, 2)
+        session.push({"type": "push_event", "event": "saved"})
+        _push_patch(session, 3)
+        _push_patch(session, 4)  # 4 frames > 3: the three patches collapse
+        assert session.queue.qsize() == 2
+        _push_patch(session, 5)  # folded into the pending recovery frame
+        assert session.queue.qsize() == 2
+
+        assert drain_queue(session) == [
+            {"type": "push_event", "event": "saved"},
+            {"type": "html_update", "html": "<p>v5</p>", "version": 2, "event_name": "tick"},
+        ]
+        assert session.queue.stats["coalesced"] == 4
+        assert session.queue.stats["dropped"] == 0
+
+    def test_frames_after_recovery_are_renumbered_in_sequence(self):
+        session = _outbox_session()
+        for version in (2, 3, 4, 5):
+            _push_patch(session, version)
+        drain_queue(session)
+
+        _push_patch(session, 6)
+        (frame,) = drain_queue(session)
+        # The recovery frame was stamped 2 (it replaced 2..5), so 6 follows as 3.
+        assert frame["version"] == 3
+
+    def test_html_update_frames_keep_their_own_html(self):
+        session = _outbox_session(max_frames=1)
+        session.push({"type": "html_update", "html": "<p>a</p>", "version": 2})
+        session.push({"type": "html_update", "html": "<p>b</p>", "version": 3})
+
+        (frame,) = drain_queue(session)
+        assert frame == {"type": "html_update", "html": "<p>b</p>", "version": 2}
+        session.view_instance._strip_comments_and_whitespace.assert_not_called()
+
+    def test_coalesced_event_response_keeps_its_ref(self):
+        session = _outbox_session(max_frames=1)
+        session._last_render = (2, "<p>v2</p>")
+        session.push({"type": "patch", "patches": [], "version": 2, "event_name": "save", "ref": 7})
+        _push_patch(session, 3)  # a server push lands behind the event response
+
+        (frame,) = drain_queue(session)
+        assert frame == {
+            "type": "html_update",
+            "html": "<p>v3</p>",
+            "version": 2,
+            "event_name": "tick",
+            "ref": 7,
+        }
+
+    def test_patch_without_matching_render_recovers_with_reload(self):
+        session = _outbox_session(max_frames=1)
+        session.push({"type": "patch", "patches": [], "version": 2})
+        session.push({"type": "patch", "patches": [], "version": 3})
+
+        assert drain_queue(session) == [{"type": "reload"}]
+
+    def test_non_vdom_overflow_drops_oldest(self):
+        session = _outbox_session(max_frames=2)
+        for n in range(4):
+            session.push({"type": "push_event", "n": n})
+
+        assert [m["n"] for m in drain_queue(session)] == [2, 3]
+        assert session.queue.stats["dropped"] == 2
+
+    def test_disconnect_policy_closes_the_stream(self):
+        session = _outbox_session(max_frames=2, policy="disconnect")
+        for version in (2, 3, 4):
+            _push_patch(session, version)
+
+        assert session.active is False
+        assert drain_queue(session) == [None]
+        session.push({"type": "push_event"})
+        assert session.queue.empty()
+        assert session.queue.stats["disconnects"] == 1
+        assert session.queue.stats["dropped"] == 4
+
+    def test_sentinel_bypasses_the_bound(self):
+        session = _outbox_session(max_frames=1)
+        session.push({"type": "push_event"})
+        session.shutdown()
+        assert drain_queue(session) == [{"type": "push_event"}, None]
+
+    def test_process_stats_track_high_water(self):
+        before = dict(sse_outbox_stats)
+        session = _outbox_session(max_frames=8)
+        for n in range(5):
+            session.push({"type": "push_event", "n": n})
+
+        assert session.queue.stats["high_water"] == 5
+        assert sse_outbox_stats["frames"] - before["frames"] == 5
+        assert sse_outbox_stats["high_water"] >= 5
+
+    def test_limits_read_from_settings(self, settings):
+        settings.DJUST_SSE_MAX_QUEUED_FRAMES = 7
+        settings.DJUST_SSE_OVERFLOW_POLICY = "disconnect"
+        session = SSESession("outbox-settings")
+        assert session.queue.max_frames == 7
+        assert session.queue.policy == "disconnect"
+
+        settings.DJUST_SSE_OVERFLOW_POLICY = "bogus"
+        assert SSESession("outbox-settings").queue.policy == "coalesce"
+
+
 # ------------------------------------------------------------------ #
 # _get_session
 # ------------------------------------------------------------------ #
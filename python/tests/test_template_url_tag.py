@@ -672,5 +672,69 @@ class TestUrlTagEdgeCases:
         assert "Link: / end" in result, f"Expected 'Link: / end' but got: {result}"
 
 
+other_urlpatterns = [
+    path("elsewhere/", home_view, name="home"),
+]
+
+
+class TestUrlTagCaching:
+    """The {% url %} plan is parsed once and reverse() is memoized."""
+
+    @staticmethod
+    def _backend():
+        from djust.template_backend import DjustTemplateBackend
+
+        return DjustTemplateBackend({"NAME": "djust", "DIRS": [], "APP_DIRS": False, "OPTIONS": {}})
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_plan_compiled_once_and_reverse_memoized(self):
+        from unittest.mock import patch
+
+        from django.urls import reverse as real_reverse
+
+        from djust.template.rendering import DjustTemplate, clear_template_cache
+
+        clear_template_cache()
+        source = "<a href=\"{% url 'post_by_id' pk %}\">{% url 'home' %}</a>"
+        compile_plan = DjustTemplate._compile_url_plan
+        with (
+            patch.object(DjustTemplate, "_compile_url_plan", side_effect=compile_plan) as compiles,
+            patch("django.urls.reverse", side_effect=real_reverse) as reverses,
+        ):
+            for _ in range(3):
+                # A fresh template object per request, as get_template() does.
+                result = self._backend().from_string(source).render({"pk": 7})
+                assert 'href="/post/7/"' in result
+            self._backend().from_string(source).render({"pk": 8})
+
+        assert compiles.call_count == 1
+        # post_by_id(7), home, post_by_id(8) — repeats hit the memo.
+        assert reverses.call_count == 3
+
+    def test_memo_follows_urlconf_override(self):
+        from djust.template.rendering import clear_template_cache
+
+        clear_template_cache()
+        source = "{% url 'home' %}"
+        with override_settings(ROOT_URLCONF=__name__):
+            assert self._backend().from_string(source).render({}) == "/"
+
+        class OtherUrls:
+            urlpatterns = other_urlpatterns
+
+        # New URLconf -> new resolver -> the memoized "/" must not be reused.
+        with override_settings(ROOT_URLCONF=OtherUrls):
+            assert self._backend().from_string(source).render({}) == "/elsewhere/"
+
+    @override_settings(ROOT_URLCONF=__name__)
+    def test_unresolved_variable_keeps_tag_for_rust(self):
+        from djust.template.rendering import DjustTemplate
+
+        plan = DjustTemplate._compile_url_plan("x {% url 'post_detail' post.slug %} y")
+        result = DjustTemplate._apply_url_plan(plan, {})
+
+        assert result == "x {% url 'post_detail' post.slug %} y"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,6 +2,7 @@
 Tests for djust file upload support.
 """
 
+import hashlib
 import importlib.util
 import os
 import struct
@@ -28,6 +29,7 @@ FRAME_CANCEL = uploads.FRAME_CANCEL
 UploadConfig = uploads.UploadConfig
 UploadEntry = uploads.UploadEntry
 UploadManager = uploads.UploadManager
+TempFileUploadWriter = uploads.TempFileUploadWriter
 UploadMixin = uploads.UploadMixin
 parse_upload_frame = uploads.parse_upload_frame
 validate_magic_bytes = uploads.validate_magic_bytes
@@ -134,7 +136,7 @@ class TestUploadEntry(TestCase):
             client_type="image/jpeg",
             client_size=200,
         )
-        entry.add_chunk(0, b"x" * 100)
+        entry.add_chunk(0, b"\xff\xd8\xff" + b"x" * 97)
         assert entry.progress == 50
 
         entry.add_chunk(1, b"x" * 100)
@@ -265,6 +267,70 @@ class TestUploadManager(TestCase):
         result = self.mgr.add_chunk("ref-1", 0, b"x" * 20)
         assert result is None  # Rejected
 
+    def test_chunks_assemble_on_disk_by_offset(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = UploadManager(temp_dir=tmpdir)
+            mgr.configure("files", max_file_size=1000, chunk_size=4)
+            entry = mgr.register_entry("files", "ref-1", "a.txt", "text/plain", 10)
+            # Out of order: chunk 2 lands at offset 8 before chunk 0 arrives.
+            mgr.add_chunk("ref-1", 2, b"89")
+            mgr.add_chunk("ref-1", 0, b"0123")
+            mgr.add_chunk("ref-1", 1, b"4567")
+            spill_path = entry._spill.path
+            assert os.path.dirname(spill_path) == tmpdir
+
+            assert mgr.complete_upload("ref-1") is entry
+            assert entry._temp_path == spill_path
+            assert entry.data == b"0123456789"
+            assert os.path.getsize(spill_path) == 10
+            assert entry.sha256 == hashlib.sha256(b"0123456789").hexdigest()
+
+    def test_magic_bytes_checked_on_first_chunk(self):
+        self.mgr.configure("avatar", max_file_size=1000)
+        self.mgr.register_entry("avatar", "ref-1", "photo.png", "image/png", 100)
+
+        assert self.mgr.add_chunk("ref-1", 0, b"not a png at all, nope") is None
+        entry = self.mgr._entries["ref-1"]
+        assert "doesn't match" in entry.error
+        assert entry._spill is None  # partial file discarded
+
+    def test_forged_chunk_index_cannot_exceed_size_limit(self):
+        self.mgr.configure("files", max_file_size=100, chunk_size=10)
+        self.mgr.register_entry("files", "ref-1", "a.txt", "text/plain", 50)
+
+        assert self.mgr.add_chunk("ref-1", 1_000_000, b"x") is None
+        assert self.mgr._entries["ref-1"].error is not None
+
+
+class TestTempFileUploadWriter(TestCase):
+    def _writer(self, **kwargs):
+        writer = TempFileUploadWriter("ref", "a.bin", "application/octet-stream", **kwargs)
+        writer.open()
+        self.addCleanup(writer.abort, None)
+        return writer
+
+    def test_running_hash_matches_out_of_order_and_retransmit(self):
+        writer = self._writer(chunk_size=3)
+        writer.write_chunk(b"def", chunk_index=1)
+        writer.write_chunk(b"abc", chunk_index=0)
+        assert writer.sha256 == hashlib.sha256(b"abcdef").hexdigest()
+        writer.write_chunk(b"DEF", chunk_index=1)  # retransmit with new bytes
+        assert writer.sha256 == hashlib.sha256(b"abcDEF").hexdigest()
+
+    def test_close_truncates_preallocation(self):
+        writer = self._writer(expected_size=1024)
+        writer.write_chunk(b"hello", chunk_index=0)
+        result = writer.close()
+        assert result["size"] == 5
+        assert os.path.getsize(result["path"]) == 5
+
+    def test_abort_removes_file(self):
+        writer = self._writer()
+        writer.write_chunk(b"hello", chunk_index=0)
+        path = writer.path
+        writer.abort(ValueError("cancelled"))
+        assert not os.path.exists(path)
+
 
 class TestParseUploadFrame(TestCase):
     def _make_ref_bytes(self):
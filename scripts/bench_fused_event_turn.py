@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark: fused single-hop event turn vs per-step ``sync_to_async`` hops.
+
+``ViewRuntime._dispatch_event_render`` used to cross the thread pool once for
+the ``@event_handler`` and once more for ``render_with_diff`` (which includes
+the Rust state sync); the WS tick path paid a third hop for
+``_sync_state_to_rust``. With ``LIVEVIEW_CONFIG['fused_event_pipeline']`` the
+synchronous segment runs as ONE executor call (``_run_fused_event_turn``).
+This script measures the end-to-end latency of both shapes for the same sync
+work so the win can be read at p50 / p99.
+
+The sync steps are stand-ins with a fixed CPU cost (``STEP_US`` each); what
+differs between the two shapes is only the number of event-loop <-> executor
+handoffs and contextvar copies. ``CONCURRENCY`` concurrent "connections" run
+turns back to back so the thread-sensitive executor is contended the way it is
+under real load — that queueing is what stretches p99.
+
+No Django setup is required. Run::
+
+    python scripts/bench_fused_event_turn.py
+
+Exit code is always 0 — this is a measurement tool, not a gate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+
+from asgiref.sync import sync_to_async
+
+TURNS = 1000
+WARMUP = 100
+CONCURRENCY = 8
+STEP_US = 20.0
+
+
+def _spin(us: float) -> None:
+    end = time.perf_counter() + us / 1e6
+    while time.perf_counter() < end:
+        pass
+
+
+def _handler() -> None:
+    _spin(STEP_US)
+
+
+def _sync_state_to_rust() -> None:
+    _spin(STEP_US)
+
+
+def _render_with_diff() -> tuple:
+    _spin(STEP_US)
+    return "<div></div>", "[]", 2
+
+
+def _fused_turn() -> tuple:
+    _handler()
+    _sync_state_to_rust()
+    return _render_with_diff()
+
+
+async def _hopped(hops: int) -> None:
+    await sync_to_async(_handler)()
+    if hops == 3:
+        await sync_to_async(_sync_state_to_rust)()
+        await sync_to_async(_render_with_diff)()
+    else:
+        # Two-hop shape: render_with_diff carries the state sync.
+        def _render() -> tuple:
+            _sync_state_to_rust()
+            return _render_with_diff()
+
+        await sync_to_async(_render)()
+
+
+async def _fused() -> None:
+    await sync_to_async(_fused_turn)()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = int(round((pct / 100.0) * (len(ordered) - 1)))
+    return ordered[idx]
+
+
+async def _measure(turn) -> list[float]:
+    samples: list[float] = []
+
+    async def connection(n: int) -> None:
+        for i in range(n):
+            start = time.perf_counter()
+            await turn()
+            if i >= WARMUP // CONCURRENCY:
+                samples.append((time.perf_counter() - start) * 1e6)
+
+    per_conn = (TURNS + WARMUP) // CONCURRENCY
+    await asyncio.gather(*(connection(per_conn) for _ in range(CONCURRENCY)))
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> tuple[float, float]:
+    p50 = statistics.median(samples)
+    p99 = _percentile(samples, 99.0)
+    print(f"  {label:<34s}  p50={p50:9.1f} us   p99={p99:9.1f} us")
+    return p50, p99
+
+
+async def main() -> int:
+    gil_probe = getattr(sys, "_is_gil_enabled", None)
+    ft = "free-threaded" if gil_probe is not None and not gil_probe() else "GIL"
+    print(
+        f"Event turn latency  ({TURNS} turns, {CONCURRENCY} concurrent connections, "
+        f"{STEP_US:.0f} us per sync step)"
+    )
+    print(f"Python {sys.version.split()[0]} [{ft}], asgiref measurement, no Django\n")
+
+    three = _report("3 hops (handler/sync/render)", await _measure(lambda: _hopped(3)))
+    two = _report("2 hops (handler/render)", await _measure(lambda: _hopped(2)))
+    fused = _report("fused (1 hop)", await _measure(_fused))
+
+    print("\nFused speed-up:")
+    for label, (p50, p99) in (("vs 3 hops", three), ("vs 2 hops", two)):
+        print(f"  {label:<10s}  p50 x{p50 / fused[0]:5.2f}   p99 x{p99 / fused[1]:5.2f}")
+    print(
+        f"SUMMARY fused_p50_us={fused[0]:.1f} fused_p99_us={fused[1]:.1f} "
+        f"two_hop_p50_us={two[0]:.1f} two_hop_p99_us={two[1]:.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Benchmark: precompiled (prepared) component-tag args vs per-call parsing.
+
+Component tags in ``djust.components.rust_handlers`` used to receive their
+arguments as ``["label=Ada", "variant='primary'", ...]`` strings that
+``_parse_args`` split, stripped, number-sniffed and ``json.loads``-ed on every
+call. Handlers registered with ``prepared_args=True`` get a dict built from an
+arg plan the Rust engine compiles once per tag source.
+
+The workload is a 500-row table with 6 component tags per row (3,000 tag
+calls per render). Two measurements:
+
+1. Handler-side: the same 3,000 handler calls fed string args (re-parsed)
+   vs prepared dicts. Needs only Django settings.
+2. End-to-end ``djust._rust.render_template`` with the handlers registered
+   both ways — only when the compiled engine supports ``prepared_args``
+   (otherwise reported as skipped).
+
+Run::
+
+    DJANGO_SETTINGS_MODULE=demo_project.settings PYTHONPATH=python \\
+        python scripts/bench_tag_arg_plans.py
+
+Exit code is always 0 — this is a measurement tool, not a gate.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+
+import django
+
+ROWS = 500
+RENDERS = 10
+
+TEMPLATE = (
+    "{% for row in rows %}<tr>"
+    '{% badge label=row.status variant="info" %}'
+    "{% progress value=row.pct max_value=100 %}"
+    '{% avatar name=row.name size="sm" %}'
+    '{% dj_button label=row.name variant="primary" disabled=False %}'
+    '{% dj_tag label=row.tag color="blue" %}'
+    '{% spinner size="sm" label=row.status %}'
+    "</tr>{% endfor %}"
+)
+
+
+def _rows():
+    return [
+        {
+            "name": f"User {i}",
+            "status": "active" if i % 2 else "idle",
+            "pct": (i * 7) % 100,
+            "tag": f"t{i % 5}",
+        }
+        for i in range(ROWS)
+    ]
+
+
+def _calls(rows):
+    """(handler, string args, prepared kwargs) for every tag call of a render."""
+    from djust.components import rust_handlers as rh
+
+    handlers = dict(rh.INLINE_HANDLERS)
+    calls = []
+    for row in rows:
+        calls += [
+            (
+                handlers["badge"],
+                [f"label={row['status']}", 'variant="info"'],
+                {"label": row["status"], "variant": "info"},
+            ),
+            (
+                handlers["progress"],
+                [f"value={row['pct']}", "max_value=100"],
+                {"value": row["pct"], "max_value": 100},
+            ),
+            (
+                handlers["avatar"],
+                [f"name={row['name']}", 'size="sm"'],
+                {"name": row["name"], "size": "sm"},
+            ),
+            (
+                handlers["dj_button"],
+                [f"label={row['name']}", 'variant="primary"', "disabled=false"],
+                {"label": row["name"], "variant": "primary", "disabled": False},
+            ),
+            (
+                handlers["dj_tag"],
+                [f"label={row['tag']}", 'color="blue"'],
+                {"label": row["tag"], "color": "blue"},
+            ),
+            (
+                handlers["spinner"],
+                ['size="sm"', f"label={row['status']}"],
+                {"size": "sm", "label": row["status"]},
+            ),
+        ]
+    return calls
+
+
+def _time(fn, repeat=RENDERS):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_handlers(rows):
+    calls = _calls(rows)
+    context = {"rows": rows}
+
+    def strings():
+        for handler, args, _ in calls:
+            handler.render(args, context)
+
+    def prepared():
+        for handler, _, kwargs in calls:
+            handler.render(kwargs, context)
+
+    strings()
+    prepared()
+    return _time(strings), _time(prepared)
+
+
+def bench_engine(rows):
+    import djust._rust as rust
+    from djust.components import rust_handlers as rh
+
+    if not rh._supports_prepared_args(rust.register_tag_handler):
+        return None
+    context = {"rows": rows}
+    tags = ("badge", "progress", "avatar", "dj_button", "dj_tag", "spinner")
+    handlers = dict(rh.INLINE_HANDLERS)
+
+    def register(prepared):
+        for tag in tags:
+            rust.register_tag_handler(tag, handlers[tag], prepared_args=prepared)
+
+    register(False)
+    rust.render_template(TEMPLATE, context)
+    strings = _time(lambda: rust.render_template(TEMPLATE, context))
+    register(True)
+    rust.render_template(TEMPLATE, context)
+    prepared = _time(lambda: rust.render_template(TEMPLATE, context))
+    return strings, prepared
+
+
+def main() -> int:
+    django.setup()
+    rows = _rows()
+    calls = ROWS * 6
+    print(f"{ROWS} rows x 6 tags = {calls} tag calls per render, median of {RENDERS}")
+
+    strings, prepared = bench_handlers(rows)
+    print(
+        f"handlers   string args {strings:8.2f} ms   prepared {prepared:8.2f} ms   "
+        f"({strings / prepared:.2f}x)"
+    )
+
+    engine = bench_engine(rows)
+    if engine is None:
+        print("engine     skipped: compiled djust._rust predates prepared_args")
+    else:
+        strings, prepared = engine
+        print(
+            f"engine     string args {strings:8.2f} ms   prepared {prepared:8.2f} ms   "
+            f"({strings / prepared:.2f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
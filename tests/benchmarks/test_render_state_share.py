@@ -0,0 +1,49 @@
+"""
+Benchmarks for building the render context from view state.
+
+``RustLiveView.render_with_diff`` used to copy the whole state map into the
+render ``Context`` on every call, so a view holding a large list paid for it
+even when the template only reads one key. The context now shares the state
+map instead. These render ``{{ count }}`` after a one-key change, over a
+5,000-item state and over a state with nothing else in it; with the state
+shared the two should be within noise of each other.
+"""
+
+import itertools
+
+import pytest
+
+from djust._rust import RustLiveView
+
+ITEMS = 5_000
+TEMPLATE = "<div><span>{{ count }}</span></div>"
+
+
+def _make_view(items: int) -> RustLiveView:
+    view = RustLiveView(TEMPLATE)
+    view.update_state(
+        {
+            "count": 0,
+            "items": [{"id": i, "name": f"item-{i}", "done": i % 2 == 0} for i in range(items)],
+        }
+    )
+    view.render_with_diff()
+    return view
+
+
+class TestRenderStateShare:
+    """Per-render cost of a one-key change as the untouched state grows."""
+
+    @pytest.mark.parametrize("items", [0, ITEMS], ids=["empty", "5k_items"])
+    @pytest.mark.benchmark(group="render_state_share")
+    def test_one_key_change(self, benchmark, items):
+        view = _make_view(items)
+        counter = itertools.count(1)
+
+        def bump_and_render():
+            view.set_state("count", next(counter))
+            return view.render_with_diff()
+
+        html, patches, _version = benchmark(bump_and_render)
+        assert "<span" in html
+        assert patches is not None
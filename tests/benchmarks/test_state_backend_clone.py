@@ -0,0 +1,64 @@
+"""
+Benchmarks for InMemoryStateBackend.get() cloning.
+
+Every cache hit hands the caller an isolated copy of the cached
+``RustLiveView``. These compare the MessagePack round trip the backend used
+to pay on each read against the native ``RustLiveView.clone()``, across
+state sizes of roughly 10KB, 100KB and 1MB.
+"""
+
+import pytest
+
+from djust._rust import RustLiveView
+from djust.state_backends.memory import InMemoryStateBackend
+
+STATE_SIZES = {"10KB": 10 * 1024, "100KB": 100 * 1024, "1MB": 1024 * 1024}
+
+HAS_NATIVE_CLONE = hasattr(RustLiveView, "clone")
+
+
+def _make_view(size_bytes: int) -> RustLiveView:
+    """A rendered view whose state serializes to roughly ``size_bytes``."""
+    rows = [
+        {"id": i, "name": f"row-{i}", "email": f"user{i}@example.com", "score": i * 1.5}
+        for i in range(size_bytes // 64)
+    ]
+    view = RustLiveView("<ul>{% for r in rows %}<li>{{ r.name }}</li>{% endfor %}</ul>")
+    view.update_state({"rows": rows})
+    view.render_with_diff()
+    return view
+
+
+@pytest.fixture(params=list(STATE_SIZES), ids=list(STATE_SIZES))
+def cached_view(request):
+    return _make_view(STATE_SIZES[request.param])
+
+
+class TestStateBackendClone:
+    """Per-read cost of isolating a cached view."""
+
+    @pytest.mark.benchmark(group="state_backend_clone")
+    def test_msgpack_round_trip(self, benchmark, cached_view):
+        """Baseline: serialize_msgpack + deserialize_msgpack."""
+
+        def round_trip():
+            return RustLiveView.deserialize_msgpack(cached_view.serialize_msgpack())
+
+        clone = benchmark(round_trip)
+        assert clone.get_state() == cached_view.get_state()
+
+    @pytest.mark.skipif(not HAS_NATIVE_CLONE, reason="extension built without clone()")
+    @pytest.mark.benchmark(group="state_backend_clone")
+    def test_native_clone(self, benchmark, cached_view):
+        """RustLiveView.clone(): struct copy, no encode/decode."""
+        clone = benchmark(cached_view.clone)
+        assert clone.get_state() == cached_view.get_state()
+
+    @pytest.mark.benchmark(group="state_backend_get")
+    def test_backend_get(self, benchmark, cached_view):
+        """End-to-end InMemoryStateBackend.get() on a cache hit."""
+        backend = InMemoryStateBackend()
+        backend.set("bench", cached_view)
+
+        result = benchmark(backend.get, "bench")
+        assert result is not None
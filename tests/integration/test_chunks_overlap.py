@@ -358,3 +358,89 @@ class TestParallelRender:
             "expected no '_wait_for_one' RuntimeWarnings; got: "
             f"{[str(w.message) for w in wait_for_one_warnings]}"
         )
+
+
+class TestLazyBudget:
+    """``ChunkEmitter.max_concurrency`` / ``deadline`` applied by Phase 5."""
+
+    @staticmethod
+    async def _render(parent, emitter):
+        async def _drain():
+            return [c async for c in emitter]
+
+        consumer = asyncio.create_task(_drain())
+        await parent.arender_chunks(parent.template, emitter)
+        await emitter.close()
+        return b"".join(await consumer)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_caps_in_flight_thunks(self, rf, make_parent):
+        parent = make_parent()
+        parent.request = rf.get("/")
+        emitter = ChunkEmitter(parent.request, max_concurrency=2)
+        in_flight = peak = 0
+
+        def _counting(vid):
+            inner = _make_sleeping_thunk(vid, 0.02)
+
+            async def _thunk():
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await inner()
+                finally:
+                    in_flight -= 1
+
+            return _thunk
+
+        slot_ids = [f"slot-{i}" for i in range(5)]
+        for vid in slot_ids:
+            emitter.register_thunk(vid, _counting(vid))
+
+        body = await self._render(parent, emitter)
+
+        assert peak == 2
+        for vid in slot_ids:
+            assert f'id="djl-fill-{vid}"'.encode() in body
+            assert emitter.thunk_timings[vid][0] == "streamed"
+
+    @pytest.mark.asyncio
+    async def test_deadline_sends_fallback_for_late_thunks(self, rf, make_parent):
+        parent = make_parent()
+        parent.request = rf.get("/")
+        emitter = ChunkEmitter(parent.request, deadline_s=0.2)
+
+        slow = _make_sleeping_thunk("slot-slow", 5.0)
+        slow.deadline_fallback = lambda: b'<template id="djl-fill-slot-slow">later</template>'
+        emitter.register_thunk("slot-fast", _make_sleeping_thunk("slot-fast", 0.01))
+        emitter.register_thunk("slot-slow", slow)
+        emitter.register_thunk("slot-slow-bare", _make_sleeping_thunk("slot-slow-bare", 5.0))
+
+        started = time.monotonic()
+        body = await self._render(parent, emitter)
+
+        assert time.monotonic() - started < 2.0
+        assert b'id="djl-fill-slot-fast"' in body
+        assert b"later</template>" in body
+        # No fallback registered: the slot keeps its placeholder.
+        assert b"slot-slow-bare" not in body
+        assert emitter.thunk_timings["slot-fast"][0] == "streamed"
+        assert emitter.thunk_timings["slot-slow"][0] == "deferred"
+        assert emitter.thunk_timings["slot-slow-bare"][0] == "deferred"
+
+    @pytest.mark.asyncio
+    async def test_failed_thunk_timing_is_recorded(self, rf, make_parent):
+        parent = make_parent()
+        parent.request = rf.get("/")
+        emitter = ChunkEmitter(parent.request)
+
+        async def _failing():
+            raise ValueError("intentional failure mid-render")
+
+        emitter.register_thunk("slot-bad", _failing)
+        await self._render(parent, emitter)
+
+        outcome, seconds = emitter.thunk_timings["slot-bad"]
+        assert outcome == "failed"
+        assert seconds >= 0
@@ -70,7 +70,15 @@ def test_render_send_paths_route_through_arm_recovery():
     runtime path it now owns (keeping the #1645 invariant covered, not deleted).
     """
     # WS-only render-send paths still on the consumer (tick / broadcast / async).
-    for name in ("server_push", "_run_async_work"):
+    # The out-of-band renders (server_push / db_notify / tick) share one send
+    # helper, ``_send_render_result``; pin that server_push renders through it
+    # and that the helper itself arms.
+    push_src = inspect.getsource(LiveViewConsumer._render_broadcast)
+    assert "self._send_render_result(" in push_src, (
+        "server_push must send its render via _send_render_result so it arms the "
+        "recovery baseline like tick / db_notify (#1645)."
+    )
+    for name in ("_send_render_result", "_run_async_work"):
         method_src = inspect.getsource(getattr(LiveViewConsumer, name))
         arms = "_arm_recovery(" in method_src or "_next_version_armed(" in method_src
         assert arms, (
@@ -462,3 +462,156 @@ class TestAget:
         # producer finishes in <1ms for the small fixture). Assert the
         # watcher path was exercised.
         assert poll_count["n"] >= 1, "disconnect watcher should have polled"
+
+
+# ---------------------------------------------------------------------------
+# 4. streaming_shell_first — shell flushed before mount()
+# ---------------------------------------------------------------------------
+
+
+class _ShellFirstView(LiveView):
+    template = (
+        "<!DOCTYPE html><html><head><title>{{ site_name }}</title></head>"
+        "<body><nav>menu</nav><div dj-root><p>{{ rows }}</p></div></body></html>"
+    )
+    streaming_render = True
+    streaming_shell_first = True
+
+    def get_shell_context_data(self):
+        return {"site_name": "Acme"}
+
+    def mount(self, request, **kwargs):
+        self.mounted = True
+        self.rows = "slow rows"
+
+
+def _shell_first_request(rf, view, monkeypatch):
+    from importlib import import_module
+    from django.conf import settings
+
+    request = _build_request(rf)
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+    monkeypatch.setattr(view, "_is_asgi_context", lambda *a, **kw: True)
+    return request
+
+
+class TestAgetShellFirst:
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_shell_is_sent_before_mount(self, rf, monkeypatch):
+        import threading
+
+        view = _ShellFirstView()
+        request = _shell_first_request(rf, view, monkeypatch)
+        release = threading.Event()
+        original_mount = view.mount
+
+        def gated_mount(request, **kwargs):
+            assert release.wait(5), "shell chunk was not sent before mount()"
+            original_mount(request, **kwargs)
+
+        view.mount = gated_mount
+
+        response = await view.aget(request)
+        assert response["X-Djust-Shell-First"] == "1"
+        assert request.session.session_key, "session cookie must leave with the shell"
+
+        chunks = response.streaming_content.__aiter__()
+        first = (await chunks.__anext__()).decode("utf-8")
+        assert not getattr(view, "mounted", False)
+        assert first.endswith("<nav>menu</nav>")
+        assert "<title>Acme</title>" in first
+
+        release.set()
+        rest = b"".join([chunk async for chunk in chunks]).decode("utf-8")
+        assert rest.startswith("<div dj-root")
+        assert "<p>slow rows</p>" in rest
+        assert "<head>" not in rest
+        assert "liveview_/" in request.session.keys()
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_on_mount_redirect_after_shell_is_client_side(self, rf, monkeypatch):
+        from djust.hooks import on_mount
+
+        @on_mount
+        def _to_login(_view, _request, **_kwargs):
+            return "/login/"
+
+        class _RedirectingView(_ShellFirstView):
+            on_mount = [_to_login]
+
+        view = _RedirectingView()
+        request = _shell_first_request(rf, view, monkeypatch)
+
+        response = await view.aget(request)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode("utf-8")
+
+        assert response.status_code == 200
+        assert 'window.location.replace("/login/")' in body
+        assert "<div dj-root" not in body
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_plain_render_drops_nothing(self, rf, monkeypatch, caplog):
+        view = _ShellFirstView()
+        request = _shell_first_request(rf, view, monkeypatch)
+
+        with caplog.at_level("WARNING", logger="djust"):
+            response = await view.aget(request)
+            b"".join([chunk async for chunk in response.streaming_content])
+
+        assert "dropped" not in caplog.text
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_headers_and_cookies_set_by_get_are_logged(self, rf, monkeypatch, caplog):
+        class _CookieView(_ShellFirstView):
+            def get(self, request, *args, **kwargs):
+                response = super().get(request, *args, **kwargs)
+                response["Cache-Control"] = "no-store"
+                response.set_cookie("theme", "dark")
+                return response
+
+        view = _CookieView()
+        request = _shell_first_request(rf, view, monkeypatch)
+
+        with caplog.at_level("WARNING", logger="djust"):
+            response = await view.aget(request)
+            b"".join([chunk async for chunk in response.streaming_content])
+
+        assert "Cache-Control" in caplog.text and "theme" in caplog.text
+        assert "theme" not in response.cookies
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_streaming_error_response_body_is_streamed(self, rf, monkeypatch):
+        from django.http import StreamingHttpResponse
+
+        class _ErrorView(_ShellFirstView):
+            def get(self, request, *args, **kwargs):
+                return StreamingHttpResponse(iter([b"<p>denied</p>"]), status=403)
+
+        view = _ErrorView()
+        request = _shell_first_request(rf, view, monkeypatch)
+
+        response = await view.aget(request)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode("utf-8")
+
+        assert response.status_code == 200
+        assert body.endswith("<p>denied</p>")
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db
+    async def test_view_without_dj_root_streams_after_mount(self, rf, monkeypatch):
+        class _FragmentView(_ShellFirstView):
+            template = "<p>{{ rows }}</p>"
+
+        view = _FragmentView()
+        request = _shell_first_request(rf, view, monkeypatch)
+
+        response = await view.aget(request)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode("utf-8")
+
+        assert response.get("X-Djust-Shell-First") is None
+        assert "slow rows" in body
@@ -345,7 +345,7 @@ class TestServerPushSourceBroadcast:
 
     @pytest.mark.asyncio
     async def test_server_push_yields_to_user_event(self):
-        """server_push skips when a user event is being processed."""
+        """server_push defers the push while a user event is being processed (#813)."""
         consumer = LiveViewConsumer()
         consumer.use_binary = False
         consumer._render_lock = asyncio.Lock()
@@ -368,14 +368,20 @@ class TestServerPushSourceBroadcast:
         # Hold the render lock to simulate user event in progress
         await consumer._render_lock.acquire()
 
-        # server_push should time out trying to acquire the lock
+        # server_push must not render while the user event owns the lock
         await consumer.server_push({"state": {"count": 10}})
+        await asyncio.sleep(0.05)
 
+        patch_msgs = [m for m in sent_messages if m.get("type") == "patch"]
+        assert len(patch_msgs) == 0
+
+        # ...and delivers the queued push once the event finishes
+        consumer._processing_user_event = False
         consumer._render_lock.release()
+        await consumer._push_drain_task
 
-        # No patch should have been sent (push was skipped)
         patch_msgs = [m for m in sent_messages if m.get("type") == "patch"]
-        assert len(patch_msgs) == 0
+        assert len(patch_msgs) == 1
 
 
 class TestAsyncWorkSourceAsync:
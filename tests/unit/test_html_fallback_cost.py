@@ -0,0 +1,151 @@
+"""Tests for the shared patch-vs-HTML cost model (``serialization.prefer_html_frame``).
+
+Every WebSocket/SSE render path sends whichever frame is smaller on the wire:
+the encoded patch JSON (the Rust string, in UTF-8 bytes) against the rendered
+HTML, instead of only reconsidering once a diff has more than 100 patches.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from djust import LiveView
+from djust.config import config
+from djust.decorators import event_handler
+from djust.serialization import RawJSON, encoded_patch_size, prefer_html_frame
+from djust.tests.test_transport_behavioral_parity import (
+    _EventSpineMixin,
+    _event_runtime_with_view,
+)
+
+# One patch that rewrites a big text node: 1 patch, ~4 KB of JSON.
+BIG_PATCHES = json.dumps([{"type": "SetText", "path": [0], "d": "1", "text": "x" * 4000}])
+SMALL_HTML = "<div dj-root>" + "y" * 200 + "</div>"
+PAGE_HTML = "<div dj-root>" + "z" * 20000 + "</div>"
+
+
+@pytest.fixture
+def ratio():
+    original = config.get("html_fallback_ratio")
+    yield
+    config.set("html_fallback_ratio", original)
+
+
+class TestPreferHtmlFrame:
+    def test_sizes_every_patch_form(self):
+        assert encoded_patch_size(BIG_PATCHES) == len(BIG_PATCHES)
+        assert encoded_patch_size(RawJSON(BIG_PATCHES)) == len(BIG_PATCHES)
+        assert encoded_patch_size(json.loads(BIG_PATCHES)) == len(BIG_PATCHES)
+        assert encoded_patch_size(None) == 0
+
+    def test_cheaper_html_wins_regardless_of_patch_count(self):
+        assert prefer_html_frame(SMALL_HTML, BIG_PATCHES)
+        assert prefer_html_frame(SMALL_HTML, RawJSON(BIG_PATCHES))
+
+    def test_patches_kept_when_smaller(self):
+        assert not prefer_html_frame(PAGE_HTML, BIG_PATCHES)
+
+    def test_small_diffs_always_stay_patches(self):
+        assert not prefer_html_frame("<p></p>", '[{"type":"SetText","path":[0],"text":"a"}]')
+        assert not prefer_html_frame("<p></p>", "[]")
+
+    def test_sizes_are_utf8_bytes(self):
+        text = "é" * 1000
+        patches = json.dumps([{"type": "SetText", "path": [0], "text": text}], ensure_ascii=False)
+        assert encoded_patch_size(patches) == len(patches.encode("utf-8"))
+        assert encoded_patch_size(RawJSON(patches)) == len(patches.encode("utf-8"))
+        # 800 characters but 1,600 bytes: larger than 0.7 x ~2 KB of patches.
+        assert not prefer_html_frame("<p>" + "é" * 800 + "</p>", patches)
+        assert prefer_html_frame("<p>" + "e" * 800 + "</p>", patches)
+
+    def test_missing_inputs(self):
+        assert not prefer_html_frame("", BIG_PATCHES)
+        assert not prefer_html_frame(SMALL_HTML, None)
+
+    def test_ratio_setting(self, ratio):
+        config.set("html_fallback_ratio", 0)
+        assert not prefer_html_frame(SMALL_HTML, BIG_PATCHES)
+        config.set("html_fallback_ratio", 0.01)
+        assert not prefer_html_frame(SMALL_HTML, BIG_PATCHES)
+
+
+class TestOutOfBandRenders:
+    """Tick / server_push / db_notify all send through ``_send_render_result``."""
+
+    def _make_consumer(self):
+        from djust.websocket import LiveViewConsumer
+
+        consumer = LiveViewConsumer()
+        consumer.view_instance = MagicMock()
+        consumer.view_instance._strip_comments_and_whitespace = lambda html: html
+        consumer.view_instance._extract_liveview_content = lambda html: html
+        consumer.view_instance._shared_resync_pending = False
+        consumer._send_update = AsyncMock()
+        consumer._flush_all_pending = AsyncMock()
+        return consumer
+
+    @pytest.mark.asyncio
+    async def test_cheaper_html_sent_as_html_update(self):
+        consumer = self._make_consumer()
+
+        sent = await consumer._send_render_result(SMALL_HTML, BIG_PATCHES, source="tick")
+
+        assert sent is True
+        kwargs = consumer._send_update.call_args.kwargs
+        assert kwargs["html"] == SMALL_HTML
+        assert "patches" not in kwargs
+        assert kwargs["source"] == "tick"
+
+    @pytest.mark.asyncio
+    async def test_html_update_keeps_broadcast_flag(self):
+        consumer = self._make_consumer()
+
+        await consumer._send_render_result(
+            SMALL_HTML, BIG_PATCHES, source="broadcast", broadcast=True
+        )
+
+        kwargs = consumer._send_update.call_args.kwargs
+        assert kwargs["html"] == SMALL_HTML
+        assert kwargs["broadcast"] is True
+
+    @pytest.mark.asyncio
+    async def test_cheaper_patches_sent_as_patch(self):
+        consumer = self._make_consumer()
+
+        await consumer._send_render_result(PAGE_HTML, BIG_PATCHES, source="broadcast")
+
+        assert consumer._send_update.call_args.kwargs["patches"] == json.loads(BIG_PATCHES)
+
+    @pytest.mark.asyncio
+    async def test_no_diff_still_only_flushes(self):
+        consumer = self._make_consumer()
+
+        assert await consumer._send_render_result(SMALL_HTML, None, source="tick") is False
+        consumer._send_update.assert_not_awaited()
+        consumer._flush_all_pending.assert_awaited_once()
+
+
+class _BigDiffView(_EventSpineMixin, LiveView):
+    @event_handler()
+    def bump(self, **kwargs):
+        self.count += 1
+
+    def render_with_diff(self):
+        return (SMALL_HTML, BIG_PATCHES, 3)
+
+
+@pytest.mark.asyncio
+async def test_event_path_uses_byte_cost_not_patch_count():
+    view = _BigDiffView()
+    view.count = 0
+    view._rust_view = MagicMock()
+    runtime, transport = _event_runtime_with_view(view)
+
+    await runtime.dispatch_event({"type": "event", "event": "bump", "params": {}})
+
+    frames = [f for f in transport.sent if f.get("type") in ("patch", "html_update")]
+    assert [f["type"] for f in frames] == ["html_update"]
+    assert frames[0]["html"] == SMALL_HTML
+    # Like _send_render_result, the event path keeps the Rust baseline.
+    view._rust_view.reset.assert_not_called()
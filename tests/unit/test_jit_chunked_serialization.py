@@ -0,0 +1,89 @@
+"""
+Chunked JIT QuerySet serialization.
+
+``JITMixin._jit_serialize_queryset`` and ``DjustTemplate._jit_serialize_queryset``
+fetch and serialize ``jit_chunk_size`` rows at a time through
+``iter_queryset_chunks`` so a large QuerySet never has all of its model
+instances alive at once.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+
+import djust._rust
+from djust.config import config
+from djust.mixins.jit import JITMixin
+from djust.optimization import iter_queryset_chunks
+
+TEMPLATE = "{% for u in users %}{{ u.username }}{% endfor %}"
+
+
+@pytest.fixture
+def users(db):
+    User.objects.bulk_create([User(username=f"user{i}") for i in range(5)])
+    return User.objects.order_by("username")
+
+
+@pytest.fixture
+def chunk_size():
+    original = config.get("jit_chunk_size")
+    yield lambda n: config.set("jit_chunk_size", n)
+    config.set("jit_chunk_size", original)
+
+
+class TestIterQuerysetChunks:
+    def test_streams_in_chunks(self, users, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            chunks = [[u.username for u in chunk] for chunk in iter_queryset_chunks(users, 2)]
+
+        assert chunks == [["user0", "user1"], ["user2", "user3"], ["user4"]]
+
+    def test_evaluated_queryset_is_not_requeried(self, users, django_assert_num_queries):
+        list(users)
+
+        with django_assert_num_queries(0):
+            sizes = [len(chunk) for chunk in iter_queryset_chunks(users, 2)]
+
+        assert sizes == [2, 2, 1]
+
+    def test_non_positive_chunk_size_yields_one_list(self, users):
+        assert [len(chunk) for chunk in iter_queryset_chunks(users, 0)] == [5]
+        assert list(iter_queryset_chunks(User.objects.none(), 0)) == []
+
+    def test_plain_iterables_are_sliced(self):
+        assert list(iter_queryset_chunks(iter(range(5)), 3)) == [[0, 1, 2], [3, 4]]
+
+
+class TestChunkedJitSerialization:
+    def test_mixin_serializes_per_chunk(self, users, chunk_size):
+        chunk_size(0)
+        expected = JITMixin()._jit_serialize_queryset(users, TEMPLATE, "users")
+
+        chunk_size(2)
+        with patch.object(
+            djust._rust, "serialize_queryset", wraps=djust._rust.serialize_queryset
+        ) as rust:
+            result = JITMixin()._jit_serialize_queryset(users, TEMPLATE, "users")
+
+        assert [len(call.args[0]) for call in rust.call_args_list] == [2, 2, 1]
+        assert result == expected
+        assert [row["username"] for row in result] == [f"user{i}" for i in range(5)]
+
+    def test_template_backend_serializes_per_chunk(self, users, chunk_size):
+        from djust.template import DjustTemplateBackend
+
+        backend = DjustTemplateBackend(
+            {"NAME": "djust", "DIRS": [], "APP_DIRS": False, "OPTIONS": {}}
+        )
+        template = backend.from_string(TEMPLATE)
+        chunk_size(2)
+
+        with patch(
+            "djust.template.rendering.serialize_queryset", wraps=djust._rust.serialize_queryset
+        ) as rust:
+            html = template.render({"users": users})
+
+        assert [len(call.args[0]) for call in rust.call_args_list] == [2, 2, 1]
+        assert html == "".join(f"user{i}" for i in range(5))
@@ -13,6 +13,8 @@ Covers:
    envelope.
 5. **Error envelope** — child raises → `data-status="error"` template;
    timeout → `data-status="timeout"` template.
+6. **Lazy budget** — sibling thunks render in parallel threads; the
+   ``deadline_fallback`` fill upgrades the slot over the WebSocket.
 
 Tag-render path is exercised via ``_render_tag``. Thunk closures are
 invoked directly via ``await thunk()`` and the returned bytes
@@ -74,6 +76,29 @@ class _LazyChildThatSleeps(LiveView):
         time.sleep(0.5)
 
 
+class _LazyChildThatNaps(LiveView):
+    """Sync mount that records its ``(start, end)`` interval, so a test can
+    tell sibling lazy children rendered in parallel threads."""
+
+    template = "<div>napped</div>"
+    intervals: List[Tuple[float, float]] = []
+
+    def mount(self, request, **kwargs):
+        import time
+
+        start = time.perf_counter()
+        time.sleep(0.1)
+        _LazyChildThatNaps.intervals.append((start, time.perf_counter()))
+
+
+class _LazyChildThatWritesSession(LiveView):
+    template = "<div>{{ seen }}</div>"
+
+    def mount(self, request, **kwargs):
+        self.seen = request.session.get("theme", "none")
+        request.session["theme"] = "dark"
+
+
 class _LazyParentView(LiveView):
     template = "{% load live_tags %}<div dj-root></div>"
 
@@ -353,3 +378,147 @@ class TestLazyThunkInvocation:
         body = chunk.decode("utf-8")
         assert 'data-status="timeout"' in body
         assert "<dj-error" in body
+
+
+# ---------------------------------------------------------------------------
+# 6. Lazy budget — parallel child renders and the deadline fallback
+# ---------------------------------------------------------------------------
+
+
+class TestLazyBudget:
+    @pytest.mark.asyncio
+    async def test_sibling_thunks_render_in_parallel_threads(self, rf):
+        parent = _make_parent(rf)
+        _LazyChildThatNaps.intervals = []
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatNaps" '
+                "lazy=True %}"
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatNaps" '
+                "lazy=True %}",
+                {"view": parent, "request": parent.request},
+            )
+        chunks = await asyncio.gather(*(thunk_fn() for _id, thunk_fn in parent._lazy_thunks))
+
+        assert all(b'data-status="ok"' in chunk for chunk in chunks)
+        (start_a, end_a), (start_b, end_b) = _LazyChildThatNaps.intervals
+        # Overlapping mounts: neither waited for the other's thread.
+        assert max(start_a, start_b) < min(end_a, end_b)
+
+    def test_deadline_fallback_upgrades_over_websocket(self, rf):
+        parent = _make_parent(rf)
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChild" lazy=lazy_cfg %}',
+                {
+                    "view": parent,
+                    "request": parent.request,
+                    "lazy_cfg": {"placeholder": "<i>loading</i>"},
+                },
+            )
+        view_id, thunk_fn = parent._lazy_thunks[0]
+        body = thunk_fn.deadline_fallback().decode("utf-8")
+        assert '<template id="djl-fill-' + view_id in body
+        assert 'data-status="ok"' in body
+        assert (
+            '<div dj-view="tests.unit.test_live_render_lazy._LazyChild" dj-lazy="idle">'
+            "<i>loading</i></div>"
+        ) in body
+
+    def test_deadline_fallback_with_kwargs_is_a_timeout_fill(self, rf):
+        parent = _make_parent(rf)
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChild" '
+                'value="x" lazy=True %}',
+                {"view": parent, "request": parent.request},
+            )
+        _view_id, thunk_fn = parent._lazy_thunks[0]
+        body = thunk_fn.deadline_fallback().decode("utf-8")
+        assert 'data-status="timeout"' in body
+        assert "dj-view=" not in body
+
+    @pytest.mark.asyncio
+    async def test_children_register_on_the_event_loop_thread(self, rf):
+        import threading
+
+        parent = _make_parent(rf)
+        register_threads = []
+        register_child = parent._register_child
+
+        def _recording_register(view_id, child):
+            register_threads.append(threading.get_ident())
+            register_child(view_id, child)
+
+        parent._register_child = _recording_register
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatNaps" '
+                "lazy=True %}"
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatNaps" '
+                "lazy=True %}",
+                {"view": parent, "request": parent.request},
+            )
+        await asyncio.gather(*(thunk_fn() for _id, thunk_fn in parent._lazy_thunks))
+
+        assert register_threads == [threading.get_ident()] * 2
+        assert sorted(parent._child_views) == sorted(vid for vid, _ in parent._lazy_thunks)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_child_is_never_registered(self, rf):
+        parent = _make_parent(rf)
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatSleeps" '
+                "lazy=lazy_cfg %}",
+                {"view": parent, "request": parent.request, "lazy_cfg": {"timeout_s": 0.01}},
+            )
+        view_id, thunk_fn = parent._lazy_thunks[0]
+        body = (await thunk_fn()).decode("utf-8")
+        # Let the abandoned worker's mount() finish.
+        await asyncio.sleep(0.6)
+
+        assert 'data-status="timeout"' in body
+        assert view_id not in getattr(parent, "_child_views", {})
+
+    @pytest.mark.asyncio
+    async def test_children_get_a_private_session_snapshot(self, rf, caplog):
+        from django.contrib.sessions.backends.signed_cookies import SessionStore
+
+        parent = _make_parent(rf)
+        parent.request.session = SessionStore()
+        parent.request.session["theme"] = "light"
+        with override_settings(
+            DJUST_LIVE_RENDER_ALLOWED_MODULES=["tests.unit.test_live_render_lazy"]
+        ):
+            _render_tag(
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatWritesSession" '
+                "lazy=True %}"
+                '{% live_render "tests.unit.test_live_render_lazy._LazyChildThatWritesSession" '
+                "lazy=True %}",
+                {"view": parent, "request": parent.request},
+            )
+        with caplog.at_level("WARNING", logger="djust"):
+            chunks = await asyncio.gather(*(thunk_fn() for _id, thunk_fn in parent._lazy_thunks))
+
+        assert all(b"<div>light</div>" in chunk for chunk in chunks)
+        assert parent.request.session["theme"] == "light"
+        assert caplog.text.count("read-only session snapshot") == 2
+
+    def test_non_session_base_sessions_are_shared(self, rf):
+        from djust.templatetags.live_tags import _isolated_request
+
+        request = rf.get("/")
+        request.session = {"theme": "light"}
+
+        assert _isolated_request(request).session is request.session
@@ -0,0 +1,117 @@
+"""Tests for zero-copy patch passthrough (``LIVEVIEW_CONFIG['patch_passthrough']``).
+
+``render_with_diff()`` returns patches as a JSON string. With passthrough on,
+the consumer wraps it in ``RawJSON`` and ``encode_frame`` splices it into the
+frame envelope verbatim instead of decoding + re-encoding.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from djust.config import config
+from djust.serialization import RawJSON, encode_frame, patches_for_wire
+
+PATCHES = '[{"type":"SetText","path":[0,1],"d":"2","text":"hi \\"there\\""}]'
+
+
+@pytest.fixture
+def passthrough():
+    config.set("patch_passthrough", True)
+    try:
+        yield
+    finally:
+        config.set("patch_passthrough", False)
+
+
+class TestEncodeFrame:
+    def test_without_raw_matches_json_dumps(self):
+        frame = {"type": "patch", "patches": [{"type": "SetText"}], "version": 3}
+        assert json.loads(encode_frame(frame)) == frame
+
+    def test_splices_raw_fragment_verbatim(self):
+        text = encode_frame({"type": "patch", "patches": RawJSON(PATCHES), "version": 3})
+
+        assert PATCHES in text
+        assert json.loads(text) == {
+            "type": "patch",
+            "patches": json.loads(PATCHES),
+            "version": 3,
+        }
+
+    def test_raw_only_frame(self):
+        assert json.loads(encode_frame({"patches": RawJSON("[]")})) == {"patches": []}
+
+    def test_nested_raw_is_decoded(self):
+        """A RawJSON below the top level (e.g. the DEBUG ``_debug`` echo) still
+        encodes as the equivalent JSON value."""
+        frame = {"type": "patch", "_debug": {"patches": RawJSON(PATCHES)}}
+        assert json.loads(encode_frame(frame))["_debug"]["patches"] == json.loads(PATCHES)
+
+
+class TestPatchesForWire:
+    def test_default_decodes(self):
+        assert patches_for_wire(PATCHES) == json.loads(PATCHES)
+
+    def test_passthrough_wraps(self, passthrough):
+        result = patches_for_wire(PATCHES)
+        assert isinstance(result, RawJSON)
+        assert result.text == PATCHES
+
+    def test_none_and_lists_pass_through(self, passthrough):
+        assert patches_for_wire(None) is None
+        assert patches_for_wire([]) == []
+
+    def test_empty_list_detection(self, passthrough):
+        assert patches_for_wire("[]").is_empty_list()
+        assert not patches_for_wire(PATCHES).is_empty_list()
+
+
+class TestConsumerPassthrough:
+    def _make_consumer(self):
+        from djust.websocket import LiveViewConsumer
+
+        consumer = LiveViewConsumer()
+        consumer.view_instance = MagicMock()
+        consumer.view_instance._skip_render = False
+        consumer.view_instance._sync_state_to_rust = MagicMock()
+        consumer.view_instance.render_with_diff = MagicMock(
+            return_value=("<div>ok</div>", PATCHES, 2)
+        )
+        consumer.view_instance.get_debug_update = MagicMock(return_value={})
+        consumer.use_binary = False
+        consumer._send_frame = AsyncMock()
+        consumer._flush_all_pending = AsyncMock()
+        return consumer
+
+    @pytest.mark.asyncio
+    async def test_server_push_splices_rust_json(self, passthrough):
+        consumer = self._make_consumer()
+
+        await consumer.server_push({"state": None, "handler": None, "payload": None})
+
+        consumer._send_frame.assert_awaited_once()
+        text = consumer._send_frame.call_args.kwargs["text_data"]
+        assert PATCHES in text
+        frame = json.loads(text)
+        assert frame["type"] == "patch"
+        assert frame["source"] == "broadcast"
+        assert frame["patches"] == json.loads(PATCHES)
+
+    @pytest.mark.asyncio
+    async def test_server_push_default_still_decodes(self):
+        consumer = self._make_consumer()
+        consumer._send_update = AsyncMock()
+
+        await consumer.server_push({"state": None, "handler": None, "payload": None})
+
+        assert consumer._send_update.call_args.kwargs["patches"] == json.loads(PATCHES)
+
+    @pytest.mark.asyncio
+    async def test_hotreload_suppresses_empty_raw_patches(self, passthrough):
+        consumer = self._make_consumer()
+
+        await consumer._send_update(patches=RawJSON("[]"), version=1, hotreload=True)
+
+        consumer._send_frame.assert_not_awaited()
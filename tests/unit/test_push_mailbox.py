@@ -0,0 +1,199 @@
+"""Tests for the server_push / db_notify coalescing mailbox (#813).
+
+Pushes that arrive while the render lock is busy merge into a per-consumer
+``PushMailbox`` (state last-write-wins, handler / ``handle_info`` calls queued)
+and drain in a single render once the lock frees.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from djust.config import config
+from djust.push import PushMailbox, mailbox_stats
+
+
+class TestPushMailbox:
+    def test_state_is_last_write_wins_per_key(self):
+        mailbox = PushMailbox()
+        mailbox.add_push({"state": {"a": 1, "b": 1}})
+        mailbox.add_push({"state": {"a": 2}})
+
+        batch = mailbox.take()
+
+        assert batch.state == {"a": 2, "b": 1}
+        assert batch.size == 2
+        assert len(mailbox) == 0
+
+    def test_calls_are_queued_in_order(self):
+        mailbox = PushMailbox()
+        mailbox.add_push({"handler": "handle_a", "payload": {"n": 1}})
+        mailbox.add_notify({"type": "db_notify", "channel": "orders", "payload": {}})
+        mailbox.add_push({"handler": "handle_a", "payload": {"n": 2}})
+
+        batch = mailbox.take()
+
+        assert [kind for kind, _ in batch.calls] == ["push", "notify", "push"]
+        assert batch.calls[2] == ("push", ("handle_a", {"n": 2}))
+        assert batch.plain == 0
+
+    def test_merged_and_dropped_counters(self):
+        mailbox = PushMailbox(max_calls=2)
+        before = dict(mailbox_stats)
+        for n in range(3):
+            mailbox.add_push({"handler": "handle_a", "payload": {"n": n}})
+
+        assert mailbox.stats["pushes"] == 3
+        assert mailbox.stats["merged"] == 2
+        assert mailbox.stats["dropped"] == 1
+        assert mailbox_stats["merged"] - before["merged"] == 2
+        # The oldest call is the one that goes.
+        assert [c[1][1]["n"] for c in mailbox.take().calls] == [1, 2]
+
+    def test_drop_discards_everything(self):
+        mailbox = PushMailbox()
+        mailbox.add_push({"state": {"a": 1}})
+        mailbox.add_notify({"type": "db_notify"})
+
+        assert mailbox.drop() == 2
+        assert len(mailbox) == 0
+        assert mailbox.pending_since is None
+        assert mailbox.stats["dropped"] == 2
+
+
+def _make_consumer():
+    from djust.websocket import LiveViewConsumer
+
+    consumer = LiveViewConsumer()
+    view = MagicMock()
+    view._skip_render = False
+    view.shared_broadcast = False
+    view._sync_state_to_rust = MagicMock()
+    view.render_with_diff = MagicMock(return_value=("<div>ok</div>", '[{"op":"x"}]', 2))
+    view.handle_info = MagicMock()
+    view.handle_msg = MagicMock()
+    consumer.view_instance = view
+    consumer.use_binary = False
+    consumer._send_update = AsyncMock()
+    consumer._flush_all_pending = AsyncMock()
+    consumer._send_noop = AsyncMock()
+    return consumer
+
+
+class TestConsumerCoalescing:
+    @pytest.mark.asyncio
+    async def test_uncontended_push_renders_inline(self):
+        consumer = _make_consumer()
+
+        await consumer.server_push({"state": {"count": 1}})
+
+        assert consumer.view_instance.count == 1
+        consumer._send_update.assert_awaited_once()
+        assert consumer._push_drain_task is None
+
+    @pytest.mark.asyncio
+    async def test_burst_while_locked_renders_once(self):
+        consumer = _make_consumer()
+        await consumer._render_lock.acquire()
+
+        for n in range(5):
+            await consumer.server_push({"state": {"count": n}})
+        await consumer.db_notify({"channel": "orders", "payload": {"pk": 1}})
+        await consumer.server_push({"handler": "handle_msg", "payload": {"text": "hi"}})
+
+        task = consumer._push_drain_task
+        assert task is not None
+        consumer.view_instance.render_with_diff.assert_not_called()
+
+        consumer._render_lock.release()
+        await task
+
+        view = consumer.view_instance
+        assert view.render_with_diff.call_count == 1
+        assert view.count == 4
+        view.handle_info.assert_called_once_with(
+            {"type": "db_notify", "channel": "orders", "payload": {"pk": 1}}
+        )
+        view.handle_msg.assert_called_once_with(text="hi")
+        consumer._send_update.assert_awaited_once()
+        assert consumer._push_mailbox.stats["merged"] == 6
+
+    @pytest.mark.asyncio
+    async def test_batch_older_than_max_latency_is_dropped(self):
+        consumer = _make_consumer()
+        config.set("push_max_latency_ms", 20)
+        try:
+            await consumer._render_lock.acquire()
+            await consumer.server_push({"state": {"count": 1}})
+            await consumer._push_drain_task
+        finally:
+            config.set("push_max_latency_ms", 2000)
+            consumer._render_lock.release()
+
+        consumer.view_instance.render_with_diff.assert_not_called()
+        assert consumer._push_mailbox.stats["dropped"] == 1
+        assert len(consumer._push_mailbox) == 0
+
+    @pytest.mark.asyncio
+    async def test_skip_render_only_when_every_message_asks(self):
+        consumer = _make_consumer()
+        view = consumer.view_instance
+
+        def skipping(**kwargs):
+            view._skip_render = True
+
+        view.handle_msg = MagicMock(side_effect=skipping)
+        await consumer.server_push({"handler": "handle_msg", "payload": {}})
+
+        view.render_with_diff.assert_not_called()
+        consumer._send_noop.assert_awaited_once()
+
+        await consumer._render_lock.acquire()
+        await consumer.server_push({"handler": "handle_msg", "payload": {}})
+        await consumer.server_push({"state": {"count": 3}})
+        consumer._render_lock.release()
+        await consumer._push_drain_task
+
+        assert view.render_with_diff.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_discards_pending(self):
+        consumer = _make_consumer()
+        await consumer._render_lock.acquire()
+        await consumer.server_push({"state": {"count": 1}})
+
+        await consumer._cancel_push_drain()
+        consumer._render_lock.release()
+
+        assert consumer._push_drain_task is None
+        assert len(consumer._push_mailbox) == 0
+        consumer.view_instance.render_with_diff.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blocked_handler_still_rejected(self):
+        consumer = _make_consumer()
+        calls = []
+        consumer.view_instance.delete_everything = lambda **kwargs: calls.append(kwargs)
+
+        await consumer.server_push({"handler": "delete_everything", "payload": {}})
+        await asyncio.sleep(0)
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_failed_background_drain_is_logged_and_cleared(self, caplog):
+        consumer = _make_consumer()
+        consumer._apply_push_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        await consumer._render_lock.acquire()
+        await consumer.server_push({"state": {"count": 1}})
+        task = consumer._push_drain_task
+
+        consumer._render_lock.release()
+        with pytest.raises(RuntimeError):
+            await task
+        await asyncio.sleep(0)
+
+        assert "push mailbox drain" in caplog.text
+        assert consumer._push_drain_task is None
+        assert consumer._push_draining is False
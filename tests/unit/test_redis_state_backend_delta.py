@@ -0,0 +1,216 @@
+"""
+Tests for RedisStateBackend delta mode (base snapshot + per-key fragments).
+
+Uses fakeredis so the hash layout, transactions and TTLs are exercised
+without a live Redis server.
+"""
+
+import fakeredis
+
+from djust._rust import RustLiveView
+from djust.state_backends.redis import (
+    _BASE_FIELD,
+    _DELTAS_FIELD,
+    _FRAGMENT_PREFIX,
+    RedisStateBackend,
+)
+
+
+def _make_backend(delta_enabled=True, compaction_interval=32):
+    """Build a RedisStateBackend over fakeredis (bypasses the live-server ping)."""
+    backend = RedisStateBackend.__new__(RedisStateBackend)
+    backend._client = fakeredis.FakeRedis()
+    backend._key_prefix = "djust:"
+    backend._default_ttl = 3600
+    backend._compression_enabled = False
+    backend._compression_threshold = 10240
+    backend._compression_level = 3
+    backend._delta_enabled = delta_enabled
+    backend._delta_compaction_interval = compaction_interval
+    backend._stats = {
+        "compressed_count": 0,
+        "uncompressed_count": 0,
+        "total_bytes_saved": 0,
+    }
+    backend._delta_stats = {
+        "base_writes": 0,
+        "delta_writes": 0,
+        "delta_bytes": 0,
+        "compactions": 0,
+    }
+    return backend
+
+
+def _view(**state):
+    view = RustLiveView("<div>{{ name }}:{% for i in items %}{{ i }},{% endfor %}</div>")
+    view.update_state({"name": "a", "items": list(range(50)), **state})
+    return view
+
+
+class TestRedisDeltaBackend:
+    def test_set_writes_base_hash(self):
+        backend = _make_backend()
+        backend.set("k", _view())
+
+        fields = backend._client.hgetall("djust:k")
+        assert _BASE_FIELD in fields
+        assert not [f for f in fields if f.startswith(_FRAGMENT_PREFIX)]
+        assert 0 < backend._client.ttl("djust:k") <= 3600
+
+    def test_delta_writes_only_changed_keys(self):
+        backend = _make_backend()
+        view = _view()
+        backend.set("k", view)
+        base = backend._client.hget("djust:k", _BASE_FIELD)
+
+        view.update_state({"name": "b"})
+        backend.set_delta("k", view, ["name"])
+
+        fields = backend._client.hgetall("djust:k")
+        assert fields[_BASE_FIELD] == base  # base untouched
+        assert list(f for f in fields if f.startswith(_FRAGMENT_PREFIX)) == [b"s:name"]
+        assert backend.get_delta_stats()["delta_writes"] == 1
+
+    def test_get_applies_fragments_and_resets_vdom(self):
+        backend = _make_backend()
+        view = _view()
+        view.render_with_diff()
+        backend.set("k", view)
+
+        view.update_state({"name": "b", "items": [1, 2]})
+        backend.set_delta("k", view, ["name", "items"])
+
+        loaded, timestamp = backend.get("k")
+        assert loaded.get_state()["name"] == "b"
+        assert loaded.get_state()["items"] == [1, 2]
+        assert timestamp > 0
+        html, patches, _ = loaded.render_with_diff()
+        assert html == '<div dj-id="0">b:1,2,</div>'
+        # Base VDOM was dropped: full HTML, no patches against the old tree.
+        assert patches is None
+
+    def test_get_without_fragments_keeps_vdom(self):
+        backend = _make_backend()
+        view = _view()
+        view.render_with_diff()
+        backend.set("k", view)
+
+        loaded, _ = backend.get("k")
+        loaded.update_state({"name": "z"})
+        _, patches, _ = loaded.render_with_diff()
+        assert patches is not None
+
+    def test_empty_delta_only_refreshes_ttl(self):
+        backend = _make_backend()
+        backend.set("k", _view(), ttl=100)
+        before = backend._client.hgetall("djust:k")
+
+        backend.set_delta("k", _view(), (), ttl=500)
+
+        assert backend._client.hgetall("djust:k") == before
+        assert backend._client.ttl("djust:k") > 100
+
+    def test_compaction_rewrites_base(self):
+        backend = _make_backend(compaction_interval=3)
+        view = _view()
+        backend.set("k", view)
+
+        for n in range(3):
+            view.update_state({"name": f"n{n}"})
+            backend.set_delta("k", view, ["name"])
+
+        fields = backend._client.hgetall("djust:k")
+        assert _DELTAS_FIELD not in fields
+        assert not [f for f in fields if f.startswith(_FRAGMENT_PREFIX)]
+        assert backend.get_delta_stats()["compactions"] == 1
+        loaded, _ = backend.get("k")
+        assert loaded.get_state()["name"] == "n2"
+
+    def test_delta_without_base_falls_back_to_full_write(self):
+        backend = _make_backend()
+        view = _view(name="fresh")
+
+        backend.set_delta("k", view, ["name"])
+
+        assert backend._client.hexists("djust:k", _BASE_FIELD)
+        loaded, _ = backend.get("k")
+        assert loaded.get_state()["name"] == "fresh"
+
+    def test_reads_and_upgrades_pre_delta_blob(self):
+        legacy = _make_backend(delta_enabled=False)
+        legacy.set("k", _view(name="legacy"))
+
+        backend = _make_backend()
+        backend._client = legacy._client
+        loaded, _ = backend.get("k")
+        assert loaded.get_state()["name"] == "legacy"
+
+        loaded.update_state({"name": "new"})
+        backend.set_delta("k", loaded, ["name"])
+        assert backend._client.type("djust:k") == b"hash"
+        assert backend.get("k")[0].get_state()["name"] == "new"
+
+    def test_delta_disabled_set_delta_is_full_set(self):
+        backend = _make_backend(delta_enabled=False)
+        backend.set_delta("k", _view(), ["name"])
+
+        assert backend._client.type("djust:k") == b"string"
+        assert backend.get("k") is not None
+
+    def test_delete_removes_hash(self):
+        backend = _make_backend()
+        backend.set("k", _view())
+
+        assert backend.delete("k") is True
+        assert backend.get("k") is None
+
+    def test_stats_read_hash_sessions(self):
+        backend = _make_backend()
+        backend.set("k", _view())
+        backend.set_delta("k", _view(name="b"), ["name"])
+
+        stats = backend.get_stats()
+        assert "error" not in stats
+        assert stats["total_sessions"] == 1
+        assert stats["oldest_session_age"] >= 0
+
+        memory = backend.get_memory_stats()
+        assert "error" not in memory
+        assert memory["sessions_sampled"] == 1
+        assert memory["largest_sessions"][0]["size_bytes"] > 0
+
+
+class TestDeltaSavePath:
+    def _live_view(self):
+        from djust import LiveView
+
+        class _View(LiveView):
+            template = "<div>{{ name }}</div>"
+
+        view = _View()
+        view._cache_key = "k"
+        view._rust_view = _view()
+        return view
+
+    def test_sync_persists_changed_keys_as_fragments(self):
+        from unittest.mock import patch
+
+        backend = _make_backend()
+        with patch("djust.state_backend.get_backend", return_value=backend):
+            view = self._live_view()
+            backend.set("k", view._rust_view)
+            view._rust_view.update_state({"name": "b"})
+            view._persist_state_delta(["name"])
+
+        fields = backend._client.hgetall("djust:k")
+        assert [f for f in fields if f.startswith(_FRAGMENT_PREFIX)] == [b"s:name"]
+        assert backend.get("k")[0].get_state()["name"] == "b"
+
+    def test_sync_skips_backends_without_delta_mode(self):
+        from unittest.mock import MagicMock, patch
+
+        backend = MagicMock(delta_enabled=False)
+        with patch("djust.state_backend.get_backend", return_value=backend):
+            self._live_view()._persist_state_delta(["name"])
+
+        backend.set_delta.assert_not_called()
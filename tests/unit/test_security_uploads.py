@@ -229,7 +229,8 @@ class TestUploadSizeEnforcement:
         assert entry is not None
 
         # Send chunks that exceed max_file_size
-        progress = mgr.add_chunk(ref, 0, b"\xff" * 800)
+        # Chunk 0 carries a JPEG signature (checked on arrival).
+        progress = mgr.add_chunk(ref, 0, b"\xff\xd8\xff" + b"\xff" * 797)
         assert progress is not None  # First chunk OK (800 < 1000)
 
         progress = mgr.add_chunk(ref, 1, b"\xff" * 500)
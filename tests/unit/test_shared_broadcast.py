@@ -0,0 +1,201 @@
+"""Tests for render-once fan-out of ``server_push`` (``LiveView.shared_broadcast``).
+
+Consumers in one process that start a push from the same rendered HTML share a
+single render: the leader renders + diffs, followers forward its patch JSON and
+mark their own Rust baseline stale, which forces a full ``html_update`` on their
+next own render.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from djust import LiveView
+from djust.push import SharedRender, shared_renders
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_renders():
+    shared_renders.clear()
+    yield
+    shared_renders.clear()
+
+
+class FakeView:
+    """Just enough of a LiveView for ``server_push``: counts renders and records
+    its baseline with the shared registry like ``TemplateMixin`` does."""
+
+    shared_broadcast = True
+    _skip_render = False
+
+    def __init__(self, html="<div>0</div>"):
+        self.renders = 0
+        self.count = 0
+        shared_renders.note_render(self, html)
+
+    def _sync_state_to_rust(self):
+        pass
+
+    def render_with_diff(self):
+        self.renders += 1
+        html = f"<div>{self.count}</div>"
+        shared_renders.note_render(self, html)
+        return html, json.dumps([{"type": "SetText", "text": str(self.count)}]), self.renders
+
+
+def _make_consumer(view):
+    from djust.websocket import LiveViewConsumer
+
+    consumer = LiveViewConsumer()
+    consumer.view_instance = view
+    consumer.use_binary = False
+    consumer._send_update = AsyncMock()
+    consumer._flush_all_pending = AsyncMock()
+    return consumer
+
+
+PUSH = {"state": {"count": 1}, "handler": None, "payload": None}
+
+
+class TestRegistry:
+    def test_push_digest_is_content_identity(self):
+        assert shared_renders.push_digest(dict(PUSH)) == shared_renders.push_digest(dict(PUSH))
+        other = {"state": {"count": 2}, "handler": None, "payload": None}
+        assert shared_renders.push_digest(PUSH) != shared_renders.push_digest(other)
+
+    def test_note_render_and_adopt_track_holders(self):
+        view = FakeView()
+        token = view._shared_render_token
+        assert shared_renders.has_holder(view, token)
+
+        shared_renders.adopt(view, SharedRender(html="<div>1</div>", patches="[]", token="t2"))
+
+        assert view._shared_baseline_stale is True
+        assert view._shared_render_token == "t2"
+        assert not shared_renders.has_holder(view, token)
+        assert not shared_renders.has_holder(view, "t2")
+
+    @pytest.mark.asyncio
+    async def test_entries_are_bounded(self):
+        shared_renders.max_entries = 2
+        try:
+            view = FakeView()
+            first = shared_renders.entry(view, {"state": {"n": 1}}, "t")
+            shared_renders.entry(view, {"state": {"n": 2}}, "t")
+            shared_renders.entry(view, {"state": {"n": 3}}, "t")
+
+            assert len(shared_renders._entries) == 2
+            # Waiters on an evicted entry are released, not left hanging.
+            assert first.future.done() and first.future.result() is None
+        finally:
+            shared_renders.max_entries = 256
+
+
+class TestServerPushFanOut:
+    @pytest.mark.asyncio
+    async def test_renders_once_for_matching_consumers(self):
+        views = [FakeView() for _ in range(3)]
+        consumers = [_make_consumer(v) for v in views]
+
+        await asyncio.gather(*(c.server_push(dict(PUSH)) for c in consumers))
+
+        assert sum(v.renders for v in views) == 1
+        assert shared_renders.stats["renders"] == 1
+        assert shared_renders.stats["reused"] == 2
+        sent = [c._send_update.call_args.kwargs["patches"] for c in consumers]
+        assert sent[0] == sent[1] == sent[2] == [{"type": "SetText", "text": "1"}]
+        assert all(v.count == 1 for v in views)
+        # Every client now shows the pushed render, whoever rendered it.
+        assert len({v._shared_render_token for v in views}) == 1
+
+    @pytest.mark.asyncio
+    async def test_followers_are_marked_stale(self):
+        views = [FakeView(), FakeView()]
+        consumers = [_make_consumer(v) for v in views]
+
+        await asyncio.gather(*(c.server_push(dict(PUSH)) for c in consumers))
+
+        stale = [v for v in views if getattr(v, "_shared_baseline_stale", False)]
+        assert len(stale) == 1
+        assert stale[0].renders == 0
+
+    @pytest.mark.asyncio
+    async def test_distinct_base_html_does_not_share(self):
+        views = [FakeView("<div>alice</div>"), FakeView("<div>bob</div>")]
+        consumers = [_make_consumer(v) for v in views]
+
+        await asyncio.gather(*(c.server_push(dict(PUSH)) for c in consumers))
+
+        assert [v.renders for v in views] == [1, 1]
+        assert shared_renders.stats["reused"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_consumer_without_leader_renders_itself(self):
+        view = FakeView()
+        shared_renders.adopt(view, SharedRender(html="<div>0</div>", patches="[]", token="gone"))
+        consumer = _make_consumer(view)
+
+        await consumer.server_push(dict(PUSH))
+
+        assert view.renders == 1
+        assert shared_renders.stats["fallbacks"] == 1
+        consumer._send_update.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_non_shared_view_is_unaffected(self):
+        view = FakeView()
+        view.shared_broadcast = False
+        consumer = _make_consumer(view)
+
+        await consumer.server_push(dict(PUSH))
+
+        assert view.renders == 1
+        assert shared_renders.stats == {"renders": 0, "reused": 0, "fallbacks": 0}
+
+
+class SharedCounterView(LiveView):
+    template = "<div dj-root>{{ count }}</div>"
+    shared_broadcast = True
+
+    def mount(self, request, **kwargs):
+        self.count = 0
+
+
+class TestStaleBaselineResync:
+    @pytest.mark.django_db
+    def test_render_records_token(self, get_request):
+        view = SharedCounterView()
+        view.get(get_request)
+        html, _patches, _version = view.render_with_diff()
+
+        assert view._shared_render_token == shared_renders.render_token(html)
+        assert shared_renders.has_holder(view, view._shared_render_token)
+
+    @pytest.mark.django_db
+    def test_stale_baseline_forces_full_html(self, get_request):
+        view = SharedCounterView()
+        view.get(get_request)
+        view.render_with_diff()
+
+        view._shared_baseline_stale = True
+        view.count = 5
+        html, patches, _version = view.render_with_diff()
+
+        assert patches is None
+        assert ">5<" in html
+        assert view._shared_resync_pending is True
+        assert view._shared_baseline_stale is False
+
+    @pytest.mark.asyncio
+    async def test_resync_sends_html_update(self):
+        view = FakeView()
+        view._shared_resync_pending = True
+        consumer = _make_consumer(view)
+
+        sent = await consumer._send_render_result("<div>5</div>", None, source="tick")
+
+        assert sent is True
+        assert consumer._send_update.call_args.kwargs["html"] == "<div>5</div>"
+        assert view._shared_resync_pending is False
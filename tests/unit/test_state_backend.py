@@ -257,6 +257,31 @@ class TestInMemoryBackend:
         backend = InMemoryStateBackend()
         assert backend.delete_all() == 0
 
+    @pytest.mark.parametrize("native", [True, False])
+    def test_get_returns_isolated_clone(self, native, monkeypatch):
+        """get() hands out an independent copy via the native ``clone()``
+        or, on extension builds without it, the msgpack round-trip."""
+        from djust.state_backends import memory
+
+        if native and not hasattr(RustLiveView, "clone"):
+            pytest.skip("extension built without RustLiveView.clone")
+        monkeypatch.setattr(memory, "_HAS_NATIVE_CLONE", native)
+
+        backend = InMemoryStateBackend()
+        original = RustLiveView("<div>{{ name }}</div>")
+        original.update_state({"name": "a", "items": [1, 2, 3]})
+        original.render_with_diff()
+        backend.set("k", original)
+
+        clone, _ts = backend.get("k")
+        assert clone is not original
+        assert clone.get_state() == original.get_state()
+
+        clone.update_state({"name": "b"})
+        _html, patches, _version = clone.render_with_diff()
+        assert patches is not None  # VDOM baseline carried over
+        assert backend.get("k")[0].get_state()["name"] == "a"
+
     def test_get_discards_corrupt_entry_on_round_trip_failure(self):
         """#1410: when serialize/deserialize round-trip fails (msgpack
         schema drift after a hot-swap, corrupt state, etc.) `get()` must
@@ -277,11 +302,11 @@ class TestInMemoryBackend:
         # Confirm baseline: a normal get() returns a (clone, ts) tuple.
         assert backend.get("k") is not None
 
-        # Force the round-trip to fail. Patch deserialize_msgpack on the
-        # class so the next call inside `get()` raises.
-        with patch.object(
-            RustLiveView,
-            "deserialize_msgpack",
+        # Force the clone to fail. Patch the clone helper (native
+        # ``clone()`` or msgpack round-trip) so the next call inside
+        # `get()` raises.
+        with patch(
+            "djust.state_backends.memory._clone_view",
             side_effect=ValueError("simulated msgpack schema drift"),
         ):
             result = backend.get("k")
@@ -314,16 +339,15 @@ class TestInMemoryBackend:
         replacement = RustLiveView("<div>replacement</div>")
 
         # Simulate the concurrent set() landing INSIDE the failed
-        # round-trip handler — patch deserialize_msgpack to raise AND
+        # round-trip handler — patch the clone helper to raise AND
         # write a fresh entry as a side effect, mirroring the worst-case
         # interleaving.
         def raise_and_simulate_concurrent_set(*_args, **_kwargs):
             backend.set("k", replacement)
             raise ValueError("simulated msgpack schema drift")
 
-        with patch.object(
-            RustLiveView,
-            "deserialize_msgpack",
+        with patch(
+            "djust.state_backends.memory._clone_view",
             side_effect=raise_and_simulate_concurrent_set,
         ):
             result = backend.get("k")
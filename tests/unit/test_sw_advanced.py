@@ -624,6 +624,188 @@ class TestMountBatch:
         assert push_idx > batch_idx, "push_event must flush after mount_batch, not before"
 
 
+class _CountingView(LiveView):
+    """template_name + custom check_permissions — exercises the batch caches."""
+
+    template_name = "sw_advanced_counting.html"
+    permission_checks = 0
+
+    def check_permissions(self, request):
+        type(self).permission_checks += 1
+        return True
+
+    def mount(self, request, **kwargs):
+        self.count = 0
+
+    def get_context_data(self, **kwargs):
+        return {"count": self.count}
+
+
+class _TickingCounter(_SimpleCounter):
+    tick_interval = 60_000
+
+    def handle_tick(self):
+        self.count += 1
+
+
+class _ListeningCounter(_SimpleCounter):
+    _listen_channels = {"orders"}
+
+
+def _batch(*targets: Tuple[str, str]) -> Dict[str, Any]:
+    return {
+        "type": "mount_batch",
+        "views": [
+            {
+                "view": "tests.unit.test_sw_advanced.%s" % view,
+                "params": {},
+                "url": "/",
+                "target_id": target_id,
+            }
+            for view, target_id in targets
+        ],
+    }
+
+
+@pytest.mark.usefixtures("_allow_test_module")
+class TestMountBatchConcurrency:
+    """Entries mount concurrently (``mount_batch_concurrency``) with shared
+    per-batch auth / template caches."""
+
+    @staticmethod
+    def _slow_group_add(consumer):
+        """Make the view-group join await, recording peak overlap."""
+        stats = {"in_flight": 0, "peak": 0}
+
+        class _SlowChannelLayer:
+            async def group_add(self, *a, **kw):
+                stats["in_flight"] += 1
+                stats["peak"] = max(stats["peak"], stats["in_flight"])
+                await asyncio.sleep(0.01)
+                stats["in_flight"] -= 1
+
+            async def group_discard(self, *a, **kw):
+                return None
+
+        type(consumer).channel_layer = property(lambda self: _SlowChannelLayer())
+        return stats
+
+    def test_async_waits_overlap_and_results_keep_request_order(self):
+        consumer = _make_fake_consumer()
+        stats = self._slow_group_add(consumer)
+        targets = [("_SimpleCounter", "t%d" % i) for i in range(4)]
+        asyncio.run(consumer.handle_mount_batch(_batch(*targets)))
+
+        (batch,) = [f for f in consumer.sent_frames if f.get("type") == "mount_batch"]
+        assert [v["target_id"] for v in batch["views"]] == ["t0", "t1", "t2", "t3"]
+        assert batch["failed"] == []
+        assert stats["peak"] > 1
+
+    def test_concurrency_one_mounts_sequentially(self):
+        from djust.config import config as djust_config
+
+        consumer = _make_fake_consumer()
+        stats = self._slow_group_add(consumer)
+        original = djust_config.get("mount_batch_concurrency")
+        djust_config.set("mount_batch_concurrency", 1)
+        try:
+            asyncio.run(
+                consumer.handle_mount_batch(
+                    _batch(("_SimpleCounter", "a"), ("_SimpleCounter", "b"))
+                )
+            )
+        finally:
+            djust_config.set("mount_batch_concurrency", original)
+
+        (batch,) = [f for f in consumer.sent_frames if f.get("type") == "mount_batch"]
+        assert [v["target_id"] for v in batch["views"]] == ["a", "b"]
+        assert stats["peak"] == 1
+
+    def test_consumer_ends_on_last_entry_view(self):
+        consumer = _make_fake_consumer()
+        asyncio.run(
+            consumer.handle_mount_batch(
+                _batch(
+                    ("_SimpleCounter", "a"),
+                    ("_SimpleCounter", "b"),
+                    ("_PushEventOnMount", "c"),
+                )
+            )
+        )
+        assert isinstance(consumer.view_instance, _PushEventOnMount)
+        assert consumer._get_runtime().view_instance is consumer.view_instance
+        assert consumer.send_json.__name__ == "send_json"
+
+    def test_consumer_wiring_is_written_by_one_mount(self):
+        consumer = _make_fake_consumer()
+        self._slow_group_add(consumer)
+        asyncio.run(
+            consumer.handle_mount_batch(
+                _batch(
+                    ("_ListeningCounter", "a"),
+                    ("_SimpleCounter", "b"),
+                    ("_ListeningCounter", "c"),
+                )
+            )
+        )
+        assert consumer._view_path == "tests.unit.test_sw_advanced._ListeningCounter"
+        assert consumer._db_notify_channels == {"orders"}
+        assert consumer._sticky_auto_reattached == set()
+
+    def test_concurrent_entries_leave_one_tick(self):
+        from djust.config import config as djust_config
+        from djust.tick import tick_scheduler
+
+        async def run():
+            consumer = _make_fake_consumer()
+            before = tick_scheduler.registered
+            await consumer.handle_mount_batch(
+                _batch(*[("_TickingCounter", "t%d" % i) for i in range(3)])
+            )
+            await asyncio.sleep(0)
+            registered = tick_scheduler.registered - before
+            consumer._tick_task.cancel()
+            await asyncio.sleep(0)
+            return registered
+
+        djust_config.set("tick_scheduler", True)
+        try:
+            assert asyncio.run(run()) == 1
+        finally:
+            djust_config.set("tick_scheduler", False)
+
+    def test_push_events_flush_after_concurrent_batch(self):
+        consumer = _make_fake_consumer_with_push_events()
+        asyncio.run(
+            consumer.handle_mount_batch(
+                _batch(("_PushEventOnMount", "a"), ("_PushEventOnMount", "b"))
+            )
+        )
+        types = [f.get("type") for f in consumer.sent_frames]
+        assert types == ["mount_batch", "push_event", "push_event"]
+
+    def test_auth_and_template_resolved_once_per_class(self, monkeypatch):
+        from djust.mixins.template import TemplateMixin
+
+        loads = []
+
+        def _load(self):
+            loads.append(type(self))
+            return "<div dj-root><span>count={{ count }}</span></div>"
+
+        monkeypatch.setattr(TemplateMixin, "_load_template_source", _load)
+        monkeypatch.setattr(_CountingView, "permission_checks", 0)
+
+        consumer = _make_fake_consumer()
+        targets = [("_CountingView", "t%d" % i) for i in range(3)]
+        asyncio.run(consumer.handle_mount_batch(_batch(*targets)))
+
+        (batch,) = [f for f in consumer.sent_frames if f.get("type") == "mount_batch"]
+        assert len(batch["views"]) == 3
+        assert _CountingView.permission_checks == 1
+        assert loads == [_CountingView]
+
+
 # ---------------------------------------------------------------------------
 # 9-10. Config / checks tests.
 # ---------------------------------------------------------------------------
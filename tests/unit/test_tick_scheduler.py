@@ -0,0 +1,186 @@
+"""Tests for the process-wide tick scheduler (``djust.tick``).
+
+``tick_interval`` views share one timer wheel per interval instead of running
+an ``asyncio.sleep`` loop each; a due slot ticks every view in it in a single
+executor submission.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from djust import LiveView
+from djust.tick import TickScheduler, tick_stats
+
+
+class _NoopTickView(LiveView):
+    template = "<div dj-root>{{ count }}</div>"
+    tick_interval = 1000
+
+    def mount(self, request, **kwargs):
+        self.count = 0
+
+    def handle_tick(self):
+        pass
+
+
+class _CountingTickView(_NoopTickView):
+    def handle_tick(self):
+        self.count += 1
+
+
+def _make_consumer(changes=True):
+    from djust.websocket import LiveViewConsumer
+
+    consumer = LiveViewConsumer()
+    view = MagicMock()
+    view._force_full_html = False
+    view.render_with_diff = MagicMock(return_value=("<div>ok</div>", "[]", 2))
+    consumer.view_instance = view
+    consumer._tick_render = MagicMock(return_value=("<div>ok</div>", "[]", 2) if changes else None)
+    consumer._send_render_result = AsyncMock(return_value=True)
+    return consumer
+
+
+async def _wait_for(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("condition not reached before timeout")
+        await asyncio.sleep(0.005)
+
+
+class TestTickScheduler:
+    async def test_consumers_share_one_bucket_per_interval(self):
+        scheduler = TickScheduler()
+        consumers = [_make_consumer() for _ in range(6)]
+        handles = [scheduler.register(c, 1000) for c in consumers]
+        other = scheduler.register(_make_consumer(), 500)
+        try:
+            sizes = scheduler.bucket_sizes()
+            assert sorted(sizes) == [500, 1000]
+            assert sum(sizes[1000]) == 6
+            # Phase-spread: six views on a 20-slot wheel never share a slot.
+            assert max(sizes[1000]) == 1
+            assert scheduler.registered == 7
+        finally:
+            for handle in handles + [other]:
+                handle.cancel()
+        await asyncio.sleep(0)
+        assert scheduler.registered == 0
+        assert scheduler.bucket_sizes() == {}
+
+    async def test_due_slot_ticks_and_sends(self):
+        scheduler = TickScheduler()
+        consumer = _make_consumer()
+        handle = scheduler.register(consumer, 50)
+        try:
+            await _wait_for(lambda: consumer._send_render_result.await_count >= 2)
+        finally:
+            handle.cancel()
+        consumer._tick_render.assert_called_with(consumer.view_instance)
+        consumer._send_render_result.assert_awaited_with(
+            "<div>ok</div>", "[]", source="tick", event_name="tick"
+        )
+        assert not consumer._render_lock.locked()
+
+    async def test_slot_renders_in_one_executor_submission(self, monkeypatch):
+        import djust.tick as tick_mod
+
+        submitted = []
+        original = tick_mod._render_batch
+
+        def _recording(jobs):
+            submitted.append(len(jobs))
+            return original(jobs)
+
+        monkeypatch.setattr(tick_mod, "_render_batch", _recording)
+        consumers = [_make_consumer() for _ in range(3)]
+        entries = [(c, asyncio.get_running_loop().create_future()) for c in consumers]
+
+        await tick_mod._tick_slot(entries)
+
+        assert submitted == [3]
+        for consumer in consumers:
+            consumer._send_render_result.assert_awaited_once()
+
+    async def test_busy_view_skips_without_waiting(self):
+        import djust.tick as tick_mod
+
+        busy = _make_consumer()
+        await busy._render_lock.acquire()
+        handling = _make_consumer()
+        handling._processing_user_event = True
+        idle = _make_consumer()
+        loop = asyncio.get_running_loop()
+        before = tick_stats["skipped"]
+
+        await tick_mod._tick_slot([(c, loop.create_future()) for c in (busy, handling, idle)])
+
+        busy._tick_render.assert_not_called()
+        handling._tick_render.assert_not_called()
+        idle._tick_render.assert_called_once()
+        assert tick_stats["skipped"] - before == 2
+        assert busy._render_lock.locked()
+        busy._render_lock.release()
+
+    async def test_unchanged_tick_sends_nothing(self):
+        import djust.tick as tick_mod
+
+        consumer = _make_consumer(changes=False)
+        await tick_mod._tick_slot([(consumer, asyncio.get_running_loop().create_future())])
+
+        consumer._tick_render.assert_called_once()
+        consumer._send_render_result.assert_not_awaited()
+
+    async def test_view_gone_resolves_registration(self):
+        scheduler = TickScheduler()
+        consumer = _make_consumer()
+        consumer.view_instance = None
+        handle = scheduler.register(consumer, 50)
+
+        await asyncio.wait_for(handle, timeout=2.0)
+        await asyncio.sleep(0)
+
+        consumer._tick_render.assert_not_called()
+        assert scheduler.registered == 0
+
+    async def test_maybe_start_tick_task_honours_config(self):
+        from djust.config import config
+        from djust.runtime import maybe_start_tick_task
+        from djust.tick import tick_scheduler
+
+        consumer = _make_consumer()
+        consumer._run_tick = MagicMock(return_value=asyncio.sleep(0))
+        assert maybe_start_tick_task(consumer, _NoopTickView) is True
+        consumer._run_tick.assert_called_once_with(1000)
+        await consumer._tick_task
+
+        before = tick_scheduler.registered
+        config.set("tick_scheduler", True)
+        try:
+            assert maybe_start_tick_task(consumer, _NoopTickView) is True
+        finally:
+            config.set("tick_scheduler", False)
+        assert tick_scheduler.registered == before + 1
+        consumer._tick_task.cancel()
+        consumer._run_tick.assert_called_once()
+
+
+class TestTickRender:
+    @pytest.mark.django_db
+    def test_tick_render_returns_none_when_unchanged(self, get_request):
+        consumer = _make_consumer()
+        del consumer._tick_render
+
+        view = _NoopTickView()
+        view.get(get_request)
+        assert consumer._tick_render(view) is None
+
+        view = _CountingTickView()
+        view.get(get_request)
+        result = consumer._tick_render(view)
+        assert result is not None
+        assert view.count == 1
@@ -0,0 +1,123 @@
+"""
+Per-key change tracking for ``LiveView.track_assigns`` views.
+
+Opted-in views record changed assigns as they happen — ``__setattr__`` plus
+tracked list / dict / set wrappers — so ``_snapshot_assigns`` no longer scans
+(or truncates) large collections.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from djust import LiveView
+from djust.change_tracking import TrackedDict, TrackedList, TrackedSet
+from djust.websocket import _compute_changed_keys, _snapshot_assigns
+
+
+class TrackedView(LiveView):
+    track_assigns = True
+    template = (
+        "<div dj-root>{{ count }}"
+        "{% for row in rows %}<p>{{ row.name }}</p>{% endfor %}"
+        "{{ tags|length }}</div>"
+    )
+
+    def mount(self, request, **kwargs):
+        self.count = 0
+        self.rows = [{"name": f"row{i}"} for i in range(500)]
+        self.tags = set()
+        self.meta = {}
+
+
+def _changed(view, mutate):
+    pre = _snapshot_assigns(view)
+    mutate(view)
+    return _compute_changed_keys(pre, _snapshot_assigns(view))
+
+
+@pytest.fixture
+def view():
+    view = TrackedView()
+    view.mount(None)
+    return view
+
+
+class TestTrackedAssigns:
+    def test_containers_are_wrapped_recursively(self, view):
+        assert type(view.rows) is TrackedList
+        assert type(view.rows[0]) is TrackedDict
+        assert type(view.tags) is TrackedSet
+
+    def test_nested_mutation_past_snapshot_limits_is_detected(self, view):
+        def mutate(v):
+            v.rows[450]["name"] = "changed"
+
+        assert _changed(view, mutate) == {"rows"}
+
+    def test_only_changed_keys_are_reported(self, view):
+        def mutate(v):
+            v.tags.add("x")
+            v.meta.setdefault("a", []).append(1)
+
+        assert _changed(view, mutate) == {"tags", "meta"}
+
+    def test_unchanged_handler_compares_equal(self, view):
+        pre = _snapshot_assigns(view)
+        view.count = 0  # same immutable value
+        view.rows = view.rows  # same object
+        assert _snapshot_assigns(view) == pre
+
+    def test_reassign_and_delete(self, view):
+        assert _changed(view, lambda v: setattr(v, "count", 1)) == {"count"}
+        assert _changed(view, lambda v: delattr(v, "meta")) == {"meta"}
+
+    def test_replaced_container_stops_reporting(self, view):
+        old = view.rows
+        view.rows = []
+
+        assert _changed(view, lambda v: old.append({"name": "stale"})) == set()
+
+    def test_alias_reports_to_both_attrs(self, view):
+        view.selected = view.meta
+
+        assert _changed(view, lambda v: v.meta.update(a=1)) == {"meta", "selected"}
+
+    def test_framework_attrs_are_not_tracked(self, view):
+        assert _changed(view, lambda v: setattr(v, "template_name", "x.html")) == set()
+        assert type(view._components) is dict
+
+    def test_wrappers_serialize_as_plain_containers(self, view):
+        assert type(pickle.loads(pickle.dumps(view.rows))) is list
+        assert type(copy.deepcopy(view.meta)) is dict
+        assert json.loads(json.dumps(view.rows[:1])) == [{"name": "row0"}]
+
+    def test_default_views_keep_snapshot_scan(self):
+        class Plain(LiveView):
+            template = "<div></div>"
+
+        plain = Plain()
+        plain.items = [1]
+
+        assert plain._assign_tracker is None
+        assert type(plain.items) is list
+        assert _snapshot_assigns(plain)["items"][1] == 1
+
+
+class TestTrackedRender:
+    @pytest.mark.django_db
+    def test_mutation_renders_patch(self, get_request):
+        view = TrackedView()
+        view.get(get_request)
+        view.render_with_diff()
+
+        pre = _snapshot_assigns(view)
+        view.rows[499]["name"] = "last"
+        view.tags.add("t")
+        view._changed_keys = _compute_changed_keys(pre, _snapshot_assigns(view))
+        html, patches, _version = view.render_with_diff()
+
+        assert ">last</p>" in html
+        assert patches is not None
@@ -537,8 +537,8 @@ class TestIsolationAndRegression:
             assert mock_mkstemp.call_count == 0
         # Entry has no temp path.
         assert entry._temp_path is None
-        # And the chunks dict was never populated — zero-RAM buffer.
-        assert entry._chunks == {}
+        # And the entry never opened its own spill file.
+        assert entry._spill is None
 
     def test_legacy_disk_path_still_writes_temp_file(self):
         mgr = UploadManager()